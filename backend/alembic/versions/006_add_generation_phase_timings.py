@@ -0,0 +1,30 @@
+"""Add phase_timings column to generations
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-17
+
+Stores per-generation phase wall times plus profiling spans and counters
+(app.core.profiling) as JSON. Nullable: older generations have none.
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        'generations',
+        sa.Column('phase_timings', sa.JSON(), nullable=True)
+    )
+
+
+def downgrade():
+    op.drop_column('generations', 'phase_timings')
@@ -1,5 +1,3 @@
-import json
-import zlib
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -10,6 +8,12 @@ from sqlalchemy.orm import selectinload
 from app.core.database import get_db
 from app.models import Creature, CreaturePerformance, CreatureFrame
 from app.schemas.creature import CreatureRead, CreatureWithFrames, FrameData
+from app.simulation.frame_codec import (
+    decode_activations,
+    decode_fitness_over_time,
+    decode_node_frames,
+    decode_pellet_frames,
+)
 
 router = APIRouter()
 
@@ -154,13 +158,11 @@ async def get_creature_with_frames(
     frames = None
     if performance.frames:
         try:
-            node_frames_raw = zlib.decompress(performance.frames.frames_data)
-            node_frames = json.loads(node_frames_raw)
+            node_frames = decode_node_frames(performance.frames.frames_data)
 
             pellet_frames = None
             if performance.frames.pellet_frames:
-                pellet_frames_raw = zlib.decompress(performance.frames.pellet_frames)
-                pellet_frames = json.loads(pellet_frames_raw)
+                pellet_frames = decode_pellet_frames(performance.frames.pellet_frames)
 
             frames = FrameData(
                 frame_count=performance.frames.frame_count,
@@ -243,23 +245,19 @@ async def get_creature_frames(
         raise HTTPException(status_code=404, detail="No frames available for this creature")
 
     try:
-        frames_raw = zlib.decompress(frame.frames_data)
-        frames_data = json.loads(frames_raw)
+        frames_data = decode_node_frames(frame.frames_data)
 
         pellet_frames = None
         if frame.pellet_frames:
-            pellet_frames_raw = zlib.decompress(frame.pellet_frames)
-            pellet_frames = json.loads(pellet_frames_raw)
+            pellet_frames = decode_pellet_frames(frame.pellet_frames)
 
         fitness_over_time = None
         if frame.fitness_over_time:
-            fitness_over_time_raw = zlib.decompress(frame.fitness_over_time)
-            fitness_over_time = json.loads(fitness_over_time_raw)
+            fitness_over_time = decode_fitness_over_time(frame.fitness_over_time)
 
         activations_per_frame = None
         if frame.activations_per_frame:
-            activations_raw = zlib.decompress(frame.activations_per_frame)
-            activations_per_frame = json.loads(activations_raw)
+            activations_per_frame = decode_activations(frame.activations_per_frame)
 
         return {
             "frames_data": frames_data,
@@ -1,19 +1,31 @@
+import asyncio
 import json
 import time
 import uuid
 import zlib
+from dataclasses import dataclass, field
 from typing import Annotated
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, WebSocket
-from sqlalchemy import func, select
+from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect
+from sqlalchemy import func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.core.database import get_db
+from app.core.database import async_session_maker, get_db
+from app.core.profiling import Profile, increment, profiling, span
 from app.models import Creature, CreaturePerformance, CreatureFrame, Generation, Run
 from app.schemas.genome import CreatureGenome
 from app.schemas.simulation import SimulationConfig
+from app.services.executor import SimulationQueueFullError
+from app.services.fitness_cache import FitnessCache, fill_misses, seed_from_id
+from app.services.pytorch_simulator import sparse_frame_rows
 from app.services.simulator import SimulatorService
+from app.simulation.frame_codec import (
+    encode_activation_dicts,
+    encode_fitness_over_time,
+    encode_node_frame_rows,
+    encode_pellet_frames,
+)
 from app.genetics.population import (
     generate_population,
     evolve_population as genetics_evolve_population,
@@ -24,6 +36,9 @@ from app.schemas.neat import InnovationCounter
 
 router = APIRouter()
 
+# Simulation result fields the survivor cache keeps (also all the DB stores per generation)
+_CACHED_FIELDS = ("fitness", "pellets_collected", "disqualified", "disqualified_reason")
+
 
 def trimmed_mean(values: list[float]) -> float:
     """Compute trimmed mean (drop highest and lowest, then average).
@@ -92,34 +107,319 @@ def compute_adaptive_boost(
         return current_boost, new_gens_since_change, 'marginal'
 
 
-async def run_generation(
-    run_id: str,
-    db: AsyncSession,
-    simulator: SimulatorService,
-) -> dict:
-    """Run a single generation of evolution."""
-    # Get the run
-    result = await db.execute(select(Run).where(Run.id == run_id))
-    run = result.scalar_one_or_none()
-    if not run:
-        raise HTTPException(status_code=404, detail="Run not found")
+# =============================================================================
+# Generation Pipeline
+# =============================================================================
+#
+# A generation runs in three stages so a long-lived EvolutionWorker can keep
+# the population in memory and overlap persistence with the next generation:
+#   load_evolution_state  -> EvolutionState   (DB reads, skipped by the worker)
+#   compute_generation    -> GenerationOutcome (evolve + simulate, no DB access)
+#   persist_generation                         (bulk writes + commit)
 
-    config = SimulationConfig(**run.config)
-    current_gen = run.current_generation
+@dataclass
+class EvolutionState:
+    """
+    In-memory evolution state of a run between generations.
+
+    Attributes:
+        generation: Next generation to run
+        genomes: Previous generation's genomes (as stored), sorted by fitness desc
+        fitness: Previous generation's fitness, aligned with genomes
+        birth_generations: creature_id -> birth generation for the previous generation
+        fitness_totals: creature_id -> (fitness sum, count) over all generations (for avg_fitness)
+        best_fitness_history: Best fitness of every completed generation
+        fitness_cache: Survivor fitness cache (seeded from the previous generation's
+                       stored results, or created on the first computed generation)
+    """
+    run_id: str
+    config: SimulationConfig
+    generation: int
+    genomes: list[dict] = field(default_factory=list)
+    fitness: list[float] = field(default_factory=list)
+    birth_generations: dict[str, int] = field(default_factory=dict)
+    fitness_totals: dict[str, tuple[float, int]] = field(default_factory=dict)
+    best_fitness_history: list[float] = field(default_factory=list)
+    adaptive_boost_level: float = 1.0
+    gens_since_boost_change: int = 0
+    innovation_counter: InnovationCounter | None = None
+    fitness_cache: FitnessCache | None = None
+
+
+@dataclass
+class GenerationOutcome:
+    """A simulated generation, ready to be written by persist_generation."""
+    generation: int
+    generation_row: dict
+    creature_rows: list[dict]
+    survivor_updates: list[dict]
+    performance_rows: list[dict]
+    frame_rows: list[dict]
+    culled_ids: set[str]
+    best_creature_id: str
+    longest_survivor: tuple[int, str] | None
+    adaptive_boost_level: float
+    gens_since_boost_change: int
+    innovation_counter: InnovationCounter | None
+    response: dict
+
+
+class _PhaseTimer:
+    """
+    Accumulates wall time per phase (reported as phase_timings_ms).
+
+    When settings.phase_profiling is on it also carries the Profile that the
+    evolve, simulate and persist phases record their spans and counters into.
+    """
+
+    def __init__(self):
+        self.timings_ms: dict[str, float] = {}
+        self.profile = Profile() if settings.phase_profiling else None
+        self._start = time.perf_counter()
+
+    def end(self, name: str) -> None:
+        now = time.perf_counter()
+        elapsed_ms = (now - self._start) * 1000
+        self.timings_ms[name] = round(self.timings_ms.get(name, 0.0) + elapsed_ms, 2)
+        self._start = now
+
+    def report(self) -> dict:
+        """Phases, spans and counters as stored in Generation.phase_timings."""
+        report = {"phases": dict(self.timings_ms)}
+        if self.profile is not None:
+            report.update(self.profile.to_dict())
+        return report
+
+
+def _finish_response(response: dict, timer: _PhaseTimer) -> dict:
+    """Add the generation's timings to its /step response."""
+    response["phase_timings_ms"] = timer.timings_ms
+    if timer.profile is not None:
+        response["profile"] = timer.profile.to_dict()
+    return response
+
+
+def _batch_config(config: SimulationConfig, fitness_cache: FitnessCache, generation: int) -> dict:
+    """Simulation config of one generation of a run."""
+    return {
+        "simulation_duration": config.simulation_duration,
+        "frame_storage_mode": config.frame_storage_mode,
+        "sparse_top_count": config.sparse_top_count,
+        "sparse_bottom_count": config.sparse_bottom_count,
+        "sparse_frame_replay": config.sparse_frame_replay,
+        "frame_rate": 15,
+        "frame_format": settings.frame_format,
+        "frame_precision": settings.frame_precision,
+        "frame_delta_encoding": settings.frame_delta_encoding,
+        "pellet_count": config.pellet_count,
+        "arena_size": config.arena_size,
+        "max_allowed_frequency": config.max_allowed_frequency,
+        "fitness_pellet_points": config.fitness_pellet_points,
+        "fitness_progress_max": config.fitness_progress_max,
+        "fitness_distance_per_unit": config.fitness_distance_per_unit,
+        "fitness_distance_traveled_max": config.fitness_distance_traveled_max,
+        "fitness_regression_penalty": config.fitness_regression_penalty,
+        "fitness_efficiency_penalty": config.fitness_efficiency_penalty,
+        "neural_dead_zone": config.neural_dead_zone,
+        "use_neural_net": config.use_neural_net,
+        "neural_mode": config.neural_mode,
+        "neural_hidden_size": config.neural_hidden_size,
+        "time_encoding": config.time_encoding,
+        "use_proprioception": config.use_proprioception,
+        "proprioception_inputs": config.proprioception_inputs,
+        # NEAT config
+        "neat_max_hidden_nodes": config.neat_max_hidden_nodes,
+        "pellet_seed": fitness_cache.pellet_seed,
+        "pellet_generation": fitness_cache.pellet_generation(generation),
+    }
+
+
+def _fitness_cache(run_id: str, config: SimulationConfig) -> FitnessCache:
+    """Survivor fitness cache of a run (pellet seed derived from the run id if unset)."""
+    return FitnessCache.from_config(config, default_seed=seed_from_id(run_id))
 
-    # Track survivor IDs for animation states
-    survivor_ids: set[str] = set()
-    culled_ids: set[str] = set()  # Creatures that died (for frontend animation)
+
+async def load_evolution_state(run: Run, db: AsyncSession) -> EvolutionState:
+    """Build the evolution state of a run from the database."""
+    config = SimulationConfig(**run.config)
+    state = EvolutionState(
+        run_id=run.id,
+        config=config,
+        generation=run.current_generation,
+        adaptive_boost_level=run.adaptive_boost_level,
+        gens_since_boost_change=run.gens_since_boost_change,
+    )
 
     # Load or create innovation counter for NEAT
-    innovation_counter = None
-    use_neat = config.neural_mode == 'neat'
-    if use_neat:
-        innovation_counter = InnovationCounter(
+    if config.neural_mode == 'neat':
+        state.innovation_counter = InnovationCounter(
             next_connection=run.innovation_counter_connection,
             next_node=run.innovation_counter_node,
         )
 
+    if state.generation == 0:
+        return state
+
+    # Get previous generation performances (sorted by fitness)
+    prev_result = await db.execute(
+        select(CreaturePerformance)
+        .where(
+            CreaturePerformance.run_id == run.id,
+            CreaturePerformance.generation == state.generation - 1
+        )
+        .order_by(CreaturePerformance.fitness.desc())
+    )
+    prev_performances = prev_result.scalars().all()
+
+    if not prev_performances:
+        raise HTTPException(status_code=400, detail="No creatures in previous generation")
+
+    # Load the creature records for genomes
+    creature_ids = [p.creature_id for p in prev_performances]
+    creatures_result = await db.execute(
+        select(Creature).where(Creature.id.in_(creature_ids))
+    )
+    prev_creatures_map = {c.id: c for c in creatures_result.scalars().all()}
+
+    state.genomes = [prev_creatures_map[p.creature_id].genome for p in prev_performances]
+    state.fitness = [p.fitness for p in prev_performances]
+    state.birth_generations = {c.id: c.birth_generation for c in prev_creatures_map.values()}
+
+    # Seed the survivor cache with the previous generation's stored results, so
+    # a freshly loaded run (POST /step, worker restart) skips its survivors too.
+    # They only hit while the next generation keeps the same pellet generation.
+    state.fitness_cache = _fitness_cache(run.id, config)
+    if state.fitness_cache.enabled:
+        previous_gen = state.generation - 1
+        state.fitness_cache.store(
+            state.genomes,
+            [{field: getattr(p, field) for field in _CACHED_FIELDS} for p in prev_performances],
+            _batch_config(config, state.fitness_cache, previous_gen),
+        )
+
+    # Lifetime fitness totals for avg_fitness, in a single GROUP BY query
+    totals_result = await db.execute(
+        select(
+            CreaturePerformance.creature_id,
+            func.sum(CreaturePerformance.fitness),
+            func.count(),
+        )
+        .where(CreaturePerformance.creature_id.in_(creature_ids))
+        .group_by(CreaturePerformance.creature_id)
+    )
+    state.fitness_totals = {cid: (total, count) for cid, total, count in totals_result.all()}
+
+    # Best fitness from all previous generations (adaptive mutation)
+    gen_result = await db.execute(
+        select(Generation.best_fitness)
+        .where(Generation.run_id == run.id)
+        .order_by(Generation.generation)
+    )
+    state.best_fitness_history = [row[0] for row in gen_result.all()]
+
+    return state
+
+
+def _has_frames(sim_result: dict) -> bool:
+    """Whether a simulation result recorded frames."""
+    return sim_result.get("frames_encoded") is not None or bool(sim_result.get("frames"))
+
+
+def _cached_result(sim_result: dict) -> dict:
+    """The fields of a simulation result the survivor cache keeps (no frames)."""
+    return {field: sim_result.get(field) for field in _CACHED_FIELDS}
+
+
+def _encode_frame_row(creature_id: str, generation: int, sim_result: dict) -> dict:
+    """Build the CreatureFrame row for one simulated creature."""
+    binary = settings.frame_format == "binary"
+
+    if sim_result.get("frames_encoded") is not None:
+        frames_data = sim_result["frames_encoded"]
+    elif binary:
+        frames_data = encode_node_frame_rows(
+            sim_result["frames"], settings.frame_precision, settings.frame_delta_encoding
+        )
+    else:
+        frames_data = zlib.compress(json.dumps(sim_result["frames"]).encode())
+
+    # Convert pellets list to pellet_frames format for storage
+    pellet_data = None
+    if sim_result.get("pellets"):
+        pellet_frames = []
+        for p in sim_result["pellets"]:
+            pellet_frames.append({
+                "position": p["position"],
+                "collected_at_frame": p.get("collected_at_frame"),
+                "spawned_at_frame": p.get("spawned_at_frame", 0),
+                "initial_distance": p.get("initial_distance", 5.0),
+            })
+        if binary:
+            pellet_data = encode_pellet_frames(pellet_frames)
+        else:
+            pellet_data = zlib.compress(json.dumps(pellet_frames).encode())
+
+    # Store fitness over time (from backend simulation)
+    fitness_over_time_data = sim_result.get("fitness_over_time_encoded")
+    if fitness_over_time_data is None and sim_result.get("fitness_over_time"):
+        if binary:
+            fitness_over_time_data = encode_fitness_over_time(sim_result["fitness_over_time"])
+        else:
+            fitness_over_time_data = zlib.compress(json.dumps(sim_result["fitness_over_time"]).encode())
+
+    # Store neural network activations per frame
+    activations_data = sim_result.get("activations_encoded")
+    if activations_data is None and sim_result.get("activations_per_frame"):
+        if binary:
+            activations_data = encode_activation_dicts(
+                sim_result["activations_per_frame"], settings.frame_precision
+            )
+        else:
+            activations_data = zlib.compress(json.dumps(sim_result["activations_per_frame"]).encode())
+
+    return {
+        "creature_id": creature_id,
+        "generation": generation,
+        "frames_data": frames_data,
+        "frame_count": sim_result.get("frame_count", 0),
+        "frame_rate": 15,
+        "pellet_frames": pellet_data,
+        "fitness_over_time": fitness_over_time_data,
+        "activations_per_frame": activations_data,
+    }
+
+
+async def compute_generation(
+    state: EvolutionState,
+    simulator: SimulatorService,
+    timer: _PhaseTimer | None = None,
+) -> GenerationOutcome:
+    """
+    Evolve and simulate the next generation of a run (no database access).
+
+    Advances state in place to the new generation, so the same state object
+    can be passed straight back in for the following generation.
+
+    Args:
+        state: Evolution state (from load_evolution_state or a worker)
+        simulator: Simulator service
+        timer: Optional phase timer (evolve, simulate, summarize); its profile
+               records the evolution operator and simulation spans
+
+    Returns:
+        GenerationOutcome to hand to persist_generation
+    """
+    timer = timer or _PhaseTimer()
+    config = state.config
+    current_gen = state.generation
+    run_id = state.run_id
+    innovation_counter = state.innovation_counter
+    use_neat = config.neural_mode == 'neat'
+
+    # Track survivor IDs for animation states
+    survivor_ids: set[str] = set()
+    culled_ids: set[str] = set()  # Creatures that died (for frontend animation)
+
     # Get genomes for this generation
     if current_gen == 0:
         # Generate initial population with neural network support
@@ -145,31 +445,6 @@ async def run_generation(
             neat_initial_connectivity=config.neat_initial_connectivity,
         )
     else:
-        # Get previous generation performances (sorted by fitness)
-        prev_result = await db.execute(
-            select(CreaturePerformance)
-            .where(
-                CreaturePerformance.run_id == run_id,
-                CreaturePerformance.generation == current_gen - 1
-            )
-            .order_by(CreaturePerformance.fitness.desc())
-        )
-        prev_performances = prev_result.scalars().all()
-
-        if not prev_performances:
-            raise HTTPException(status_code=400, detail="No creatures in previous generation")
-
-        # Load the creature records for genomes
-        creature_ids = [p.creature_id for p in prev_performances]
-        creatures_result = await db.execute(
-            select(Creature).where(Creature.id.in_(creature_ids))
-        )
-        prev_creatures_map = {c.id: c for c in creatures_result.scalars().all()}
-
-        # Prepare genomes and fitness scores for evolution
-        prev_genomes = [prev_creatures_map[p.creature_id].genome for p in prev_performances]
-        prev_fitness = [p.fitness for p in prev_performances]
-
         # Build evolution config
         evolution_config = {
             'population_size': config.population_size,
@@ -210,25 +485,14 @@ async def run_generation(
         # Compute adaptive mutation boost if enabled
         adaptive_boost_level = 1.0
         if config.use_adaptive_mutation:
-            # Get best fitness from all previous generations
-            gen_result = await db.execute(
-                select(Generation.best_fitness)
-                .where(Generation.run_id == run_id)
-                .order_by(Generation.generation)
-            )
-            best_fitness_history = [row[0] for row in gen_result.all()]
-
-            # Compute new boost level
             new_boost, new_gens_since_change, decision = compute_adaptive_boost(
-                best_fitness_history=best_fitness_history,
-                current_boost=run.adaptive_boost_level,
-                gens_since_change=run.gens_since_boost_change,
+                best_fitness_history=state.best_fitness_history,
+                current_boost=state.adaptive_boost_level,
+                gens_since_change=state.gens_since_boost_change,
                 config=config,
             )
-
-            # Update run state
-            run.adaptive_boost_level = new_boost
-            run.gens_since_boost_change = new_gens_since_change
+            state.adaptive_boost_level = new_boost
+            state.gens_since_boost_change = new_gens_since_change
             adaptive_boost_level = new_boost
 
         # Pass boost level to evolution config
@@ -236,13 +500,17 @@ async def run_generation(
 
         # Evolve to get new genomes
         # Note: evolve_population preserves survivor IDs, gives new IDs to offspring
-        genomes, evolution_stats = genetics_evolve_population(
-            genomes=prev_genomes,
-            fitness_scores=prev_fitness,
-            config=evolution_config,
-            generation=current_gen - 1,
-            innovation_counter=innovation_counter,
-        )
+        # Runs in a thread (which inherits the profiling context) so speciation and
+        # mutation don't stall websocket forwarding or a pipelined persist
+        with profiling(timer.profile):
+            genomes, evolution_stats = await asyncio.to_thread(
+                genetics_evolve_population,
+                genomes=state.genomes,
+                fitness_scores=state.fitness,
+                config=evolution_config,
+                generation=current_gen - 1,
+                innovation_counter=innovation_counter,
+            )
 
         # Only generate new IDs for offspring (survivalStreak == 0)
         # Survivors keep their original creature ID
@@ -256,47 +524,46 @@ async def run_generation(
         survivor_ids = evolution_stats.survivor_ids or set()
 
         # Calculate culled IDs (creatures from previous gen that didn't survive)
-        all_prev_ids = {p.creature_id for p in prev_performances}
+        all_prev_ids = {g["id"] for g in state.genomes}
         culled_ids = all_prev_ids - survivor_ids
+    timer.end("evolve")
 
-        # Mark culled creatures as dead (based on actual selection method, not truncation)
-        for creature_id in culled_ids:
-            creature = prev_creatures_map.get(creature_id)
-            if creature and creature.death_generation is None:
-                creature.death_generation = current_gen - 1
-
-    # Simulate all creatures
+    # Simulate all creatures (survivors with a valid cached result are skipped)
     start_time = time.time()
-    # Determine frame storage mode: if sparse, we still need to record all frames
-    # for selection later; if none, don't record; if all, record all
-    effective_frame_mode = "all" if config.frame_storage_mode == "sparse" else config.frame_storage_mode
-    sim_results = await simulator.simulate_batch(
-        genomes=genomes,
-        config={
-            "simulation_duration": config.simulation_duration,
-            "frame_storage_mode": effective_frame_mode,
-            "frame_rate": 15,
-            "pellet_count": config.pellet_count,
-            "arena_size": config.arena_size,
-            "max_allowed_frequency": config.max_allowed_frequency,
-            "fitness_pellet_points": config.fitness_pellet_points,
-            "fitness_progress_max": config.fitness_progress_max,
-            "fitness_distance_per_unit": config.fitness_distance_per_unit,
-            "fitness_distance_traveled_max": config.fitness_distance_traveled_max,
-            "fitness_regression_penalty": config.fitness_regression_penalty,
-            "fitness_efficiency_penalty": config.fitness_efficiency_penalty,
-            "neural_dead_zone": config.neural_dead_zone,
-            "use_neural_net": config.use_neural_net,
-            "neural_mode": config.neural_mode,
-            "neural_hidden_size": config.neural_hidden_size,
-            "time_encoding": config.time_encoding,
-            "use_proprioception": config.use_proprioception,
-            "proprioception_inputs": config.proprioception_inputs,
-            # NEAT config
-            "neat_max_hidden_nodes": config.neat_max_hidden_nodes,
-        },
-    )
+    if state.fitness_cache is None:
+        state.fitness_cache = _fitness_cache(run_id, config)
+    fitness_cache = state.fitness_cache
+    batch_config = _batch_config(config, fitness_cache, current_gen)
+    cached = fitness_cache.lookup(genomes, batch_config)
+    missing = [g for g, r in zip(genomes, cached) if r is None]
+    with profiling(timer.profile):
+        fresh = []
+        if missing:
+            fresh = await simulator.simulate_batch(genomes=missing, config=batch_config)
+    sim_results = fill_misses(cached, fresh)
+
+    # The simulator keeps frames per config.frame_storage_mode; cached results
+    # carry none, so re-simulate the creatures among them that storage keeps
+    if config.frame_storage_mode == "all":
+        keep_rows = range(len(genomes))
+    elif config.frame_storage_mode == "sparse":
+        keep_rows = sparse_frame_rows([r["fitness"] for r in sim_results], config)
+    else:
+        keep_rows = []
+    unrecorded = [i for i in keep_rows if not _has_frames(sim_results[i])]
+    with profiling(timer.profile):
+        if unrecorded:
+            recorded = await simulator.simulate_batch(
+                genomes=[genomes[i] for i in unrecorded],
+                config={**batch_config, "frame_storage_mode": "all"},
+            )
+            for i, sim_result in zip(unrecorded, recorded):
+                sim_results[i] = sim_result
+        cached_count = len(genomes) - len(missing) - len(unrecorded)
+        increment("simulate.cached", cached_count)
+    fitness_cache.store(genomes, [_cached_result(r) for r in sim_results], batch_config)
     simulation_time_ms = int((time.time() - start_time) * 1000)
+    timer.end("simulate")
 
     # Calculate statistics
     fitnesses = [r["fitness"] for r in sim_results]
@@ -312,201 +579,102 @@ async def run_generation(
         node_count = str(len(genome["nodes"]))
         creature_types[node_count] = creature_types.get(node_count, 0) + 1
 
-    # Create generation record
-    generation = Generation(
-        run_id=run_id,
-        generation=current_gen,
-        best_fitness=best_fitness,
-        avg_fitness=avg_fitness,
-        worst_fitness=worst_fitness,
-        median_fitness=median_fitness,
-        creature_types=creature_types,
-        simulation_time_ms=simulation_time_ms,
-    )
-    db.add(generation)
-
-    # Determine which creatures get frame storage based on config.frame_storage_mode
-    sorted_results = sorted(
-        zip(genomes, sim_results),
-        key=lambda x: x[1]["fitness"],
-        reverse=True,
-    )
-    keep_frames_ids = set()
+    # Generation record
+    generation_row = {
+        "run_id": run_id,
+        "generation": current_gen,
+        "best_fitness": best_fitness,
+        "avg_fitness": avg_fitness,
+        "worst_fitness": worst_fitness,
+        "median_fitness": median_fitness,
+        "creature_types": creature_types,
+        "simulation_time_ms": simulation_time_ms,
+    }
 
-    if config.frame_storage_mode == "all":
-        # Store frames for all creatures
-        for genome, _ in sorted_results:
-            keep_frames_ids.add(genome["id"])
-    elif config.frame_storage_mode == "sparse":
-        # Use config values for sparse storage (top N + bottom N + random from middle)
-        top_count = config.sparse_top_count
-        bottom_count = config.sparse_bottom_count
-
-        # Top N
-        for genome, _ in sorted_results[:top_count]:
-            keep_frames_ids.add(genome["id"])
-
-        # Bottom N
-        for genome, _ in sorted_results[-bottom_count:]:
-            keep_frames_ids.add(genome["id"])
-
-        # Random N from middle (use settings.frames_keep_random for middle selection)
-        import random
-        middle = sorted_results[top_count:-bottom_count] if bottom_count > 0 else sorted_results[top_count:]
-        random.shuffle(middle)
-        for genome, _ in middle[:settings.frames_keep_random]:
-            keep_frames_ids.add(genome["id"])
-    # else: frame_storage_mode == "none" -> keep_frames_ids stays empty
-
-    # Create/update creature records and performance records
-    # Track creature objects for lifecycle info in response
-    creature_records: dict[str, Creature] = {}
+    # Creature, performance and frame rows. Survivors keep their record (only
+    # streak and stored genome change); everyone else gets a new creature row.
+    creature_rows: list[dict] = []
+    survivor_updates: list[dict] = []
+    performance_rows: list[dict] = []
+    frame_rows: list[dict] = []
+    stored_genomes: list[dict] = []
+    birth_generations: dict[str, int] = {}
 
     for genome, sim_result in zip(genomes, sim_results):
         creature_id = genome["id"]
         survival_streak = genome.get("survivalStreak", genome.get("survival_streak", 0))
         is_survivor = survival_streak > 0 and current_gen > 0
 
-        if is_survivor:
-            # Survivor: Update existing creature record
-            result = await db.execute(
-                select(Creature).where(Creature.id == creature_id)
+        if is_survivor and creature_id in state.birth_generations:
+            # Survivor: Update existing creature record (genome with new survivalStreak value)
+            survivor_updates.append(
+                {"id": creature_id, "survival_streak": survival_streak, "genome": genome}
             )
-            creature = result.scalar_one_or_none()
-            if creature:
-                creature.survival_streak = survival_streak
-                # Update genome with new survivalStreak value
-                updated_genome = dict(creature.genome)
-                updated_genome['survivalStreak'] = survival_streak
-                creature.genome = updated_genome
-            else:
-                # Shouldn't happen, but handle gracefully
-                creature = Creature(
-                    id=creature_id,
-                    run_id=run_id,
-                    genome=genome,
-                    birth_generation=current_gen,
-                    survival_streak=survival_streak,
-                    is_elite=False,
-                    parent_ids=genome.get("parentIds", genome.get("parent_ids", [])),
-                )
-                db.add(creature)
+            birth_generations[creature_id] = state.birth_generations[creature_id]
         else:
-            # New offspring: Create new creature record
-            creature = Creature(
-                id=creature_id,
-                run_id=run_id,
-                genome=genome,
-                birth_generation=current_gen,
-                survival_streak=0,
-                is_elite=False,
-                parent_ids=genome.get("parentIds", genome.get("parent_ids", [])),
-            )
-            db.add(creature)
-
-        # Track for lifecycle info in response
-        creature_records[creature_id] = creature
-
-        # Create performance record for this generation
-        performance = CreaturePerformance(
-            creature_id=creature_id,
-            generation=current_gen,
-            run_id=run_id,
-            fitness=sim_result["fitness"],
-            pellets_collected=sim_result["pellets_collected"],
-            disqualified=sim_result["disqualified"],
-            disqualified_reason=sim_result.get("disqualified_reason"),
-        )
-        db.add(performance)
-
-        # Store frames if this creature is in the keep set
-        if creature_id in keep_frames_ids and sim_result.get("frames"):
-            frames_data = zlib.compress(json.dumps(sim_result["frames"]).encode())
-
-            # Convert pellets list to pellet_frames format for storage
-            pellet_data = None
-            if sim_result.get("pellets"):
-                pellet_frames = []
-                for p in sim_result["pellets"]:
-                    pellet_frames.append({
-                        "position": p["position"],
-                        "collected_at_frame": p.get("collected_at_frame"),
-                        "spawned_at_frame": p.get("spawned_at_frame", 0),
-                        "initial_distance": p.get("initial_distance", 5.0),
-                    })
-                pellet_data = zlib.compress(json.dumps(pellet_frames).encode())
-
-            # Store fitness over time (from backend simulation)
-            fitness_over_time_data = None
-            if sim_result.get("fitness_over_time"):
-                fitness_over_time_data = zlib.compress(json.dumps(sim_result["fitness_over_time"]).encode())
-
-            # Store neural network activations per frame
-            activations_data = None
-            if sim_result.get("activations_per_frame"):
-                activations_data = zlib.compress(json.dumps(sim_result["activations_per_frame"]).encode())
-
-            creature_frame = CreatureFrame(
-                creature_id=creature_id,
-                generation=current_gen,
-                frames_data=frames_data,
-                frame_count=sim_result.get("frame_count", 0),
-                frame_rate=15,
-                pellet_frames=pellet_data,
-                fitness_over_time=fitness_over_time_data,
-                activations_per_frame=activations_data,
-            )
-            db.add(creature_frame)
-
-    # Update run
-    run.current_generation = current_gen + 1
-    run.generation_count = current_gen + 1
+            # New offspring (or a survivor whose record is missing): create creature record
+            creature_rows.append({
+                "id": creature_id,
+                "run_id": run_id,
+                "genome": genome,
+                "birth_generation": current_gen,
+                "survival_streak": survival_streak if is_survivor else 0,
+                "is_elite": False,
+                "parent_ids": genome.get("parentIds", genome.get("parent_ids", [])),
+            })
+            birth_generations[creature_id] = current_gen
+        stored_genomes.append(genome)
+
+        # Performance record for this generation
+        performance_rows.append({
+            "creature_id": creature_id,
+            "generation": current_gen,
+            "run_id": run_id,
+            "fitness": sim_result["fitness"],
+            "pellets_collected": sim_result["pellets_collected"],
+            "disqualified": sim_result["disqualified"],
+            "disqualified_reason": sim_result.get("disqualified_reason"),
+        })
 
-    if best_fitness > run.best_fitness:
-        run.best_fitness = best_fitness
-        # Find the best creature
-        best_creature = max(zip(genomes, sim_results), key=lambda x: x[1]["fitness"])
-        run.best_creature_id = best_creature[0]["id"]
-        run.best_creature_generation = current_gen
+        # Store the frames the simulation kept
+        if _has_frames(sim_result):
+            frame_rows.append(_encode_frame_row(creature_id, current_gen, sim_result))
 
-    # Update longest survivor tracking
+    # Best creature and longest survivor of this generation
+    best_genome, _ = max(zip(genomes, sim_results), key=lambda x: x[1]["fitness"])
+    longest_survivor = None
     for genome in genomes:
         streak = genome.get("survivalStreak", genome.get("survival_streak", 0))
-        if streak > run.longest_survivor_streak:
-            run.longest_survivor_streak = streak
-            run.longest_survivor_id = genome["id"]
-            run.longest_survivor_generation = current_gen
-
-    # Save NEAT innovation counter state
-    if innovation_counter is not None:
-        run.innovation_counter_connection = innovation_counter.next_connection
-        run.innovation_counter_node = innovation_counter.next_node
+        if longest_survivor is None or streak > longest_survivor[0]:
+            longest_survivor = (streak, genome["id"])
 
-    await db.commit()
+    # Advance the in-memory state to this generation
+    fitness_totals = {}
+    for genome, sim_result in zip(genomes, sim_results):
+        total, count = state.fitness_totals.get(genome["id"], (0.0, 0))
+        fitness_totals[genome["id"]] = (total + sim_result["fitness"], count + 1)
+    ranked = sorted(
+        zip(stored_genomes, (r["fitness"] for r in sim_results)),
+        key=lambda x: x[1],
+        reverse=True,
+    )
+    state.genomes = [g for g, _ in ranked]
+    state.fitness = [f for _, f in ranked]
+    state.birth_generations = birth_generations
+    state.fitness_totals = fitness_totals
+    state.best_fitness_history.append(best_fitness)
+    state.generation = current_gen + 1
 
     # Build creature data for frontend display
-    # First, batch compute avg_fitness for creatures with survival_streak > 1
-    creatures_needing_avg = [
-        genome["id"] for genome in genomes
-        if genome.get("survivalStreak", genome.get("survival_streak", 0)) > 1
-    ]
-    avg_fitness_map: dict[str, float] = {}
-    if creatures_needing_avg:
-        # Compute avg_fitness in one query per creature (could be optimized to single query)
-        for cid in creatures_needing_avg:
-            result = await db.execute(
-                select(func.avg(CreaturePerformance.fitness))
-                .where(CreaturePerformance.creature_id == cid)
-            )
-            avg = result.scalar_one_or_none()
-            if avg is not None:
-                avg_fitness_map[cid] = round(avg, 1)
-
+    framed_ids = {row["creature_id"] for row in frame_rows}
     creatures_data = []
     for genome, sim_result in zip(genomes, sim_results):
         creature_id = genome["id"]
-        creature = creature_records.get(creature_id)
         survival_streak = genome.get("survivalStreak", genome.get("survival_streak", 0))
+        avg_fitness_value = None
+        if survival_streak > 1:
+            total, count = fitness_totals[creature_id]
+            avg_fitness_value = round(total / count, 1)
         creatures_data.append({
             "id": creature_id,
             "genome": genome,
@@ -516,11 +684,12 @@ async def run_generation(
             "disqualified_reason": sim_result.get("disqualified_reason"),
             "is_survivor": creature_id in survivor_ids,
             "parent_ids": genome.get("parentIds", genome.get("parent_ids", [])),
-            "has_frames": creature_id in keep_frames_ids,
+            "has_frames": creature_id in framed_ids,
             "survival_streak": survival_streak,
-            "birth_generation": creature.birth_generation if creature else None,
-            "death_generation": creature.death_generation if creature else None,
-            "avg_fitness": avg_fitness_map.get(creature_id) if survival_streak > 1 else None,
+            "birth_generation": birth_generations[creature_id],
+            # Everyone in the current population is alive
+            "death_generation": None,
+            "avg_fitness": avg_fitness_value,
         })
 
     # Build response
@@ -531,6 +700,7 @@ async def run_generation(
         "worst_fitness": worst_fitness,
         "median_fitness": median_fitness,
         "simulation_time_ms": simulation_time_ms,
+        "cached_count": cached_count,  # Survivors whose cached result was reused
         "creature_count": len(genomes),
         "creatures": creatures_data,
         "culled_ids": list(culled_ids),  # Creatures from previous gen that died
@@ -542,27 +712,368 @@ async def run_generation(
             "next_connection": innovation_counter.next_connection,
             "next_node": innovation_counter.next_node,
         }
+    timer.end("summarize")
+
+    return GenerationOutcome(
+        generation=current_gen,
+        generation_row=generation_row,
+        creature_rows=creature_rows,
+        survivor_updates=survivor_updates,
+        performance_rows=performance_rows,
+        frame_rows=frame_rows,
+        culled_ids=culled_ids,
+        best_creature_id=best_genome["id"],
+        longest_survivor=longest_survivor,
+        adaptive_boost_level=state.adaptive_boost_level,
+        gens_since_boost_change=state.gens_since_boost_change,
+        innovation_counter=innovation_counter,
+        response=response,
+    )
+
+
+async def persist_generation(
+    run: Run,
+    outcome: GenerationOutcome,
+    db: AsyncSession,
+    timer: _PhaseTimer | None = None,
+) -> None:
+    """
+    Write a computed generation and commit.
+
+    Uses bulk statements throughout: multi-row INSERTs (insertmanyvalues) for
+    new creatures, performances and frames, a bulk UPDATE by primary key for
+    survivors and one UPDATE for culled creatures.
+    """
+    current_gen = outcome.generation
+    generation = Generation(**outcome.generation_row)
+    db.add(generation)
+
+    with profiling(timer.profile if timer else None):
+        # Mark culled creatures as dead (based on actual selection method, not truncation)
+        with span("persist.update_creatures"):
+            if outcome.culled_ids:
+                await db.execute(
+                    update(Creature)
+                    .where(Creature.id.in_(outcome.culled_ids), Creature.death_generation.is_(None))
+                    .values(death_generation=current_gen - 1)
+                )
+            if outcome.survivor_updates:
+                await db.execute(update(Creature), outcome.survivor_updates)
+
+            # Flush ORM changes first (generation row is the FK target of performances)
+            await db.flush()
+        with span("persist.insert_creatures"):
+            if outcome.creature_rows:
+                await db.execute(insert(Creature), outcome.creature_rows)
+            if outcome.performance_rows:
+                await db.execute(insert(CreaturePerformance), outcome.performance_rows)
+        with span("persist.insert_frames"):
+            if outcome.frame_rows:
+                await db.execute(insert(CreatureFrame), outcome.frame_rows)
+        row_count = (
+            len(outcome.creature_rows) + len(outcome.performance_rows) + len(outcome.frame_rows)
+        )
+        increment("persist.rows", row_count)
+
+    # Update run
+    run.current_generation = current_gen + 1
+    run.generation_count = current_gen + 1
+    run.adaptive_boost_level = outcome.adaptive_boost_level
+    run.gens_since_boost_change = outcome.gens_since_boost_change
+
+    best_fitness = outcome.generation_row["best_fitness"]
+    if best_fitness > run.best_fitness:
+        run.best_fitness = best_fitness
+        run.best_creature_id = outcome.best_creature_id
+        run.best_creature_generation = current_gen
+
+    # Update longest survivor tracking
+    if outcome.longest_survivor is not None:
+        streak, creature_id = outcome.longest_survivor
+        if streak > run.longest_survivor_streak:
+            run.longest_survivor_streak = streak
+            run.longest_survivor_id = creature_id
+            run.longest_survivor_generation = current_gen
+
+    # Save NEAT innovation counter state
+    if outcome.innovation_counter is not None:
+        run.innovation_counter_connection = outcome.innovation_counter.next_connection
+        run.innovation_counter_node = outcome.innovation_counter.next_node
+    if timer:
+        timer.end("persist")
+        generation.phase_timings = timer.report()
+
+    await db.commit()
+    if timer:
+        timer.end("commit")
+
+
+async def run_generation(
+    run_id: str,
+    db: AsyncSession,
+    simulator: SimulatorService,
+) -> dict:
+    """
+    Run a single generation of evolution.
+
+    The response includes phase_timings_ms: wall time per phase (load, evolve,
+    simulate, summarize, persist, commit), and profile: the spans and counters
+    recorded inside them (app.core.profiling), unless settings.phase_profiling
+    is off. Both except commit are also stored in Generation.phase_timings.
+    """
+    timer = _PhaseTimer()
+
+    # Get the run
+    result = await db.execute(select(Run).where(Run.id == run_id))
+    run = result.scalar_one_or_none()
+    if not run:
+        raise HTTPException(status_code=404, detail="Run not found")
+
+    state = await load_evolution_state(run, db)
+    timer.end("load")
+
+    outcome = await compute_generation(state, simulator, timer)
+
+    await persist_generation(run, outcome, db, timer)
+
+    return _finish_response(outcome.response, timer)
 
-    return response
 
+# =============================================================================
+# Background Evolution Worker
+# =============================================================================
+
+class EvolutionWorker:
+    """
+    Long-lived, in-process evolution worker for one run.
+
+    Keeps the population, fitness history and innovation counter in memory
+    between generations (the database is only read on the first generation or
+    after another writer advanced the run), and persists each generation in the
+    background while the next one is evolved and simulated. Per-generation
+    summaries are broadcast to subscribers (the /{run_id}/ws websocket).
+    """
+
+    def __init__(self, run_id: str, session_factory=async_session_maker):
+        self.run_id = run_id
+        self._session_factory = session_factory
+        self._simulator = SimulatorService(cache_neat_genomes=True)
+        self._state: EvolutionState | None = None
+        self._lock = asyncio.Lock()  # One generation computes at a time
+        self._persist_task: asyncio.Task | None = None
+        self._task: asyncio.Task | None = None
+        self._stop_requested = False
+        self._subscribers: set[asyncio.Queue] = set()
+        self._steps = 0  # step() calls in progress or waiting for the lock
+
+    @property
+    def running(self) -> bool:
+        """Whether a multi-generation run is in progress."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def idle(self) -> bool:
+        """No background run, subscriber or pending step (safe to discard)."""
+        return not self.running and not self._subscribers and self._steps == 0
+
+    def subscribe(self) -> asyncio.Queue:
+        """Register a queue that receives every broadcast message."""
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self._subscribers.discard(queue)
+
+    def _publish(self, message: dict) -> None:
+        for queue in self._subscribers:
+            queue.put_nowait(message)
+
+    async def _load_state(self, db: AsyncSession) -> Run:
+        """Load the run, (re)building the in-memory state if it is missing or stale."""
+        result = await db.execute(select(Run).where(Run.id == self.run_id))
+        run = result.scalar_one_or_none()
+        if not run:
+            raise HTTPException(status_code=404, detail="Run not found")
+        if self._state is None or self._state.generation != run.current_generation:
+            self._state = await load_evolution_state(run, db)
+        return run
+
+    async def _compute(self, timer: _PhaseTimer) -> GenerationOutcome:
+        """Evolve and simulate the next generation from the in-memory state."""
+        if self._state is None:
+            async with self._session_factory() as db:
+                await self._load_state(db)
+            timer.end("load")
+        try:
+            return await compute_generation(self._state, self._simulator, timer)
+        except BaseException:
+            # State may be partially advanced; rebuild it from the database next time
+            self._state = None
+            raise
+
+    async def _persist(
+        self,
+        outcome: GenerationOutcome,
+        timer: _PhaseTimer,
+        db: AsyncSession | None = None,
+    ) -> dict:
+        """Write a generation (in its own session unless one is given) and broadcast its summary."""
+        try:
+            if db is None:
+                async with self._session_factory() as session:
+                    run = await session.get(Run, self.run_id)
+                    await persist_generation(run, outcome, session, timer)
+            else:
+                await persist_generation(await db.get(Run, self.run_id), outcome, db, timer)
+        except BaseException:
+            self._state = None
+            raise
+        response = _finish_response(outcome.response, timer)
+        self._publish({"type": "generation_complete", "data": response})
+        return response
+
+    async def _drain_persist(self) -> None:
+        """Wait for the in-flight persist (if any) to finish."""
+        task, self._persist_task = self._persist_task, None
+        if task is not None:
+            await task
+
+    async def step(self, db: AsyncSession | None = None) -> dict:
+        """
+        Run, persist and broadcast a single generation.
+
+        Steps are serialized on the worker lock, so concurrent callers (POST
+        /step, websocket "step" commands) each compute a different generation.
+
+        Args:
+            db: Session to load and persist with (POST /step passes the
+                request's); None opens sessions from the worker's factory
+        """
+        if self.running:
+            raise HTTPException(status_code=409, detail="Evolution is already running")
+        self._steps += 1
+        try:
+            async with self._lock:
+                await self._drain_persist()
+                timer = _PhaseTimer()
+                # Another writer may have advanced the run
+                if db is None:
+                    async with self._session_factory() as session:
+                        await self._load_state(session)
+                else:
+                    await self._load_state(db)
+                timer.end("load")
+                outcome = await self._compute(timer)
+                return await self._persist(outcome, timer, db)
+        finally:
+            self._steps -= 1
+
+    def start(self, generations: int) -> None:
+        """Start running the given number of generations in the background."""
+        if self.running:
+            raise HTTPException(status_code=409, detail="Evolution is already running")
+        self._stop_requested = False
+        self._task = asyncio.create_task(self._run(generations))
+        self._task.add_done_callback(lambda _: release_evolution_worker(self))
+
+    async def stop(self) -> None:
+        """Stop after the current generation and wait for it to be persisted."""
+        self._stop_requested = True
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def _run(self, generations: int) -> None:
+        status = "paused"
+        try:
+            async with self._lock:
+                async with self._session_factory() as db:
+                    await self._load_state(db)
+                for _ in range(generations):
+                    if self._stop_requested:
+                        break
+                    timer = _PhaseTimer()
+                    outcome = await self._compute(timer)
+                    # Pipeline: generation N is written while N+1 is computed
+                    await self._drain_persist()
+                    self._persist_task = asyncio.create_task(self._persist(outcome, timer))
+                await self._drain_persist()
+                if not self._stop_requested:
+                    status = "completed"
+        except Exception as e:
+            status = "failed"
+            self._publish({"type": "error", "message": str(e)})
+        finally:
+            if self._persist_task is not None:
+                await asyncio.gather(self._persist_task, return_exceptions=True)
+                self._persist_task = None
+            async with self._session_factory() as db:
+                await db.execute(update(Run).where(Run.id == self.run_id).values(status=status))
+                await db.commit()
+            self._publish({"type": "run_complete", "status": status})
+
+
+_workers: dict[str, EvolutionWorker] = {}
+
+
+def get_evolution_worker(run_id: str) -> EvolutionWorker:
+    """Get (or create) the evolution worker for a run."""
+    worker = _workers.get(run_id)
+    if worker is None:
+        worker = EvolutionWorker(run_id)
+        _workers[run_id] = worker
+    return worker
+
+
+def release_evolution_worker(worker: EvolutionWorker) -> None:
+    """
+    Drop a worker once it is idle.
+
+    Frees its in-memory population and simulator (NEAT genome cache); the next
+    request for the run creates a new worker, which reloads from the database.
+    """
+    if worker.idle and _workers.get(worker.run_id) is worker:
+        del _workers[worker.run_id]
+
+
+async def shutdown_evolution_workers() -> None:
+    """Stop all evolution workers (called on application shutdown)."""
+    workers = list(_workers.values())
+    _workers.clear()
+    for worker in workers:
+        await worker.stop()
+
+
+# =============================================================================
+# Endpoints
+# =============================================================================
 
 @router.post("/{run_id}/step")
 async def evolution_step(
     run_id: str,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
-    """Run a single generation of evolution."""
-    simulator = SimulatorService()
+    """
+    Run a single generation of evolution.
 
-    result = await run_generation(run_id, db, simulator)
-    return result
+    Goes through the run's worker, so it is serialized with websocket steps
+    and rejected while a background run is in progress. The summary is also
+    broadcast to the run's websocket subscribers.
+    """
+    worker = get_evolution_worker(run_id)
+    try:
+        return await worker.step(db)
+    except SimulationQueueFullError as e:
+        # Backpressure: tell the client to retry instead of queueing unbounded work
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+    finally:
+        release_evolution_worker(worker)
 
 
 @router.post("/{run_id}/run")
 async def run_evolution(
     run_id: str,
     generations: int,
-    background_tasks: BackgroundTasks,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """Start running evolution for N generations in the background."""
@@ -572,43 +1083,106 @@ async def run_evolution(
     if not run:
         raise HTTPException(status_code=404, detail="Run not found")
 
+    worker = get_evolution_worker(run_id)
+    if worker.running:
+        raise HTTPException(status_code=409, detail="Evolution is already running")
+
     # Update status
     run.status = "running"
     await db.commit()
 
-    # TODO: Add background task to run generations
-    # For now, we'll use WebSocket for real-time updates
+    # Summaries are streamed over /{run_id}/ws as each generation is persisted
+    worker.start(generations)
 
     return {"message": f"Started evolution for {generations} generations", "run_id": run_id}
 
 
+@router.post("/{run_id}/stop")
+async def stop_evolution(run_id: str):
+    """Stop a background evolution run after the current generation."""
+    worker = _workers.get(run_id)
+    if worker is None or not worker.running:
+        raise HTTPException(status_code=409, detail="Evolution is not running")
+    await worker.stop()
+    return {"message": "Evolution stopped", "run_id": run_id}
+
+
 @router.websocket("/{run_id}/ws")
 async def evolution_websocket(
     websocket: WebSocket,
     run_id: str,
 ):
-    """WebSocket for real-time evolution updates."""
+    """
+    WebSocket for real-time evolution updates.
+
+    Streams {"type": "generation_complete", "data": summary} for every
+    generation the run's worker completes (whether started by POST /run or by
+    a "step" command), and {"type": "run_complete", "status": ...} when a
+    background run ends. Commands: {"command": "step"}, {"command": "run",
+    "generations": N} and {"command": "stop"}.
+    """
+    async with async_session_maker() as db:
+        run = await db.get(Run, run_id)
+    if run is None:
+        await websocket.close(code=1008, reason="Run not found")
+        return
+
     await websocket.accept()
+    worker = get_evolution_worker(run_id)
+    queue = worker.subscribe()
 
+    async def forward_updates():
+        while True:
+            await websocket.send_json(await queue.get())
+
+    async def step():
+        try:
+            # Summary arrives through the subscription queue
+            await worker.step()
+        except HTTPException as e:
+            await websocket.send_json({"type": "error", "message": e.detail})
+        except Exception as e:
+            await websocket.send_json({"type": "error", "message": str(e)})
+
+    forwarder = asyncio.create_task(forward_updates())
+    # Steps run as tasks, like "run", so commands keep being read meanwhile
+    steps: set[asyncio.Task] = set()
     try:
         while True:
             # Wait for commands from client
             data = await websocket.receive_json()
             command = data.get("command")
 
-            if command == "step":
-                # Run one generation and send results
-                # Note: Would need to create a new db session here
-                await websocket.send_json({
-                    "type": "generation_complete",
-                    "data": {"message": "WebSocket evolution not yet implemented"},
-                })
-
-            elif command == "stop":
-                await websocket.send_json({"type": "stopped"})
-                break
-
+            try:
+                if command == "step":
+                    task = asyncio.create_task(step())
+                    steps.add(task)
+                    task.add_done_callback(steps.discard)
+
+                elif command == "run":
+                    worker.start(int(data.get("generations", 1)))
+
+                elif command == "stop":
+                    # Stop after the current generation, stepped or run
+                    await worker.stop()
+                    await asyncio.gather(*steps, return_exceptions=True)
+                    await websocket.send_json({"type": "stopped"})
+                    break
+            except HTTPException as e:
+                await websocket.send_json({"type": "error", "message": e.detail})
+
+    except WebSocketDisconnect:
+        pass
     except Exception as e:
         await websocket.send_json({"type": "error", "message": str(e)})
     finally:
-        await websocket.close()
+        # In-flight steps still persist their generation
+        await asyncio.gather(*steps, return_exceptions=True)
+        worker.unsubscribe(queue)
+        release_evolution_worker(worker)
+        forwarder.cancel()
+        await asyncio.gather(forwarder, return_exceptions=True)
+        try:
+            await websocket.close()
+        except RuntimeError:
+            pass  # Already closed by the client
@@ -261,6 +261,7 @@ async def list_generations(
             "median_fitness": gen.median_fitness,
             "creature_types": gen.creature_types,
             "simulation_time_ms": gen.simulation_time_ms,
+            "phase_timings": gen.phase_timings,
             "creature_count": counts.get(gen.generation, 0),
         }
         response.append(GenerationRead(**gen_dict))
@@ -351,6 +352,7 @@ async def get_generation(
         median_fitness=gen.median_fitness,
         creature_types=gen.creature_types,
         simulation_time_ms=gen.simulation_time_ms,
+        phase_timings=gen.phase_timings,
         creature_count=creature_count,
     )
 
@@ -170,6 +170,7 @@ async def fork_run(
             median_fitness=gen.median_fitness,
             creature_types=gen.creature_types,
             simulation_time_ms=gen.simulation_time_ms,
+            phase_timings=gen.phase_timings,
         )
         db.add(new_gen)
 
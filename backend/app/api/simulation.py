@@ -7,7 +7,7 @@ Provides endpoints for running batched physics simulations using PyTorch.
 import time
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
 
 from app.schemas.simulation import (
     BatchSimulationRequest,
@@ -16,6 +16,7 @@ from app.schemas.simulation import (
     SimulationResult,
 )
 from app.schemas.genome import CreatureGenome
+from app.services.executor import SimulationQueueFullError
 from app.services.simulator import SimulatorService
 
 router = APIRouter()
@@ -26,21 +27,44 @@ def get_simulator() -> SimulatorService:
     return SimulatorService()
 
 
+async def _run_batch(
+    simulator: SimulatorService,
+    request: BatchSimulationRequest,
+) -> BatchSimulationResponse:
+    """Simulate a request on the shared simulation executor."""
+    start_time = time.time()
+    genomes = [g.model_dump(by_alias=True) for g in request.genomes]
+
+    try:
+        results = await simulator.simulate_batch(genomes, request.config)
+    except SimulationQueueFullError as e:
+        # Backpressure: tell the client to retry instead of queueing unbounded work
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+
+    elapsed_ms = int((time.time() - start_time) * 1000)
+    return BatchSimulationResponse(
+        results=results,
+        total_time_ms=elapsed_ms,
+        creatures_per_second=len(genomes) / (elapsed_ms / 1000) if elapsed_ms > 0 else 0.0,
+    )
+
+
 @router.post("/batch", response_model=BatchSimulationResponse)
-def simulate_batch(
+async def simulate_batch(
     request: BatchSimulationRequest,
     simulator: Annotated[SimulatorService, Depends(get_simulator)],
 ):
     """
     Simulate a batch of creatures and return their fitness results.
 
-    Uses PyTorch batched physics for efficient parallel simulation.
+    Uses PyTorch batched physics for efficient parallel simulation. Runs on
+    the bounded simulation executor; returns 503 when it is at capacity.
     """
-    return simulator.simulate_batch_sync(request)
+    return await _run_batch(simulator, request)
 
 
 @router.post("/single", response_model=SimulationResult)
-def simulate_single(
+async def simulate_single(
     genome: CreatureGenome,
     config: SimulationConfig | None = None,
     simulator: Annotated[SimulatorService, Depends(get_simulator)] = None,
@@ -57,6 +81,6 @@ def simulate_single(
         config = SimulationConfig()
 
     request = BatchSimulationRequest(genomes=[genome], config=config)
-    response = simulator.simulate_batch_sync(request)
+    response = await _run_batch(simulator, request)
 
     return response.results[0]
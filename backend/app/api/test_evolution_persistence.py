@@ -0,0 +1,194 @@
+"""
+Tests for bulk persistence in run_generation (/api/evolution/{run_id}/step).
+"""
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base, get_db
+from app.main import app
+from app.models import Creature, CreatureFrame, CreaturePerformance
+
+
+@pytest.fixture
+async def test_session():
+    """Create an in-memory test database with a shared session."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        echo=False,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+    session = async_session()
+
+    yield session
+
+    await session.close()
+    await engine.dispose()
+
+
+@pytest.fixture
+async def async_client(test_session):
+    """Create a test client with dependency override using shared session."""
+
+    async def override_get_db():
+        yield test_session
+
+    app.dependency_overrides[get_db] = override_get_db
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+    app.dependency_overrides.clear()
+
+
+async def _create_run(client: AsyncClient, **config) -> str:
+    response = await client.post(
+        "/api/runs",
+        json={
+            "name": "Bulk Persistence",
+            "config": {
+                "population_size": 12, "cull_percentage": 0.5, "simulation_duration": 1, **config,
+            },
+        },
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+class TestBulkPersistence:
+    """Each step writes one creature/performance row per genome and reports timings."""
+
+    async def test_rows_written_per_generation(
+        self, async_client: AsyncClient, test_session: AsyncSession
+    ):
+        run_id = await _create_run(async_client)
+
+        for gen in range(3):
+            response = await async_client.post(f"/api/evolution/{run_id}/step")
+            assert response.status_code == 200
+            data = response.json()
+            assert data["generation"] == gen
+
+            performances = await test_session.scalar(
+                select(func.count()).select_from(CreaturePerformance).where(
+                    CreaturePerformance.run_id == run_id, CreaturePerformance.generation == gen
+                )
+            )
+            assert performances == data["creature_count"] == 12
+
+        # Survivors are updated in place, never duplicated
+        creatures = await test_session.scalar(
+            select(func.count()).select_from(Creature).where(Creature.run_id == run_id)
+        )
+        distinct_ids = await test_session.scalar(
+            select(func.count(func.distinct(CreaturePerformance.creature_id))).where(
+                CreaturePerformance.run_id == run_id
+            )
+        )
+        assert creatures == distinct_ids
+
+        # Lifecycle and avg fitness (single GROUP BY) in the response
+        for creature in data["creatures"]:
+            assert creature["birth_generation"] is not None
+            if creature["survival_streak"] > 1:
+                assert creature["avg_fitness"] is not None
+            if creature["survival_streak"] > 0:
+                assert creature["birth_generation"] < data["generation"]
+
+    async def test_phase_timings(self, async_client: AsyncClient):
+        run_id = await _create_run(async_client)
+
+        for _ in range(2):
+            response = await async_client.post(f"/api/evolution/{run_id}/step")
+            timings = response.json()["phase_timings_ms"]
+            assert set(timings) == {"load", "evolve", "simulate", "persist", "commit", "summarize"}
+            assert all(v >= 0 for v in timings.values())
+
+            profile = response.json()["profile"]
+            assert {"simulate.pack_genomes", "simulate.physics_step", "simulate.marshal_results",
+                    "persist.insert_creatures"} <= set(profile["spans"])
+            assert profile["counters"]["simulate.creatures"] > 0
+
+        # Second step evolved a population
+        assert {"evolve.selection", "evolve.mutation"} <= set(profile["spans"])
+
+        stored = await async_client.get(f"/api/runs/{run_id}/generations/1")
+        timings = stored.json()["phase_timings"]
+        assert set(timings["phases"]) == {"load", "evolve", "simulate", "summarize", "persist"}
+        assert timings["spans"].keys() == profile["spans"].keys()
+
+    async def test_survivor_cache_seeded_from_database(self, async_client: AsyncClient):
+        run_id = await _create_run(async_client, survivor_reevaluation="never")
+
+        # Every POST /step loads the run from the database
+        first = (await async_client.post(f"/api/evolution/{run_id}/step")).json()
+        second = (await async_client.post(f"/api/evolution/{run_id}/step")).json()
+
+        previous = {c["id"]: c["fitness"] for c in first["creatures"]}
+        survivors = [c for c in second["creatures"] if c["id"] in previous]
+        assert survivors and second["cached_count"] == len(survivors)
+        for creature in survivors:
+            assert creature["fitness"] == previous[creature["id"]]
+
+    async def test_frames_bulk_inserted(
+        self, async_client: AsyncClient, test_session: AsyncSession
+    ):
+        run_id = await _create_run(async_client, frame_storage_mode="all")
+
+        response = await async_client.post(f"/api/evolution/{run_id}/step")
+        creature_id = response.json()["creatures"][0]["id"]
+
+        frames = await test_session.scalar(select(func.count()).select_from(CreatureFrame))
+        assert frames == 12
+
+        replay = await async_client.get(f"/api/creatures/{creature_id}/frames")
+        assert replay.status_code == 200
+        assert len(replay.json()["frames_data"]) == replay.json()["frame_count"]
+
+    async def test_cached_survivors_keep_frames(
+        self, async_client: AsyncClient, test_session: AsyncSession
+    ):
+        run_id = await _create_run(
+            async_client, survivor_reevaluation="never", frame_storage_mode="all"
+        )
+
+        # The second step reloads the run: its survivors hit the seeded (frameless) cache
+        await async_client.post(f"/api/evolution/{run_id}/step")
+        second = (await async_client.post(f"/api/evolution/{run_id}/step")).json()
+
+        framed = set(await test_session.scalars(
+            select(CreatureFrame.creature_id).where(CreatureFrame.generation == 1)
+        ))
+        assert framed == {c["id"] for c in second["creatures"] if c["has_frames"]}
+        assert len(framed) == second["creature_count"]
+
+        survivor = next(c for c in second["creatures"] if c["survival_streak"] > 0)
+        replay = await async_client.get(f"/api/creatures/{survivor['id']}/frames?generation=1")
+        assert replay.status_code == 200
+
+    async def test_sparse_frames_selected_by_simulator(
+        self, async_client: AsyncClient, test_session: AsyncSession
+    ):
+        run_id = await _create_run(
+            async_client, survivor_reevaluation="never", frame_storage_mode="sparse",
+            sparse_top_count=2, sparse_bottom_count=3,
+        )
+
+        for gen in range(2):
+            data = (await async_client.post(f"/api/evolution/{run_id}/step")).json()
+            ranked = sorted(data["creatures"], key=lambda c: c["fitness"], reverse=True)
+            framed = set(await test_session.scalars(
+                select(CreatureFrame.creature_id).where(CreatureFrame.generation == gen)
+            ))
+            # Top and bottom of the whole generation, cached survivors included
+            assert {c["id"] for c in ranked[:2] + ranked[-3:]} <= framed
+            assert framed == {c["id"] for c in data["creatures"] if c["has_frames"]}
@@ -0,0 +1,182 @@
+"""
+Tests for the long-lived evolution worker (POST /run, /{run_id}/ws).
+"""
+
+import asyncio
+import uuid
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.api import evolution
+from app.api.evolution import EvolutionWorker, release_evolution_worker, run_generation
+from app.core.database import Base
+from app.models import Creature, CreaturePerformance, Generation, Run
+from app.schemas.simulation import SimulationConfig
+from app.services.simulator import SimulatorService
+
+
+@pytest.fixture
+async def session_factory():
+    """In-memory database; every session shares the same connection."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        echo=False,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield async_sessionmaker(engine, expire_on_commit=False)
+
+    await engine.dispose()
+
+
+async def _create_run(session_factory, **config) -> str:
+    run_id = str(uuid.uuid4())
+    config = SimulationConfig(
+        population_size=10, cull_percentage=0.5, simulation_duration=1, **config
+    )
+    async with session_factory() as db:
+        db.add(Run(id=run_id, name="Worker", config=config.model_dump()))
+        await db.commit()
+    return run_id
+
+
+async def _drain(queue: asyncio.Queue) -> list[dict]:
+    messages = []
+    while not queue.empty():
+        messages.append(queue.get_nowait())
+    return messages
+
+
+class TestEvolutionWorker:
+    """The worker keeps state in memory and streams every persisted generation."""
+
+    async def test_background_run_streams_and_persists(self, session_factory):
+        run_id = await _create_run(session_factory)
+        worker = EvolutionWorker(run_id, session_factory)
+        queue = worker.subscribe()
+
+        worker.start(3)
+        assert worker.running
+        await worker._task
+
+        messages = await _drain(queue)
+        summaries = [m["data"] for m in messages if m["type"] == "generation_complete"]
+        assert [s["generation"] for s in summaries] == [0, 1, 2]
+        assert all(s["creature_count"] == 10 for s in summaries)
+        assert messages[-1] == {"type": "run_complete", "status": "completed"}
+
+        async with session_factory() as db:
+            run = await db.get(Run, run_id)
+            assert run.current_generation == 3
+            assert run.status == "completed"
+            generations = await db.scalar(select(func.count()).select_from(Generation))
+            performances = await db.scalar(select(func.count()).select_from(CreaturePerformance))
+            assert generations == 3
+            assert performances == 30
+
+        # The population stays in memory for the next generation
+        assert worker._state.generation == 3
+        assert len(worker._state.genomes) == 10
+
+    async def test_step_reloads_after_external_writer(self, session_factory):
+        run_id = await _create_run(session_factory)
+        worker = EvolutionWorker(run_id, session_factory)
+
+        assert (await worker.step())["generation"] == 0
+
+        # Another writer advances the run behind the worker's back
+        async with session_factory() as db:
+            await run_generation(run_id, db, SimulatorService())
+
+        summary = await worker.step()
+        assert summary["generation"] == 2
+
+        async with session_factory() as db:
+            survivors = [c for c in summary["creatures"] if c["survival_streak"] > 0]
+            assert survivors
+            for creature in survivors:
+                record = await db.get(Creature, creature["id"])
+                assert record.birth_generation == creature["birth_generation"] < 2
+
+    async def test_stop_after_current_generation(self, session_factory):
+        run_id = await _create_run(session_factory)
+        worker = EvolutionWorker(run_id, session_factory)
+        queue = worker.subscribe()
+
+        worker.start(50)
+        while queue.empty():
+            await asyncio.sleep(0.01)
+        await worker.stop()
+
+        assert not worker.running
+        messages = await _drain(queue)
+        assert messages[-1] == {"type": "run_complete", "status": "paused"}
+
+        async with session_factory() as db:
+            run = await db.get(Run, run_id)
+            assert 0 < run.current_generation < 50
+            assert run.current_generation == worker._state.generation
+
+    async def test_neat_genome_cache_tracks_population(self, session_factory):
+        run_id = await _create_run(session_factory, neural_mode="neat", use_neural_net=True)
+        worker = EvolutionWorker(run_id, session_factory)
+
+        worker.start(2)
+        await worker._task
+
+        cache = worker._simulator._pytorch_simulator._neat_cache
+        assert set(cache) == {g["id"] for g in worker._state.genomes}
+
+    async def test_survivor_fitness_cache(self, session_factory):
+        run_id = await _create_run(session_factory, survivor_reevaluation="never")
+        worker = EvolutionWorker(run_id, session_factory)
+
+        first = await worker.step()
+        second = await worker.step()
+
+        assert first["cached_count"] == 0
+        previous = {c["id"]: c["fitness"] for c in first["creatures"]}
+        survivors = [c for c in second["creatures"] if c["id"] in previous]
+        assert survivors and second["cached_count"] == len(survivors)
+        for creature in survivors:
+            assert creature["fitness"] == previous[creature["id"]]
+
+    async def test_concurrent_steps_are_serialized(self, session_factory):
+        run_id = await _create_run(session_factory)
+        worker = EvolutionWorker(run_id, session_factory)
+
+        async with session_factory() as db:
+            summaries = await asyncio.gather(worker.step(db), worker.step())
+
+        assert sorted(s["generation"] for s in summaries) == [0, 1]
+        async with session_factory() as db:
+            generations = await db.scalar(select(func.count()).select_from(Generation))
+            assert generations == 2
+
+    async def test_idle_worker_is_released(self, session_factory):
+        run_id = await _create_run(session_factory)
+        worker = EvolutionWorker(run_id, session_factory)
+        evolution._workers[run_id] = worker
+        try:
+            queue = worker.subscribe()
+            release_evolution_worker(worker)
+            assert evolution._workers[run_id] is worker
+
+            worker.start(1)
+            worker.unsubscribe(queue)
+            release_evolution_worker(worker)
+            assert evolution._workers[run_id] is worker
+
+            # Dropped once the background run finishes
+            await worker._task
+            await asyncio.sleep(0)
+            assert run_id not in evolution._workers
+        finally:
+            evolution._workers.pop(run_id, None)
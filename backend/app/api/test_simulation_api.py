@@ -7,7 +7,9 @@ Tests the full pipeline from API request to PyTorch physics and back.
 import pytest
 from fastapi.testclient import TestClient
 
+from app.api.simulation import get_simulator
 from app.main import app
+from app.services.executor import SimulationQueueFullError, get_simulation_executor
 
 
 @pytest.fixture
@@ -194,6 +196,47 @@ class TestSimulationBatchEndpoint:
         assert result["fitness"] == 0.0
 
 
+class TestSimulationBackpressure:
+    """Simulation endpoints run on the bounded simulation executor."""
+
+    GENOME = {
+        "id": "creature",
+        "nodes": [
+            {"id": "n1", "position": {"x": 0, "y": 1, "z": 0}, "size": 0.3, "friction": 0.5},
+            {"id": "n2", "position": {"x": 0.5, "y": 1, "z": 0}, "size": 0.3, "friction": 0.5},
+        ],
+        "muscles": [
+            {
+                "id": "m1", "nodeA": "n1", "nodeB": "n2", "restLength": 0.5, "stiffness": 100,
+                "damping": 1.0, "frequency": 1.0, "amplitude": 0.3, "phase": 0,
+            },
+        ],
+    }
+
+    def test_batch_runs_on_executor(self, client):
+        completed = get_simulation_executor().stats()["completed"]
+        request = {"genomes": [self.GENOME], "config": {"simulation_duration": 1.0}}
+
+        assert client.post("/api/simulation/batch", json=request).status_code == 200
+        assert get_simulation_executor().stats()["completed"] == completed + 1
+
+    def test_queue_full_returns_503(self, client):
+        class FullSimulator:
+            async def simulate_batch(self, genomes, config=None):
+                raise SimulationQueueFullError("Simulation queue is full")
+
+        app.dependency_overrides[get_simulator] = FullSimulator
+        try:
+            batch = client.post("/api/simulation/batch", json={"genomes": [self.GENOME]})
+            single = client.post("/api/simulation/single", json={"genome": self.GENOME})
+        finally:
+            app.dependency_overrides.pop(get_simulator)
+
+        for response in (batch, single):
+            assert response.status_code == 503
+            assert response.headers["Retry-After"] == "1"
+
+
 class TestSimulationPerformance:
     """Test simulation performance meets targets."""
 
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
@@ -16,11 +18,24 @@ class Settings(BaseSettings):
     default_population_size: int = 20
     default_simulation_duration: float = 8.0
     max_workers: int = 8
+    simulation_queue_size: int = 16  # Simulations allowed to wait for a worker before rejecting
+    compiled_engine: bool = False  # torch.compile + CUDA graphs for the neural physics step
+    # Compile the NEAT Numba kernels at startup (cached on disk after the first run)
+    numba_warmup: bool = True
+    # Record app.core.profiling spans/counters per generation (phase_timings)
+    phase_profiling: bool = True
 
     # Frame storage strategy
     frames_keep_top: int = 10
     frames_keep_random: int = 10
     frames_keep_bottom: int = 5
+    # 'binary' (app.simulation.frame_codec) or 'json' (legacy zlib JSON)
+    frame_format: str = "binary"
+    # Node position / activation precision for binary frames (float16 is opt-in:
+    # half the size, but rounds positions far from the origin)
+    frame_precision: Literal["float16", "float32"] = "float32"
+    # Frame-to-frame deltas (opt-in: no size win on typical replays)
+    frame_delta_encoding: bool = False
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,94 @@
+"""
+Tests for phase profiling spans and counters.
+"""
+
+import random
+
+import torch
+
+from app.core.profiling import Profile, current_profile, increment, profiling, span
+from app.genetics.population import generate_population
+from app.schemas.simulation import SimulationConfig
+from app.services.pytorch_simulator import PyTorchSimulator
+
+
+class TestProfile:
+    """Spans, counters and the active profile."""
+
+    def test_disabled_is_noop(self):
+        assert current_profile() is None
+        with span("a"):
+            increment("b")
+        assert span("a") is span("c")  # Shared no-op span, nothing allocated
+
+    def test_records_spans_and_counters(self):
+        profile = Profile()
+        with profiling(profile):
+            for _ in range(3):
+                with span("step"):
+                    pass
+            increment("items", 5)
+            increment("items")
+
+        data = profile.to_dict()
+        assert data["spans"]["step"]["calls"] == 3
+        assert data["spans"]["step"]["ms"] >= 0
+        assert data["counters"] == {"items": 6}
+        assert current_profile() is None
+
+    def test_nested_activation_restores_outer(self):
+        outer, inner = Profile(), Profile()
+        with profiling(outer):
+            with profiling(inner):
+                increment("x")
+            with profiling(None):
+                increment("x")
+            increment("x")
+        assert inner.counters == {"x": 1}
+        assert outer.counters == {"x": 1}
+
+    def test_span_records_on_exception(self):
+        profile = Profile()
+        try:
+            with profiling(profile), span("failing"):
+                raise ValueError
+        except ValueError:
+            pass
+        assert profile.spans["failing"][1] == 1
+
+    def test_merge(self):
+        a, b = Profile(), Profile()
+        a.add("s", 1.5)
+        a.increment("c", 2)
+        b.add("s", 0.5, calls=2)
+        b.add("t", 1.0)
+        a.merge(b)
+        a.merge({"spans": {}, "counters": {"c": 1}})
+        assert a.to_dict() == {
+            "spans": {"s": {"ms": 2.0, "calls": 3}, "t": {"ms": 1.0, "calls": 1}},
+            "counters": {"c": 3},
+        }
+
+
+def test_simulation_phases():
+    random.seed(0)
+    genomes = generate_population(6, neural_mode='pure', time_encoding='none')
+    config = SimulationConfig(
+        simulation_duration=1.0,
+        neural_mode='pure',
+        time_encoding='none',
+        pellet_seed=0,
+        neural_update_hz=10,
+    )
+    profile = Profile()
+    with profiling(profile):
+        PyTorchSimulator(torch.device('cpu')).simulate_batch(genomes, config)
+
+    spans = profile.to_dict()["spans"]
+    steps = int(config.simulation_duration / config.time_step)
+    assert spans["simulate.physics_step"]["calls"] == steps
+    assert spans["simulate.pellets"]["calls"] == steps + 1  # Plus initial placement
+    assert spans["simulate.nn_tick"]["calls"] < steps
+    for name in ("simulate.pack_genomes", "simulate.build_network", "simulate.marshal_results"):
+        assert spans[name]["calls"] == 1
+    assert profile.counters["simulate.creatures"] == 6
@@ -0,0 +1,25 @@
+"""
+Thread-pool limits for worker processes.
+
+Torch, the BLAS libraries and Numba size their thread pools from these
+environment variables when they are first imported, so limit_threads() must
+run before any of them is loaded. This module imports nothing heavy.
+"""
+
+import os
+
+THREAD_ENV_VARS = (
+    'OMP_NUM_THREADS',
+    'MKL_NUM_THREADS',
+    'OPENBLAS_NUM_THREADS',
+    'NUMEXPR_NUM_THREADS',
+    'VECLIB_MAXIMUM_THREADS',
+    'NUMBA_NUM_THREADS',
+)
+
+
+def limit_threads(threads: int) -> None:
+    """Cap the native thread pools of this process at `threads`."""
+    for var in THREAD_ENV_VARS:
+        os.environ[var] = str(threads)
+    os.environ['OMP_WAIT_POLICY'] = 'PASSIVE'  # Prevent busy-waiting
@@ -24,6 +24,7 @@ from .mutation import (
     mutate_genome,
     mutate_neural_weights,
     mutate_neural_genome,
+    gaussian_perturbation,
     add_node,
     remove_node,
     add_muscle,
@@ -35,6 +36,9 @@ from .crossover import (
     clone_genome,
     crossover_neural_weights,
     uniform_crossover_neural_weights,
+    sbx_crossover_neural_weights,
+    crossover_weight_arrays,
+    breed_neural_genomes,
     adapt_neural_topology,
     initialize_neural_genome,
 )
@@ -50,6 +54,8 @@ from .population import (
     evolve_population,
 )
 
+from .population_arrays import PopulationArrays
+
 from .speciation import (
     Species,
     DistanceFunction,
@@ -78,6 +84,7 @@ __all__ = [
     'mutate_genome',
     'mutate_neural_weights',
     'mutate_neural_genome',
+    'gaussian_perturbation',
     'add_node',
     'remove_node',
     'add_muscle',
@@ -87,6 +94,9 @@ __all__ = [
     'clone_genome',
     'crossover_neural_weights',
     'uniform_crossover_neural_weights',
+    'sbx_crossover_neural_weights',
+    'crossover_weight_arrays',
+    'breed_neural_genomes',
     'adapt_neural_topology',
     'initialize_neural_genome',
     # Population
@@ -98,6 +108,7 @@ __all__ = [
     'generate_population',
     'get_population_stats',
     'evolve_population',
+    'PopulationArrays',
     # Speciation
     'Species',
     'DistanceFunction',
@@ -13,7 +13,11 @@ from copy import deepcopy
 from dataclasses import dataclass
 from typing import Any
 
-from .mutation import generate_id, distance, normalize, GenomeConstraints
+import numpy as np
+
+from .mutation import (
+    generate_id, distance, normalize, GenomeConstraints, gaussian_perturbation, numpy_rng,
+)
 from .neat_crossover import (
     neat_crossover,
     neat_crossover_equal_fitness,
@@ -657,8 +661,11 @@ def get_input_size(neural_genome: dict) -> int:
     return 8
 
 
-def clone_neural_genome(neural_genome: dict) -> dict:
-    """Deep clone a neural genome."""
+NEURAL_WEIGHT_KEYS = ['weights_ih', 'weights_ho', 'biases_h', 'biases_o', 'weights']
+
+
+def _clone_neural_header(neural_genome: dict) -> dict:
+    """Clone the non-weight fields of a neural genome (sizes, activation, topology)."""
     result = {}
 
     # Copy basic fields
@@ -666,14 +673,122 @@ def clone_neural_genome(neural_genome: dict) -> dict:
         if key in neural_genome:
             result[key] = neural_genome[key]
 
+    # Copy topology if present (old format)
+    if 'topology' in neural_genome:
+        result['topology'] = dict(neural_genome['topology'])
+
+    return result
+
+
+def clone_neural_genome(neural_genome: dict) -> dict:
+    """Deep clone a neural genome."""
+    result = _clone_neural_header(neural_genome)
+
     # Copy weight arrays
-    for key in ['weights_ih', 'weights_ho', 'biases_h', 'biases_o', 'weights']:
+    for key in NEURAL_WEIGHT_KEYS:
         if key in neural_genome:
             result[key] = list(neural_genome[key])
 
-    # Copy topology if present (old format)
-    if 'topology' in neural_genome:
-        result['topology'] = dict(neural_genome['topology'])
+    return result
+
+
+# =============================================================================
+# Neural weight crossover kernels (whole arrays, any shape)
+# =============================================================================
+
+
+def interpolation_crossover_arrays(
+    w1: np.ndarray, w2: np.ndarray, rng: np.random.Generator
+) -> np.ndarray:
+    """Per-weight linear interpolation with a uniform random t."""
+    return w1 + (w2 - w1) * rng.random(w1.shape)
+
+
+def uniform_crossover_arrays(
+    w1: np.ndarray, w2: np.ndarray, rng: np.random.Generator
+) -> np.ndarray:
+    """Per-weight pick from either parent with probability 0.5."""
+    return np.where(rng.random(w1.shape) < 0.5, w1, w2)
+
+
+def sbx_crossover_arrays(
+    w1: np.ndarray, w2: np.ndarray, eta: float, rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Per-weight Simulated Binary Crossover (see sbx_crossover_neural_weights).
+
+    Each weight takes one of the two SBX children at random; identical
+    parent weights are passed through unchanged.
+    """
+    u = rng.random(w1.shape)
+    # Spread factor beta from u (u < 1, so 1 - u never reaches 0)
+    beta = np.where(u <= 0.5, 2.0 * u, 1.0 / (2.0 * (1.0 - u))) ** (1.0 / (eta + 1.0))
+    child1 = 0.5 * ((1 + beta) * w1 + (1 - beta) * w2)
+    child2 = 0.5 * ((1 - beta) * w1 + (1 + beta) * w2)
+    child = np.where(rng.random(w1.shape) < 0.5, child1, child2)
+    return np.where(np.abs(w1 - w2) < 1e-14, w1, child)
+
+
+def crossover_weight_arrays(
+    w1: np.ndarray,
+    w2: np.ndarray,
+    method: str,
+    rng: np.random.Generator,
+    sbx_eta: float = 2.0,
+) -> np.ndarray:
+    """
+    Cross two equally shaped weight arrays.
+
+    Args:
+        w1: First parent's weights
+        w2: Second parent's weights
+        method: 'interpolation', 'uniform' or 'sbx'
+        rng: Random generator
+        sbx_eta: Distribution index for SBX
+
+    Returns:
+        Child weights
+    """
+    if method == 'uniform':
+        return uniform_crossover_arrays(w1, w2, rng)
+    if method == 'sbx':
+        return sbx_crossover_arrays(w1, w2, sbx_eta, rng)
+    return interpolation_crossover_arrays(w1, w2, rng)
+
+
+def _crossover_weight_lists(
+    parent1: dict,
+    parent2: dict,
+    method: str,
+    rng: np.random.Generator | None,
+    sbx_eta: float = 2.0,
+) -> dict:
+    """
+    Cross every weight list of two neural genomes.
+
+    The child is a clone of parent1; the first min(len1, len2) weights of each
+    list are crossed and any extra weights of parent1 are copied.
+    """
+    result = _clone_neural_header(parent1)
+    rng = numpy_rng(rng)
+
+    # New format (separate arrays) and old format (flat weights array)
+    for key in NEURAL_WEIGHT_KEYS:
+        if key not in parent1:
+            continue
+        if key not in parent2:
+            result[key] = list(parent1[key])
+        else:
+            w1 = parent1[key]
+            w2 = parent2[key]
+            min_len = min(len(w1), len(w2))
+            crossed = crossover_weight_arrays(
+                np.asarray(w1[:min_len], dtype=np.float64),
+                np.asarray(w2[:min_len], dtype=np.float64),
+                method, rng, sbx_eta,
+            )
+            # If parent1 has more, copy them
+            result[key] = crossed.tolist() + list(w1[min_len:])
 
     return result
 
@@ -681,6 +796,7 @@ def clone_neural_genome(neural_genome: dict) -> dict:
 def crossover_neural_weights(
     parent1: dict,
     parent2: dict,
+    rng: np.random.Generator | None = None,
 ) -> dict:
     """
     Crossover neural network weights using interpolation.
@@ -688,46 +804,18 @@ def crossover_neural_weights(
     Args:
         parent1: First parent's neural genome
         parent2: Second parent's neural genome
+        rng: Random generator (default: seeded from `random`)
 
     Returns:
         New neural genome with crossed-over weights
     """
-    result = clone_neural_genome(parent1)
-
-    # Handle new format (separate weight arrays)
-    for key in ['weights_ih', 'weights_ho', 'biases_h', 'biases_o']:
-        if key in parent1 and key in parent2:
-            w1 = parent1[key]
-            w2 = parent2[key]
-            min_len = min(len(w1), len(w2))
-            new_weights = []
-            for i in range(min_len):
-                t = random.random()
-                new_weights.append(lerp(w1[i], w2[i], t))
-            # If parent1 has more, copy them
-            for i in range(min_len, len(w1)):
-                new_weights.append(w1[i])
-            result[key] = new_weights
-
-    # Handle old format (flat weights array)
-    if 'weights' in parent1 and 'weights' in parent2:
-        w1 = parent1['weights']
-        w2 = parent2['weights']
-        min_len = min(len(w1), len(w2))
-        new_weights = []
-        for i in range(min_len):
-            t = random.random()
-            new_weights.append(lerp(w1[i], w2[i], t))
-        for i in range(min_len, len(w1)):
-            new_weights.append(w1[i])
-        result['weights'] = new_weights
-
-    return result
+    return _crossover_weight_lists(parent1, parent2, 'interpolation', rng)
 
 
 def uniform_crossover_neural_weights(
     parent1: dict,
     parent2: dict,
+    rng: np.random.Generator | None = None,
 ) -> dict:
     """
     Uniform crossover for neural weights - randomly pick from either parent.
@@ -735,44 +823,19 @@ def uniform_crossover_neural_weights(
     Args:
         parent1: First parent's neural genome
         parent2: Second parent's neural genome
+        rng: Random generator (default: seeded from `random`)
 
     Returns:
         New neural genome with crossed-over weights
     """
-    result = clone_neural_genome(parent1)
-
-    # Handle new format
-    for key in ['weights_ih', 'weights_ho', 'biases_h', 'biases_o']:
-        if key in parent1 and key in parent2:
-            w1 = parent1[key]
-            w2 = parent2[key]
-            min_len = min(len(w1), len(w2))
-            new_weights = []
-            for i in range(min_len):
-                new_weights.append(w1[i] if random.random() < 0.5 else w2[i])
-            for i in range(min_len, len(w1)):
-                new_weights.append(w1[i])
-            result[key] = new_weights
-
-    # Handle old format
-    if 'weights' in parent1 and 'weights' in parent2:
-        w1 = parent1['weights']
-        w2 = parent2['weights']
-        min_len = min(len(w1), len(w2))
-        new_weights = []
-        for i in range(min_len):
-            new_weights.append(w1[i] if random.random() < 0.5 else w2[i])
-        for i in range(min_len, len(w1)):
-            new_weights.append(w1[i])
-        result['weights'] = new_weights
-
-    return result
+    return _crossover_weight_lists(parent1, parent2, 'uniform', rng)
 
 
 def sbx_crossover_neural_weights(
     parent1: dict,
     parent2: dict,
     eta: float = 2.0,
+    rng: np.random.Generator | None = None,
 ) -> dict:
     """
     Simulated Binary Crossover (SBX) for neural weights.
@@ -789,59 +852,80 @@ def sbx_crossover_neural_weights(
         parent2: Second parent's neural genome
         eta: Distribution index (0.5-5.0). Lower = more spread, higher = closer to parents.
              eta=2 is a common default providing balanced exploration.
+        rng: Random generator (default: seeded from `random`)
 
     Returns:
         New neural genome with SBX crossed-over weights
     """
-    result = clone_neural_genome(parent1)
-
-    def sbx_single(p1: float, p2: float, eta_c: float) -> float:
-        """Apply SBX to a single pair of values, returning one child."""
-        # If parents are identical, no crossover needed
-        if abs(p1 - p2) < 1e-14:
-            return p1
+    return _crossover_weight_lists(parent1, parent2, 'sbx', rng, eta)
 
-        u = random.random()
 
-        # Calculate beta (spread factor) based on random u
-        if u <= 0.5:
-            beta = (2.0 * u) ** (1.0 / (eta_c + 1.0))
-        else:
-            beta = (1.0 / (2.0 * (1.0 - u))) ** (1.0 / (eta_c + 1.0))
-
-        # Generate two children, randomly pick one
-        child1 = 0.5 * ((1 + beta) * p1 + (1 - beta) * p2)
-        child2 = 0.5 * ((1 - beta) * p1 + (1 + beta) * p2)
+def breed_neural_genomes(
+    neural_genomes: list[dict],
+    first: list[int],
+    second: list[int],
+    rng: np.random.Generator,
+    method: str = 'sbx',
+    sbx_eta: float = 2.0,
+    mutation_rate: float = 0.0,
+    mutation_magnitude: float = 0.0,
+) -> list[dict]:
+    """
+    Produce one child per parent pair: crossover, then Gaussian mutation.
 
-        return child1 if random.random() < 0.5 else child2
+    Children are equivalent to crossing with the per-genome functions (child
+    shaped like its first parent) and then mutate_neural_genome, but pairs
+    with the same weight-list layout are processed as one [pairs, weights]
+    array per list, so a whole generation takes a handful of NumPy calls.
 
-    # Handle new format (separate arrays)
-    for key in ['weights_ih', 'weights_ho', 'biases_h', 'biases_o']:
-        if key in parent1 and key in parent2:
-            w1 = parent1[key]
-            w2 = parent2[key]
-            min_len = min(len(w1), len(w2))
-            new_weights = []
-            for i in range(min_len):
-                new_weights.append(sbx_single(w1[i], w2[i], eta))
-            # If parent1 has more, copy them
-            for i in range(min_len, len(w1)):
-                new_weights.append(w1[i])
-            result[key] = new_weights
-
-    # Handle old format (flat weights array)
-    if 'weights' in parent1 and 'weights' in parent2:
-        w1 = parent1['weights']
-        w2 = parent2['weights']
-        min_len = min(len(w1), len(w2))
-        new_weights = []
-        for i in range(min_len):
-            new_weights.append(sbx_single(w1[i], w2[i], eta))
-        for i in range(min_len, len(w1)):
-            new_weights.append(w1[i])
-        result['weights'] = new_weights
+    Args:
+        neural_genomes: Parent neural genomes
+        first: Index of each child's first parent (structure parent)
+        second: Index of each child's second parent
+        rng: Random generator driving every draw
+        method: Crossover method ('interpolation', 'uniform', 'sbx')
+        sbx_eta: Distribution index for SBX
+        mutation_rate: Probability each child weight mutates (0 = no mutation)
+        mutation_magnitude: Standard deviation of the mutation
 
-    return result
+    Returns:
+        List of child neural genomes, in pair order
+    """
+    def layout(genome: dict) -> tuple:
+        return tuple(len(genome[key]) if key in genome else -1 for key in NEURAL_WEIGHT_KEYS)
+
+    # Group pairs with identical weight-list lengths
+    groups: dict[tuple, list[int]] = {}
+    for child, (a, b) in enumerate(zip(first, second)):
+        groups.setdefault((layout(neural_genomes[a]), layout(neural_genomes[b])), []).append(child)
+
+    children: list[dict | None] = [None] * len(first)
+    for (layout1, layout2), members in groups.items():
+        parents1 = [neural_genomes[first[c]] for c in members]
+        parents2 = [neural_genomes[second[c]] for c in members]
+        results = [_clone_neural_header(parent) for parent in parents1]
+
+        for key, len1, len2 in zip(NEURAL_WEIGHT_KEYS, layout1, layout2):
+            if len1 < 0:
+                continue
+            weights = np.array([parent[key] for parent in parents1], dtype=np.float64)
+            weights = weights.reshape(len(members), len1)
+            if len2 >= 0:
+                min_len = min(len1, len2)
+                others = np.array([parent[key][:min_len] for parent in parents2], dtype=np.float64)
+                others = others.reshape(len(members), min_len)
+                weights[:, :min_len] = crossover_weight_arrays(
+                    weights[:, :min_len], others, method, rng, sbx_eta,
+                )
+            if mutation_rate > 0 and key != 'weights':
+                weights = gaussian_perturbation(weights, mutation_rate, mutation_magnitude, rng)
+            for result, row in zip(results, weights.tolist()):
+                result[key] = row
+
+        for c, result in zip(members, results):
+            children[c] = result
+
+    return children
 
 
 def adapt_neural_topology(
@@ -12,6 +12,16 @@ This prevents the population from converging to a single solution.
 import math
 
 import numpy as np
+import torch
+
+# Neural genome weight groups compared by distance functions
+# Support both camelCase (frontend) and snake_case (backend) keys
+NEURAL_WEIGHT_KEYS = [
+    ('weights_ih', 'inputWeights'),      # input->hidden weights
+    ('weights_ho', 'outputWeights'),     # hidden->output weights
+    ('biases_h', 'hiddenBiases'),        # hidden biases
+    ('biases_o', 'outputBiases'),        # output biases
+]
 
 
 def neural_genome_distance(genome1: dict, genome2: dict) -> float:
@@ -42,15 +52,7 @@ def neural_genome_distance(genome1: dict, genome2: dict) -> float:
     total_weights = 0
 
     # Compare weight matrices
-    # Support both camelCase (frontend) and snake_case (backend) keys
-    keys_to_check = [
-        ('weights_ih', 'inputWeights'),      # input->hidden weights
-        ('weights_ho', 'outputWeights'),     # hidden->output weights
-        ('biases_h', 'hiddenBiases'),        # hidden biases
-        ('biases_o', 'outputBiases'),        # output biases
-    ]
-
-    for snake_key, camel_key in keys_to_check:
+    for snake_key, camel_key in NEURAL_WEIGHT_KEYS:
         w1 = ng1.get(snake_key) or ng1.get(camel_key, [])
         w2 = ng2.get(snake_key) or ng2.get(camel_key, [])
 
@@ -151,6 +153,139 @@ def sharing_function(distance: float, radius: float, alpha: float = 1.0) -> floa
     return 1.0 - (distance / radius) ** alpha
 
 
+def _flat_weights(weights) -> np.ndarray:
+    """Flatten a (possibly ragged) nested weight list to a float64 vector."""
+    try:
+        return np.asarray(weights, dtype=np.float64).ravel()
+    except ValueError:
+        return np.asarray(_flatten(weights), dtype=np.float64)
+
+
+def body_distance_matrix(genomes: list[dict]) -> np.ndarray:
+    """
+    Pairwise body_genome_distance for a population.
+
+    Args:
+        genomes: List of creature genomes
+
+    Returns:
+        [n, n] distance matrix
+    """
+    nodes = np.array([len(g.get('nodes', [])) for g in genomes], dtype=np.float64)
+    muscles = np.array([len(g.get('muscles', [])) for g in genomes], dtype=np.float64)
+    freqs = np.array([g.get('globalFrequencyMultiplier', 1.0) for g in genomes], dtype=np.float64)
+
+    return (
+        np.abs(nodes[:, None] - nodes[None, :]) * 0.3
+        + np.abs(muscles[:, None] - muscles[None, :]) * 0.2
+        + np.abs(freqs[:, None] - freqs[None, :]) * 0.5
+    )
+
+
+def neural_distance_matrix(genomes: list[dict]) -> np.ndarray:
+    """
+    Pairwise neural_genome_distance for a population.
+
+    Each weight group is packed into a padded [n, max_len] matrix sorted by
+    flattened length. Every pair of length groups is compared over the shorter
+    prefix with one cdist call (plus the size-mismatch penalty), so the result
+    matches neural_genome_distance pair by pair.
+
+    Args:
+        genomes: List of creature genomes
+
+    Returns:
+        [n, n] distance matrix (zero diagonal)
+    """
+    n = len(genomes)
+    neural_genomes = [g.get('neuralGenome') for g in genomes]
+    has_neural = np.array([ng is not None for ng in neural_genomes])
+
+    squared_diff = np.zeros((n, n))
+    weight_counts = np.zeros((n, n))
+
+    neural_idx = np.flatnonzero(has_neural)
+    for snake_key, camel_key in NEURAL_WEIGHT_KEYS:
+        flats = [
+            _flat_weights(neural_genomes[i].get(snake_key) or neural_genomes[i].get(camel_key, []))
+            for i in neural_idx
+        ]
+        lengths = np.array([len(f) for f in flats], dtype=np.int64)
+        if len(flats) == 0 or lengths.max() == 0:
+            continue
+
+        # Sort by length so each length group is a contiguous block
+        order = np.argsort(lengths, kind='stable')
+        sorted_lengths = lengths[order]
+        packed = np.zeros((len(flats), lengths.max()))
+        for row, i in enumerate(order):
+            packed[row, :len(flats[i])] = flats[i]
+        packed_t = torch.from_numpy(packed)
+
+        # Squared differences over the shared prefix, block by block
+        prefix_diff = np.zeros((len(flats), len(flats)))
+        unique_lengths, starts = np.unique(sorted_lengths, return_index=True)
+        ends = [*starts[1:].tolist(), len(flats)]
+        bounds = list(zip(unique_lengths.tolist(), starts.tolist(), ends))
+        bounds = [bound for bound in bounds if bound[0] > 0]
+        for a, (len_a, start_a, end_a) in enumerate(bounds):
+            for _, start_b, end_b in bounds[a:]:
+                # Exact differences (no matmul expansion) so identical genomes give 0
+                dist = torch.cdist(
+                    packed_t[start_a:end_a, :len_a],
+                    packed_t[start_b:end_b, :len_a],
+                    compute_mode='donot_use_mm_for_euclid_dist',
+                ).numpy()
+                block = dist * dist
+                prefix_diff[start_a:end_a, start_b:end_b] = block
+                prefix_diff[start_b:end_b, start_a:end_a] = block.T
+
+        # Back to population order, then add the size-mismatch penalty. Pairs
+        # where either side is empty are skipped (as in neural_genome_distance).
+        inverse = np.argsort(order)
+        prefix_diff = prefix_diff.take(inverse, axis=0).take(inverse, axis=1)
+        shorter = np.minimum(lengths[:, None], lengths[None, :])
+        longer = np.maximum(lengths[:, None], lengths[None, :])
+        compared = shorter > 0
+        key_squared_diff = np.where(compared, prefix_diff + (longer - shorter) * 4.0, 0.0)
+        key_counts = np.where(compared, longer, 0)
+
+        if len(neural_idx) == n:
+            squared_diff += key_squared_diff
+            weight_counts += key_counts
+        else:
+            rows = np.ix_(neural_idx, neural_idx)
+            squared_diff[rows] += key_squared_diff
+            weight_counts[rows] += key_counts
+
+    # Fall back to body distance when either lacks a neural genome or nothing was compared
+    use_neural = has_neural[:, None] & has_neural[None, :] & (weight_counts > 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        distances = np.sqrt(squared_diff / weight_counts)
+    if not use_neural.all():
+        distances = np.where(use_neural, distances, body_distance_matrix(genomes))
+    np.fill_diagonal(distances, 0.0)
+    return distances
+
+
+def sharing_matrix(distances: np.ndarray, radius: float, alpha: float = 1.0) -> np.ndarray:
+    """
+    Vectorized sharing_function over a distance matrix.
+
+    Args:
+        distances: Distance matrix
+        radius: Sharing radius (sigma_share)
+        alpha: Shape parameter (1.0 = linear, 2.0 = quadratic)
+
+    Returns:
+        Matrix of sharing values in [0, 1]
+    """
+    within = distances < radius
+    with np.errstate(divide='ignore', invalid='ignore'):
+        values = 1.0 - (distances / radius) ** alpha
+    return np.where(within, values, 0.0)
+
+
 def apply_fitness_sharing(
     genomes: list[dict],
     fitness_scores: list[float],
@@ -183,21 +318,13 @@ def apply_fitness_sharing(
     if n != len(fitness_scores):
         raise ValueError("genomes and fitness_scores must have same length")
 
-    # Build distance matrix (symmetric, so only compute upper triangle)
-    distances = np.zeros((n, n))
-    for i in range(n):
-        for j in range(i + 1, n):
-            d = neural_genome_distance(genomes[i], genomes[j])
-            distances[i, j] = d
-            distances[j, i] = d
-
-    # Calculate niche counts
-    niche_counts = np.ones(n)  # Start at 1 (self)
-    for i in range(n):
-        for j in range(n):
-            if i != j:
-                share_val = sharing_function(distances[i, j], sharing_radius, alpha)
-                niche_counts[i] += share_val
+    # Build distance matrix (vectorized neural_genome_distance for all pairs)
+    distances = neural_distance_matrix(genomes)
+
+    # Calculate niche counts: 1 (self) + sharing with every other creature
+    shares = sharing_matrix(distances, sharing_radius, alpha)
+    np.fill_diagonal(shares, 0.0)
+    niche_counts = 1.0 + shares.sum(axis=1)
 
     # Apply sharing: shared_fitness = raw_fitness / niche_count
     shared_fitness = [
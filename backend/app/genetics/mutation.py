@@ -13,6 +13,8 @@ import uuid
 from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
+
 
 @dataclass
 class MutationConfig:
@@ -409,10 +411,44 @@ def add_muscle(
     }
 
 
+def numpy_rng(rng: np.random.Generator | None = None) -> np.random.Generator:
+    """
+    Generator for the vectorized operators.
+
+    Returns `rng` itself, or a generator seeded from the `random` module so
+    that random.seed() keeps runs reproducible.
+    """
+    return rng if rng is not None else np.random.default_rng(random.getrandbits(64))
+
+
+def gaussian_perturbation(
+    weights: np.ndarray,
+    mutation_rate: float,
+    mutation_magnitude: float,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """
+    Gaussian perturbation of a whole weight array (any shape).
+
+    Args:
+        weights: Weight array
+        mutation_rate: Probability each weight mutates (0-1)
+        mutation_magnitude: Standard deviation of Gaussian perturbation
+        rng: Random generator
+
+    Returns:
+        New array with a N(0, magnitude) step added to the mutated weights
+    """
+    mutated = rng.random(weights.shape) < mutation_rate
+    perturbation = rng.standard_normal(weights.shape) * mutation_magnitude
+    return np.where(mutated, weights + perturbation, weights)
+
+
 def mutate_neural_weights(
     weights: list[float],
     mutation_rate: float,
     mutation_magnitude: float,
+    rng: np.random.Generator | None = None,
 ) -> list[float]:
     """
     Mutate neural network weights with Gaussian perturbation.
@@ -421,20 +457,23 @@ def mutate_neural_weights(
         weights: Flat array of network weights
         mutation_rate: Probability each weight mutates (0-1)
         mutation_magnitude: Standard deviation of Gaussian perturbation
+        rng: Random generator (default: seeded from `random`)
 
     Returns:
         New mutated weight array
     """
-    return [
-        w + random_gaussian() * mutation_magnitude if random.random() < mutation_rate else w
-        for w in weights
-    ]
+    if len(weights) == 0:
+        return []
+    weights = np.asarray(weights, dtype=np.float64)
+    mutated = gaussian_perturbation(weights, mutation_rate, mutation_magnitude, numpy_rng(rng))
+    return mutated.tolist()
 
 
 def mutate_neural_genome(
     neural_genome: dict,
     mutation_rate: float,
     mutation_magnitude: float,
+    rng: np.random.Generator | None = None,
 ) -> dict:
     """
     Mutate a complete neural genome.
@@ -443,28 +482,22 @@ def mutate_neural_genome(
         neural_genome: Neural genome dict with weights
         mutation_rate: Probability each weight mutates
         mutation_magnitude: Standard deviation of perturbation
+        rng: Random generator (default: seeded from `random`)
 
     Returns:
         New mutated neural genome
     """
     new_genome = dict(neural_genome)
+    rng = numpy_rng(rng)
 
-    # Mutate all weight arrays
-    for key in ['weights_ih', 'weights_ho']:
-        if key in new_genome:
-            new_genome[key] = mutate_neural_weights(
-                new_genome[key],
-                mutation_rate,
-                mutation_magnitude
-            )
-
-    # Mutate biases
-    for key in ['biases_h', 'biases_o']:
+    # Mutate all weight arrays and biases
+    for key in ['weights_ih', 'weights_ho', 'biases_h', 'biases_o']:
         if key in new_genome:
             new_genome[key] = mutate_neural_weights(
                 new_genome[key],
                 mutation_rate,
-                mutation_magnitude
+                mutation_magnitude,
+                rng,
             )
 
     return new_genome
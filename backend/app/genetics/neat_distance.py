@@ -14,8 +14,16 @@ Where:
 - c1, c2, c3 = coefficients to tune relative importance
 
 See docs/NEAT.md for technical details.
+
+Speciation compares every genome against many representatives, so the
+distance function returned by create_neat_distance_fn compiles each genome
+once (sorted innovation and weight arrays) and caches it by genome id.
 """
 
+from dataclasses import dataclass
+
+import numpy as np
+
 from app.schemas.neat import NEATGenome
 
 
@@ -196,32 +204,338 @@ def _extract_neat_genome(genome: dict | NEATGenome) -> NEATGenome:
     return NEATGenome(neurons=[], connections=[])
 
 
+@dataclass
+class CompiledNEATGenome:
+    """NEAT genome reduced to the sorted arrays compatibility distance needs."""
+
+    innovations: np.ndarray  # Unique innovation numbers, ascending (int64)
+    weights: np.ndarray  # Connection weight per innovation (float64)
+    neuron_ids: np.ndarray  # Unique neuron ids, ascending (int64)
+    neuron_biases: np.ndarray  # Bias per neuron id (float64)
+
+
+def _genes_by_key(
+    genes: list, key: str, value: str, default: float | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """Sorted (keys, values) arrays from genes (dicts or models); later duplicates win."""
+    by_key = {}
+    for gene in genes:
+        if isinstance(gene, dict):
+            by_key[gene[key]] = gene[value] if default is None else gene.get(value, default)
+        else:
+            by_key[getattr(gene, key)] = getattr(gene, value)
+    keys = np.fromiter(by_key.keys(), dtype=np.int64, count=len(by_key))
+    values = np.fromiter(by_key.values(), dtype=np.float64, count=len(by_key))
+    order = np.argsort(keys)
+    return keys[order], values[order]
+
+
+def compile_neat_genome(genome: dict | NEATGenome) -> CompiledNEATGenome:
+    """
+    Compile a genome (same input formats as _extract_neat_genome) for distance.
+
+    Reads genome dicts directly, without building a Pydantic NEATGenome.
+    """
+    neat = genome
+    if isinstance(genome, dict):
+        if 'neatGenome' in genome:
+            neat = genome['neatGenome']
+        elif 'neat_genome' in genome:
+            neat = genome['neat_genome']
+        elif not ('neurons' in genome and 'connections' in genome):
+            # Fallback: empty genome
+            neat = {'neurons': [], 'connections': []}
+
+    if isinstance(neat, NEATGenome):
+        connections, neurons = neat.connections, neat.neurons
+    else:
+        connections, neurons = neat.get('connections', []), neat.get('neurons', [])
+
+    innovations, weights = _genes_by_key(connections, 'innovation', 'weight')
+    neuron_ids, neuron_biases = _genes_by_key(neurons, 'id', 'bias', default=0.0)
+    return CompiledNEATGenome(innovations, weights, neuron_ids, neuron_biases)
+
+
+class NEATGenomeCache:
+    """
+    Compiled genomes keyed by genome id (object identity for genomes without one).
+
+    Only valid while genomes are not modified, i.e. within one generation.
+    """
+
+    def __init__(self):
+        self._compiled: dict = {}
+
+    def __len__(self) -> int:
+        return len(self._compiled)
+
+    def get(self, genome: dict | NEATGenome) -> CompiledNEATGenome:
+        """Compiled form of genome, compiling it on first use."""
+        key = genome.get('id') if isinstance(genome, dict) else None
+        if key is None:
+            key = id(genome)
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            compiled = compile_neat_genome(genome)
+            self._compiled[key] = compiled
+        return compiled
+
+
+def _match_positions(a: np.ndarray, b: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """For sorted unique a and b: mask of a's entries found in b, and their positions in b."""
+    positions = np.minimum(np.searchsorted(b, a), len(b) - 1)
+    return b[positions] == a, positions
+
+
+def compiled_genome_distance(
+    genome_a: CompiledNEATGenome,
+    genome_b: CompiledNEATGenome,
+    excess_coefficient: float = 1.0,
+    disjoint_coefficient: float = 1.0,
+    weight_coefficient: float = 0.4,
+    normalize_by_size: bool = True,
+) -> float:
+    """
+    neat_genome_distance on compiled genomes, as a sorted-array merge.
+
+    Args:
+        genome_a: First compiled genome
+        genome_b: Second compiled genome
+        excess_coefficient: Weight for excess gene term (c1)
+        disjoint_coefficient: Weight for disjoint gene term (c2)
+        weight_coefficient: Weight for weight difference term (c3)
+        normalize_by_size: If True, divide E and D by N (larger genome size)
+
+    Returns:
+        Compatibility distance (0 = identical structure and weights)
+    """
+    a_inn, b_inn = genome_a.innovations, genome_b.innovations
+    size_a, size_b = len(a_inn), len(b_inn)
+
+    # Handle empty genomes
+    if size_a == 0 and size_b == 0:
+        if len(genome_a.neuron_ids) == 0 or len(genome_b.neuron_ids) == 0:
+            return 0.0
+        matched, positions = _match_positions(genome_a.neuron_ids, genome_b.neuron_ids)
+        if not matched.any():
+            return 0.0
+        diffs = np.abs(genome_a.neuron_biases[matched] - genome_b.neuron_biases[positions[matched]])
+        return float(diffs.mean())
+
+    if size_a == 0:
+        return excess_coefficient * size_b
+
+    if size_b == 0:
+        return excess_coefficient * size_a
+
+    # Matching genes
+    matched, positions = _match_positions(a_inn, b_inn)
+    matching_count = int(np.count_nonzero(matched))
+
+    # Excess genes lie beyond the other genome's max innovation (never matching)
+    excess_a = size_a - int(np.searchsorted(a_inn, b_inn[-1], side='right'))
+    excess_b = size_b - int(np.searchsorted(b_inn, a_inn[-1], side='right'))
+    excess_count = excess_a + excess_b
+    disjoint_count = (size_a - matching_count - excess_a) + (size_b - matching_count - excess_b)
+
+    if matching_count:
+        weight_diffs = np.abs(genome_a.weights[matched] - genome_b.weights[positions[matched]])
+        avg_weight_diff = float(weight_diffs.mean())
+    else:
+        avg_weight_diff = 0.0
+
+    n = max(size_a, size_b, 1) if normalize_by_size else 1
+
+    return (
+        (excess_coefficient * excess_count / n) +
+        (disjoint_coefficient * disjoint_count / n) +
+        (weight_coefficient * avg_weight_diff)
+    )
+
+
+class NEATRepresentatives:
+    """
+    One-vs-many NEAT distance kernel for speciation.
+
+    Species representatives are stored as dense rows of an innovation-indexed
+    weight matrix (representatives x innovations of the population) with a
+    presence mask and its running count. A genome is then compared with every
+    representative at once by gathering its own innovation columns: matching
+    genes and weight differences come from the mask, excess genes from the
+    running count at the other genome's max innovation. Results match
+    compiled_genome_distance pair by pair.
+    """
+
+    def __init__(
+        self,
+        genomes: list[CompiledNEATGenome],
+        excess_coefficient: float = 1.0,
+        disjoint_coefficient: float = 1.0,
+        weight_coefficient: float = 0.4,
+        normalize_by_size: bool = True,
+    ):
+        """
+        Args:
+            genomes: Compiled genomes of the population (indexed by position)
+            excess_coefficient: Weight for excess gene term (c1)
+            disjoint_coefficient: Weight for disjoint gene term (c2)
+            weight_coefficient: Weight for weight difference term (c3)
+            normalize_by_size: If True, divide E and D by N (larger genome size)
+        """
+        self.genomes = genomes
+        self.excess_coefficient = excess_coefficient
+        self.disjoint_coefficient = disjoint_coefficient
+        self.weight_coefficient = weight_coefficient
+        self.normalize_by_size = normalize_by_size
+
+        # Column index of every innovation in the population
+        all_innovations = [g.innovations for g in genomes]
+        self._innovations = (
+            np.unique(np.concatenate(all_innovations)) if all_innovations else np.empty(0, np.int64)
+        )
+        self._columns = [np.searchsorted(self._innovations, g.innovations) for g in genomes]
+
+        self.count = 0
+        self._members: list[int] = []
+        capacity = min(len(genomes), 16)
+        num_columns = len(self._innovations)
+        self._weights = np.zeros((capacity, num_columns))
+        self._present = np.zeros((capacity, num_columns), dtype=bool)
+        self._present_count = np.zeros((capacity, num_columns), dtype=np.int64)
+        self._sizes = np.zeros(capacity, dtype=np.int64)
+        self._max_columns = np.zeros(capacity, dtype=np.int64)
+
+    def add(self, index: int) -> None:
+        """Add genome `index` as the next representative."""
+        if self.count == len(self._sizes):
+            grow = max(len(self._sizes), 1)
+            self._weights = np.vstack([self._weights, np.zeros((grow, self._weights.shape[1]))])
+            self._present = np.vstack(
+                [self._present, np.zeros((grow, self._present.shape[1]), dtype=bool)]
+            )
+            count_rows = np.zeros((grow, self._present_count.shape[1]), dtype=np.int64)
+            self._present_count = np.vstack([self._present_count, count_rows])
+            self._sizes = np.concatenate([self._sizes, np.zeros(grow, dtype=np.int64)])
+            self._max_columns = np.concatenate([self._max_columns, np.zeros(grow, dtype=np.int64)])
+
+        row = self.count
+        columns = self._columns[index]
+        self._weights[row, columns] = self.genomes[index].weights
+        self._present[row, columns] = True
+        np.cumsum(self._present[row], out=self._present_count[row])
+        self._sizes[row] = len(columns)
+        self._max_columns[row] = columns[-1] if len(columns) else -1
+        self._members.append(index)
+        self.count += 1
+
+    def distances(self, index: int) -> np.ndarray:
+        """Distance from genome `index` to every representative, in insertion order."""
+        n = self.count
+        genome = self.genomes[index]
+        columns = self._columns[index]
+        size_a = len(columns)
+        sizes_b = self._sizes[:n]
+        empty_b = sizes_b == 0
+
+        if size_a == 0:
+            # All representative genes are excess; two empty genomes compare biases
+            distances = self.excess_coefficient * sizes_b.astype(np.float64)
+            for row in np.flatnonzero(empty_b):
+                distances[row] = compiled_genome_distance(genome, self.genomes[self._members[row]])
+            return distances
+
+        present = self._present[:n, columns]
+        matching = present.sum(axis=1)
+        weight_diff = np.abs(self._weights[:n, columns] - genome.weights)
+        weight_diff_sum = np.where(present, weight_diff, 0.0).sum(axis=1)
+        avg_weight_diff = np.divide(
+            weight_diff_sum, matching, out=np.zeros(n), where=matching > 0
+        )
+
+        # Excess genes lie beyond the other genome's max innovation
+        excess_a = size_a - np.searchsorted(columns, self._max_columns[:n], side='right')
+        excess_b = sizes_b - self._present_count[np.arange(n), columns[-1]]
+        excess_count = excess_a + excess_b
+        disjoint_count = (size_a - matching - excess_a) + (sizes_b - matching - excess_b)
+
+        if self.normalize_by_size:
+            norm = np.maximum(np.maximum(sizes_b, size_a), 1)
+        else:
+            norm = 1
+
+        distances = (
+            (self.excess_coefficient * excess_count / norm) +
+            (self.disjoint_coefficient * disjoint_count / norm) +
+            (self.weight_coefficient * avg_weight_diff)
+        )
+        distances[empty_b] = self.excess_coefficient * size_a
+        return distances
+
+
+class NEATDistanceFunction:
+    """
+    NEAT compatibility distance with fixed coefficients and a compiled-genome cache.
+
+    Callable as a speciation distance_fn; assign_species detects it and uses
+    the batched NEATRepresentatives kernel instead of per-pair calls.
+    """
+
+    def __init__(
+        self,
+        excess_coefficient: float = 1.0,
+        disjoint_coefficient: float = 1.0,
+        weight_coefficient: float = 0.4,
+        cache: NEATGenomeCache | None = None,
+    ):
+        self.excess_coefficient = excess_coefficient
+        self.disjoint_coefficient = disjoint_coefficient
+        self.weight_coefficient = weight_coefficient
+        self.cache = cache if cache is not None else NEATGenomeCache()
+
+    def __call__(self, genome_a: dict, genome_b: dict) -> float:
+        return compiled_genome_distance(
+            self.cache.get(genome_a),
+            self.cache.get(genome_b),
+            excess_coefficient=self.excess_coefficient,
+            disjoint_coefficient=self.disjoint_coefficient,
+            weight_coefficient=self.weight_coefficient,
+        )
+
+    def representatives(self, genomes: list[dict]) -> NEATRepresentatives:
+        """One-vs-many kernel over a population."""
+        return NEATRepresentatives(
+            [self.cache.get(g) for g in genomes],
+            excess_coefficient=self.excess_coefficient,
+            disjoint_coefficient=self.disjoint_coefficient,
+            weight_coefficient=self.weight_coefficient,
+        )
+
+
 def create_neat_distance_fn(
     excess_coefficient: float = 1.0,
     disjoint_coefficient: float = 1.0,
     weight_coefficient: float = 0.4,
+    cache: NEATGenomeCache | None = None,
 ):
     """
     Create a distance function with specific coefficients.
 
     This returns a function compatible with the speciation system's
-    distance_fn parameter.
+    distance_fn parameter. Genomes are compiled once and cached by id, so
+    create a new function (or cache) per generation.
 
     Args:
         excess_coefficient: Weight for excess gene term
         disjoint_coefficient: Weight for disjoint gene term
         weight_coefficient: Weight for weight difference term
+        cache: Compiled-genome cache to use (default: a new one)
 
     Returns:
-        Distance function: (genome_a, genome_b) -> float
-    """
-    def distance_fn(genome_a: dict, genome_b: dict) -> float:
-        return neat_genome_distance_from_dict(
-            genome_a,
-            genome_b,
-            excess_coefficient=excess_coefficient,
-            disjoint_coefficient=disjoint_coefficient,
-            weight_coefficient=weight_coefficient,
-        )
-
-    return distance_fn
+        Distance function: (genome_a, genome_b) -> float (a NEATDistanceFunction)
+    """
+    return NEATDistanceFunction(
+        excess_coefficient=excess_coefficient,
+        disjoint_coefficient=disjoint_coefficient,
+        weight_coefficient=weight_coefficient,
+        cache=cache,
+    )
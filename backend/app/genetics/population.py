@@ -40,6 +40,7 @@ from .crossover import (
 from .fitness_sharing import apply_fitness_sharing
 from .speciation import apply_speciation
 from .neat_distance import create_neat_distance_fn
+from app.core.profiling import span
 from app.neural.network import get_input_size
 from app.neural.neat_network import create_minimal_neat_genome
 from app.schemas.neat import InnovationCounter
@@ -629,53 +630,54 @@ def evolve_population(
 
     # Apply fitness sharing if enabled (before selection)
     # This penalizes creatures in crowded niches to maintain diversity
-    selection_fitness = fitness_scores
-    if config.use_fitness_sharing:
-        selection_fitness = apply_fitness_sharing(
-            genomes, fitness_scores, config.sharing_radius
-        )
+    with span("evolve.selection"):
+        selection_fitness = fitness_scores
+        if config.use_fitness_sharing:
+            selection_fitness = apply_fitness_sharing(
+                genomes, fitness_scores, config.sharing_radius
+            )
 
-    # Select survivors based on configured method
-    survival_rate = 1 - config.cull_percentage
-    num_survivors = max(1, int(len(genomes) * survival_rate))
-
-    # Species list for within-species breeding (only used when selection_method='speciation')
-    species_list = None
-
-    # Apply speciation if selection_method is 'speciation'
-    if config.selection_method == 'speciation':
-        # Speciation groups creatures by genome similarity
-        # Selection happens within each species, protecting diverse solutions
-        # Use NEAT distance function if NEAT is enabled
-        distance_fn = None
-        if config.use_neat:
-            distance_fn = create_neat_distance_fn(
-                excess_coefficient=config.neat_excess_coefficient,
-                disjoint_coefficient=config.neat_disjoint_coefficient,
-                weight_coefficient=config.neat_weight_coefficient,
+        # Select survivors based on configured method
+        survival_rate = 1 - config.cull_percentage
+        num_survivors = max(1, int(len(genomes) * survival_rate))
+
+        # Species list for within-species breeding (only used when selection_method='speciation')
+        species_list = None
+
+        # Apply speciation if selection_method is 'speciation'
+        if config.selection_method == 'speciation':
+            # Speciation groups creatures by genome similarity
+            # Selection happens within each species, protecting diverse solutions
+            # Use NEAT distance function if NEAT is enabled
+            distance_fn = None
+            if config.use_neat:
+                distance_fn = create_neat_distance_fn(
+                    excess_coefficient=config.neat_excess_coefficient,
+                    disjoint_coefficient=config.neat_disjoint_coefficient,
+                    weight_coefficient=config.neat_weight_coefficient,
+                )
+            survivors, species_list = apply_speciation(
+                genomes,
+                selection_fitness,
+                config.compatibility_threshold,
+                survival_rate,
+                config.min_species_size,
+                distance_fn=distance_fn,
             )
-        survivors, species_list = apply_speciation(
-            genomes,
-            selection_fitness,
-            config.compatibility_threshold,
-            survival_rate,
-            config.min_species_size,
-            distance_fn=distance_fn,
-        )
-    elif config.selection_method == 'truncation':
-        # Strict cutoff - only top performers survive
-        result = truncation_selection(genomes, selection_fitness, survival_rate)
-        survivors = result.survivors
-    elif config.selection_method == 'tournament':
-        # Tournament selection - random groups, best of each survives
-        survivors = tournament_selection(
-            genomes, selection_fitness, num_survivors, config.tournament_size
-        )
-    else:  # 'rank' (default)
-        # Rank-based selection - higher rank = higher survival probability
-        # Still uses truncation for initial survival, but rank-based for breeding
-        result = truncation_selection(genomes, selection_fitness, survival_rate)
-        survivors = result.survivors
+        elif config.selection_method == 'truncation':
+            # Strict cutoff - only top performers survive
+            result = truncation_selection(genomes, selection_fitness, survival_rate)
+            survivors = result.survivors
+        elif config.selection_method == 'tournament':
+            # Tournament selection - random groups, best of each survives
+            survivors = tournament_selection(
+                genomes, selection_fitness, num_survivors, config.tournament_size
+            )
+        else:  # 'rank' (default)
+            # Rank-based selection - higher rank = higher survival probability
+            # Still uses truncation for initial survival, but rank-based for breeding
+            result = truncation_selection(genomes, selection_fitness, survival_rate)
+            survivors = result.survivors
 
     # Get survivor fitness scores for rank-based selection
     # Use shared fitness for selection probabilities (if sharing enabled)
@@ -813,14 +815,15 @@ def evolve_population(
             # Use NEAT crossover if enabled
             parent1_fitness = survivor_fitness_map.get(parent1['id'], 0)
             parent2_fitness = survivor_fitness_map.get(parent2['id'], 0)
-            child = single_point_crossover(
-                parent1, parent2, constraints,
-                neural_crossover_method=config.neural_crossover_method,
-                sbx_eta=config.sbx_eta,
-                use_neat=config.use_neat,
-                fitness1=parent1_fitness,
-                fitness2=parent2_fitness,
-            )
+            with span("evolve.crossover"):
+                child = single_point_crossover(
+                    parent1, parent2, constraints,
+                    neural_crossover_method=config.neural_crossover_method,
+                    sbx_eta=config.sbx_eta,
+                    use_neat=config.use_neat,
+                    fitness1=parent1_fitness,
+                    fitness2=parent2_fitness,
+                )
             reproduction_type = 'crossover'
             # Build ancestry chain from both parents
             build_ancestry_chain(
@@ -838,14 +841,15 @@ def evolve_population(
 
         # Always mutate offspring - survivors are already kept unchanged
         # This ensures evolution always has variation (no duplicate genomes)
-        if config.use_neat:
-            # Use NEAT mutation for variable-topology networks
-            child = mutate_genome_neat(
-                child, innovation_counter, mutation_config, constraints, neat_config
-            )
-        else:
-            # Use standard mutation for fixed-topology networks
-            child = mutate_genome(child, mutation_config, constraints)
+        with span("evolve.mutation"):
+            if config.use_neat:
+                # Use NEAT mutation for variable-topology networks
+                child = mutate_genome_neat(
+                    child, innovation_counter, mutation_config, constraints, neat_config
+                )
+            else:
+                # Use standard mutation for fixed-topology networks
+                child = mutate_genome(child, mutation_config, constraints)
         # Update reproduction type if mutation was the only operator
         if reproduction_type == 'clone':
             reproduction_type = 'mutation'
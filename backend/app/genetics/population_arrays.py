@@ -0,0 +1,709 @@
+"""
+Structure-of-arrays population store.
+
+PopulationArrays holds a whole population as padded NumPy arrays (one row per
+creature, node/muscle slots padded to the simulation's MAX_NODES/MAX_MUSCLES)
+plus masks and id lists. It converts to and from the genome dict schema and
+provides vectorized versions of the fixed-topology operators:
+
+- mutate(): per-gene mutation masks over whole arrays, with the ranges of
+  mutate_node / mutate_muscle / mutate_neural_weights
+- crossover(): uniform crossover of bodies, neuralGenome weights crossed with
+  any of the neural crossover kernels
+
+and feeds the simulator directly (to_batch / to_network) without re-parsing
+dicts. Structural mutations and NEAT genomes stay on the dict path: a
+neatGenome is carried through unchanged with the other top-level fields.
+
+Padding is always zero, so padded rows load exactly like the dict path.
+"""
+
+import math
+from dataclasses import dataclass, fields
+
+import numpy as np
+import torch
+
+from app.neural.network import BatchedNeuralNetwork, NeuralConfig, get_input_size
+from app.simulation.tensors import MAX_MUSCLES, MAX_NODES, CreatureBatch
+
+from .crossover import crossover_weight_arrays, lerp_hsl
+from .mutation import GenomeConstraints, MutationConfig, gaussian_perturbation, generate_id
+
+# Muscle scalar fields: (array name, genome key, snake_case key, default)
+MUSCLE_SCALARS = (
+    ('rest_length', 'restLength', 'rest_length', 1.0),
+    ('stiffness', 'stiffness', 'stiffness', 100.0),
+    ('damping', 'damping', 'damping', 3.0),
+    ('frequency', 'frequency', 'frequency', 1.0),
+    ('amplitude', 'amplitude', 'amplitude', 0.2),
+    ('phase', 'phase', 'phase', 0.0),
+    ('bias_strength', 'biasStrength', 'bias_strength', 0.0),
+    ('velocity_strength', 'velocityStrength', 'velocity_strength', 0.0),
+    ('distance_bias', 'distanceBias', 'distance_bias', 0.0),
+    ('distance_strength', 'distanceStrength', 'distance_strength', 0.0),
+)
+# Muscle vector fields: (array name, genome key, snake_case key)
+MUSCLE_VECTORS = (
+    ('direction_bias', 'directionBias', 'direction_bias'),
+    ('velocity_bias', 'velocityBias', 'velocity_bias'),
+)
+NEURAL_WEIGHTS = ('weights_ih', 'biases_h', 'weights_ho', 'biases_o')
+
+# Genome keys held in arrays (everything else is kept in `meta`)
+_ARRAY_KEYS = {'id', 'nodes', 'muscles', 'globalFrequencyMultiplier', 'global_frequency_multiplier'}
+_NEURAL_KEYS = {'input_size', 'hidden_size', 'output_size', *NEURAL_WEIGHTS}
+
+_DEFAULT_UP = {'x': 0, 'y': 1, 'z': 0}
+
+
+@dataclass
+class PopulationArrays:
+    """
+    A population as padded arrays. P creatures, N = MAX_NODES, M = MAX_MUSCLES,
+    I/H/O = largest neural input/hidden/output size in the population.
+    """
+    ids: list[str]                       # Creature ids
+    node_ids: list[list[str]]            # Per creature, one id per valid node slot
+    muscle_ids: list[list[str]]          # Per creature, one id per valid muscle slot
+    meta: list[dict]                     # Top-level genome fields not held in arrays
+
+    # Nodes
+    node_mask: np.ndarray                # [P, N] bool
+    positions: np.ndarray                # [P, N, 3] genome positions (no spawn offset)
+    sizes: np.ndarray                    # [P, N]
+    frictions: np.ndarray                # [P, N]
+
+    # Muscles
+    muscle_mask: np.ndarray              # [P, M] bool
+    muscle_nodes: np.ndarray             # [P, M, 2] node slot indices (int64)
+    rest_length: np.ndarray              # [P, M]
+    stiffness: np.ndarray                # [P, M]
+    damping: np.ndarray                  # [P, M]
+    frequency: np.ndarray                # [P, M]
+    amplitude: np.ndarray                # [P, M]
+    phase: np.ndarray                    # [P, M]
+    direction_bias: np.ndarray           # [P, M, 3]
+    bias_strength: np.ndarray            # [P, M]
+    velocity_bias: np.ndarray            # [P, M, 3]
+    velocity_strength: np.ndarray        # [P, M]
+    distance_bias: np.ndarray            # [P, M]
+    distance_strength: np.ndarray        # [P, M]
+
+    global_freq_multiplier: np.ndarray   # [P]
+
+    # Fixed-topology neural network (neuralGenome)
+    neural_mask: np.ndarray              # [P] bool - creature has a neuralGenome
+    neural_sizes: np.ndarray             # [P, 3] input, hidden, output size (int64)
+    neural_meta: list[dict]              # Other neuralGenome fields (activation, ...)
+    weights_ih: np.ndarray               # [P, I, H]
+    biases_h: np.ndarray                 # [P, H]
+    weights_ho: np.ndarray               # [P, H, O]
+    biases_o: np.ndarray                 # [P, O]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def node_counts(self) -> np.ndarray:
+        """[P] number of nodes per creature."""
+        return self.node_mask.sum(axis=1)
+
+    @property
+    def muscle_counts(self) -> np.ndarray:
+        """[P] number of muscles per creature."""
+        return self.muscle_mask.sum(axis=1)
+
+    # -------------------------------------------------------------------------
+    # Dict conversion
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def from_genomes(cls, genomes: list[dict]) -> 'PopulationArrays':
+        """
+        Build arrays from genome dicts.
+
+        Missing fields get the defaults of creature_genomes_to_batch; snake_case
+        keys are accepted. Genomes in the canonical schema (as produced by
+        generate_random_genome, mutate_genome and the crossovers) round-trip
+        exactly through to_genomes().
+
+        Raises:
+            ValueError: If a genome does not fit the padded layout (too many
+                nodes/muscles, a muscle referencing an unknown node, or neural
+                weight lists that do not match their topology)
+        """
+        num_creatures = len(genomes)
+        arrays = _empty_arrays(num_creatures)
+
+        node_ids, muscle_ids, meta, neural_meta, neural_genomes = [], [], [], [], []
+        for p, genome in enumerate(genomes):
+            genome_id = genome.get('id', f'genome_{p}')
+            nodes = genome.get('nodes', [])
+            muscles = genome.get('muscles', [])
+            if len(nodes) > MAX_NODES or len(muscles) > MAX_MUSCLES:
+                raise ValueError(
+                    f"Genome {genome_id} has {len(nodes)} nodes / {len(muscles)} muscles "
+                    f"(max {MAX_NODES} / {MAX_MUSCLES})"
+                )
+
+            slot_of = {node['id']: i for i, node in enumerate(nodes)}
+            node_ids.append([node['id'] for node in nodes])
+            for i, node in enumerate(nodes):
+                pos = node.get('position', {'x': 0, 'y': 0.5, 'z': 0})
+                arrays['positions'][p, i] = (pos.get('x', 0), pos.get('y', 0.5), pos.get('z', 0))
+                arrays['sizes'][p, i] = node.get('size', 0.5)
+                arrays['frictions'][p, i] = node.get('friction', 0.5)
+            arrays['node_mask'][p, :len(nodes)] = True
+
+            muscle_ids.append([muscle['id'] for muscle in muscles])
+            for j, muscle in enumerate(muscles):
+                ends = (
+                    muscle.get('nodeA', muscle.get('node_a', '')),
+                    muscle.get('nodeB', muscle.get('node_b', '')),
+                )
+                if ends[0] not in slot_of or ends[1] not in slot_of:
+                    raise ValueError(
+                        f"Muscle {muscle['id']} of genome {genome_id} references an unknown node"
+                    )
+                arrays['muscle_nodes'][p, j] = (slot_of[ends[0]], slot_of[ends[1]])
+                for name, key, snake_key, default in MUSCLE_SCALARS:
+                    arrays[name][p, j] = _first_set(muscle.get(key), muscle.get(snake_key), default)
+                for name, key, snake_key in MUSCLE_VECTORS:
+                    vector = muscle.get(key) or muscle.get(snake_key) or _DEFAULT_UP
+                    if not isinstance(vector, dict):
+                        vector = {}
+                    arrays[name][p, j] = (
+                        vector.get('x', 0), vector.get('y', 1), vector.get('z', 0),
+                    )
+            arrays['muscle_mask'][p, :len(muscles)] = True
+
+            arrays['global_freq_multiplier'][p] = genome.get(
+                'globalFrequencyMultiplier', genome.get('global_frequency_multiplier', 1.0)
+            )
+
+            neural = genome.get('neuralGenome') or genome.get('neural_genome')
+            if isinstance(neural, dict) and 'weights_ih' in neural:
+                neural_key = 'neuralGenome' if genome.get('neuralGenome') else 'neural_genome'
+                neural_genomes.append(neural)
+                neural_meta.append({k: v for k, v in neural.items() if k not in _NEURAL_KEYS})
+            else:
+                neural_key = None
+                neural_genomes.append(None)
+                neural_meta.append({})
+            meta.append({
+                k: v for k, v in genome.items()
+                if k not in _ARRAY_KEYS and k != neural_key
+            })
+
+        _load_neural(arrays, neural_genomes, [len(m) for m in muscle_ids], genomes)
+
+        return cls(
+            ids=[genome.get('id', f'genome_{p}') for p, genome in enumerate(genomes)],
+            node_ids=node_ids,
+            muscle_ids=muscle_ids,
+            meta=meta,
+            neural_meta=neural_meta,
+            **arrays,
+        )
+
+    def to_genomes(self) -> list[dict]:
+        """Convert back to genome dicts (camelCase keys)."""
+        positions = self.positions.tolist()
+        sizes = self.sizes.tolist()
+        frictions = self.frictions.tolist()
+        muscle_nodes = self.muscle_nodes.tolist()
+        scalars = {name: getattr(self, name).tolist() for name, *_ in MUSCLE_SCALARS}
+        vectors = {name: getattr(self, name).tolist() for name, *_ in MUSCLE_VECTORS}
+        global_freq = self.global_freq_multiplier.tolist()
+        weights = {name: getattr(self, name) for name in NEURAL_WEIGHTS}
+
+        genomes = []
+        for p, genome_id in enumerate(self.ids):
+            ids = self.node_ids[p]
+            nodes = [
+                {
+                    'id': ids[i],
+                    'size': sizes[p][i],
+                    'friction': frictions[p][i],
+                    'position': dict(zip('xyz', positions[p][i])),
+                }
+                for i in range(len(ids))
+            ]
+            muscles = []
+            for j, muscle_id in enumerate(self.muscle_ids[p]):
+                muscle = {
+                    'id': muscle_id,
+                    'nodeA': ids[muscle_nodes[p][j][0]],
+                    'nodeB': ids[muscle_nodes[p][j][1]],
+                }
+                for name, key, _, _ in MUSCLE_SCALARS:
+                    muscle[key] = scalars[name][p][j]
+                for name, key, _ in MUSCLE_VECTORS:
+                    muscle[key] = dict(zip('xyz', vectors[name][p][j]))
+                muscles.append(muscle)
+
+            genome = {
+                'id': genome_id,
+                **self.meta[p],
+                'nodes': nodes,
+                'muscles': muscles,
+                'globalFrequencyMultiplier': global_freq[p],
+            }
+            if self.neural_mask[p]:
+                n_in, n_hid, n_out = self.neural_sizes[p].tolist()
+                genome['neuralGenome'] = {
+                    'input_size': n_in,
+                    'hidden_size': n_hid,
+                    'output_size': n_out,
+                    'weights_ih': weights['weights_ih'][p, :n_in, :n_hid].ravel().tolist(),
+                    'weights_ho': weights['weights_ho'][p, :n_hid, :n_out].ravel().tolist(),
+                    'biases_h': weights['biases_h'][p, :n_hid].tolist(),
+                    'biases_o': weights['biases_o'][p, :n_out].tolist(),
+                    **self.neural_meta[p],
+                }
+            genomes.append(genome)
+        return genomes
+
+    # -------------------------------------------------------------------------
+    # Row operations
+    # -------------------------------------------------------------------------
+
+    def select(self, rows) -> 'PopulationArrays':
+        """Copy of the creatures at `rows` (int indices, in order)."""
+        rows = np.asarray(rows, dtype=np.int64)
+        values = {}
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if isinstance(value, np.ndarray):
+                values[f.name] = value[rows]
+            else:
+                values[f.name] = [_copy_entry(value[r]) for r in rows.tolist()]
+        return PopulationArrays(**values)
+
+    @classmethod
+    def concat(cls, parts: list['PopulationArrays']) -> 'PopulationArrays':
+        """Stack populations (e.g. elites + offspring), padding neural arrays to the widest."""
+        shape = _neural_shape(parts)
+        values = {}
+        for f in fields(cls):
+            items = [getattr(part, f.name) for part in parts]
+            if f.name in NEURAL_WEIGHTS:
+                values[f.name] = np.concatenate([_pad_neural(f.name, a, shape) for a in items])
+            elif isinstance(items[0], np.ndarray):
+                values[f.name] = np.concatenate(items)
+            else:
+                values[f.name] = [entry for item in items for entry in item]
+        return cls(**values)
+
+    # -------------------------------------------------------------------------
+    # Vectorized operators
+    # -------------------------------------------------------------------------
+
+    def mutate(
+        self,
+        rng: np.random.Generator,
+        config: MutationConfig | None = None,
+        constraints: GenomeConstraints | None = None,
+    ) -> 'PopulationArrays':
+        """
+        Mutate every creature (vectorized mutate_genome without structural mutations).
+
+        Each gene mutates with probability config.rate using the ranges and
+        magnitudes of mutate_node / mutate_muscle; neural weights and biases
+        get Gaussian perturbations with config.neural_rate / neural_magnitude.
+        Children get new creature ids and keep their parent's node/muscle ids.
+
+        Args:
+            rng: Random generator driving all draws
+            config: Mutation configuration
+            constraints: Genome constraints (value ranges)
+
+        Returns:
+            New PopulationArrays (self is not modified)
+        """
+        if config is None:
+            config = MutationConfig()
+        if constraints is None:
+            constraints = GenomeConstraints()
+        child = self.select(np.arange(len(self)))
+        rate, magnitude = config.rate, config.magnitude
+        nodes, muscles = self.node_mask, self.muscle_mask
+        spawn = constraints.spawn_radius
+
+        def mutate_field(name, mask, low, high, scale):
+            value = getattr(child, name)
+            hit = mask & (rng.random(mask.shape) < rate)
+            delta = (rng.random(mask.shape) * 2 - 1) * (high - low) * scale
+            setattr(child, name, np.where(hit, np.clip(value + delta, low, high), value))
+
+        # Nodes
+        mutate_field('sizes', nodes, constraints.min_size, constraints.max_size, magnitude)
+        mutate_field('frictions', nodes, 0.1, 1.0, magnitude)
+        moved = nodes & (rng.random(nodes.shape) < rate)
+        low = np.array([-spawn, 0.3, -spawn])
+        high = np.array([spawn, spawn * 1.5, spawn])
+        delta = (rng.random(child.positions.shape) * 2 - 1) * (high - low) * magnitude * 0.5
+        child.positions = np.where(
+            moved[..., None], np.clip(child.positions + delta, low, high), child.positions,
+        )
+
+        # Muscles
+        mutate_field(
+            'stiffness', muscles, constraints.min_stiffness, constraints.max_stiffness, magnitude,
+        )
+        mutate_field('damping', muscles, 1.0, 6.0, magnitude)
+        mutate_field(
+            'frequency', muscles, constraints.min_frequency, constraints.max_frequency, magnitude,
+        )
+        mutate_field('amplitude', muscles, 0.05, constraints.max_amplitude, magnitude)
+        shifted = muscles & (rng.random(muscles.shape) < rate)
+        delta = (rng.random(muscles.shape) * 2 - 1) * math.pi * 2 * magnitude
+        child.phase = np.where(shifted, (child.phase + delta) % (math.pi * 2), child.phase)
+        mutate_field('rest_length', muscles, 0.2, 4.0, magnitude * 0.3)
+        for name in ('direction_bias', 'velocity_bias'):
+            turned = muscles & (rng.random(muscles.shape) < rate)
+            current = getattr(child, name)
+            perturbed = current + (rng.random(muscles.shape + (3,)) * 2 - 1) * magnitude
+            setattr(child, name, np.where(turned[..., None], _normalize(perturbed), current))
+        # Like mutate_muscle, zero strengths/biases read as "absent" and never mutate
+        for name, low in (('bias_strength', 0.0), ('velocity_strength', 0.0),
+                          ('distance_bias', -1.0), ('distance_strength', 0.0)):
+            mutate_field(name, muscles & (getattr(child, name) != 0), low, 1.0, magnitude)
+
+        hit = rng.random(len(self)) < rate
+        delta = (rng.random(len(self)) * 2 - 1) * (2.0 - 0.3) * magnitude
+        child.global_freq_multiplier = np.where(
+            hit,
+            np.clip(child.global_freq_multiplier + delta, 0.3, 2.0),
+            child.global_freq_multiplier,
+        )
+
+        # Neural weights (padding stays zero)
+        for name, valid in _neural_regions(self).items():
+            value = getattr(child, name)
+            mutated = gaussian_perturbation(value, config.neural_rate, config.neural_magnitude, rng)
+            setattr(child, name, np.where(valid, mutated, value))
+
+        # Metadata: new ids, slight hue drift
+        recolor = rng.random(len(self)) < rate * 0.5
+        hue_shift = rng.random(len(self)) * 0.1 - 0.05
+        child.ids = [generate_id('creature') for _ in range(len(self))]
+        for p, meta in enumerate(child.meta):
+            color = meta.get('color')
+            if color and recolor[p]:
+                meta['color'] = {**color, 'h': (color.get('h', 0.5) + hue_shift[p] + 1) % 1}
+        return child
+
+    def crossover(
+        self,
+        first: np.ndarray,
+        second: np.ndarray,
+        rng: np.random.Generator,
+        neural_method: str = 'uniform',
+        sbx_eta: float = 2.0,
+    ) -> 'PopulationArrays':
+        """
+        Uniform crossover of parent pairs (vectorized uniform_crossover).
+
+        For each child one parent (chosen at random) provides the structure:
+        node positions, muscle connectivity and neural topology. Every other
+        gene is taken from either parent with probability 0.5; the other
+        parent's gene comes from the same slot modulo its node/muscle count,
+        as in uniform_crossover. Neural weights are crossed position-wise in
+        the [input, hidden] / [hidden, output] layout with `neural_method`, so
+        the child's network always matches its muscles without
+        adapt_neural_topology.
+
+        Args:
+            first: [C] row indices of the first parents
+            second: [C] row indices of the second parents
+            rng: Random generator driving all draws
+            neural_method: Neural weight crossover ('uniform', 'interpolation', 'sbx')
+            sbx_eta: Distribution index for SBX
+
+        Returns:
+            PopulationArrays with C children
+        """
+        first = np.asarray(first, dtype=np.int64)
+        second = np.asarray(second, dtype=np.int64)
+        num_children = len(first)
+        first_structure = rng.random(num_children) < 0.5
+        structure = np.where(first_structure, first, second)
+        other = np.where(first_structure, second, first)
+        child = self.select(structure)
+
+        def other_slots(mask):
+            # Slot i of the other parent is i % count (own slot when it has none)
+            count = mask[other].sum(axis=1, keepdims=True)
+            slots = np.arange(mask.shape[1])[None, :]
+            return np.where(count > 0, slots % np.maximum(count, 1), slots), count > 0
+
+        def mix(names, mask, slots, has_other):
+            for name in names:
+                own = getattr(child, name)
+                theirs = getattr(self, name)[other[:, None], slots]
+                pick = mask & has_other & (rng.random(mask.shape) < 0.5)
+                pick = pick.reshape(pick.shape + (1,) * (own.ndim - 2))
+                setattr(child, name, np.where(pick, theirs, own))
+
+        slots, has_other = other_slots(self.node_mask)
+        mix(('sizes', 'frictions'), child.node_mask, slots, has_other)
+
+        slots, has_other = other_slots(self.muscle_mask)
+        mix(
+            [name for name, *_ in MUSCLE_SCALARS] + [name for name, *_ in MUSCLE_VECTORS],
+            child.muscle_mask, slots, has_other,
+        )
+        child.phase = child.phase % (math.pi * 2)
+
+        pick = rng.random(num_children) < 0.5
+        child.global_freq_multiplier = np.where(
+            pick, self.global_freq_multiplier[first], self.global_freq_multiplier[second],
+        )
+
+        # Neural weights: only where the other parent has a weight at that position
+        regions = _neural_regions(self)
+        for name, valid in regions.items():
+            own = getattr(child, name)
+            crossed = crossover_weight_arrays(
+                own, getattr(self, name)[other], neural_method, rng, sbx_eta,
+            )
+            setattr(child, name, np.where(valid[structure] & valid[other], crossed, own))
+
+        child.ids = [generate_id('creature') for _ in range(num_children)]
+        child.meta = [
+            {
+                'generation': max(
+                    self.meta[a].get('generation', 0), self.meta[b].get('generation', 0),
+                ) + 1,
+                'survivalStreak': 0,
+                'parentIds': [self.ids[a], self.ids[b]],
+                'controllerType': self.meta[a].get('controllerType', 'oscillator'),
+                'color': lerp_hsl(self.meta[a].get('color'), self.meta[b].get('color'), 0.5),
+            }
+            for a, b in zip(first.tolist(), second.tolist())
+        ]
+        return child
+
+    # -------------------------------------------------------------------------
+    # Simulation
+    # -------------------------------------------------------------------------
+
+    def to_batch(self, device: torch.device | None = None) -> CreatureBatch:
+        """
+        CreatureBatch for the simulator (same tensors as creature_genomes_to_batch).
+
+        Args:
+            device: Target device (cpu/cuda). Defaults to cpu.
+        """
+        if device is None:
+            device = torch.device('cpu')
+        nodes, muscles = self.node_mask, self.muscle_mask
+
+        # Spawn above ground and mass from size, as in creature_genomes_to_batch
+        positions = self.positions + np.array([0.0, 1.0, 0.0])
+        radius = self.sizes * 0.5
+        masses = np.maximum(0.5, (4 / 3) * 3.14159 * (radius ** 3) * 10)
+
+        def f32(value, mask):
+            mask = mask.reshape(mask.shape + (1,) * (value.ndim - mask.ndim))
+            return torch.from_numpy(np.where(mask, value, 0.0).astype(np.float32)).to(device)
+
+        return CreatureBatch(
+            device=device,
+            batch_size=len(self),
+            genome_ids=list(self.ids),
+            positions=f32(positions, nodes),
+            velocities=torch.zeros(len(self), MAX_NODES, 3, device=device),
+            masses=f32(masses, nodes),
+            sizes=f32(self.sizes, nodes),
+            frictions=f32(self.frictions, nodes),
+            node_mask=f32(np.ones(nodes.shape), nodes),
+            node_counts=torch.from_numpy(self.node_counts.astype(np.int64)).to(device),
+            spring_node_a=torch.from_numpy(self.muscle_nodes[..., 0].copy()).to(device),
+            spring_node_b=torch.from_numpy(self.muscle_nodes[..., 1].copy()).to(device),
+            spring_rest_length=f32(self.rest_length, muscles),
+            spring_stiffness=f32(self.stiffness, muscles),
+            spring_damping=f32(self.damping, muscles),
+            spring_frequency=f32(self.frequency, muscles),
+            spring_amplitude=f32(self.amplitude, muscles),
+            spring_phase=f32(self.phase, muscles),
+            spring_mask=f32(np.ones(muscles.shape), muscles),
+            muscle_counts=torch.from_numpy(self.muscle_counts.astype(np.int64)).to(device),
+            global_freq_multiplier=f32(self.global_freq_multiplier, np.ones(len(self), dtype=bool)),
+            direction_bias=f32(self.direction_bias, muscles),
+            bias_strength=f32(self.bias_strength, muscles),
+            velocity_bias=f32(self.velocity_bias, muscles),
+            velocity_strength=f32(self.velocity_strength, muscles),
+            distance_bias=f32(self.distance_bias, muscles),
+            distance_strength=f32(self.distance_strength, muscles),
+        )
+
+    def to_network(
+        self,
+        config: NeuralConfig,
+        max_muscles: int = MAX_MUSCLES,
+        device: str | None = None,
+    ) -> BatchedNeuralNetwork:
+        """
+        BatchedNeuralNetwork for the simulator (same as BatchedNeuralNetwork.from_genomes).
+
+        Args:
+            config: Neural configuration (batch input/hidden sizes)
+            max_muscles: Maximum number of muscles (output padding)
+            device: Target device
+        """
+        input_size = get_input_size(
+            config.neural_mode,
+            config.time_encoding,
+            config.use_proprioception,
+            config.proprioception_inputs,
+        )
+        shape = (input_size, config.hidden_size, max_muscles)
+        network = BatchedNeuralNetwork(
+            batch_size=0,
+            input_size=input_size,
+            hidden_size=config.hidden_size,
+            max_muscles=max_muscles,
+            activation=config.activation,
+            device=device,
+        )
+        network.batch_size = len(self)
+        for name, attr in zip(NEURAL_WEIGHTS, ('weights_ih', 'bias_h', 'weights_ho', 'bias_o')):
+            value = _pad_neural(name, getattr(self, name), shape)
+            setattr(network, attr, torch.from_numpy(value.astype(np.float32)).to(network.device))
+
+        counts = self.muscle_counts[:, None]
+        mask = (np.arange(max_muscles)[None, :] < counts) | ~self.neural_mask[:, None]
+        network.muscle_mask = torch.from_numpy(mask).to(network.device)
+        return network
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def _empty_arrays(num_creatures: int) -> dict[str, np.ndarray]:
+    """Zeroed body arrays per creature (neural arrays are sized by _load_neural)."""
+    arrays = {
+        'node_mask': np.zeros((num_creatures, MAX_NODES), dtype=bool),
+        'positions': np.zeros((num_creatures, MAX_NODES, 3)),
+        'sizes': np.zeros((num_creatures, MAX_NODES)),
+        'frictions': np.zeros((num_creatures, MAX_NODES)),
+        'muscle_mask': np.zeros((num_creatures, MAX_MUSCLES), dtype=bool),
+        'muscle_nodes': np.zeros((num_creatures, MAX_MUSCLES, 2), dtype=np.int64),
+        'global_freq_multiplier': np.ones(num_creatures),
+        'neural_mask': np.zeros(num_creatures, dtype=bool),
+    }
+    for name, *_ in MUSCLE_SCALARS:
+        arrays[name] = np.zeros((num_creatures, MAX_MUSCLES))
+    for name, *_ in MUSCLE_VECTORS:
+        arrays[name] = np.zeros((num_creatures, MAX_MUSCLES, 3))
+    return arrays
+
+
+def _load_neural(
+    arrays: dict,
+    neural_genomes: list,
+    muscle_counts: list[int],
+    genomes: list[dict],
+) -> None:
+    """Fill the neural arrays of `arrays` from neuralGenome dicts (None = no network)."""
+    sizes = np.zeros((len(neural_genomes), 3), dtype=np.int64)
+    for p, neural in enumerate(neural_genomes):
+        if neural is not None:
+            sizes[p] = (
+                neural.get('input_size', 0),
+                neural.get('hidden_size', len(neural.get('biases_h', []))),
+                neural.get('output_size', muscle_counts[p]),
+            )
+    n_inputs, n_hidden, n_outputs = sizes.max(axis=0).tolist() if len(sizes) else (0, 0, 0)
+    arrays['neural_sizes'] = sizes
+    arrays['weights_ih'] = np.zeros((len(sizes), n_inputs, n_hidden))
+    arrays['biases_h'] = np.zeros((len(sizes), n_hidden))
+    arrays['weights_ho'] = np.zeros((len(sizes), n_hidden, n_outputs))
+    arrays['biases_o'] = np.zeros((len(sizes), n_outputs))
+
+    for p, neural in enumerate(neural_genomes):
+        if neural is None:
+            continue
+        n_in, n_hid, n_out = sizes[p].tolist()
+        expected = {
+            'weights_ih': n_in * n_hid,
+            'biases_h': n_hid,
+            'weights_ho': n_hid * n_out,
+            'biases_o': n_out,
+        }
+        for name, length in expected.items():
+            found = len(neural.get(name, []))
+            if found != length:
+                raise ValueError(
+                    f"neuralGenome of {genomes[p].get('id', p)}: {name} has {found} values, "
+                    f"topology needs {length}"
+                )
+        arrays['weights_ih'][p, :n_in, :n_hid] = np.reshape(neural['weights_ih'], (n_in, n_hid))
+        arrays['biases_h'][p, :n_hid] = neural['biases_h']
+        arrays['weights_ho'][p, :n_hid, :n_out] = np.reshape(neural['weights_ho'], (n_hid, n_out))
+        arrays['biases_o'][p, :n_out] = neural['biases_o']
+        arrays['neural_mask'][p] = True
+
+
+def _neural_regions(population: PopulationArrays) -> dict[str, np.ndarray]:
+    """Per neural array, a mask of the entries inside each creature's topology."""
+    n_in, n_hid, n_out = (population.neural_sizes[:, k] for k in range(3))
+    n_inputs, n_hidden = population.weights_ih.shape[1:]
+    n_outputs = population.weights_ho.shape[2]
+    in_ok = np.arange(n_inputs)[None, :] < n_in[:, None]
+    hid_ok = np.arange(n_hidden)[None, :] < n_hid[:, None]
+    out_ok = np.arange(n_outputs)[None, :] < n_out[:, None]
+    return {
+        'weights_ih': in_ok[:, :, None] & hid_ok[:, None, :],
+        'biases_h': hid_ok,
+        'weights_ho': hid_ok[:, :, None] & out_ok[:, None, :],
+        'biases_o': out_ok,
+    }
+
+
+def _neural_shape(parts: list[PopulationArrays]) -> tuple[int, int, int]:
+    """Widest (I, H, O) over several populations."""
+    n_inputs = max((part.weights_ih.shape[1] for part in parts), default=0)
+    n_hidden = max((part.weights_ih.shape[2] for part in parts), default=0)
+    n_outputs = max((part.weights_ho.shape[2] for part in parts), default=0)
+    return n_inputs, n_hidden, n_outputs
+
+
+def _pad_neural(name: str, value: np.ndarray, shape: tuple[int, int, int]) -> np.ndarray:
+    """Zero-pad or truncate a neural array to the (I, H, O) layout."""
+    n_inputs, n_hidden, n_outputs = shape
+    target = {
+        'weights_ih': (n_inputs, n_hidden),
+        'biases_h': (n_hidden,),
+        'weights_ho': (n_hidden, n_outputs),
+        'biases_o': (n_outputs,),
+    }[name]
+    out = np.zeros((value.shape[0], *target))
+    common = tuple(slice(0, min(a, b)) for a, b in zip(value.shape[1:], target))
+    out[(slice(None), *common)] = value[(slice(None), *common)]
+    return out
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """Normalize [..., 3] vectors; near-zero ones become the up vector (like mutation.normalize)."""
+    length = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return np.where(length < 1e-8, np.array([0.0, 1.0, 0.0]), vectors / np.maximum(length, 1e-8))
+
+
+def _first_set(*values):
+    """First value that is not None (camelCase key, snake_case key, default)."""
+    return next(value for value in values if value is not None)
+
+
+def _copy_entry(entry):
+    """Copy one list entry of a PopulationArrays (id lists and metadata dicts are not shared)."""
+    if isinstance(entry, list):
+        return list(entry)
+    if isinstance(entry, dict):
+        return dict(entry)
+    return entry
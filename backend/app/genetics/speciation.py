@@ -11,13 +11,19 @@ Based on NEAT speciation (Stanley & Miikkulainen, 2002), simplified:
 
 The distance function is pluggable to support different genome types:
 - neural_genome_distance: For standard neural genomes (default)
-- neat_genome_distance: For NEAT genomes (future, uses innovation numbers)
+- neat_genome_distance: For NEAT genomes (uses innovation numbers)
+
+With a NEAT distance function from create_neat_distance_fn, each genome is
+compared with all species representatives at once (NEATRepresentatives).
 """
 
 from dataclasses import dataclass, field
 from typing import Callable
 
+import numpy as np
+
 from .fitness_sharing import neural_genome_distance
+from .neat_distance import NEATDistanceFunction
 
 # Type alias for distance functions
 DistanceFunction = Callable[[dict, dict], float]
@@ -83,6 +89,11 @@ def assign_species(
     if distance_fn is None:
         distance_fn = neural_genome_distance
 
+    if isinstance(distance_fn, NEATDistanceFunction):
+        return _assign_species_batched(
+            genomes, fitness_scores, compatibility_threshold, distance_fn
+        )
+
     species_list: list[Species] = []
 
     for genome, fitness in zip(genomes, fitness_scores):
@@ -110,6 +121,40 @@ def assign_species(
     return species_list
 
 
+def _assign_species_batched(
+    genomes: list[dict],
+    fitness_scores: list[float],
+    compatibility_threshold: float,
+    distance_fn: NEATDistanceFunction,
+) -> list[Species]:
+    """
+    assign_species for NEAT distance: one kernel call per genome against all
+    representatives. Same first-compatible-species rule, same assignments.
+    """
+    representatives = distance_fn.representatives(genomes)
+    species_list: list[Species] = []
+
+    for index, (genome, fitness) in enumerate(zip(genomes, fitness_scores)):
+        if species_list:
+            compatible = np.flatnonzero(representatives.distances(index) < compatibility_threshold)
+            if len(compatible):
+                species = species_list[compatible[0]]
+                species.members.append(genome)
+                species.fitness_scores.append(fitness)
+                continue
+
+        # Create new species if no compatible one found
+        species_list.append(Species(
+            id=len(species_list),
+            representative=genome,
+            members=[genome],
+            fitness_scores=[fitness],
+        ))
+        representatives.add(index)
+
+    return species_list
+
+
 def select_within_species(
     species_list: list[Species],
     survival_rate: float,
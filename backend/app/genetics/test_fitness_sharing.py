@@ -1,5 +1,8 @@
 """Tests for fitness sharing module."""
 
+import random
+
+import numpy as np
 import pytest
 
 from app.genetics.fitness_sharing import (
@@ -7,7 +10,9 @@ from app.genetics.fitness_sharing import (
     body_genome_distance,
     sharing_function,
     apply_fitness_sharing,
+    neural_distance_matrix,
 )
+from app.genetics.population import generate_population
 
 
 class TestNeuralGenomeDistance:
@@ -213,3 +218,46 @@ class TestIntegration:
         identical_fitness = shared[0]  # All identical creatures same
 
         assert unique_fitness > identical_fitness
+
+
+class TestVectorizedSharing:
+    """The distance matrix must match pairwise neural_genome_distance."""
+
+    def _mixed_population(self) -> list[dict]:
+        random.seed(0)
+        genomes = generate_population(12, neural_mode='hybrid', time_encoding='none')
+        genomes += generate_population(8, neural_mode='pure', time_encoding='sin')
+        # No neural genome (body fallback), camelCase keys, empty and ragged weights
+        genomes.append({'nodes': [1, 2], 'muscles': [1], 'globalFrequencyMultiplier': 1.3})
+        genomes.append(
+            {'neuralGenome': {'inputWeights': [[0.5, -0.5], [0.1]], 'hiddenBiases': [0.2]}}
+        )
+        genomes.append({'neuralGenome': {'weights_ih': [], 'inputWeights': [[0.3]]}})
+        genomes.append({'neuralGenome': {}, 'nodes': [1, 2, 3]})
+        return genomes
+
+    def test_matches_pairwise_distance(self):
+        genomes = self._mixed_population()
+        matrix = neural_distance_matrix(genomes)
+
+        expected = np.array([
+            [0.0 if i == j else neural_genome_distance(a, b) for j, b in enumerate(genomes)]
+            for i, a in enumerate(genomes)
+        ])
+        np.testing.assert_allclose(matrix, expected, rtol=1e-12, atol=1e-12)
+
+    def test_matches_pairwise_sharing(self):
+        genomes = self._mixed_population()
+        fitness = [float(i) for i in range(len(genomes))]
+
+        for radius, alpha in [(0.5, 1.0), (2.0, 2.0)]:
+            expected = []
+            for i, a in enumerate(genomes):
+                niche = 1.0 + sum(
+                    sharing_function(neural_genome_distance(a, b), radius, alpha)
+                    for j, b in enumerate(genomes) if i != j
+                )
+                expected.append(fitness[i] / niche)
+
+            shared = apply_fitness_sharing(genomes, fitness, sharing_radius=radius, alpha=alpha)
+            assert shared == pytest.approx(expected, rel=1e-12)
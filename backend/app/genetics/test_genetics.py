@@ -5,6 +5,8 @@ Tests selection, mutation, crossover, and population operations.
 """
 
 import math
+
+import numpy as np
 import pytest
 
 from app.genetics import (
@@ -24,11 +26,16 @@ from app.genetics import (
     remove_node,
     add_muscle,
     mutate_neural_weights,
+    mutate_neural_genome,
     # Crossover
     single_point_crossover,
     uniform_crossover,
     clone_genome,
     crossover_neural_weights,
+    uniform_crossover_neural_weights,
+    sbx_crossover_neural_weights,
+    crossover_weight_arrays,
+    breed_neural_genomes,
     adapt_neural_topology,
     initialize_neural_genome,
     # Population
@@ -393,6 +400,18 @@ class TestNeuralMutation:
         # Check rough properties of Gaussian
         mean = sum(mutated) / len(mutated)
         assert abs(mean) < 0.1  # Mean should be near 0
+        assert abs(np.std(mutated) - 0.3) < 0.02
+
+    def test_seeded_generator_is_reproducible(self):
+        """Same generator seed gives the same mutation."""
+        neural = initialize_neural_genome(num_muscles=3, hidden_size=4)
+
+        a = mutate_neural_genome(neural, 0.5, 0.3, rng=np.random.default_rng(7))
+        b = mutate_neural_genome(neural, 0.5, 0.3, rng=np.random.default_rng(7))
+
+        assert a == b
+        assert a['weights_ih'] != neural['weights_ih']
+        assert len(a['biases_o']) == 3
 
 
 # =============================================================================
@@ -492,6 +511,82 @@ class TestNeuralCrossover:
 
         assert 'weights_ih' in child or 'weights' in child
 
+    @pytest.mark.parametrize('method', ['interpolation', 'uniform', 'sbx'])
+    def test_kernels_keep_shape_and_identical_parents(self, method):
+        """Crossing a weight array with itself returns it unchanged."""
+        rng = np.random.default_rng(0)
+        weights = rng.standard_normal((5, 12))
+
+        child = crossover_weight_arrays(weights, weights, method, rng)
+
+        assert child.shape == (5, 12)
+        assert np.allclose(child, weights)
+
+    def test_uniform_picks_parent_values(self):
+        """Uniform crossover takes every weight from one of the parents."""
+        neural1 = initialize_neural_genome(num_muscles=3, hidden_size=4)
+        neural2 = initialize_neural_genome(num_muscles=3, hidden_size=4)
+
+        child = uniform_crossover_neural_weights(neural1, neural2, rng=np.random.default_rng(1))
+
+        for w, w1, w2 in zip(child['weights_ih'], neural1['weights_ih'], neural2['weights_ih']):
+            assert w in (w1, w2)
+
+    def test_sbx_spread_shrinks_with_eta(self):
+        """SBX children are centered on the parents, closer for larger eta."""
+        w1, w2 = np.zeros(20000), np.ones(20000)
+
+        low = crossover_weight_arrays(w1, w2, 'sbx', np.random.default_rng(2), sbx_eta=0.5)
+        high = crossover_weight_arrays(w1, w2, 'sbx', np.random.default_rng(2), sbx_eta=20.0)
+
+        assert abs(low.mean() - 0.5) < 0.05 and abs(high.mean() - 0.5) < 0.05
+        def to_nearest_parent(child):
+            return np.minimum(np.abs(child), np.abs(child - 1)).mean()
+
+        assert to_nearest_parent(high) < to_nearest_parent(low)
+
+    def test_extra_parent1_weights_copied(self):
+        """Weights beyond the shorter parent come from parent1."""
+        neural1 = initialize_neural_genome(num_muscles=4, hidden_size=4)
+        neural2 = initialize_neural_genome(num_muscles=2, hidden_size=4)
+
+        child = sbx_crossover_neural_weights(neural1, neural2, rng=np.random.default_rng(3))
+
+        assert len(child['weights_ho']) == 16
+        assert child['weights_ho'][8:] == neural1['weights_ho'][8:]
+
+    def test_breed_neural_genomes(self):
+        """Batched breeding gives one child per pair, shaped like its first parent."""
+        parents = [initialize_neural_genome(num_muscles=2 + i % 3, hidden_size=4) for i in range(9)]
+        first, second = [0, 1, 2, 3, 4, 5], [3, 4, 5, 6, 7, 8]
+
+        children = breed_neural_genomes(
+            parents, first, second, np.random.default_rng(4), method='uniform'
+        )
+
+        assert len(children) == 6
+        for child, a, b in zip(children, first, second):
+            assert child['output_size'] == parents[a]['output_size']
+            assert len(child['weights_ho']) == len(parents[a]['weights_ho'])
+            parent_weights = zip(parents[a]['weights_ih'], parents[b]['weights_ih'])
+            for w, (w1, w2) in zip(child['weights_ih'], parent_weights):
+                assert w in (w1, w2)
+
+        again = breed_neural_genomes(
+            parents, first, second, np.random.default_rng(4), method='uniform'
+        )
+        assert again == children
+
+        mutated = breed_neural_genomes(
+            parents,
+            first,
+            first,
+            np.random.default_rng(5),
+            mutation_rate=1.0,
+            mutation_magnitude=0.1,
+        )
+        assert all(child['biases_h'] != parents[a]['biases_h'] for child, a in zip(mutated, first))
+
     def test_adapt_topology_changes_output_size(self):
         """Topology adaptation should change output size."""
         neural = initialize_neural_genome(num_muscles=3, hidden_size=4)
@@ -10,17 +10,24 @@ Tests cover:
 - Integration with speciation
 """
 
+import random
+
 import pytest
 
 from app.genetics.neat_distance import (
+    NEATGenomeCache,
+    NEATRepresentatives,
+    compile_neat_genome,
+    compiled_genome_distance,
     neat_genome_distance,
     neat_genome_distance_from_dict,
     create_neat_distance_fn,
     _extract_neat_genome,
 )
+from app.genetics.neat_mutation import mutate_neat_genome
 from app.genetics.speciation import assign_species
 from app.neural.neat_network import create_minimal_neat_genome
-from app.schemas.neat import ConnectionGene, NEATGenome, NeuronGene
+from app.schemas.neat import ConnectionGene, InnovationCounter, NEATGenome, NeuronGene
 
 
 class TestNeatGenomeDistance:
@@ -574,3 +581,100 @@ class TestSymmetry:
         dist_ba = neat_genome_distance(genome_b, genome_a)
 
         assert dist_ab == pytest.approx(dist_ba)
+
+
+class TestCompiledGenomeDistance:
+    """The compiled (sorted-array) distance must match neat_genome_distance."""
+
+    def _mutated_population(self, size: int = 30) -> list[dict]:
+        random.seed(0)
+        counter = InnovationCounter()
+        base = create_minimal_neat_genome(input_size=4, output_size=3, innovation_counter=counter,
+                                          connectivity='sparse')
+        genomes = []
+        for i in range(size):
+            genome = base
+            for _ in range(i % 6):
+                genome = mutate_neat_genome(
+                    genome, counter, add_connection_rate=0.7, add_node_rate=0.4
+                )
+            genomes.append({'id': f'creature-{i}', 'neatGenome': genome.model_dump()})
+        # Edge cases: no connections, no genome at all
+        genomes.append({'id': 'empty', 'neatGenome': {
+            'neurons': [{'id': 0, 'type': 'input', 'bias': 0.3}],
+            'connections': [],
+        }})
+        genomes.append({'id': 'missing'})
+        return genomes
+
+    def test_matches_reference_distance(self):
+        genomes = self._mutated_population()
+        parsed = [_extract_neat_genome(g) for g in genomes]
+        compiled = [compile_neat_genome(g) for g in genomes]
+
+        for normalize in (True, False):
+            for i in range(len(genomes)):
+                for j in range(len(genomes)):
+                    expected = neat_genome_distance(parsed[i], parsed[j], 1.5, 0.7, 0.4, normalize)
+                    actual = compiled_genome_distance(
+                        compiled[i], compiled[j], 1.5, 0.7, 0.4, normalize
+                    )
+                    assert actual == pytest.approx(expected, rel=1e-12, abs=1e-12)
+
+    def test_compiles_models_and_dicts_alike(self):
+        genome = self._mutated_population()[5]
+        from_dict = compile_neat_genome(genome)
+        from_model = compile_neat_genome(_extract_neat_genome(genome))
+
+        assert from_dict.innovations.tolist() == from_model.innovations.tolist()
+        assert from_dict.weights.tolist() == from_model.weights.tolist()
+        assert list(from_dict.innovations) == sorted(from_dict.innovations)
+
+    def test_distance_fn_compiles_each_genome_once(self):
+        genomes = self._mutated_population()
+        cache = NEATGenomeCache()
+        distance_fn = create_neat_distance_fn(cache=cache)
+
+        species = assign_species(genomes, [1.0] * len(genomes), 1.0, distance_fn=distance_fn)
+
+        assert sum(s.size for s in species) == len(genomes)
+        assert len(cache) == len(genomes)
+        assert cache.get(genomes[0]) is cache.get(genomes[0])
+
+
+class TestBatchedSpeciation:
+    """The one-vs-many kernel must reproduce per-pair distances and species."""
+
+    def test_kernel_matches_pairwise(self):
+        genomes = TestCompiledGenomeDistance()._mutated_population()
+        compiled = [compile_neat_genome(g) for g in genomes]
+        kernel = NEATRepresentatives(compiled, 1.5, 0.7, 0.4)
+
+        # Every genome becomes a representative (including the empty ones)
+        for index in range(len(genomes)):
+            if kernel.count:
+                expected = [
+                    compiled_genome_distance(compiled[index], compiled[rep], 1.5, 0.7, 0.4)
+                    for rep in range(kernel.count)
+                ]
+                actual = kernel.distances(index).tolist()
+                assert actual == pytest.approx(expected, rel=1e-12, abs=1e-12)
+            kernel.add(index)
+
+    @pytest.mark.parametrize("threshold", [0.2, 0.5, 1.0, 3.0])
+    def test_same_species_as_pairwise(self, threshold):
+        genomes = TestCompiledGenomeDistance()._mutated_population(60)
+        fitness = [float(i) for i in range(len(genomes))]
+        distance_fn = create_neat_distance_fn()
+
+        # A plain function is not detected as NEAT, so it takes the per-pair path
+        pairwise = assign_species(
+            genomes, fitness, threshold, distance_fn=lambda a, b: distance_fn(a, b)
+        )
+        batched = assign_species(genomes, fitness, threshold, distance_fn=distance_fn)
+
+        def members(species):
+            return [[g['id'] for g in s.members] for s in species]
+
+        assert members(batched) == members(pairwise)
+        assert [s.fitness_scores for s in batched] == [s.fitness_scores for s in pairwise]
@@ -0,0 +1,186 @@
+"""
+Tests for the structure-of-arrays population store.
+
+Tests cover:
+- Lossless dict round trip (pure, hybrid, NEAT metadata)
+- to_batch / to_network match the dict path exactly
+- Vectorized mutation ranges, masks and padding
+- Vectorized crossover gene origins and topology
+"""
+
+import dataclasses
+import random
+
+import numpy as np
+import pytest
+import torch
+
+from app.genetics.mutation import GenomeConstraints, MutationConfig, mutate_genome
+from app.genetics.population import generate_population
+from app.genetics.population_arrays import PopulationArrays
+from app.neural.network import BatchedNeuralNetwork, NeuralConfig
+from app.schemas.neat import InnovationCounter
+from app.simulation.tensors import MAX_MUSCLES, creature_genomes_to_batch
+
+
+def _genomes(n: int, mode: str = 'pure', time_encoding: str = 'none') -> list[dict]:
+    random.seed(0)
+    genomes = generate_population(
+        n, neural_mode=mode, use_neat=mode == 'neat', time_encoding=time_encoding,
+        innovation_counter=InnovationCounter(),
+    )
+    # Structural mutations give varied node/muscle counts and adapted networks
+    if mode == 'neat':
+        return genomes
+    return [mutate_genome(g, MutationConfig(structural_rate=0.5)) for g in genomes]
+
+
+class TestConversion:
+    """Dict <-> arrays conversion."""
+
+    @pytest.mark.parametrize(
+        'mode,time_encoding', [('pure', 'none'), ('hybrid', 'cyclic'), ('neat', 'none')]
+    )
+    def test_round_trip(self, mode, time_encoding):
+        genomes = _genomes(30, mode, time_encoding)
+        population = PopulationArrays.from_genomes(genomes)
+
+        assert len(population) == 30
+        assert population.to_genomes() == genomes
+        assert population.neural_mask.all() == (mode != 'neat')
+
+    def test_padding_is_zero(self):
+        population = PopulationArrays.from_genomes(_genomes(20))
+
+        assert not population.sizes[~population.node_mask].any()
+        assert not population.stiffness[~population.muscle_mask].any()
+        for p, (n_in, n_hid, n_out) in enumerate(population.neural_sizes.tolist()):
+            assert not population.weights_ho[p, n_hid:].any()
+            assert not population.weights_ho[p, :, n_out:].any()
+
+    def test_rejects_unknown_node(self):
+        genome = _genomes(1)[0]
+        genome['muscles'][0]['nodeA'] = 'missing'
+        with pytest.raises(ValueError, match='unknown node'):
+            PopulationArrays.from_genomes([genome])
+
+    def test_rejects_mismatched_weights(self):
+        genome = _genomes(1)[0]
+        genome['neuralGenome']['weights_ho'] = genome['neuralGenome']['weights_ho'][:-1]
+        with pytest.raises(ValueError, match='weights_ho'):
+            PopulationArrays.from_genomes([genome])
+
+    def test_select_and_concat(self):
+        genomes = _genomes(10)
+        population = PopulationArrays.from_genomes(genomes)
+
+        part = population.select([7, 2])
+        assert part.to_genomes() == [genomes[7], genomes[2]]
+        part.meta[0]['generation'] = 99
+        assert genomes[7]['generation'] != 99  # Metadata is copied, not shared
+
+        both = PopulationArrays.concat([population.select([0]), population.select([1, 2])])
+        assert both.to_genomes() == genomes[:3]
+
+
+class TestSimulationInputs:
+    """to_batch / to_network match the dict path."""
+
+    def test_to_batch_matches_creature_genomes_to_batch(self):
+        genomes = _genomes(40)
+        expected = creature_genomes_to_batch(genomes)
+        batch = PopulationArrays.from_genomes(genomes).to_batch()
+
+        for f in dataclasses.fields(expected):
+            value = getattr(expected, f.name)
+            if isinstance(value, torch.Tensor):
+                assert torch.equal(getattr(batch, f.name), value), f.name
+            else:
+                assert getattr(batch, f.name) == value, f.name
+
+    @pytest.mark.parametrize('hidden_size', [8, 5])
+    def test_to_network_matches_from_genomes(self, hidden_size):
+        genomes = _genomes(40, 'hybrid', 'cyclic')
+        genomes[3] = {k: v for k, v in genomes[3].items() if k != 'neuralGenome'}
+        config = NeuralConfig(neural_mode='hybrid', hidden_size=hidden_size, time_encoding='cyclic')
+        expected = BatchedNeuralNetwork.from_genomes(
+            [g.get('neuralGenome') for g in genomes],
+            [len(g['muscles']) for g in genomes],
+            config,
+            MAX_MUSCLES,
+            'cpu',
+        )
+        network = PopulationArrays.from_genomes(genomes).to_network(config, MAX_MUSCLES, 'cpu')
+
+        for name in ('weights_ih', 'bias_h', 'weights_ho', 'bias_o', 'muscle_mask'):
+            assert torch.equal(getattr(network, name), getattr(expected, name)), name
+
+
+class TestMutation:
+    """Vectorized mutation."""
+
+    def test_zero_rates_only_change_ids(self):
+        genomes = _genomes(10)
+        population = PopulationArrays.from_genomes(genomes)
+        config = MutationConfig(rate=0.0, neural_rate=0.0)
+        child = population.mutate(np.random.default_rng(0), config)
+
+        assert child.ids != population.ids
+        for a, b in zip(child.to_genomes(), genomes):
+            assert {**a, 'id': b['id']} == b
+
+    def test_values_stay_in_range_and_original_untouched(self):
+        genomes = _genomes(50)
+        population = PopulationArrays.from_genomes(genomes)
+        constraints = GenomeConstraints()
+        config = MutationConfig(rate=1.0, neural_rate=1.0)
+        child = population.mutate(np.random.default_rng(1), config, constraints)
+
+        assert population.to_genomes() == genomes
+        nodes, muscles = child.node_mask, child.muscle_mask
+        assert (child.sizes[nodes] >= constraints.min_size).all()
+        assert (child.sizes[nodes] <= constraints.max_size).all()
+        assert (child.stiffness[muscles] >= constraints.min_stiffness).all()
+        assert ((child.phase[muscles] >= 0) & (child.phase[muscles] < 2 * np.pi)).all()
+        assert np.allclose(np.linalg.norm(child.direction_bias[muscles], axis=-1), 1.0)
+        assert not child.sizes[~nodes].any() and not child.direction_bias[~muscles].any()
+        assert (child.weights_ih != population.weights_ih).mean() > 0.5
+        # Mutated population still converts and packs like the dict path
+        expected = creature_genomes_to_batch(child.to_genomes()).spring_stiffness
+        assert torch.equal(child.to_batch().spring_stiffness, expected)
+
+
+class TestCrossover:
+    """Vectorized uniform crossover."""
+
+    def test_genes_come_from_parents(self):
+        genomes = _genomes(20)
+        population = PopulationArrays.from_genomes(genomes)
+        first, second = np.arange(10), np.arange(10, 20)
+        children = population.crossover(first, second, np.random.default_rng(2))
+
+        for c, (a, b) in enumerate(zip(first, second)):
+            child = children.to_genomes()[c]
+            assert child['parentIds'] == [genomes[a]['id'], genomes[b]['id']]
+            parent_generation = max(genomes[a]['generation'], genomes[b]['generation'])
+            assert child['generation'] == parent_generation + 1
+
+            # Topology from one parent, genes from either
+            structure = genomes[a] if children.node_ids[c] == population.node_ids[a] else genomes[b]
+            assert len(child['muscles']) == len(structure['muscles'])
+            assert child['neuralGenome']['output_size'] == len(child['muscles'])
+            parent_sizes = {n['size'] for n in genomes[a]['nodes'] + genomes[b]['nodes']}
+            assert {n['size'] for n in child['nodes']} <= parent_sizes
+            parent_weights = set(
+                genomes[a]['neuralGenome']['weights_ih'] + genomes[b]['neuralGenome']['weights_ih']
+            )
+            assert set(child['neuralGenome']['weights_ih']) <= parent_weights
+
+    def test_same_parent_reproduces_parent(self):
+        genomes = _genomes(5)
+        population = PopulationArrays.from_genomes(genomes)
+        children = population.crossover(np.arange(5), np.arange(5), np.random.default_rng(3))
+
+        for child, parent in zip(children.to_genomes(), genomes):
+            assert child['nodes'] == parent['nodes'] and child['muscles'] == parent['muscles']
+            assert child['neuralGenome'] == parent['neuralGenome']
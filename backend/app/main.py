@@ -1,3 +1,4 @@
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
@@ -6,6 +7,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.api import creatures, evolution, generations, genetics, runs, simulation
 from app.core.config import settings
 from app.core.database import engine, Base
+from app.neural.neat_network import warm_up_numba_kernels
+from app.services.executor import get_simulation_executor, shutdown_simulation_executor
 
 
 @asynccontextmanager
@@ -14,8 +17,13 @@ async def lifespan(app: FastAPI):
     # Startup: create tables if they don't exist (dev only, use alembic in prod)
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    # Compile (or load cached) NEAT kernels before the first simulation request
+    if settings.numba_warmup:
+        await asyncio.to_thread(warm_up_numba_kernels)
     yield
-    # Shutdown: close connections
+    # Shutdown: stop evolution and simulation workers and close connections
+    await evolution.shutdown_evolution_workers()
+    shutdown_simulation_executor()
     await engine.dispose()
 
 
@@ -59,6 +67,7 @@ async def health_check():
         "device": "cuda" if torch.cuda.is_available() else "cpu",
         "gpu_backend_url": gpu_backend_url,
         "mode": "proxy" if gpu_backend_url else "local",
+        "simulation_executor": get_simulation_executor().stats(),
     }
 
 
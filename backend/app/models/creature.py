@@ -123,7 +123,7 @@ class CreatureFrame(Base):
     creature_id: Mapped[str] = mapped_column(String(36), primary_key=True)
     generation: Mapped[int] = mapped_column(Integer, primary_key=True)
 
-    # Compressed frame data as binary blob
+    # Frame data as binary blob (app.simulation.frame_codec format, or legacy zlib JSON)
     frames_data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
 
     # Frame metadata
@@ -133,10 +133,11 @@ class CreatureFrame(Base):
     # Pellet positions at each frame (optional, for replay)
     pellet_frames: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
 
-    # Fitness values per frame (compressed JSON array)
+    # Fitness values per frame (frame_codec array, or legacy compressed JSON array)
     fitness_over_time: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
 
-    # Neural network activations per frame (compressed JSON array of {inputs, hidden, outputs})
+    # Neural network activations per frame (frame_codec arrays, or legacy
+    # compressed JSON of {inputs, hidden, outputs})
     activations_per_frame: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
 
     # Composite foreign key
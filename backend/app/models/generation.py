@@ -39,6 +39,9 @@ class Generation(Base):
     # Simulation duration for this generation
     simulation_time_ms: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
 
+    # Per-phase wall time and profiling spans/counters (app.core.profiling)
+    phase_timings: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+
     # Relationships
     run: Mapped["Run"] = relationship("Run", back_populates="generations")
     performances: Mapped[list["CreaturePerformance"]] = relationship(
@@ -9,6 +9,7 @@ See docs/NEAT.md for technical details.
 
 import math
 import random
+import time
 from collections import deque
 from typing import Literal, Optional
 
@@ -32,7 +33,7 @@ except ImportError:
     def njit(*args, **kwargs):
         def decorator(func):
             return func
-        return decorator if not args else decorator(args[0])
+        return decorator(args[0]) if args and callable(args[0]) else decorator
     def prange(*args):
         return range(*args)
 
@@ -68,9 +69,54 @@ ACTIVATION_SIGMOID = 2
 # =============================================================================
 # Numba JIT-compiled forward pass functions
 # These provide significant speedup (3-6x) for NEAT network evaluation
+#
+# Kernels are cached on disk (cache=True, next to this file in __pycache__ or
+# under NUMBA_CACHE_DIR) and compiled for the explicit signatures below by
+# warm_up_numba_kernels(), so a process start loads machine code instead of
+# JIT-compiling on the first simulation. Inputs come from torch as float32;
+# every packed array is built C-contiguous by _build_numba_arrays.
 # =============================================================================
 
-@njit
+_PACKED_COUNTS = "int32[::1]"
+_PACKED_ROWS = "int32[:, ::1]"
+_PACKED_VALUES = "float64[:, ::1]"
+
+NUMBA_KERNEL_SIGNATURES = {
+    '_numba_forward_single': (
+        "(float32[::1], int64, float64[::1], int32[::1], int32[::1], float64[::1], int32[::1], "
+        "int64, int32[::1], int64, int32[::1], int64, int32[::1], int64, int64, int64)"
+    ),
+    '_numba_forward_batch_parallel': (
+        f"(float32[:, ::1], {_PACKED_COUNTS}, {_PACKED_VALUES}, {_PACKED_ROWS}, {_PACKED_ROWS}, "
+        f"{_PACKED_VALUES}, {_PACKED_ROWS}, {_PACKED_COUNTS}, {_PACKED_ROWS}, {_PACKED_COUNTS}, "
+        f"{_PACKED_ROWS}, {_PACKED_COUNTS}, {_PACKED_ROWS}, {_PACKED_COUNTS}, {_PACKED_COUNTS}, "
+        "int64, int64)"
+    ),
+    '_numba_forward_full_batch_parallel': (
+        f"(float32[:, ::1], {_PACKED_VALUES}, {_PACKED_ROWS}, {_PACKED_ROWS}, {_PACKED_VALUES}, "
+        f"{_PACKED_ROWS}, {_PACKED_COUNTS}, {_PACKED_ROWS}, {_PACKED_COUNTS}, {_PACKED_ROWS}, "
+        f"{_PACKED_COUNTS}, {_PACKED_ROWS}, {_PACKED_COUNTS}, {_PACKED_ROWS}, {_PACKED_COUNTS}, "
+        f"{_PACKED_COUNTS}, int64, int64, int64)"
+    ),
+}
+# Sequential variants take exactly the same arguments as the parallel ones
+NUMBA_KERNEL_SIGNATURES['_numba_forward_batch_sequential'] = (
+    NUMBA_KERNEL_SIGNATURES['_numba_forward_batch_parallel']
+)
+NUMBA_KERNEL_SIGNATURES['_numba_forward_full_batch_sequential'] = (
+    NUMBA_KERNEL_SIGNATURES['_numba_forward_full_batch_parallel']
+)
+
+# Kernels NEATBatchedNetwork dispatches to (the single-network kernel is not on the hot path)
+WARM_UP_KERNELS = (
+    '_numba_forward_batch_parallel',
+    '_numba_forward_batch_sequential',
+    '_numba_forward_full_batch_parallel',
+    '_numba_forward_full_batch_sequential',
+)
+
+
+@njit(cache=True)
 def _numba_forward_single(
     inputs: np.ndarray,
     n_neurons: int,
@@ -129,7 +175,7 @@ def _numba_forward_single(
     return outputs
 
 
-@njit(parallel=True)
+@njit(parallel=True, cache=True)
 def _numba_forward_batch_parallel(
     inputs_batch: np.ndarray,
     n_neurons: np.ndarray,
@@ -195,7 +241,7 @@ def _numba_forward_batch_parallel(
     return all_outputs
 
 
-@njit
+@njit(cache=True)
 def _numba_forward_batch_sequential(
     inputs_batch: np.ndarray,
     n_neurons: np.ndarray,
@@ -256,6 +302,168 @@ def _numba_forward_batch_sequential(
     return all_outputs
 
 
+@njit(parallel=True, cache=True)
+def _numba_forward_full_batch_parallel(
+    inputs_batch: np.ndarray,
+    biases: np.ndarray,
+    conn_starts: np.ndarray,
+    conn_from: np.ndarray,
+    conn_weights: np.ndarray,
+    eval_order: np.ndarray,
+    n_eval: np.ndarray,
+    input_indices: np.ndarray,
+    n_inputs: np.ndarray,
+    hidden_indices: np.ndarray,
+    n_hidden: np.ndarray,
+    output_indices: np.ndarray,
+    n_outputs: np.ndarray,
+    bias_indices: np.ndarray,
+    n_bias: np.ndarray,
+    activation_codes: np.ndarray,
+    max_neurons: int,
+    max_hidden: int,
+    max_outputs: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Numba-compiled parallel forward pass returning hidden and output activations.
+
+    Same evaluation as _numba_forward_batch_parallel, but also gathers hidden
+    neuron values (in sorted neuron-ID order, truncated to max_hidden) for
+    visualization.
+
+    Returns:
+        Tuple of ([B, max_hidden] hidden activations, [B, max_outputs] outputs)
+    """
+    batch_size = inputs_batch.shape[0]
+    all_hidden = np.zeros((batch_size, max_hidden))
+    all_outputs = np.zeros((batch_size, max_outputs))
+
+    for g_idx in prange(batch_size):
+        values = np.zeros(max_neurons)
+
+        for i in range(n_bias[g_idx]):
+            values[bias_indices[g_idx, i]] = 1.0
+
+        for i in range(n_inputs[g_idx]):
+            values[input_indices[g_idx, i]] = inputs_batch[g_idx, i]
+
+        activation_code = activation_codes[g_idx]
+        for e in range(n_eval[g_idx]):
+            neuron_idx = eval_order[g_idx, e]
+            start = conn_starts[g_idx, neuron_idx]
+            end = conn_starts[g_idx, neuron_idx + 1]
+            total = biases[g_idx, neuron_idx]
+            for j in range(start, end):
+                total += values[conn_from[g_idx, j]] * conn_weights[g_idx, j]
+
+            if activation_code == ACTIVATION_TANH:
+                values[neuron_idx] = np.tanh(total)
+            elif activation_code == ACTIVATION_RELU:
+                values[neuron_idx] = max(0.0, total)
+            else:
+                clamped = max(-500.0, min(500.0, total))
+                values[neuron_idx] = 1.0 / (1.0 + np.exp(-clamped))
+
+        for i in range(min(n_hidden[g_idx], max_hidden)):
+            all_hidden[g_idx, i] = values[hidden_indices[g_idx, i]]
+
+        for i in range(n_outputs[g_idx]):
+            all_outputs[g_idx, i] = values[output_indices[g_idx, i]]
+
+    return all_hidden, all_outputs
+
+
+@njit(cache=True)
+def _numba_forward_full_batch_sequential(
+    inputs_batch: np.ndarray,
+    biases: np.ndarray,
+    conn_starts: np.ndarray,
+    conn_from: np.ndarray,
+    conn_weights: np.ndarray,
+    eval_order: np.ndarray,
+    n_eval: np.ndarray,
+    input_indices: np.ndarray,
+    n_inputs: np.ndarray,
+    hidden_indices: np.ndarray,
+    n_hidden: np.ndarray,
+    output_indices: np.ndarray,
+    n_outputs: np.ndarray,
+    bias_indices: np.ndarray,
+    n_bias: np.ndarray,
+    activation_codes: np.ndarray,
+    max_neurons: int,
+    max_hidden: int,
+    max_outputs: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Numba-compiled sequential forward pass returning hidden and output activations.
+
+    Same as parallel version but without prange (for small batches).
+    """
+    batch_size = inputs_batch.shape[0]
+    all_hidden = np.zeros((batch_size, max_hidden))
+    all_outputs = np.zeros((batch_size, max_outputs))
+
+    for g_idx in range(batch_size):
+        values = np.zeros(max_neurons)
+
+        for i in range(n_bias[g_idx]):
+            values[bias_indices[g_idx, i]] = 1.0
+
+        for i in range(n_inputs[g_idx]):
+            values[input_indices[g_idx, i]] = inputs_batch[g_idx, i]
+
+        activation_code = activation_codes[g_idx]
+        for e in range(n_eval[g_idx]):
+            neuron_idx = eval_order[g_idx, e]
+            start = conn_starts[g_idx, neuron_idx]
+            end = conn_starts[g_idx, neuron_idx + 1]
+            total = biases[g_idx, neuron_idx]
+            for j in range(start, end):
+                total += values[conn_from[g_idx, j]] * conn_weights[g_idx, j]
+
+            if activation_code == ACTIVATION_TANH:
+                values[neuron_idx] = np.tanh(total)
+            elif activation_code == ACTIVATION_RELU:
+                values[neuron_idx] = max(0.0, total)
+            else:
+                clamped = max(-500.0, min(500.0, total))
+                values[neuron_idx] = 1.0 / (1.0 + np.exp(-clamped))
+
+        for i in range(min(n_hidden[g_idx], max_hidden)):
+            all_hidden[g_idx, i] = values[hidden_indices[g_idx, i]]
+
+        for i in range(n_outputs[g_idx]):
+            all_outputs[g_idx, i] = values[output_indices[g_idx, i]]
+
+    return all_hidden, all_outputs
+
+
+def warm_up_numba_kernels(kernels: tuple[str, ...] = WARM_UP_KERNELS) -> dict[str, float]:
+    """
+    Compile (or load from the on-disk cache) the NEAT forward kernels.
+
+    Call once per process before the first NEAT simulation, e.g. at API
+    startup or in a NAS worker, so the parallel and sequential variants do
+    not JIT on the first request.
+
+    Args:
+        kernels: Names from NUMBA_KERNEL_SIGNATURES to compile
+
+    Returns:
+        Dict of kernel name -> seconds spent (empty when Numba is unavailable)
+    """
+    if not HAS_NUMBA:
+        return {}
+
+    timings = {}
+    for name in kernels:
+        start = time.perf_counter()
+        globals()[name].compile(NUMBA_KERNEL_SIGNATURES[name])
+        timings[name] = time.perf_counter() - start
+    return timings
+
+
 def create_minimal_neat_genome(
     input_size: int,
     output_size: int,
@@ -941,6 +1149,8 @@ class NEATBatchedNetwork:
     - Incoming connections and biases are pre-computed as lookup structures
     - Batch CPU transfer: all inputs converted at once instead of per-creature
     - Numba JIT compilation: 3x speedup for sequential, 5-6x for parallel (batch >= 300)
+    - forward_full uses the same packed arrays: one Numba call returns hidden + outputs
+    - Optional 'tensor' backend: depth layers evaluated with batched matmuls on device
     """
 
     # Threshold for using parallel Numba (below this, sequential is faster)
@@ -953,6 +1163,8 @@ class NEATBatchedNetwork:
         max_muscles: int = 15,
         max_hidden: int = 64,
         device: Optional[torch.device] = None,
+        backend: Literal['auto', 'tensor'] = 'auto',
+        structures: list[dict | None] | None = None,
     ):
         """
         Initialize NEAT batched network.
@@ -963,22 +1175,39 @@ class NEATBatchedNetwork:
             max_muscles: Maximum muscles (for output tensor size)
             max_hidden: Maximum hidden neurons (for hidden tensor size)
             device: Torch device
+            backend: Execution backend. 'auto' uses Numba on CPU (dict walk if Numba is
+                     missing); 'tensor' evaluates depth layers with batched matmuls on
+                     device, so inputs and outputs never leave the simulation device.
+            structures: Optional precomputed structures aligned with genomes (None entries
+                        are computed). Lets callers reuse structures of unchanged genomes.
         """
+        if backend not in ('auto', 'tensor'):
+            raise ValueError(f"Unknown NEAT backend: {backend}")
+
         self.genomes = genomes
         self.num_muscles = num_muscles
         self.max_muscles = max_muscles
         self.max_hidden = max_hidden
         self.device = device or torch.device('cpu')
         self.batch_size = len(genomes)
+        self.backend = backend
 
         # Pre-compute and cache network structures for each genome
         # This avoids recomputing topological_sort and building lookups every forward pass
         self._cached_structures: list[dict] = []
-        for genome in genomes:
-            self._cached_structures.append(self._precompute_structure(genome))
+        for i, genome in enumerate(genomes):
+            structure = structures[i] if structures is not None else None
+            if structure is None:
+                structure = self._precompute_structure(genome)
+            self._cached_structures.append(structure)
+
+        # Layered tensor backend: pack depth layers into device tensors
+        self._use_tensor = backend == 'tensor' and self.batch_size > 0
+        if self._use_tensor:
+            self._build_layered_tensors()
 
         # Build Numba-compatible packed arrays if Numba is available
-        self._use_numba = HAS_NUMBA and self.batch_size > 0
+        self._use_numba = HAS_NUMBA and self.batch_size > 0 and not self._use_tensor
         self._numba_compiled = False  # Track if JIT compilation has happened
         if self._use_numba:
             self._build_numba_arrays()
@@ -1041,6 +1270,7 @@ class NEATBatchedNetwork:
         max_neurons = 0
         max_conns = 0
         max_inputs = 0
+        max_hidden = 0
         max_outputs = 0
         max_bias = 0
         max_eval = 0
@@ -1056,6 +1286,7 @@ class NEATBatchedNetwork:
             max_conns = max(max_conns, n_conns)
 
             max_inputs = max(max_inputs, len(cache['input_ids']))
+            max_hidden = max(max_hidden, len(cache['hidden_ids']))
             max_outputs = max(max_outputs, len(cache['output_ids']))
             max_bias = max(max_bias, len(cache['bias_ids']))
             max_eval = max(max_eval, len(cache['eval_order']))
@@ -1064,6 +1295,7 @@ class NEATBatchedNetwork:
         max_neurons = max(max_neurons, 1)
         max_conns = max(max_conns, 1)
         max_inputs = max(max_inputs, 1)
+        max_hidden = max(max_hidden, 1)
         max_outputs = max(max_outputs, 1)
         max_bias = max(max_bias, 1)
         max_eval = max(max_eval, 1)
@@ -1074,6 +1306,7 @@ class NEATBatchedNetwork:
         self._nb_n_neurons = np.zeros(n, dtype=np.int32)
         self._nb_n_eval = np.zeros(n, dtype=np.int32)
         self._nb_n_inputs = np.zeros(n, dtype=np.int32)
+        self._nb_n_hidden = np.zeros(n, dtype=np.int32)
         self._nb_n_outputs = np.zeros(n, dtype=np.int32)
         self._nb_n_bias = np.zeros(n, dtype=np.int32)
         self._nb_activation_codes = np.zeros(n, dtype=np.int32)
@@ -1084,6 +1317,7 @@ class NEATBatchedNetwork:
         self._nb_conn_weights = np.zeros((n, max_conns), dtype=np.float64)
         self._nb_eval_order = np.zeros((n, max_eval), dtype=np.int32)
         self._nb_input_indices = np.zeros((n, max_inputs), dtype=np.int32)
+        self._nb_hidden_indices = np.zeros((n, max_hidden), dtype=np.int32)
         self._nb_output_indices = np.zeros((n, max_outputs), dtype=np.int32)
         self._nb_bias_indices = np.zeros((n, max_bias), dtype=np.int32)
 
@@ -1112,6 +1346,7 @@ class NEATBatchedNetwork:
             self._nb_n_neurons[g_idx] = nn
             self._nb_n_eval[g_idx] = len(cache['eval_order'])
             self._nb_n_inputs[g_idx] = len(cache['input_ids'])
+            self._nb_n_hidden[g_idx] = len(cache['hidden_ids'])
             self._nb_n_outputs[g_idx] = len(cache['output_ids'])
             self._nb_n_bias[g_idx] = len(cache['bias_ids'])
 
@@ -1153,14 +1388,184 @@ class NEATBatchedNetwork:
                     )
                 self._nb_eval_order[g_idx, i] = idx
 
-            # Input/output/bias indices
+            # Input/hidden/output/bias indices
             for i, nid in enumerate(cache['input_ids']):
                 self._nb_input_indices[g_idx, i] = id_to_idx[nid]
+            for i, nid in enumerate(cache['hidden_ids']):
+                self._nb_hidden_indices[g_idx, i] = id_to_idx[nid]
             for i, nid in enumerate(cache['output_ids']):
                 self._nb_output_indices[g_idx, i] = id_to_idx[nid]
             for i, nid in enumerate(cache['bias_ids']):
                 self._nb_bias_indices[g_idx, i] = id_to_idx[nid]
 
+    def _build_layered_tensors(self) -> None:
+        """
+        Build depth-layered weight tensors for the on-device tensor backend.
+
+        Neurons are grouped by depth (get_neuron_depths). Each depth layer is
+        packed across the whole batch into a dense [B, K, N + 1] weight tensor,
+        where K is the widest layer in the batch and N the largest neuron count
+        (the extra column is a scratch slot that absorbs padded writes). Neuron
+        slots use the same sorted-ID layout as the Numba arrays.
+        """
+        n = self.batch_size
+
+        per_genome = []
+        max_neurons = 1
+        max_inputs = max_bias = max_hidden = max_outputs = 1
+        for genome, cache in zip(self.genomes, self._cached_structures):
+            all_ids = sorted(set(
+                cache['input_ids'] + cache['output_ids'] +
+                cache['hidden_ids'] + cache['bias_ids']
+            ))
+            id_to_idx = {nid: idx for idx, nid in enumerate(all_ids)}
+
+            # Depth layers from get_neuron_depths. Depths are only a layout hint
+            # (outputs are pinned to max depth, unreachable neurons get 0), so
+            # bump each neuron past all of its sources in topological order to
+            # guarantee every layer only reads already-computed values.
+            depths = get_neuron_depths(genome)
+            layer: dict[int, int] = {nid: 0 for nid in cache['input_ids'] + cache['bias_ids']}
+            for nid in cache['eval_order']:
+                source_layer = max(
+                    (layer[from_id] for from_id, _ in cache['incoming'][nid]), default=0
+                )
+                layer[nid] = max(depths.get(nid, 0), source_layer + 1, 1)
+
+            layers: dict[int, list[int]] = {}
+            for nid in cache['eval_order']:
+                layers.setdefault(layer[nid], []).append(nid)
+
+            per_genome.append((id_to_idx, [layers[d] for d in sorted(layers)]))
+            max_neurons = max(max_neurons, len(all_ids))
+            max_inputs = max(max_inputs, len(cache['input_ids']))
+            max_bias = max(max_bias, len(cache['bias_ids']))
+            max_hidden = max(max_hidden, len(cache['hidden_ids']))
+            max_outputs = max(max_outputs, len(cache['output_ids']))
+
+        scratch = max_neurons  # Padding slot index
+        num_layers = max((len(layers) for _, layers in per_genome), default=0)
+
+        # Input/bias/hidden/output slot indices (padding -> scratch slot)
+        input_idx = np.full((n, max_inputs), scratch, dtype=np.int64)
+        bias_idx = np.full((n, max_bias), scratch, dtype=np.int64)
+        hidden_idx = np.full((n, max_hidden), scratch, dtype=np.int64)
+        output_idx = np.full((n, max_outputs), scratch, dtype=np.int64)
+        activation_codes = np.zeros(n, dtype=np.int64)
+
+        for g_idx, (cache, (id_to_idx, _)) in enumerate(zip(self._cached_structures, per_genome)):
+            for i, nid in enumerate(cache['input_ids']):
+                input_idx[g_idx, i] = id_to_idx[nid]
+            for i, nid in enumerate(cache['bias_ids']):
+                bias_idx[g_idx, i] = id_to_idx[nid]
+            for i, nid in enumerate(cache['hidden_ids']):
+                hidden_idx[g_idx, i] = id_to_idx[nid]
+            for i, nid in enumerate(cache['output_ids']):
+                output_idx[g_idx, i] = id_to_idx[nid]
+
+            activation_func = cache['activation']
+            if activation_func == tanh:
+                activation_codes[g_idx] = ACTIVATION_TANH
+            elif activation_func == relu:
+                activation_codes[g_idx] = ACTIVATION_RELU
+            else:
+                activation_codes[g_idx] = ACTIVATION_SIGMOID
+
+        # Per-layer packed weights, biases and target slots
+        self._tn_layers: list[tuple[torch.Tensor, torch.Tensor, torch.Tensor]] = []
+        for depth in range(num_layers):
+            width = max(
+                (len(layers[depth]) for _, layers in per_genome if depth < len(layers)),
+                default=1,
+            )
+            weights = np.zeros((n, width, max_neurons + 1), dtype=np.float32)
+            biases = np.zeros((n, width), dtype=np.float32)
+            targets = np.full((n, width), scratch, dtype=np.int64)
+
+            structures = zip(self._cached_structures, per_genome)
+            for g_idx, (cache, (id_to_idx, layers)) in enumerate(structures):
+                if depth >= len(layers):
+                    continue
+                for k, nid in enumerate(layers[depth]):
+                    targets[g_idx, k] = id_to_idx[nid]
+                    biases[g_idx, k] = cache['neuron_bias'][nid]
+                    for from_id, weight in cache['incoming'][nid]:
+                        weights[g_idx, k, id_to_idx[from_id]] += weight
+
+            self._tn_layers.append((
+                torch.from_numpy(weights).to(self.device),
+                torch.from_numpy(biases).to(self.device),
+                torch.from_numpy(targets).to(self.device),
+            ))
+
+        self._tn_num_slots = max_neurons + 1
+        self._tn_input_idx = torch.from_numpy(input_idx).to(self.device)
+        self._tn_bias_idx = torch.from_numpy(bias_idx).to(self.device)
+        self._tn_hidden_idx = torch.from_numpy(hidden_idx[:, :self.max_hidden]).to(self.device)
+        self._tn_output_idx = torch.from_numpy(output_idx[:, :self.max_muscles]).to(self.device)
+
+        # Output mask: only each creature's first num_muscles outputs (and only real outputs)
+        n_outputs = np.array([len(c['output_ids']) for c in self._cached_structures])
+        out_cols = np.arange(self._tn_output_idx.shape[1])
+        output_mask = (out_cols[None, :] < np.minimum(n_outputs, self.num_muscles)[:, None])
+        self._tn_output_mask = torch.from_numpy(output_mask.astype(np.float32)).to(self.device)
+
+        n_hidden = np.array([len(c['hidden_ids']) for c in self._cached_structures])
+        hidden_cols = np.arange(self._tn_hidden_idx.shape[1])
+        hidden_mask = hidden_cols[None, :] < n_hidden[:, None]
+        self._tn_hidden_mask = torch.from_numpy(hidden_mask.astype(np.float32)).to(self.device)
+
+        # Activation: a single function for homogeneous batches, per-creature select otherwise
+        unique_codes = np.unique(activation_codes)
+        self._tn_activation_code = int(unique_codes[0]) if len(unique_codes) == 1 else None
+        self._tn_activation_codes = torch.from_numpy(activation_codes).to(self.device).unsqueeze(1)
+
+    def _tensor_activation(self, x: torch.Tensor) -> torch.Tensor:
+        """Apply each creature's activation function to [B, K] pre-activations."""
+        if self._tn_activation_code == ACTIVATION_TANH:
+            return torch.tanh(x)
+        if self._tn_activation_code == ACTIVATION_RELU:
+            return torch.relu(x)
+        if self._tn_activation_code == ACTIVATION_SIGMOID:
+            return torch.sigmoid(x)
+        codes = self._tn_activation_codes
+        return torch.where(
+            codes == ACTIVATION_TANH, torch.tanh(x),
+            torch.where(codes == ACTIVATION_RELU, torch.relu(x), torch.sigmoid(x)),
+        )
+
+    def _forward_tensor(self, inputs: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor]:
+        """
+        Evaluate all networks layer by layer with batched matmuls on device.
+
+        Args:
+            inputs: [B, input_size] sensor inputs (on self.device)
+
+        Returns:
+            Tuple of ([B, max_hidden] hidden activations, [B, max_muscles] outputs)
+        """
+        values = torch.zeros(self.batch_size, self._tn_num_slots, device=self.device)
+
+        # Bias neurons are constant 1.0, inputs are scattered into their slots
+        values.scatter_(1, self._tn_bias_idx, 1.0)
+        n_in = min(inputs.shape[1], self._tn_input_idx.shape[1])
+        values.scatter_(1, self._tn_input_idx[:, :n_in], inputs[:, :n_in].to(values.dtype))
+
+        for weights, biases, targets in self._tn_layers:
+            pre = torch.bmm(weights, values.unsqueeze(-1)).squeeze(-1) + biases  # [B, K]
+            values.scatter_(1, targets, self._tensor_activation(pre))
+
+        hidden = values.gather(1, self._tn_hidden_idx) * self._tn_hidden_mask
+        outputs = values.gather(1, self._tn_output_idx) * self._tn_output_mask
+
+        # Pad to the fixed [B, max_hidden] / [B, max_muscles] shapes
+        if hidden.shape[1] < self.max_hidden:
+            hidden = torch.nn.functional.pad(hidden, (0, self.max_hidden - hidden.shape[1]))
+        if outputs.shape[1] < self.max_muscles:
+            outputs = torch.nn.functional.pad(outputs, (0, self.max_muscles - outputs.shape[1]))
+
+        return hidden, outputs
+
     def _forward_numba(self, inputs_cpu: np.ndarray) -> np.ndarray:
         """
         Execute forward pass using Numba JIT-compiled functions.
@@ -1213,6 +1618,72 @@ class NEATBatchedNetwork:
                 self._nb_max_outputs,
             )
 
+    def _forward_full_numba(self, inputs_cpu: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Execute full-activation forward pass using Numba JIT-compiled functions.
+
+        Args:
+            inputs_cpu: [B, input_size] numpy array of inputs
+
+        Returns:
+            Tuple of ([B, max_hidden] hidden activations, [B, max_outputs] outputs)
+        """
+        kernel = (
+            _numba_forward_full_batch_parallel
+            if self.batch_size >= self.NUMBA_PARALLEL_THRESHOLD
+            else _numba_forward_full_batch_sequential
+        )
+        return kernel(
+            inputs_cpu,
+            self._nb_biases,
+            self._nb_conn_starts,
+            self._nb_conn_from,
+            self._nb_conn_weights,
+            self._nb_eval_order,
+            self._nb_n_eval,
+            self._nb_input_indices,
+            self._nb_n_inputs,
+            self._nb_hidden_indices,
+            self._nb_n_hidden,
+            self._nb_output_indices,
+            self._nb_n_outputs,
+            self._nb_bias_indices,
+            self._nb_n_bias,
+            self._nb_activation_codes,
+            self._nb_max_neurons,
+            self.max_hidden,
+            self._nb_max_outputs,
+        )
+
+    def _numba_outputs_to_tensor(self, numba_outputs: np.ndarray) -> torch.Tensor:
+        """
+        Convert [B, max_outputs] Numba outputs to a masked [B, max_muscles] tensor.
+
+        Outputs beyond each creature's muscle count are zeroed.
+        """
+        # Fast conversion: create tensor directly from numpy
+        # Numba outputs are [B, max_outputs], we need [B, max_muscles]
+        if self._nb_max_outputs == self.max_muscles:
+            # Same size - direct conversion
+            outputs = torch.from_numpy(numba_outputs).float()
+        else:
+            # Need to pad/truncate - use numpy slicing
+            outputs_np = np.zeros((self.batch_size, self.max_muscles), dtype=np.float64)
+            copy_cols = min(self._nb_max_outputs, self.max_muscles)
+            outputs_np[:, :copy_cols] = numba_outputs[:, :copy_cols]
+            outputs = torch.from_numpy(outputs_np).float()
+
+        # Apply num_muscles masking efficiently using numpy before conversion
+        # Create mask for outputs beyond each creature's muscle count
+        if not hasattr(self, '_num_muscles_mask'):
+            # Build and cache the mask
+            mask = np.zeros((self.batch_size, self.max_muscles), dtype=np.float64)
+            for i in range(self.batch_size):
+                mask[i, :self.num_muscles[i]] = 1.0
+            self._num_muscles_mask = torch.from_numpy(mask).float()
+
+        return outputs * self._num_muscles_mask
+
     @torch.no_grad()
     def forward(self, inputs: torch.Tensor) -> torch.Tensor:
         """
@@ -1227,36 +1698,17 @@ class NEATBatchedNetwork:
         if self.batch_size == 0:
             return torch.zeros(0, self.max_muscles, device=self.device)
 
+        # Layered tensor backend stays on device (no CPU round-trip)
+        if self._use_tensor:
+            return self._forward_tensor(inputs)[1]
+
         # Single batch CPU transfer (optimization: avoid per-creature transfers)
         inputs_cpu = inputs.cpu().numpy()
 
         # Use Numba-accelerated forward pass if available
         if self._use_numba:
             numba_outputs = self._forward_numba(inputs_cpu)
-
-            # Fast conversion: create tensor directly from numpy
-            # Numba outputs are [B, max_outputs], we need [B, max_muscles]
-            if self._nb_max_outputs == self.max_muscles:
-                # Same size - direct conversion
-                outputs = torch.from_numpy(numba_outputs).float()
-            else:
-                # Need to pad/truncate - use numpy slicing
-                outputs_np = np.zeros((self.batch_size, self.max_muscles), dtype=np.float64)
-                copy_cols = min(self._nb_max_outputs, self.max_muscles)
-                outputs_np[:, :copy_cols] = numba_outputs[:, :copy_cols]
-                outputs = torch.from_numpy(outputs_np).float()
-
-            # Apply num_muscles masking efficiently using numpy before conversion
-            # Create mask for outputs beyond each creature's muscle count
-            if hasattr(self, '_num_muscles_mask'):
-                outputs = outputs * self._num_muscles_mask
-            else:
-                # Build and cache the mask
-                mask = np.zeros((self.batch_size, self.max_muscles), dtype=np.float64)
-                for i in range(self.batch_size):
-                    mask[i, :self.num_muscles[i]] = 1.0
-                self._num_muscles_mask = torch.from_numpy(mask).float()
-                outputs = outputs * self._num_muscles_mask
+            outputs = self._numba_outputs_to_tensor(numba_outputs)
 
             # Move to target device if not CPU
             if self.device.type != 'cpu':
@@ -1332,12 +1784,56 @@ class NEATBatchedNetwork:
                 - 'hidden': [B, max_hidden] hidden layer activations (padded)
                 - 'outputs': [B, max_muscles] output layer activations
         """
-        outputs = torch.zeros(self.batch_size, self.max_muscles, device=self.device)
-        hidden = torch.zeros(self.batch_size, self.max_hidden, device=self.device)
+        if self.batch_size == 0:
+            return {
+                'inputs': inputs,
+                'hidden': torch.zeros(0, self.max_hidden, device=self.device),
+                'outputs': torch.zeros(0, self.max_muscles, device=self.device),
+            }
+
+        if self._use_tensor:
+            hidden, outputs = self._forward_tensor(inputs)
+            return {
+                'inputs': inputs,
+                'hidden': hidden,
+                'outputs': outputs,
+            }
 
         # Single batch CPU transfer
         inputs_cpu = inputs.cpu().numpy()
 
+        if not self._use_numba:
+            return self._forward_full_loop(inputs, inputs_cpu)
+
+        # One Numba call evaluates every network and gathers hidden + output values
+        numba_hidden, numba_outputs = self._forward_full_numba(inputs_cpu)
+        hidden = torch.from_numpy(numba_hidden).float()
+        outputs = self._numba_outputs_to_tensor(numba_outputs)
+
+        if self.device.type != 'cpu':
+            hidden = hidden.to(self.device)
+            outputs = outputs.to(self.device)
+
+        return {
+            'inputs': inputs,
+            'hidden': hidden,
+            'outputs': outputs,
+        }
+
+    def _forward_full_loop(self, inputs: torch.Tensor, inputs_cpu: np.ndarray) -> dict:
+        """
+        Dict-based forward_full fallback (used when Numba is unavailable).
+
+        Args:
+            inputs: [B, input_size] original input tensor (returned as-is)
+            inputs_cpu: [B, input_size] numpy copy of inputs
+
+        Returns:
+            Same dict as forward_full
+        """
+        outputs = torch.zeros(self.batch_size, self.max_muscles, device=self.device)
+        hidden = torch.zeros(self.batch_size, self.max_hidden, device=self.device)
+
         for i in range(self.batch_size):
             result = self._forward_full_cached(i, inputs_cpu[i])
 
@@ -1414,7 +1910,9 @@ class NEATBatchedNetwork:
         return output
 
     @torch.no_grad()
-    def forward_full_with_dead_zone(self, inputs: torch.Tensor, dead_zone: float = 0.1) -> dict:
+    def forward_full_with_dead_zone(
+        self, inputs: torch.Tensor, dead_zone: float | torch.Tensor = 0.1
+    ) -> dict:
         """
         Forward pass with dead zone applied, returning full activations (pure mode).
 
@@ -1426,12 +1924,39 @@ class NEATBatchedNetwork:
         # Store raw outputs before dead zone
         result['outputs_raw'] = result['outputs'].clone()
 
-        if dead_zone > 0:
+        if isinstance(dead_zone, torch.Tensor):
+            # Per-creature [B] thresholds (packed batches)
+            mask = torch.abs(result['outputs']) < dead_zone.unsqueeze(-1)
+            result['outputs'] = result['outputs'].masked_fill(mask, 0.0)
+        elif dead_zone > 0:
             mask = torch.abs(result['outputs']) < dead_zone
             result['outputs'] = result['outputs'].masked_fill(mask, 0.0)
 
         return result
 
+    def subset(self, indices: torch.Tensor) -> "NEATBatchedNetwork":
+        """
+        Network of the creatures at `indices` (used to compact a running batch).
+
+        Reuses the cached structures, so only the packed arrays are rebuilt.
+
+        Args:
+            indices: [K] long tensor of creature indices to keep, in order
+
+        Returns:
+            New NEATBatchedNetwork with batch size K
+        """
+        keep = indices.tolist()
+        return NEATBatchedNetwork(
+            [self.genomes[i] for i in keep],
+            [self.num_muscles[i] for i in keep],
+            self.max_muscles,
+            self.max_hidden,
+            self.device,
+            self.backend,
+            structures=[self._cached_structures[i] for i in keep],
+        )
+
     @classmethod
     def from_genome_dicts(
         cls,
@@ -1440,6 +1965,7 @@ class NEATBatchedNetwork:
         max_muscles: int = 15,
         max_hidden: int = 64,
         device: Optional[torch.device] = None,
+        backend: Literal['auto', 'tensor'] = 'auto',
     ) -> "NEATBatchedNetwork":
         """
         Create NEATBatchedNetwork from genome dicts (from API).
@@ -1450,6 +1976,7 @@ class NEATBatchedNetwork:
             max_muscles: Maximum muscles
             max_hidden: Maximum hidden neurons
             device: Torch device
+            backend: Execution backend ('auto' or 'tensor')
         """
         genomes = [NEATGenome(**g) for g in neat_genomes]
-        return cls(genomes, num_muscles, max_muscles, max_hidden, device)
+        return cls(genomes, num_muscles, max_muscles, max_hidden, device, backend)
@@ -8,6 +8,7 @@ Architecture matches TypeScript: Input -> Hidden (configurable activation) -> Ou
 Weights are evolved through genetic algorithms, NOT trained with gradients.
 """
 
+import numpy as np
 import torch
 from typing import Literal, Optional
 from dataclasses import dataclass
@@ -128,6 +129,21 @@ def calculate_weight_count(input_size: int, hidden_size: int, output_size: int)
     return (input_size * hidden_size) + hidden_size + (hidden_size * output_size) + output_size
 
 
+
+def _stack_flat(genomes: list[dict], key: str, shape: tuple[int, ...]) -> np.ndarray:
+    """
+    Stack one flat weight list of each genome into a [G, *shape] array.
+
+    Lists shorter than the shape are zero-padded, longer ones truncated. All
+    genomes must have lists of the same length (see from_genomes grouping).
+    """
+    size = int(np.prod(shape, dtype=np.int64))
+    stacked = np.zeros((len(genomes), size))
+    values = np.array([genome.get(key, [])[:size] for genome in genomes], dtype=np.float64)
+    values = values.reshape(len(genomes), -1)
+    stacked[:, :values.shape[1]] = values
+    return stacked.reshape(len(genomes), *shape)
+
 class BatchedNeuralNetwork:
     """
     Batched neural network for multiple creatures.
@@ -196,6 +212,32 @@ class BatchedNeuralNetwork:
         self.muscle_mask = self.muscle_mask.to(device)
         return self
 
+    def subset(self, indices: torch.Tensor) -> 'BatchedNeuralNetwork':
+        """
+        Network of the creatures at `indices` (used to compact a running batch).
+
+        Args:
+            indices: [K] long tensor of creature indices to keep, in order
+
+        Returns:
+            New BatchedNeuralNetwork with batch size K
+        """
+        network = BatchedNeuralNetwork(
+            batch_size=0,
+            input_size=self.input_size,
+            hidden_size=self.hidden_size,
+            max_muscles=self.max_muscles,
+            activation=self.activation_name,
+            device=self.device,
+        )
+        network.batch_size = len(indices)
+        network.weights_ih = self.weights_ih[indices]
+        network.bias_h = self.bias_h[indices]
+        network.weights_ho = self.weights_ho[indices]
+        network.bias_o = self.bias_o[indices]
+        network.muscle_mask = self.muscle_mask[indices]
+        return network
+
     @torch.no_grad()
     def forward(self, inputs: torch.Tensor) -> torch.Tensor:
         """
@@ -272,7 +314,9 @@ class BatchedNeuralNetwork:
         return output
 
     @torch.no_grad()
-    def forward_full_with_dead_zone(self, inputs: torch.Tensor, dead_zone: float = 0.1) -> dict:
+    def forward_full_with_dead_zone(
+        self, inputs: torch.Tensor, dead_zone: float | torch.Tensor = 0.1
+    ) -> dict:
         """
         Forward pass with dead zone applied, returning full activations (pure mode).
 
@@ -288,7 +332,11 @@ class BatchedNeuralNetwork:
         # Store raw outputs before dead zone for visualization
         result['outputs_raw'] = result['outputs'].clone()
 
-        if dead_zone > 0:
+        if isinstance(dead_zone, torch.Tensor):
+            # Per-creature [B] thresholds (packed batches)
+            mask = torch.abs(result['outputs']) < dead_zone.unsqueeze(-1)
+            result['outputs'] = result['outputs'].masked_fill(mask, 0.0)
+        elif dead_zone > 0:
             # Zero out small outputs
             mask = torch.abs(result['outputs']) < dead_zone
             result['outputs'] = result['outputs'].masked_fill(mask, 0.0)
@@ -323,60 +371,64 @@ class BatchedNeuralNetwork:
         )
         hidden_size = config.hidden_size
 
+        # Group genomes by layout: each group loads with one NumPy conversion per array
+        groups: dict[tuple, list[int]] = {}
+        for i, genome in enumerate(neural_genomes):
+            if genome is None:
+                continue
+            layout = (
+                max(0, genome.get('input_size', input_size)),
+                max(0, genome.get('hidden_size', hidden_size)),
+                max(0, genome.get('output_size', num_muscles[i])),
+                len(genome.get('weights_ih', [])),
+                len(genome.get('biases_h', [])),
+                len(genome.get('weights_ho', [])),
+                len(genome.get('biases_o', [])),
+            )
+            groups.setdefault(layout, []).append(i)
+
+        # Host staging arrays; rows without a genome keep the constructor defaults
+        weights_ih = np.zeros((batch_size, input_size, hidden_size))
+        bias_h = np.zeros((batch_size, hidden_size))
+        weights_ho = np.zeros((batch_size, hidden_size, max_muscles))
+        bias_o = np.zeros((batch_size, max_muscles))
+        muscle_mask = np.ones((batch_size, max_muscles), dtype=bool)
+
+        for (g_input_size, g_hidden_size, g_output_size, *_), rows in groups.items():
+            genomes = [neural_genomes[i] for i in rows]
+            # Genome topology is padded or truncated to the batch topology
+            n_in = min(g_input_size, input_size)
+            n_hid = min(g_hidden_size, hidden_size)
+            n_out = min(g_output_size, max_muscles)
+
+            # weights_ih is flattened [input_size * hidden_size],
+            # weights_ho [hidden_size * output_size]
+            group_ih = _stack_flat(genomes, 'weights_ih', (g_input_size, g_hidden_size))
+            weights_ih[rows, :n_in, :n_hid] = group_ih[:, :n_in, :n_hid]
+            bias_h[rows, :n_hid] = _stack_flat(genomes, 'biases_h', (g_hidden_size,))[:, :n_hid]
+            group_ho = _stack_flat(genomes, 'weights_ho', (g_hidden_size, g_output_size))
+            weights_ho[rows, :n_hid, :n_out] = group_ho[:, :n_hid, :n_out]
+            bias_o[rows, :n_out] = _stack_flat(genomes, 'biases_o', (g_output_size,))[:, :n_out]
+
+            # Muscle mask (valid muscles only)
+            counts = np.array([num_muscles[i] for i in rows])
+            muscle_mask[rows] = np.arange(max_muscles) < counts[:, None]
+
         network = cls(
-            batch_size=batch_size,
+            batch_size=0,
             input_size=input_size,
             hidden_size=hidden_size,
             max_muscles=max_muscles,
             activation=config.activation,
             device=device,
         )
-
-        # Extract weights from each genome
-        for i, genome in enumerate(neural_genomes):
-            if genome is None:
-                continue
-
-            # Structured format: weights_ih, weights_ho, biases_h, biases_o
-            weights_ih = genome.get('weights_ih', [])
-            weights_ho = genome.get('weights_ho', [])
-            biases_h = genome.get('biases_h', [])
-            biases_o = genome.get('biases_o', [])
-
-            # Get topology info
-            g_input_size = genome.get('input_size', input_size)
-            g_hidden_size = genome.get('hidden_size', hidden_size)
-            g_output_size = genome.get('output_size', num_muscles[i])
-
-            # weights_ih is flattened [input_size * hidden_size]
-            idx = 0
-            for inp in range(g_input_size):
-                for hid in range(g_hidden_size):
-                    if idx < len(weights_ih) and inp < input_size and hid < hidden_size:
-                        network.weights_ih[i, inp, hid] = weights_ih[idx]
-                    idx += 1
-
-            # biases_h is [hidden_size]
-            for hid in range(g_hidden_size):
-                if hid < len(biases_h) and hid < hidden_size:
-                    network.bias_h[i, hid] = biases_h[hid]
-
-            # weights_ho is flattened [hidden_size * output_size]
-            idx = 0
-            for hid in range(g_hidden_size):
-                for out in range(g_output_size):
-                    if idx < len(weights_ho) and hid < hidden_size and out < max_muscles:
-                        network.weights_ho[i, hid, out] = weights_ho[idx]
-                    idx += 1
-
-            # biases_o is [output_size]
-            for out in range(g_output_size):
-                if out < len(biases_o) and out < max_muscles:
-                    network.bias_o[i, out] = biases_o[out]
-
-            # Set muscle mask (valid muscles only)
-            network.muscle_mask[i, :num_muscles[i]] = True
-            network.muscle_mask[i, num_muscles[i]:] = False
+        network.batch_size = batch_size
+        # One host -> device copy per tensor (float64 -> float32 rounds like scalar writes)
+        network.weights_ih = torch.from_numpy(weights_ih.astype(np.float32)).to(network.device)
+        network.bias_h = torch.from_numpy(bias_h.astype(np.float32)).to(network.device)
+        network.weights_ho = torch.from_numpy(weights_ho.astype(np.float32)).to(network.device)
+        network.bias_o = torch.from_numpy(bias_o.astype(np.float32)).to(network.device)
+        network.muscle_mask = torch.from_numpy(muscle_mask).to(network.device)
 
         return network
 
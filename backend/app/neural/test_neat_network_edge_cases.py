@@ -26,7 +26,12 @@ from app.neural.neat_network import (
     would_create_cycle,
     get_network_depth,
     ACTIVATIONS,
+    HAS_NUMBA,
+    NUMBA_KERNEL_SIGNATURES,
+    WARM_UP_KERNELS,
+    warm_up_numba_kernels,
 )
+from app.neural import neat_network
 
 
 # =============================================================================
@@ -535,6 +540,119 @@ class TestNEATBatchedNetwork:
         # Dead zone should zero it
         assert outputs_with_dz[0, 0].item() == 0.0
 
+    @pytest.mark.parametrize("batch_size", [7, NEATBatchedNetwork.NUMBA_PARALLEL_THRESHOLD + 5])
+    def test_forward_full_numba_matches_loop(self, batch_size: int):
+        """Numba forward_full must match the per-genome dict path (sequential and parallel)."""
+        import random
+
+        from app.genetics.neat_mutation import mutate_neat_genome
+
+        random.seed(11)
+        counter = InnovationCounter()
+        genomes = []
+        for i in range(batch_size):
+            genome = create_minimal_neat_genome(
+                input_size=7, output_size=2 + i % 5, output_bias=-0.3,
+                innovation_counter=counter,
+            )
+            for _ in range(i % 6):
+                genome = mutate_neat_genome(
+                    genome, counter, add_node_rate=0.8, add_connection_rate=0.8
+                )
+            genomes.append(genome)
+
+        num_muscles = [max(1, len(g.get_output_neurons()) - 1) for g in genomes]
+        network = NEATBatchedNetwork(
+            genomes=genomes, num_muscles=num_muscles, max_muscles=15, max_hidden=2,
+        )
+        assert network._use_numba
+
+        inputs = torch.randn(batch_size, 7)
+        fast = network.forward_full(inputs)
+        slow = network._forward_full_loop(inputs, inputs.numpy())
+
+        assert fast['inputs'] is inputs
+        assert fast['hidden'].shape == (batch_size, 2)
+        assert torch.allclose(fast['hidden'], slow['hidden'], atol=1e-6)
+        assert torch.allclose(fast['outputs'], slow['outputs'], atol=1e-6)
+        assert torch.equal(fast['outputs'], network.forward(inputs))
+
+
+class TestNEATTensorBackend:
+    """Tests for the layered on-device tensor backend."""
+
+    @staticmethod
+    def _evolved_genomes(
+        batch_size: int, activations: tuple[str, ...] = ('tanh',)
+    ) -> list[NEATGenome]:
+        import random
+
+        from app.genetics.neat_mutation import mutate_neat_genome
+
+        random.seed(23)
+        counter = InnovationCounter()
+        genomes = []
+        for i in range(batch_size):
+            genome = create_minimal_neat_genome(
+                input_size=7, output_size=2 + i % 6, output_bias=-0.2,
+                innovation_counter=counter,
+            )
+            for _ in range(i % 12):
+                genome = mutate_neat_genome(
+                    genome, counter, add_node_rate=0.7, add_connection_rate=0.9
+                )
+            genome.activation = activations[i % len(activations)]
+            genomes.append(genome)
+        return genomes
+
+    @pytest.mark.parametrize("activations", [('tanh',), ('tanh', 'relu', 'sigmoid')])
+    def test_matches_numba(self, activations):
+        genomes = self._evolved_genomes(40, activations)
+        num_muscles = [max(1, len(g.get_output_neurons()) - i % 2) for i, g in enumerate(genomes)]
+
+        reference = NEATBatchedNetwork(genomes, num_muscles, max_muscles=15, max_hidden=8)
+        layered = NEATBatchedNetwork(
+            genomes, num_muscles, max_muscles=15, max_hidden=8, backend='tensor'
+        )
+        assert layered._use_tensor and not layered._use_numba
+
+        inputs = torch.randn(40, 7)
+        expected = reference.forward_full(inputs)
+        actual = layered.forward_full(inputs)
+
+        assert actual['hidden'].shape == (40, 8)
+        assert actual['outputs'].shape == (40, 15)
+        assert torch.allclose(actual['hidden'], expected['hidden'], atol=1e-5)
+        assert torch.allclose(actual['outputs'], expected['outputs'], atol=1e-5)
+        assert torch.allclose(layered.forward(inputs), reference.forward(inputs), atol=1e-5)
+
+    def test_deep_chain(self):
+        """A chain of hidden neurons needs one layer per hidden neuron."""
+        genome = NEATGenome(
+            neurons=[
+                NeuronGene(id=0, type='input'),
+                NeuronGene(id=1, type='output', bias=0.1),
+                NeuronGene(id=2, type='hidden', bias=0.2),
+                NeuronGene(id=3, type='hidden', bias=-0.3),
+            ],
+            connections=[
+                ConnectionGene(from_node=0, to_node=2, weight=0.9, innovation=0),
+                ConnectionGene(from_node=2, to_node=3, weight=-1.1, innovation=1),
+                ConnectionGene(from_node=3, to_node=1, weight=0.7, innovation=2),
+                ConnectionGene(from_node=0, to_node=1, weight=0.4, innovation=3),
+            ],
+        )
+        network = NEATBatchedNetwork([genome], [1], max_muscles=4, backend='tensor')
+        assert len(network._tn_layers) == 3
+
+        outputs = network.forward(torch.tensor([[0.5]]))
+        expected = neat_forward(genome, [0.5])
+        assert abs(outputs[0, 0].item() - expected[0]) < 1e-6
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            NEATBatchedNetwork([], [], backend='gpu')
+
 
 # =============================================================================
 # Bias Mode Tests
@@ -897,3 +1015,31 @@ class TestIntegrationStress:
 
         assert outputs.shape == (3, 15)
         assert torch.isfinite(outputs).all()
+
+
+@pytest.mark.skipif(not HAS_NUMBA, reason="Numba not installed")
+class TestNumbaWarmUp:
+    """Warm-up compiles the explicit signatures the batched network dispatches to."""
+
+    def test_forward_reuses_warmed_kernels(self):
+        timings = warm_up_numba_kernels()
+        assert set(timings) == set(WARM_UP_KERNELS)
+        compiled = {name: len(getattr(neat_network, name).signatures) for name in WARM_UP_KERNELS}
+
+        genomes = [
+            create_minimal_neat_genome(
+                input_size=7, output_size=4, innovation_counter=InnovationCounter()
+            )
+            for _ in range(5)
+        ]
+        network = NEATBatchedNetwork(
+            genomes=genomes, num_muscles=[4] * 5, max_muscles=15, device=torch.device('cpu')
+        )
+        inputs = torch.randn(5, 7)
+        network.forward(inputs)
+        network.forward_full(inputs)
+
+        # No extra specialization was JIT-compiled for the real call types
+        for name in WARM_UP_KERNELS:
+            signatures = getattr(neat_network, name).signatures
+            assert len(signatures) == compiled[name], NUMBA_KERNEL_SIGNATURES[name]
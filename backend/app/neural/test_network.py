@@ -575,6 +575,41 @@ class TestFromGenomes:
         assert abs(network.bias_o[0, 0].item() - (-0.5)) < 1e-6
         assert abs(network.bias_o[0, 2].item() - (-0.5)) < 1e-6
 
+    def test_mismatched_topologies_padded_and_truncated(self):
+        """Genomes larger than the batch topology are truncated, short weight lists zero-padded."""
+        config = NeuralConfig(hidden_size=4)
+        input_size = get_input_size(config.neural_mode, config.time_encoding)
+        large = {
+            'input_size': input_size + 2,
+            'hidden_size': 6,
+            'output_size': 12,
+            'weights_ih': list(range((input_size + 2) * 6)),
+            'weights_ho': list(range(6 * 12)),
+            'biases_h': [1.0] * 6,
+            'biases_o': [2.0] * 12,
+        }
+        short = {'hidden_size': 4, 'output_size': 3, 'weights_ih': [5.0] * 6, 'biases_o': [3.0]}
+        network = BatchedNeuralNetwork.from_genomes(
+            neural_genomes=[large, None, short],
+            num_muscles=[12, 2, 3],
+            config=config,
+            max_muscles=10,
+        )
+
+        # Row-major indices use the genome's own hidden/output sizes
+        assert network.weights_ih[0, 1, 0].item() == 6
+        assert network.weights_ih[0, :, 3].tolist() == [6.0 * i + 3 for i in range(input_size)]
+        assert network.weights_ho[0, 1, :].tolist() == [12.0 + i for i in range(10)]
+        assert network.bias_h[0].tolist() == [1.0] * 4
+        assert network.muscle_mask[0].all()
+
+        assert torch.all(network.weights_ih[1] == 0) and network.muscle_mask[1].all()
+
+        assert network.weights_ih[2, 0].tolist() == [5.0] * 4
+        assert network.weights_ih[2, 1].tolist() == [5.0, 5.0, 0.0, 0.0]
+        assert network.bias_o[2].tolist() == [3.0] + [0.0] * 9
+        assert network.muscle_mask[2].tolist() == [True] * 3 + [False] * 7
+
 
 # =============================================================================
 # Test Weight Export
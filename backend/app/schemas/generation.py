@@ -33,6 +33,7 @@ class GenerationRead(BaseModel):
     median_fitness: float
     creature_types: dict[str, int]
     simulation_time_ms: int
+    phase_timings: dict | None = None  # {"phases", "spans", "counters"}
     creature_count: int = 0
 
     class Config:
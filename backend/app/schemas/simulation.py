@@ -104,6 +104,8 @@ class SimulationConfig(BaseModel):
     neat_disjoint_coefficient: float = Field(default=1.0, ge=0.0, le=10.0)  # Weight for disjoint genes in distance
     neat_weight_coefficient: float = Field(default=0.4, ge=0.0, le=10.0)  # Weight for weight differences in distance
     neat_max_hidden_nodes: int = Field(default=16, ge=1, le=128)  # Maximum hidden neurons to prevent bloat
+    # 'tensor' = layered batched matmuls on the simulation device
+    neat_backend: Literal['auto', 'tensor'] = 'auto'
 
     # Proprioception (body-sensing inputs)
     use_proprioception: bool = False
@@ -123,6 +125,52 @@ class SimulationConfig(BaseModel):
     frame_rate: int = Field(default=15, ge=1, le=60)
     sparse_top_count: int = Field(default=10, ge=1, le=50)
     sparse_bottom_count: int = Field(default=10, ge=1, le=50)
+    # sparse_frame_replay: in 'sparse' mode, simulate without frames and replay only
+    # the kept creatures with recording (instead of recording everyone and keeping a subset).
+    # Not combinable with early_termination: the recorded replay always runs to the end.
+    sparse_frame_replay: bool = False
+    # frame_format: 'json' (lists in the result) or 'binary' (encoded blobs,
+    # see app.simulation.frame_codec)
+    frame_format: Literal['json', 'binary'] = 'json'
+    frame_precision: Literal['float16', 'float32'] = 'float32'
+    frame_delta_encoding: bool = False
+
+    # Execution
+    # sync_free_physics: masked, branch-free step loop (no per-step host/device syncs)
+    sync_free_physics: bool = False
+
+    # Pellet randomness
+    # Each creature draws its pellets from its own counter-based stream keyed by
+    # (pellet_seed, pellet_generation, creature id), so its pellets do not depend
+    # on the batch it is simulated in. pellet_seed None = one seed per batch,
+    # drawn from the global torch RNG.
+    pellet_seed: int | None = Field(default=None, ge=0)
+    pellet_generation: int = Field(default=0, ge=0)
+
+    # Survivor fitness cache (evolution loops)
+    # survivor_reevaluation: 'always' re-simulates survivors every generation on
+    # fresh pellets. 'every_n' keeps one pellet layout per epoch of
+    # survivor_reevaluation_interval generations and reuses survivors' results
+    # within it; 'never' keeps one layout and reuses them for as long as the
+    # creature survives. Caching pins the pellet seed (pellet_seed defaults to
+    # the run seed, or 0).
+    survivor_reevaluation: Literal['always', 'every_n', 'never'] = 'always'
+    survivor_reevaluation_interval: int = Field(default=5, ge=1, le=1000)
+
+    # Early termination (neural simulation, ignored when recording frames)
+    # Every early_termination_check_interval seconds, stop creatures that are
+    # disqualified, have stagnated (COM moved less than ..._stagnation_distance
+    # over ..._stagnation_window seconds, 0 = off) or are still below
+    # ..._min_fitness after ..._grace_period seconds (None = off). A stopped
+    # creature is scored on the state it stopped in.
+    early_termination: bool = False
+    early_termination_check_interval: float = Field(default=1.0, gt=0.0, le=60.0)
+    early_termination_stagnation_window: float = Field(default=3.0, ge=0.0, le=60.0)
+    early_termination_stagnation_distance: float = Field(default=0.1, ge=0.0)
+    early_termination_min_fitness: float | None = None
+    early_termination_grace_period: float = Field(default=5.0, ge=0.0, le=60.0)
+    # Rows stopped before compacting
+    early_termination_compact_fraction: float = Field(default=0.25, gt=0.0, le=1.0)
 
     @model_validator(mode='before')
     @classmethod
@@ -149,6 +197,14 @@ class SimulationConfig(BaseModel):
                     data['bias_mode'] = 'bias_node'
         return data
 
+    @model_validator(mode='after')
+    def check_sparse_frame_replay(self) -> 'SimulationConfig':
+        """Reject sparse replay under early termination (the replay would not match)."""
+        sparse = self.frame_storage_mode == 'sparse'
+        if sparse and self.sparse_frame_replay and self.early_termination:
+            raise ValueError('sparse_frame_replay cannot be combined with early_termination')
+        return self
+
     @property
     def record_frames(self) -> bool:
         """Backwards-compatible property: True if any frame storage is enabled."""
@@ -194,6 +250,7 @@ class SimulationResult(BaseModel):
     net_displacement: float = 0.0
     distance_traveled: float = 0.0
     total_activation: float = 0.0  # For neural network efficiency
+    terminated_at: float | None = None  # Simulated seconds when early termination stopped it
 
     # Frame data (only if record_frames=True)
     frame_count: int = 0
@@ -210,6 +267,14 @@ class SimulationResult(BaseModel):
     # Each entry: { "inputs": [...], "hidden": [...], "outputs": [...] }
     activations_per_frame: list[dict] | None = None
 
+    # Binary-encoded replay columns (frame_format='binary'; the list fields above stay None)
+    frames_encoded: bytes | None = None
+    fitness_over_time_encoded: bytes | None = None
+    activations_encoded: bytes | None = None
+
+    class Config:
+        ser_json_bytes = 'base64'
+
 
 class BatchSimulationRequest(BaseModel):
     """Request to simulate a batch of creatures."""
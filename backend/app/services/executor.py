@@ -0,0 +1,165 @@
+"""
+Simulation executor.
+
+Runs blocking PyTorch simulations off the FastAPI event loop on a dedicated
+thread pool (PyTorch releases the GIL inside tensor ops, so threads keep the
+loop responsive without pickling genomes to worker processes).
+
+Admission is bounded: at most max_workers simulations run concurrently and at
+most max_queue_size more wait for a worker. Submissions beyond that are
+rejected with SimulationQueueFullError so callers can shed load (HTTP 503)
+instead of piling up unbounded work. Queue depth and wait-time metrics are
+exposed via stats() for the /health endpoint.
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+
+class SimulationQueueFullError(RuntimeError):
+    """Raised when the simulation queue is at capacity (backpressure)."""
+
+
+class SimulationExecutor:
+    """
+    Bounded thread pool for simulation jobs.
+
+    Usage:
+        executor = get_simulation_executor()
+        results = await executor.run(simulator.simulate_batch, genomes, config)
+    """
+
+    def __init__(self, max_workers: int, max_queue_size: int):
+        """
+        Initialize the executor.
+
+        Args:
+            max_workers: Simulations that may run concurrently
+            max_queue_size: Additional simulations that may wait for a worker
+        """
+        self.max_workers = max(1, max_workers)
+        self.max_queue_size = max(0, max_queue_size)
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="simulation"
+        )
+
+        # Counters are touched from the event loop and from worker threads
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._total_wait_s = 0.0
+        self._max_wait_s = 0.0
+        self._last_wait_s = 0.0
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of admitted (queued + running) jobs."""
+        return self.max_workers + self.max_queue_size
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run fn(*args, **kwargs) on a simulation worker and await its result.
+
+        Raises:
+            SimulationQueueFullError: If capacity is exhausted
+        """
+        with self._lock:
+            if self._queued + self._running >= self.capacity:
+                self._rejected += 1
+                raise SimulationQueueFullError(
+                    f"Simulation queue full ({self._running} running, {self._queued} queued)"
+                )
+            self._queued += 1
+
+        submitted_at = time.perf_counter()
+        # Like asyncio.to_thread: the job sees the caller's context variables
+        # (e.g. the active app.core.profiling profile)
+        context = contextvars.copy_context()
+
+        def job() -> T:
+            wait_s = time.perf_counter() - submitted_at
+            with self._lock:
+                self._queued -= 1
+                self._running += 1
+                self._total_wait_s += wait_s
+                self._max_wait_s = max(self._max_wait_s, wait_s)
+                self._last_wait_s = wait_s
+            try:
+                result = context.run(fn, *args, **kwargs)
+            except BaseException:
+                with self._lock:
+                    self._running -= 1
+                    self._failed += 1
+                raise
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+            return result
+
+        future = self._pool.submit(job)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # Caller went away before a worker picked the job up: release its slot
+            if future.cancel():
+                with self._lock:
+                    self._queued -= 1
+            raise
+
+    def stats(self) -> dict[str, Any]:
+        """Snapshot of queue depth and wait-time metrics."""
+        with self._lock:
+            started = self._completed + self._failed + self._running
+            return {
+                "max_workers": self.max_workers,
+                "max_queue_size": self.max_queue_size,
+                "queue_depth": self._queued,
+                "running": self._running,
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+                "avg_wait_ms": round(self._total_wait_s / started * 1000, 2) if started else 0.0,
+                "max_wait_ms": round(self._max_wait_s * 1000, 2),
+                "last_wait_ms": round(self._last_wait_s * 1000, 2),
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the worker threads."""
+        self._pool.shutdown(wait=wait)
+
+
+_executor: SimulationExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_simulation_executor() -> SimulationExecutor:
+    """Get the process-wide simulation executor (created on first use)."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = SimulationExecutor(
+                max_workers=settings.max_workers,
+                max_queue_size=settings.simulation_queue_size,
+            )
+        return _executor
+
+
+def shutdown_simulation_executor() -> None:
+    """Shut down the process-wide executor (FastAPI lifespan shutdown)."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+            _executor = None
@@ -0,0 +1,139 @@
+"""
+Fitness cache for creatures that survive into the next generation.
+
+evolve_population passes survivors through unchanged, so the result of an
+earlier generation is as good a measure of a survivor as a new simulation,
+as long as the survivor is scored on the same pellets as its cohort.
+FitnessCache keeps the last generation's results keyed by genome content and
+simulation config (pellet generation included), and hands them back for
+survivors according to SimulationConfig.survivor_reevaluation.
+
+Usage:
+    cache = FitnessCache.from_config(sim_config, default_seed=seed)
+    batch_config['pellet_seed'] = cache.pellet_seed
+    batch_config['pellet_generation'] = cache.pellet_generation(generation)
+    cached = cache.lookup(genomes, batch_config)
+    missing = [g for g, r in zip(genomes, cached) if r is None]
+    results = fill_misses(cached, simulator.simulate_batch(missing, batch_config))
+    cache.store(genomes, results, batch_config)
+"""
+
+import hashlib
+from typing import Any, TypeVar
+
+from app.schemas.simulation import SimulationConfig
+from app.services.pytorch_simulator import simulation_key
+from app.simulation.tensors import genome_content_hash
+
+R = TypeVar('R')
+
+
+def seed_from_id(key: str) -> int:
+    """Stable pellet seed for a run without one (differs between runs, same across restarts)."""
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), 'big') >> 2
+
+
+def fill_misses(cached: list[R | None], fresh: list[R]) -> list[R]:
+    """Merge simulated results into the cache misses (None entries), in order."""
+    fresh_results = iter(fresh)
+    return [result if result is not None else next(fresh_results) for result in cached]
+
+
+class FitnessCache:
+    """
+    Simulation results of the most recent generation.
+
+    Only the latest generation is kept: survivors are the only creatures that
+    can hit, and they all come from the previous generation. Results are only
+    reused under the config (and so the pellet generation) they were simulated
+    with: when pellet_generation() moves on, the whole cohort is re-simulated.
+    """
+
+    def __init__(
+        self,
+        policy: str = 'always',
+        interval: int = 1,
+        pellet_seed: int | None = None,
+    ):
+        """
+        Args:
+            policy: 'always' (no caching), 'every_n' or 'never' (see SimulationConfig)
+            interval: Generations per pellet layout under 'every_n'
+            pellet_seed: Pellet stream seed the cached results were simulated with
+        """
+        self.policy = policy
+        self.interval = interval
+        self.pellet_seed = pellet_seed
+        self.hits = 0
+        self._config_key: tuple | None = None
+        self._entries: dict[int, Any] = {}  # genome content hash -> result
+
+    @classmethod
+    def from_config(cls, config: SimulationConfig, default_seed: int = 0) -> 'FitnessCache':
+        """
+        Build the cache for an evolution run.
+
+        An enabled cache pins the pellet seed (to `default_seed` when the
+        config has none) so cached and fresh results come from one run seed.
+        """
+        pellet_seed = config.pellet_seed
+        if pellet_seed is None and config.survivor_reevaluation != 'always':
+            pellet_seed = default_seed
+        return cls(config.survivor_reevaluation, config.survivor_reevaluation_interval, pellet_seed)
+
+    @property
+    def enabled(self) -> bool:
+        return self.policy != 'always'
+
+    def pellet_generation(self, generation: int) -> int:
+        """
+        Pellet generation to simulate a generation with.
+
+        Pellet streams are keyed by (seed, pellet generation, creature id).
+        Without a cache every generation draws fresh pellets. 'every_n' keeps
+        one pellet layout per epoch of `interval` generations, so survivors
+        are reused within an epoch and everyone is re-simulated on fresh
+        pellets when the next one starts; 'never' keeps a single layout.
+        """
+        if self.policy == 'always':
+            return generation
+        if self.policy == 'every_n':
+            return generation // self.interval
+        return 0
+
+    def lookup(
+        self,
+        genomes: list[dict[str, Any]],
+        config: SimulationConfig | dict,
+    ) -> list[Any | None]:
+        """
+        Find reusable results.
+
+        Args:
+            genomes: Genomes about to be simulated
+            config: Simulation config of the batch
+
+        Returns:
+            Cached result per genome, None where it must be simulated
+        """
+        self.hits = 0
+        if not self.enabled or not self._entries or simulation_key(config) != self._config_key:
+            return [None] * len(genomes)
+
+        cached = [self._entries.get(genome_content_hash(genome)) for genome in genomes]
+        self.hits = sum(result is not None for result in cached)
+        return cached
+
+    def store(
+        self,
+        genomes: list[dict[str, Any]],
+        results: list[Any],
+        config: SimulationConfig | dict,
+    ) -> None:
+        """Replace the cache with this generation's results."""
+        if not self.enabled:
+            return
+        self._entries = {
+            genome_content_hash(genome): result for genome, result in zip(genomes, results)
+        }
+        self._config_key = simulation_key(config)
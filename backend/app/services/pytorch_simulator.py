@@ -5,12 +5,15 @@ Bridges the API layer to the PyTorch physics engine.
 Handles genome conversion, batched simulation, and result formatting.
 """
 
+import dataclasses
 import time
 from typing import Any
 
+import numpy as np
 import torch
 
 from app.core.device import get_best_device
+from app.core.profiling import increment, span
 
 from app.schemas.simulation import (
     SimulationConfig as ApiSimulationConfig,
@@ -19,7 +22,9 @@ from app.schemas.simulation import (
     PelletResult,
 )
 from app.simulation.config import SimulationConfig as EngineConfig
-from app.simulation.tensors import creature_genomes_to_batch, get_center_of_mass, MAX_MUSCLES
+from app.simulation.tensors import (
+    StagedGenomes, creature_genomes_to_batch, get_center_of_mass, MAX_MUSCLES,
+)
 from app.simulation.physics import (
     simulate_with_pellets,
     simulate_with_neural,
@@ -27,9 +32,20 @@ from app.simulation.physics import (
     simulate_with_fitness_neural,
     TIME_STEP,
 )
+from app.simulation.compiled import get_compiled_neural_step
+from app.simulation.early_termination import EarlyTermination
+from app.simulation.frame_codec import (
+    encode_activations,
+    encode_fitness_over_time,
+    encode_node_frames,
+)
 from app.simulation.fitness import (
     FitnessConfig,
+    FitnessState,
+    PelletBatch,
     initialize_pellets,
+    creature_stream_ids,
+    pellet_stream_keys,
     initialize_fitness_state,
     update_fitness_state,
     calculate_fitness,
@@ -37,6 +53,149 @@ from app.simulation.fitness import (
 )
 from app.neural.network import BatchedNeuralNetwork, NeuralConfig
 from app.neural.neat_network import NEATBatchedNetwork
+from app.schemas.neat import NEATGenome
+from app.storage.frames import select_creatures_for_frames
+
+
+# Config fields a packed batch may vary per creature (sent to the physics and
+# fitness code as [B] tensors), mapped to their FitnessConfig name where relevant
+PER_CREATURE_FIELDS = {
+    'neural_dead_zone': None,
+    'muscle_velocity_cap': None,
+    'output_smoothing_alpha': None,
+    'muscle_damping_multiplier': None,
+    'fitness_pellet_points': 'pellet_points',
+    'fitness_progress_max': 'progress_max',
+    'fitness_distance_per_unit': 'distance_per_unit',
+    'fitness_distance_traveled_max': 'distance_traveled_max',
+    'fitness_regression_penalty': 'regression_penalty',
+    'fitness_efficiency_penalty': 'efficiency_penalty',
+}
+
+# Config fields simulate_batch reads batch-wide; configs can only share a batch
+# when these match. time_step stays here because the step count, NN update
+# interval and frame interval are all derived from it.
+SIMULATION_FIELDS = (
+    'time_step',
+    'simulation_duration',
+    'arena_size',
+    'use_neural_net',
+    'neural_mode',
+    'neural_hidden_size',
+    'neural_activation',
+    'time_encoding',
+    'use_proprioception',
+    'proprioception_inputs',
+    'neural_update_hz',
+    'max_extension_ratio',
+    'neat_max_hidden_nodes',
+    'neat_backend',
+    'max_allowed_frequency',
+    'position_threshold',
+    'height_threshold',
+    'pellet_collection_radius',
+    'frame_storage_mode',
+    'sparse_top_count',
+    'sparse_bottom_count',
+    'sparse_frame_replay',
+    'frame_rate',
+    'frame_format',
+    'frame_precision',
+    'frame_delta_encoding',
+    'sync_free_physics',
+    'pellet_seed',
+    'pellet_generation',
+    'early_termination',
+    'early_termination_check_interval',
+    'early_termination_stagnation_window',
+    'early_termination_stagnation_distance',
+    'early_termination_min_fitness',
+    'early_termination_grace_period',
+    'early_termination_compact_fraction',
+)
+
+
+def _coerce_config(config: ApiSimulationConfig | dict | None) -> ApiSimulationConfig:
+    """Accept an API config, a plain dict or None (defaults)."""
+    if config is None:
+        return ApiSimulationConfig()
+    if isinstance(config, dict):
+        return ApiSimulationConfig(**config)
+    return config
+
+
+def packing_key(config: ApiSimulationConfig | dict | None) -> tuple:
+    """
+    Key under which configs can be simulated together by simulate_packed.
+
+    Configs with equal keys differ at most in PER_CREATURE_FIELDS (and in
+    evolution-only settings, which the simulation never reads).
+    """
+    config = _coerce_config(config)
+    return tuple(getattr(config, name) for name in SIMULATION_FIELDS)
+
+
+def check_packable(configs: list[ApiSimulationConfig]) -> None:
+    """
+    Check that configs can share one simulation batch.
+
+    Raises:
+        ValueError: If the configs do not share a packing_key (names the fields)
+    """
+    base = configs[0]
+    key = packing_key(base)
+    for config in configs[1:]:
+        if packing_key(config) != key:
+            mismatched = [
+                name for name in SIMULATION_FIELDS
+                if getattr(config, name) != getattr(base, name)
+            ]
+            raise ValueError(f"Cannot pack configs that differ in {', '.join(mismatched)}")
+
+
+def simulation_key(config: ApiSimulationConfig | dict | None) -> tuple:
+    """
+    Key of every config field that can change a simulation result.
+
+    Results simulated under equal keys are interchangeable, so this is the
+    config half of a fitness cache key.
+    """
+    config = _coerce_config(config)
+    return packing_key(config) + tuple(getattr(config, name) for name in PER_CREATURE_FIELDS)
+
+
+def draw_pellet_seed() -> int:
+    """Pellet seed for a batch without one, drawn from the global torch RNG."""
+    return int(torch.randint(0, 2**62, (1,)).item())
+
+
+def sparse_frame_rows(fitness: list[float], config: ApiSimulationConfig) -> list[int]:
+    """
+    Batch rows whose frames sparse storage keeps (see select_creatures_for_frames).
+
+    Args:
+        fitness: Reported fitness per creature, in batch order
+        config: Config with sparse_top_count / sparse_bottom_count
+
+    Returns:
+        Sorted row indices
+    """
+    keys = [str(i) for i in range(len(fitness))]
+    kept = select_creatures_for_frames(
+        keys, fitness, 'sparse', config.sparse_top_count, config.sparse_bottom_count,
+    )
+    return sorted(int(k) for k in kept)
+
+
+def _keep_recorded_rows(result: dict, rows: torch.Tensor) -> None:
+    """Narrow the recorded frame tensors of a simulation result to `rows` (in place)."""
+    result['frames'] = result['frames'][rows]
+    if 'fitness_per_frame' in result:
+        result['fitness_per_frame'] = result['fitness_per_frame'][rows]
+    if 'activations_per_frame' in result:
+        act = result['activations_per_frame']
+        result['activations_per_frame'] = {k: v[rows.to(v.device)] for k, v in act.items()}
+    result['recorded_rows'] = rows.tolist()
 
 
 def _safe_float(val: float, default: float = 0.0) -> float:
@@ -57,11 +216,30 @@ class PyTorchSimulator:
     - Result extraction and formatting (tensor -> API)
     """
 
-    def __init__(self, device: torch.device | None = None):
-        """Initialize simulator with optional device override."""
+    def __init__(
+        self,
+        device: torch.device | None = None,
+        compiled: bool = False,
+        cache_neat_genomes: bool = False,
+    ):
+        """
+        Initialize simulator with optional device override.
+
+        Args:
+            device: Torch device (None = best available)
+            compiled: Use the compiled engine (torch.compile + CUDA graphs) for the
+                      neural physics step. Falls back to eager execution on CPU.
+            cache_neat_genomes: Keep parsed NEAT genomes and their network structures
+                      across batches, keyed by creature id. Only valid when a creature
+                      id always refers to the same genome (true within one evolution run).
+        """
         if device is None:
             device = get_best_device()
         self.device = device
+        self.compiled = compiled
+        self._neat_cache: dict[str, tuple[NEATGenome, dict]] | None = (
+            {} if cache_neat_genomes else None
+        )
 
     def simulate_batch(
         self,
@@ -80,23 +258,112 @@ class PyTorchSimulator:
         """
         if not genomes:
             return []
+        return self._simulate(genomes, _coerce_config(config))
 
-        # Convert config
-        if config is None:
-            config = ApiSimulationConfig()
-        elif isinstance(config, dict):
-            config = ApiSimulationConfig(**config)
+    def simulate_packed(
+        self,
+        groups: list[tuple[list[dict[str, Any]], ApiSimulationConfig | dict | None]],
+        staged: StagedGenomes | None = None,
+    ) -> list[list[SimulationResult]]:
+        """
+        Simulate several (genomes, config) groups as one batch.
+
+        Used to run many small populations (e.g. NAS trials) through a single
+        simulation. The configs must share a packing_key; fields in
+        PER_CREATURE_FIELDS that differ between groups are passed down as
+        per-creature [B] tensors.
+
+        Args:
+            groups: List of (genomes, config) pairs
+            staged: Bodies of all genomes, in batch order (see stage_creature_genomes).
+                    The genome dicts then only need their id and controller fields.
+
+        Returns:
+            One list of SimulationResult per group, in input order
+
+        Raises:
+            ValueError: If the configs do not share a packing_key
+        """
+        configs = [_coerce_config(config) for _, config in groups]
+        if not configs:
+            return []
+        check_packable(configs)
+        base = configs[0]
+
+        genomes = [genome for group, _ in groups for genome in group]
+        sizes = [len(group) for group, _ in groups]
+        if not genomes:
+            return [[] for _ in groups]
+
+        # Only fields that actually vary become tensors; uniform ones stay scalar
+        per_creature = {}
+        for name in PER_CREATURE_FIELDS:
+            values = [getattr(config, name) for config in configs]
+            if any(v != values[0] for v in values[1:]):
+                per_creature[name] = torch.tensor(
+                    [v for v, size in zip(values, sizes) for _ in range(size)],
+                    dtype=torch.float32, device=self.device,
+                )
+
+        results = self._simulate(genomes, base, per_creature, staged)
+
+        split = []
+        offset = 0
+        for size in sizes:
+            split.append(results[offset:offset + size])
+            offset += size
+        return split
+
+    def _simulate(
+        self,
+        genomes: list[dict[str, Any]],
+        config: ApiSimulationConfig,
+        per_creature: dict[str, torch.Tensor] | None = None,
+        staged: StagedGenomes | None = None,
+    ) -> list[SimulationResult]:
+        """
+        Run one simulation batch.
+
+        Args:
+            genomes: List of genome dicts
+            config: Simulation configuration for the whole batch
+            per_creature: [B] overrides for PER_CREATURE_FIELDS (packed batches)
+            staged: Pre-staged genome bodies (None = stage them from `genomes`)
+        """
+        per_creature = per_creature or {}
+        if config.frame_storage_mode == 'sparse' and config.sparse_frame_replay:
+            return self._simulate_sparse_replay(genomes, config, per_creature, staged)
+
+        def param(name: str) -> float | torch.Tensor:
+            return per_creature.get(name, getattr(config, name))
 
         # Convert to engine config
         engine_config = self._api_to_engine_config(config)
         fitness_config = self._api_to_fitness_config(config)
+        fitness_overrides = {
+            PER_CREATURE_FIELDS[name]: value
+            for name, value in per_creature.items()
+            if PER_CREATURE_FIELDS[name] is not None
+        }
+        if fitness_overrides:
+            fitness_config = dataclasses.replace(fitness_config, **fitness_overrides)
 
         # Convert genomes to tensor batch
-        batch = creature_genomes_to_batch(genomes, device=self.device)
+        increment("simulate.creatures", len(genomes))
+        with span("simulate.pack_genomes"):
+            if staged is None:
+                batch = creature_genomes_to_batch(genomes, device=self.device)
+                num_muscles = [len(g.get("muscles", [])) for g in genomes]
+            else:
+                batch = staged.to_batch(self.device)
+                num_muscles = staged.genome_muscle_counts.tolist()
 
         # Apply global damping multiplier to per-muscle damping
-        if config.muscle_damping_multiplier != 1.0:
-            batch.spring_damping = batch.spring_damping * config.muscle_damping_multiplier
+        damping_multiplier = param('muscle_damping_multiplier')
+        if isinstance(damping_multiplier, torch.Tensor):
+            batch.spring_damping = batch.spring_damping * damping_multiplier.unsqueeze(-1)
+        elif damping_multiplier != 1.0:
+            batch.spring_damping = batch.spring_damping * damping_multiplier
 
         # Check for frequency violations before simulation (only for hybrid mode)
         # In pure/neat mode, frequency is not used - neural net directly controls muscles
@@ -105,8 +372,17 @@ class PyTorchSimulator:
         else:
             freq_violations = check_frequency_violations(batch, fitness_config)
 
-        # Initialize pellets and fitness state
-        pellet_batch = initialize_pellets(batch, arena_size=config.arena_size)
+        # Initialize pellets and fitness state. Each creature draws from its own
+        # stream keyed by (seed, generation, creature id), independent of the batch.
+        pellet_seed = config.pellet_seed if config.pellet_seed is not None else draw_pellet_seed()
+        stream_ids = creature_stream_ids(batch.genome_ids)
+        stream_keys = pellet_stream_keys(
+            pellet_seed, config.pellet_generation, stream_ids, self.device
+        )
+        with span("simulate.pellets"):
+            pellet_batch = initialize_pellets(
+                batch, arena_size=config.arena_size, stream_keys=stream_keys
+            )
         fitness_state = initialize_fitness_state(batch, pellet_batch)
 
         # Store initial pellet positions per creature for replay
@@ -128,38 +404,33 @@ class PyTorchSimulator:
         use_neat = config.neural_mode == 'neat'
 
         if use_neural:
-            num_muscles = [len(g.get("muscles", [])) for g in genomes]
-
-            if use_neat:
-                # Create NEAT batched network (variable topology)
-                neat_genomes = [g.get("neatGenome") or g.get("neat_genome") for g in genomes]
-                network = NEATBatchedNetwork.from_genome_dicts(
-                    neat_genomes=neat_genomes,
-                    num_muscles=num_muscles,
-                    max_muscles=MAX_MUSCLES,  # Use physics system constant for tensor compatibility
-                    max_hidden=config.neat_max_hidden_nodes,
-                    device=self.device,
-                )
-            else:
-                # Create fixed-topology batched neural network
-                neural_genomes = [g.get("neuralGenome") or g.get("neural_genome") for g in genomes]
-
-                nn_config = NeuralConfig(
-                    neural_mode=config.neural_mode,
-                    hidden_size=config.neural_hidden_size,
-                    activation=config.neural_activation,
-                    time_encoding=config.time_encoding,
-                    use_proprioception=config.use_proprioception,
-                    proprioception_inputs=config.proprioception_inputs,
-                )
-
-                network = BatchedNeuralNetwork.from_genomes(
-                    neural_genomes=neural_genomes,
-                    num_muscles=num_muscles,
-                    config=nn_config,
-                    max_muscles=MAX_MUSCLES,  # Use physics system constant for tensor compatibility
-                    device=self.device,
-                )
+            with span("simulate.build_network"):
+                if use_neat:
+                    # Create NEAT batched network (variable topology)
+                    network = self._build_neat_network(genomes, num_muscles, config)
+                else:
+                    # Create fixed-topology batched neural network
+                    neural_genomes = [
+                        g.get("neuralGenome") or g.get("neural_genome") for g in genomes
+                    ]
+
+                    nn_config = NeuralConfig(
+                        neural_mode=config.neural_mode,
+                        hidden_size=config.neural_hidden_size,
+                        activation=config.neural_activation,
+                        time_encoding=config.time_encoding,
+                        use_proprioception=config.use_proprioception,
+                        proprioception_inputs=config.proprioception_inputs,
+                    )
+
+                    network = BatchedNeuralNetwork.from_genomes(
+                        neural_genomes=neural_genomes,
+                        num_muscles=num_muscles,
+                        config=nn_config,
+                        # Use physics system constant for tensor compatibility
+                        max_muscles=MAX_MUSCLES,
+                        device=self.device,
+                    )
 
             # Calculate frame interval based on physics FPS and desired frame rate
             physics_fps = int(1.0 / dt)
@@ -174,7 +445,7 @@ class PyTorchSimulator:
                 num_steps=num_steps,
                 fitness_config=fitness_config,
                 mode=config.neural_mode,
-                dead_zone=config.neural_dead_zone,
+                dead_zone=param('neural_dead_zone'),
                 dt=dt,
                 record_frames=config.record_frames,
                 frame_interval=frame_interval,
@@ -184,9 +455,12 @@ class PyTorchSimulator:
                 max_time=config.simulation_duration,
                 use_proprioception=config.use_proprioception,
                 proprioception_inputs=config.proprioception_inputs,
-                velocity_cap=config.muscle_velocity_cap,
-                output_smoothing_alpha=config.output_smoothing_alpha,
+                velocity_cap=param('muscle_velocity_cap'),
+                output_smoothing_alpha=param('output_smoothing_alpha'),
                 max_extension_ratio=config.max_extension_ratio,
+                sync_free=config.sync_free_physics,
+                physics_step_fn=get_compiled_neural_step(self.device) if self.compiled else None,
+                early_termination=self._api_to_early_termination(config),
             )
             total_activation = result.get('total_activation', torch.zeros(batch.batch_size))
         else:
@@ -217,86 +491,311 @@ class PyTorchSimulator:
             batch, pellet_batch, fitness_state, simulation_time, fitness_config
         )
 
-        # Build results
+        if config.frame_storage_mode == 'sparse' and 'frames' in result:
+            # Sparse storage decided at the end: only the selected creatures'
+            # frames are marshalled. Rank on the fitness the results report.
+            nan_positions = torch.isnan(result['final_positions']).flatten(1).any(dim=1)
+            disqualified = freq_violations | nan_positions
+            reported = torch.nan_to_num(
+                fitness_values.masked_fill(disqualified, 0.0), nan=0.0, posinf=0.0, neginf=0.0
+            )
+            keep = sparse_frame_rows(reported.cpu().tolist(), config)
+            keep_rows = torch.tensor(keep, dtype=torch.long, device=result['frames'].device)
+            _keep_recorded_rows(result, keep_rows)
+
+        with span("simulate.marshal_results"):
+            return self._marshal_results(
+                genomes=genomes,
+                config=config,
+                fitness_config=fitness_config,
+                result=result,
+                fitness_values=fitness_values,
+                fitness_state=fitness_state,
+                pellet_batch=pellet_batch,
+                freq_violations=freq_violations,
+                num_muscles=num_muscles,
+                initial_com=initial_com,
+                initial_pellet_positions=initial_pellet_positions,
+                initial_pellet_distances=initial_pellet_distances,
+                total_activation=total_activation,
+                use_neural=use_neural,
+                simulation_time=simulation_time,
+                frame_interval=frame_interval,
+                dt=dt,
+            )
+
+    def _simulate_sparse_replay(
+        self,
+        genomes: list[dict[str, Any]],
+        config: ApiSimulationConfig,
+        per_creature: dict[str, torch.Tensor],
+        staged: StagedGenomes | None = None,
+    ) -> list[SimulationResult]:
+        """
+        Sparse frame storage by replay.
+
+        Simulates the batch without recording, then re-simulates only the
+        creatures sparse storage keeps, with frames. Pellets come from
+        per-creature streams and every row is simulated independently, so the
+        replay reproduces the first pass exactly for those creatures (which is
+        why SimulationConfig rejects this mode under early termination).
+        """
+        if config.pellet_seed is None:
+            config = config.model_copy(update={'pellet_seed': draw_pellet_seed()})
+        results = self._simulate(
+            genomes, config.model_copy(update={'frame_storage_mode': 'none'}), per_creature, staged,
+        )
+
+        keep = sparse_frame_rows([r.fitness for r in results], config)
+        rows = torch.tensor(keep, dtype=torch.long, device=self.device)
+        replayed = self._simulate(
+            [genomes[i] for i in keep],
+            config.model_copy(update={'frame_storage_mode': 'all'}),
+            {name: values[rows] for name, values in per_creature.items()},
+            staged.select(keep) if staged is not None else None,
+        )
+        for i, result in zip(keep, replayed):
+            results[i] = result
+        return results
+
+    def _build_neat_network(
+        self,
+        genomes: list[dict[str, Any]],
+        num_muscles: list[int],
+        config: ApiSimulationConfig,
+    ) -> NEATBatchedNetwork:
+        """Create the NEAT batched network, reusing cached genomes/structures when enabled."""
+        neat_genomes = [g.get("neatGenome") or g.get("neat_genome") for g in genomes]
+        if self._neat_cache is None:
+            return NEATBatchedNetwork.from_genome_dicts(
+                neat_genomes=neat_genomes,
+                num_muscles=num_muscles,
+                max_muscles=MAX_MUSCLES,  # Use physics system constant for tensor compatibility
+                max_hidden=config.neat_max_hidden_nodes,
+                device=self.device,
+                backend=config.neat_backend,
+            )
+
+        parsed: list[NEATGenome] = []
+        structures: list[dict | None] = []
+        for genome, neat_genome in zip(genomes, neat_genomes):
+            cached = self._neat_cache.get(genome.get("id"))
+            if cached is not None:
+                parsed.append(cached[0])
+                structures.append(cached[1])
+            else:
+                parsed.append(NEATGenome(**neat_genome))
+                structures.append(None)
+
+        network = NEATBatchedNetwork(
+            parsed,
+            num_muscles,
+            MAX_MUSCLES,
+            config.neat_max_hidden_nodes,
+            self.device,
+            config.neat_backend,
+            structures=structures,
+        )
+
+        # Keep only the current population (culled creatures never come back)
+        self._neat_cache = {
+            genome["id"]: (neat_genome, structure)
+            for genome, neat_genome, structure in zip(genomes, parsed, network._cached_structures)
+            if genome.get("id") is not None
+        }
+        return network
+
+    def _marshal_results(
+        self,
+        genomes: list[dict[str, Any]],
+        config: ApiSimulationConfig,
+        fitness_config: FitnessConfig,
+        result: dict,
+        fitness_values: torch.Tensor,
+        fitness_state: FitnessState,
+        pellet_batch: PelletBatch,
+        freq_violations: torch.Tensor,
+        num_muscles: list[int],
+        initial_com: torch.Tensor,
+        initial_pellet_positions: torch.Tensor,
+        initial_pellet_distances: torch.Tensor,
+        total_activation: torch.Tensor,
+        use_neural: bool,
+        simulation_time: float,
+        frame_interval: int,
+        dt: float,
+    ) -> list[SimulationResult]:
+        """
+        Convert simulation tensors into SimulationResult objects.
+
+        Every result tensor is sanitized in bulk (NaN/Inf -> 0, matching
+        _safe_float) and moved to the host once; per-creature values are then
+        read from NumPy arrays / Python lists instead of .item() and per-frame
+        .cpu().tolist() calls.
+
+        Returns:
+            List of SimulationResult, one per genome
+        """
+        batch_size = len(genomes)
+
+        def host(t: torch.Tensor) -> np.ndarray:
+            return torch.nan_to_num(t.detach(), nan=0.0, posinf=0.0, neginf=0.0).cpu().numpy()
+
+        # Per-creature scalars
+        exploded = torch.isnan(result['final_positions']).flatten(1).any(dim=1).cpu().tolist()
+        if 'terminated_at_step' in result:
+            terminated_steps = result['terminated_at_step'].cpu().tolist()
+            terminated_at = [step * dt if step >= 0 else None for step in terminated_steps]
+        else:
+            terminated_at = [None] * batch_size
+        frequency_exceeded = freq_violations.cpu().tolist()
+        net_displacements = host(torch.norm(
+            result['final_com'][:, [0, 2]] - initial_com[:, [0, 2]], dim=1
+        )).tolist()
+        distances_traveled = host(fitness_state.distance_traveled).tolist()
+        pellets_collected_list = pellet_batch.total_collected.cpu().tolist()
+        fitness_list = host(fitness_values).tolist()
+        activation_list = host(total_activation).tolist()
+
+        # Score weights, one value per creature (tensors in packed batches)
+        def weights(value: float | torch.Tensor) -> list[float]:
+            if isinstance(value, torch.Tensor):
+                return value.cpu().tolist()
+            return [value] * batch_size
+
+        pellet_points = weights(fitness_config.pellet_points)
+        progress_max = weights(fitness_config.progress_max)
+        distance_per_unit = weights(fitness_config.distance_per_unit)
+        distance_traveled_max = weights(fitness_config.distance_traveled_max)
+        efficiency_penalty = weights(fitness_config.efficiency_penalty)
+
+        # Recorded frames: [B, F, N, 3] -> one host copy
+        record = config.record_frames and 'frames' in result
+        binary_frames = record and config.frame_format == 'binary'
+        frame_count = 0
+        frame_rows = fitness_rows = activation_rows = None
+        fitness_np = None
+        activations_np: dict[str, np.ndarray] = {}
+        if record:
+            frames_np = host(result['frames'])
+            frame_count = frames_np.shape[1]
+            if frame_count > 0 and 'fitness_per_frame' in result:
+                fitness_np = host(result['fitness_per_frame'])  # [B, F]
+            if frame_count > 0 and 'activations_per_frame' in result:
+                # {inputs: [B, F, I], hidden, outputs, outputs_raw?}
+                act = result['activations_per_frame']
+                activations_np = {
+                    k: host(act[k])
+                    for k in ('inputs', 'hidden', 'outputs', 'outputs_raw') if k in act
+                }
+
+            if not binary_frames:
+                # Flat frame format the frontend expects: [time, x1,y1,z1, x2,y2,z2, ...]
+                recorded = frames_np.shape[0]
+                table = np.empty((recorded, frame_count, 1 + frames_np.shape[2] * 3))
+                table[:, :, 0] = np.arange(frame_count) * frame_interval * dt
+                table[:, :, 1:] = frames_np.reshape(recorded, frame_count, -1)
+                frame_rows = table.tolist()
+                if fitness_np is not None:
+                    fitness_rows = fitness_np.tolist()
+                if activations_np:
+                    activation_rows = {k: v.tolist() for k, v in activations_np.items()}
+
+        # Creature index -> row of the frame tensors (sparse storage keeps a subset)
+        recorded_rows = result.get('recorded_rows', range(batch_size))
+        frame_slots = {i: k for k, i in enumerate(recorded_rows)} if record else {}
+
+        # Fallback pellet info when the simulation kept no pellet history
+        initial_pellets = host(initial_pellet_positions).tolist()
+        initial_distances = host(initial_pellet_distances).tolist()
+
         results = []
-        for i in range(batch.batch_size):
+        for i in range(batch_size):
             genome_id = genomes[i].get("id", f"creature_{i}")
 
             # Check disqualification
             disqualified = False
             disqualified_reason = None
 
-            if freq_violations[i]:
+            if frequency_exceeded[i]:
                 disqualified = True
                 disqualified_reason = "frequency_exceeded"
-            elif torch.any(torch.isnan(result['final_positions'][i])):
+            elif exploded[i]:
                 disqualified = True
                 disqualified_reason = "physics_explosion"
 
-            # Calculate displacement metrics (with NaN guards for JSON serialization)
-            final_com = result['final_com'][i]
-            net_displacement = _safe_float(torch.norm(
-                final_com[[0, 2]] - initial_com[i][[0, 2]]
-            ).item())
-            distance_traveled = _safe_float(fitness_state.distance_traveled[i].item())
-
-            # Get pellet info from pellet_batch
-            pellets_collected = int(pellet_batch.total_collected[i].item())
+            net_displacement = net_displacements[i]
+            distance_traveled = distances_traveled[i]
+            pellets_collected = int(pellets_collected_list[i])
 
             # Calculate progress (estimate from current state)
             # Progress is based on how close we got to pellets
             progress_score = min(
-                fitness_config.progress_max,
-                net_displacement * fitness_config.distance_per_unit
+                progress_max[i],
+                net_displacement * distance_per_unit[i]
             )
 
             # Build fitness breakdown (with NaN guards)
             # Efficiency penalty is normalized by simulation time and muscle count
+            efficiency_penalty_val = 0.0
             if use_neural and simulation_time > 0:
-                num_muscles_i = len(genomes[i].get("muscles", []))
+                num_muscles_i = num_muscles[i]
                 if num_muscles_i > 0:
-                    avg_activation = total_activation[i].item() / (simulation_time * num_muscles_i)
-                    efficiency_penalty_val = _safe_float((avg_activation / 60) * 10 * fitness_config.efficiency_penalty)
-                else:
-                    efficiency_penalty_val = 0.0
-            else:
-                efficiency_penalty_val = 0.0
+                    avg_activation = activation_list[i] / (simulation_time * num_muscles_i)
+                    efficiency_penalty_val = _safe_float(
+                        (avg_activation / 60) * 10 * efficiency_penalty[i]
+                    )
 
             breakdown = FitnessBreakdown(
-                pellet_points=_safe_float(pellets_collected * fitness_config.pellet_points),
+                pellet_points=_safe_float(pellets_collected * pellet_points[i]),
                 progress=_safe_float(progress_score),
                 distance_traveled=_safe_float(min(
-                    distance_traveled * fitness_config.distance_per_unit,
-                    fitness_config.distance_traveled_max
+                    distance_traveled * distance_per_unit[i],
+                    distance_traveled_max[i]
                 )),
                 efficiency_penalty=efficiency_penalty_val,
             )
 
-            # Get frames if recorded
+            # Frames, fitness over time and activations (JSON lists or binary blobs)
+            slot = frame_slots.get(i)
             frames = None
-            frame_count = 0
-            if config.record_frames and 'frames' in result:
-                # Convert tensor frames [F, N, 3] to flat list format [time, x1,y1,z1, x2,y2,z2, ...]
-                # This format matches what the frontend expects
-                frames_tensor = result['frames'][i]  # [F, N, 3]
-                frame_count = frames_tensor.shape[0]
-                frames = []
-
-                # Calculate time per frame: frame_index * frame_interval * dt
-                for f_idx in range(frame_count):
-                    time_val = f_idx * frame_interval * dt
-                    frame_data = [_safe_float(time_val)]  # Start with time
-
-                    # Flatten node positions: [N, 3] -> [x1,y1,z1, x2,y2,z2, ...]
-                    node_positions = frames_tensor[f_idx].cpu().tolist()  # [N, 3]
-                    for pos in node_positions:
-                        frame_data.extend([_safe_float(pos[0]), _safe_float(pos[1]), _safe_float(pos[2])])
-
-                    frames.append(frame_data)
-
-            # Extract fitness and activation with NaN guards
-            fitness_val = _safe_float(0.0 if disqualified else fitness_values[i].item())
-            activation_val = _safe_float(total_activation[i].item())
+            fitness_over_time_list = None
+            activations_per_frame_list = None
+            frames_encoded = None
+            fitness_over_time_encoded = None
+            activations_encoded = None
+            if binary_frames and slot is not None:
+                frames_encoded = encode_node_frames(
+                    frames_np[slot], frame_interval * dt,
+                    precision=config.frame_precision, delta=config.frame_delta_encoding,
+                )
+                if fitness_np is not None:
+                    fitness_over_time_encoded = encode_fitness_over_time(fitness_np[slot])
+                if activations_np:
+                    outputs_raw_np = activations_np.get('outputs_raw')
+                    activations_encoded = encode_activations(
+                        activations_np['inputs'][slot],
+                        activations_np['hidden'][slot],
+                        activations_np['outputs'][slot],
+                        outputs_raw_np[slot] if outputs_raw_np is not None else None,
+                        precision=config.frame_precision,
+                    )
+            elif slot is not None:
+                frames = frame_rows[slot]
+                if fitness_rows is not None:
+                    fitness_over_time_list = fitness_rows[slot]
+                if activation_rows is not None:
+                    # List of {inputs, hidden, outputs, outputs_raw?} dicts, one per frame
+                    # (outputs_raw: pre-dead-zone outputs, pure mode only)
+                    keys = list(activation_rows)
+                    activations_per_frame_list = [
+                        dict(zip(keys, frame))
+                        for frame in zip(*(activation_rows[k][slot] for k in keys))
+                    ]
+
+            # Extract fitness and activation (already NaN-sanitized)
+            fitness_val = 0.0 if disqualified else fitness_list[i]
+            activation_val = activation_list[i]
 
             # Build pellet data from simulation's pellet_history
             pellet_list = []
@@ -316,47 +815,15 @@ class PyTorchSimulator:
                     ))
             else:
                 # Fallback: use initial positions if no history
-                init_pos = initial_pellet_positions[i].cpu().tolist()
-                init_dist = _safe_float(initial_pellet_distances[i].item())
+                init_pos = initial_pellets[i]
                 pellet_list.append(PelletResult(
                     id="pellet_0",
-                    position={"x": _safe_float(init_pos[0]), "y": _safe_float(init_pos[1]), "z": _safe_float(init_pos[2])},
+                    position={"x": init_pos[0], "y": init_pos[1], "z": init_pos[2]},
                     collected_at_frame=None,
                     spawned_at_frame=0,
-                    initial_distance=init_dist,
+                    initial_distance=initial_distances[i],
                 ))
 
-            # Build fitness over time from simulation's per-frame fitness
-            fitness_over_time_list = None
-            if config.record_frames and 'fitness_per_frame' in result and frame_count > 0:
-                fitness_tensor = result['fitness_per_frame'][i]  # [F]
-                fitness_over_time_list = [_safe_float(f.item()) for f in fitness_tensor]
-
-            # Build activations per frame from simulation's per-frame neural outputs
-            # Format: list of {inputs, hidden, outputs, outputs_raw?} dicts for each frame
-            activations_per_frame_list = None
-            if config.record_frames and 'activations_per_frame' in result and frame_count > 0:
-                act_data = result['activations_per_frame']
-                # act_data is {inputs: [B, F, I], hidden: [B, F, H], outputs: [B, F, O], outputs_raw?: [B, F, O]}
-                inputs_tensor = act_data['inputs'][i]   # [F, I]
-                hidden_tensor = act_data['hidden'][i]   # [F, H]
-                outputs_tensor = act_data['outputs'][i]  # [F, O]
-                outputs_raw_tensor = act_data.get('outputs_raw')  # [B, F, O] or None
-                if outputs_raw_tensor is not None:
-                    outputs_raw_tensor = outputs_raw_tensor[i]  # [F, O]
-
-                activations_per_frame_list = []
-                for f in range(inputs_tensor.shape[0]):
-                    frame_act = {
-                        'inputs': [_safe_float(v.item()) for v in inputs_tensor[f]],
-                        'hidden': [_safe_float(v.item()) for v in hidden_tensor[f]],
-                        'outputs': [_safe_float(v.item()) for v in outputs_tensor[f]],
-                    }
-                    # Include raw outputs for visualization (pre-dead-zone, pure mode only)
-                    if outputs_raw_tensor is not None:
-                        frame_act['outputs_raw'] = [_safe_float(v.item()) for v in outputs_raw_tensor[f]]
-                    activations_per_frame_list.append(frame_act)
-
             results.append(SimulationResult(
                 genome_id=genome_id,
                 fitness=fitness_val,
@@ -367,15 +834,33 @@ class PyTorchSimulator:
                 net_displacement=net_displacement,
                 distance_traveled=distance_traveled,
                 total_activation=activation_val,
-                frame_count=frame_count,
+                terminated_at=terminated_at[i],
+                frame_count=frame_count if slot is not None else 0,
                 frames=frames,
                 pellets=pellet_list,
                 fitness_over_time=fitness_over_time_list,
                 activations_per_frame=activations_per_frame_list,
+                frames_encoded=frames_encoded,
+                fitness_over_time_encoded=fitness_over_time_encoded,
+                activations_encoded=activations_encoded,
             ))
 
         return results
 
+    def _api_to_early_termination(self, api_config: ApiSimulationConfig) -> EarlyTermination | None:
+        """Convert the early termination settings (seconds) to a step-based policy."""
+        if not api_config.early_termination:
+            return None
+        dt = api_config.time_step
+        return EarlyTermination(
+            check_interval=max(1, round(api_config.early_termination_check_interval / dt)),
+            stagnation_window=round(api_config.early_termination_stagnation_window / dt),
+            stagnation_distance=api_config.early_termination_stagnation_distance,
+            min_fitness=api_config.early_termination_min_fitness,
+            grace_steps=round(api_config.early_termination_grace_period / dt),
+            compact_fraction=api_config.early_termination_compact_fraction,
+        )
+
     def _api_to_engine_config(self, api_config: ApiSimulationConfig) -> EngineConfig:
         """Convert API config to engine config."""
         return EngineConfig(
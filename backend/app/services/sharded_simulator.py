@@ -0,0 +1,456 @@
+"""
+Multi-process sharded simulation.
+
+PyTorchSimulator runs a whole population in one process. On CPU-only hosts
+torch's intra-op threads scale poorly on the small [B, 8, 3] physics tensors
+and the NEAT path is mostly single-threaded Python. ShardedSimulator splits
+every batch into contiguous shards and simulates them in worker processes,
+each holding its own warm PyTorchSimulator.
+
+Genomes and results travel through shared memory, not the worker pipes:
+
+- The parent stages each shard's bodies (stage_creature_genomes) and writes
+  the float32 / int64 staging arrays into one shared-memory block. Only the
+  controller fields (neural / NEAT genomes, ids) have no fixed layout and
+  are pickled alongside.
+- Each worker writes per-creature result columns (fitness, pellets,
+  disqualification, ...) into a block of its own as NumPy arrays. Replay data
+  (frames, pellet events, activations) is variable-length and is pickled
+  after the columns.
+
+The pipes only carry block names, offsets and configs. Pellets come from
+per-creature streams (see fitness.pellet_stream_keys), so a creature scores
+the same whichever shard simulates it.
+
+Usage:
+    with ShardedSimulator(n_workers=4) as simulator:
+        results = simulator.simulate_batch(genomes, config)
+"""
+
+import math
+import multiprocessing as mp
+import os
+import pickle
+import traceback
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+import numpy as np
+
+from app.core.threads import limit_threads
+from app.schemas.simulation import FitnessBreakdown, SimulationConfig, SimulationResult
+
+# NOTE: Don't import torch/pytorch_simulator at module level - spawned workers
+# import this module and must set thread limits before torch is loaded.
+
+_MIN_BLOCK_SIZE = 1 << 20  # 1 MiB
+
+# Genome keys carried by the staging arrays (everything else is a controller field)
+_BODY_KEYS = frozenset({'nodes', 'muscles'})
+
+# Per-creature result columns: float64 [len(_FLOAT_COLUMNS) + len(_BREAKDOWN_COLUMNS), n]
+# (NaN = None) and int64 [len(_INT_COLUMNS), n]
+_FLOAT_COLUMNS = (
+    'fitness', 'net_displacement', 'distance_traveled', 'total_activation', 'terminated_at',
+)
+_BREAKDOWN_COLUMNS = tuple(FitnessBreakdown.model_fields)
+_INT_COLUMNS = ('pellets_collected', 'disqualified', 'disqualified_reason', 'frame_count')
+_N_FLOATS = len(_FLOAT_COLUMNS) + len(_BREAKDOWN_COLUMNS)
+_DISQUALIFIED_REASONS = (None, 'frequency_exceeded', 'physics_explosion')
+
+# Variable-length result fields, pickled after the columns
+_REPLAY_FIELDS = frozenset({
+    'frames', 'pellets', 'fitness_over_time', 'activations_per_frame',
+    'frames_encoded', 'fitness_over_time_encoded', 'activations_encoded',
+})
+
+
+def _aligned(offset: int) -> int:
+    """Round a byte offset up so every array in a block starts 8-byte aligned."""
+    return (offset + 7) & ~7
+
+
+class _SharedBuffer:
+    """Writer side of a shared-memory block, replaced by a larger one when too small."""
+
+    def __init__(self):
+        self.shm: SharedMemory | None = None
+
+    def write(self, parts: list[np.ndarray | bytes]) -> tuple[str, list[tuple[int, int]]]:
+        """
+        Copy contiguous arrays / bytes into the block, one after another.
+
+        Returns:
+            Block name and the (offset, nbytes) of every part
+        """
+        views = [memoryview(part).cast('B') for part in parts]
+        spans, size = [], 0
+        for view in views:
+            spans.append((size, view.nbytes))
+            size = _aligned(size + view.nbytes)
+        if self.shm is None or self.shm.size < size:
+            self.release()
+            self.shm = SharedMemory(create=True, size=max(_MIN_BLOCK_SIZE, size * 3 // 2))
+        for view, (offset, nbytes) in zip(views, spans):
+            self.shm.buf[offset:offset + nbytes] = view
+        return self.shm.name, spans
+
+    def release(self) -> None:
+        if self.shm is not None:
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+
+
+class _Attachment:
+    """Reader side of another process's _SharedBuffer (re-attaches when it is replaced)."""
+
+    def __init__(self):
+        self.shm: SharedMemory | None = None
+
+    def _attach(self, name: str) -> SharedMemory:
+        if self.shm is None or self.shm.name != name:
+            self.close()
+            self.shm = SharedMemory(name=name)
+        return self.shm
+
+    def read(self, name: str, offset: int, length: int) -> bytes:
+        return bytes(self._attach(name).buf[offset:offset + length])
+
+    def array(self, name: str, offset: int, length: int, dtype, shape: tuple = (-1,)) -> np.ndarray:
+        """Copy of an array written into the block."""
+        count = length // np.dtype(dtype).itemsize
+        array = np.frombuffer(self._attach(name).buf, dtype=dtype, count=count, offset=offset)
+        return array.reshape(shape).copy()
+
+    def close(self) -> None:
+        if self.shm is not None:
+            self.shm.close()
+            self.shm = None
+
+
+def _result_columns(results: list[SimulationResult]) -> list[np.ndarray | bytes]:
+    """Per-creature result columns and pickled replay data (see _results_from_columns)."""
+    nan = float('nan')
+    floats = np.array([
+        [nan if value is None else value for value in (getattr(r, name) for name in _FLOAT_COLUMNS)]
+        + [getattr(r.fitness_breakdown, name, nan) for name in _BREAKDOWN_COLUMNS]
+        for r in results
+    ], dtype=np.float64).reshape(len(results), _N_FLOATS)
+    ints = np.array([
+        (
+            r.pellets_collected,
+            r.disqualified,
+            _DISQUALIFIED_REASONS.index(r.disqualified_reason),
+            r.frame_count,
+        )
+        for r in results
+    ], dtype=np.int64).reshape(len(results), len(_INT_COLUMNS))
+    replays = [r.model_dump(include=_REPLAY_FIELDS, exclude_none=True) for r in results]
+    return [
+        np.ascontiguousarray(floats.T),
+        np.ascontiguousarray(ints.T),
+        pickle.dumps(replays, protocol=pickle.HIGHEST_PROTOCOL),
+    ]
+
+
+def _results_from_columns(
+    genome_ids: list[str],
+    floats: np.ndarray,
+    ints: np.ndarray,
+    replays: list[dict],
+) -> list[SimulationResult]:
+    """Rebuild SimulationResults from the columns written by _result_columns."""
+    n_scalars = len(_FLOAT_COLUMNS)
+    rows = zip(genome_ids, floats.T.tolist(), ints.T.tolist(), replays)
+    results = []
+    for genome_id, float_row, int_row, replay in rows:
+        values = dict(zip(_FLOAT_COLUMNS, float_row[:n_scalars]))
+        if math.isnan(values['terminated_at']):
+            values['terminated_at'] = None
+        breakdown = dict(zip(_BREAKDOWN_COLUMNS, float_row[n_scalars:]))
+        if math.isnan(breakdown['pellet_points']):  # The result had no breakdown
+            breakdown = None
+        pellets_collected, disqualified, reason, frame_count = int_row
+        results.append(SimulationResult(
+            genome_id=genome_id,
+            **values,
+            pellets_collected=pellets_collected,
+            disqualified=bool(disqualified),
+            disqualified_reason=_DISQUALIFIED_REASONS[reason],
+            frame_count=frame_count,
+            fitness_breakdown=FitnessBreakdown(**breakdown) if breakdown else None,
+            **replay,
+        ))
+    return results
+
+
+def _worker_main(
+    conn: Connection,
+    device: str,
+    threads: int,
+    compiled: bool,
+    cache_neat_genomes: bool,
+    warm_up: bool,
+) -> None:
+    """Worker process: configure threads, warm up, then simulate shards until None."""
+    # Thread limits must be in place BEFORE torch/numba are imported
+    if threads:
+        limit_threads(threads)
+
+    import torch
+    if threads:
+        torch.set_num_threads(threads)
+
+    from app.services.pytorch_simulator import PyTorchSimulator
+    from app.simulation.tensors import StagedGenomes
+
+    simulator = PyTorchSimulator(
+        device=torch.device(device),
+        compiled=compiled,
+        cache_neat_genomes=cache_neat_genomes,
+    )
+    if warm_up:
+        from app.neural.neat_network import warm_up_numba_kernels
+        warm_up_numba_kernels()
+    conn.send(('ready',))
+
+    genomes_in = _Attachment()
+    results_out = _SharedBuffer()
+    try:
+        while True:
+            task = conn.recv()
+            if task is None:
+                break
+            name, (floats, longs, muscle_counts, controllers), runs = task
+            try:
+                genome_ids, controllers = pickle.loads(genomes_in.read(name, *controllers))
+                staged = StagedGenomes(
+                    floats=genomes_in.array(name, *floats, np.float32),
+                    longs=genomes_in.array(name, *longs, np.int64),
+                    genome_ids=genome_ids,
+                    genome_muscle_counts=genomes_in.array(name, *muscle_counts, np.int64),
+                )
+                groups, start = [], 0
+                for size, config in runs:
+                    groups.append((controllers[start:start + size], config))
+                    start += size
+                shard_results = simulator.simulate_packed(groups, staged=staged)
+                flat_results = [result for group in shard_results for result in group]
+                block, spans = results_out.write(_result_columns(flat_results))
+                conn.send(('result', block, spans))
+            except Exception:
+                conn.send(('error', traceback.format_exc()))
+    finally:
+        genomes_in.close()
+        results_out.release()
+
+
+class ShardedSimulator:
+    """
+    Drop-in replacement for PyTorchSimulator that shards batches across processes.
+
+    Workers are started with the 'spawn' method (safe with torch) and live
+    until close(). Batches smaller than 2 * min_shard_size use fewer shards;
+    results always come back in input order.
+    """
+
+    def __init__(
+        self,
+        n_workers: int | None = None,
+        device: Any = 'cpu',
+        threads_per_worker: int | None = None,
+        compiled: bool = False,
+        cache_neat_genomes: bool = False,
+        warm_up: bool = True,
+        min_shard_size: int = 32,
+    ):
+        """
+        Start the worker processes and wait until they are warm.
+
+        Args:
+            n_workers: Number of worker processes (None = one per CPU)
+            device: PyTorch device (or its name) for every worker
+            threads_per_worker: Torch/BLAS threads per worker (None = CPUs / n_workers)
+            compiled: Use the compiled engine in the workers (see PyTorchSimulator)
+            cache_neat_genomes: Keep parsed NEAT genomes per worker (see PyTorchSimulator)
+            warm_up: Load the NEAT Numba kernels in every worker at startup
+            min_shard_size: Smallest number of creatures worth sending to a worker
+
+        Raises:
+            RuntimeError: If a worker fails to start
+        """
+        import torch
+
+        cpus = os.cpu_count() or 1
+        n_workers = n_workers or cpus
+        if threads_per_worker is None:
+            threads_per_worker = max(1, cpus // n_workers)
+
+        self.device = torch.device(device)
+        self.n_workers = n_workers
+        self.min_shard_size = max(1, min_shard_size)
+
+        ctx = mp.get_context('spawn')
+        self._conns: list[Connection] = []
+        self._processes = []
+        for _ in range(n_workers):
+            parent_conn, child_conn = ctx.Pipe()
+            process = ctx.Process(
+                target=_worker_main,
+                args=(
+                    child_conn, str(device), threads_per_worker,
+                    compiled, cache_neat_genomes, warm_up,
+                ),
+                daemon=True,
+            )
+            process.start()
+            child_conn.close()
+            self._conns.append(parent_conn)
+            self._processes.append(process)
+
+        self._genomes_out = _SharedBuffer()
+        self._results_in = [_Attachment() for _ in range(n_workers)]
+        for worker_idx in range(n_workers):
+            self._receive(worker_idx)
+
+    def simulate_batch(
+        self,
+        genomes: list[dict[str, Any]],
+        config: SimulationConfig | dict | None = None,
+    ) -> list[SimulationResult]:
+        """
+        Simulate a batch of creatures across the workers.
+
+        Args:
+            genomes: List of genome dicts
+            config: Simulation configuration (API schema or dict)
+
+        Returns:
+            List of SimulationResult for each creature, in input order
+        """
+        if not genomes:
+            return []
+        return self.simulate_packed([(genomes, config)])[0]
+
+    def simulate_packed(
+        self,
+        groups: list[tuple[list[dict[str, Any]], SimulationConfig | dict | None]],
+    ) -> list[list[SimulationResult]]:
+        """
+        Simulate several (genomes, config) groups as one sharded batch.
+
+        Same contract as PyTorchSimulator.simulate_packed.
+
+        Raises:
+            ValueError: If the configs do not share a packing_key
+            RuntimeError: If a worker fails or dies
+        """
+        from app.services.pytorch_simulator import _coerce_config, check_packable, draw_pellet_seed
+        from app.simulation.tensors import stage_creature_genomes
+
+        configs = [_coerce_config(config) for _, config in groups]
+        if not configs:
+            return []
+        check_packable(configs)
+        # Every shard must draw from the same pellet seed
+        if configs[0].pellet_seed is None:
+            seed = draw_pellet_seed()
+            configs = [config.model_copy(update={'pellet_seed': seed}) for config in configs]
+        config_dicts = [config.model_dump() for config in configs]
+
+        # (group index, genome) in batch order, cut into contiguous shards
+        flat = [(g, genome) for g, (genomes, _) in enumerate(groups) for genome in genomes]
+        results: list[list[SimulationResult]] = [[] for _ in groups]
+        if not flat:
+            return results
+        n_shards = max(1, min(self.n_workers, len(flat) // self.min_shard_size))
+        bounds = [len(flat) * k // n_shards for k in range(n_shards + 1)]
+
+        # Per shard: staged bodies, raw muscle counts and the pickled controller fields
+        parts, tasks = [], []
+        for k in range(n_shards):
+            shard = flat[bounds[k]:bounds[k + 1]]
+            genomes = [genome for _, genome in shard]
+            staged = stage_creature_genomes(genomes, first_index=bounds[k])
+            controllers = [
+                {key: value for key, value in genome.items() if key not in _BODY_KEYS}
+                for genome in genomes
+            ]
+            parts += [
+                staged.floats,
+                staged.longs,
+                staged.genome_muscle_counts,
+                pickle.dumps((staged.genome_ids, controllers), protocol=pickle.HIGHEST_PROTOCOL),
+            ]
+            runs: list[list] = []
+            for g, _ in shard:
+                if runs and runs[-1][0] == g:
+                    runs[-1][1] += 1
+                else:
+                    runs.append([g, 1])
+            # Results are named like PyTorchSimulator._marshal_results names them
+            # (id-less genomes after their index in the whole batch)
+            genome_ids = [
+                genome.get('id', f'creature_{bounds[k] + i}') for i, genome in enumerate(genomes)
+            ]
+            tasks.append((runs, genome_ids))
+
+        name, spans = self._genomes_out.write(parts)
+        for k, (runs, _) in enumerate(tasks):
+            shard_runs = [(size, config_dicts[g]) for g, size in runs]
+            self._conns[k].send((name, spans[4 * k:4 * k + 4], shard_runs))
+
+        # Collect every reply before raising so no stale message stays in a pipe
+        replies = [self._receive(k) for k in range(n_shards)]
+        for k, reply in enumerate(replies):
+            if reply[0] == 'error':
+                raise RuntimeError(f"Simulation worker {k} failed:\n{reply[1]}")
+
+        for k, ((_, block, spans), (runs, genome_ids)) in enumerate(zip(replies, tasks)):
+            floats, ints, replays = spans
+            results_in = self._results_in[k]
+            shard_results = _results_from_columns(
+                genome_ids,
+                results_in.array(block, *floats, np.float64, shape=(_N_FLOATS, -1)),
+                results_in.array(block, *ints, np.int64, shape=(len(_INT_COLUMNS), -1)),
+                pickle.loads(results_in.read(block, *replays)),
+            )
+            start = 0
+            for g, size in runs:
+                results[g].extend(shard_results[start:start + size])
+                start += size
+        return results
+
+    def _receive(self, worker_idx: int) -> tuple:
+        """Wait for a worker's next message, failing fast if it died."""
+        conn = self._conns[worker_idx]
+        while not conn.poll(1.0):
+            process = self._processes[worker_idx]
+            if not process.is_alive():
+                raise RuntimeError(f"Simulation worker exited with code {process.exitcode}")
+        return conn.recv()
+
+    def close(self) -> None:
+        """Stop the workers and free the shared memory."""
+        for conn in self._conns:
+            try:
+                conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join(timeout=30)
+            if process.is_alive():
+                process.terminate()
+        for attachment in self._results_in:
+            attachment.close()
+        self._genomes_out.release()
+        self._conns = []
+        self._processes = []
+
+    def __enter__(self) -> 'ShardedSimulator':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
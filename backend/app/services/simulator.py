@@ -20,6 +20,8 @@ from app.schemas.simulation import (
     BatchSimulationRequest,
     BatchSimulationResponse,
 )
+from app.core.config import settings
+from app.services.executor import get_simulation_executor
 from app.services.pytorch_simulator import PyTorchSimulator
 
 # Remote GPU backend URL (e.g., "http://localhost:9000" via SSH tunnel)
@@ -33,30 +35,50 @@ class SimulatorService:
     Uses PyTorch batched physics for efficient simulation of many creatures.
     """
 
-    def __init__(self):
-        """Initialize the simulator service with PyTorch backend."""
-        self._pytorch_simulator = PyTorchSimulator()
+    def __init__(self, cache_neat_genomes: bool = False):
+        """
+        Initialize the simulator service with PyTorch backend.
+
+        Args:
+            cache_neat_genomes: Reuse parsed NEAT genomes across batches (see
+                PyTorchSimulator). Used by long-lived evolution workers.
+        """
+        self._pytorch_simulator = PyTorchSimulator(
+            compiled=settings.compiled_engine,
+            cache_neat_genomes=cache_neat_genomes,
+        )
 
     async def simulate_batch(
         self,
         genomes: list[dict[str, Any]],
-        config: dict[str, Any] | None = None,
+        config: SimulationConfig | dict[str, Any] | None = None,
     ) -> list[dict[str, Any]]:
         """
         Simulate a batch of creatures in parallel.
 
+        The simulation runs on the shared simulation executor so the event loop
+        stays responsive while it executes.
+
         Args:
             genomes: List of genome dicts
-            config: Simulation configuration dict
+            config: Simulation configuration (schema or dict)
 
         Returns:
             List of result dicts with fitness, pellets_collected, etc.
+
+        Raises:
+            SimulationQueueFullError: If the simulation executor is at capacity
         """
         # Convert config dict to SimulationConfig if provided
-        sim_config = SimulationConfig(**config) if config else SimulationConfig()
-
-        # Run simulation using PyTorch backend
-        results = self._pytorch_simulator.simulate_batch(genomes, sim_config)
+        if isinstance(config, SimulationConfig):
+            sim_config = config
+        else:
+            sim_config = SimulationConfig(**config) if config else SimulationConfig()
+
+        # Run simulation using PyTorch backend (off the event loop)
+        results = await get_simulation_executor().run(
+            self._pytorch_simulator.simulate_batch, genomes, sim_config
+        )
 
         # Convert results to dicts for backward compatibility
         return [r.model_dump() for r in results]
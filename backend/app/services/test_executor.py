@@ -0,0 +1,128 @@
+"""
+Tests for the bounded simulation executor.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from app.core.profiling import Profile, increment, profiling
+from app.services.executor import SimulationExecutor, SimulationQueueFullError
+
+
+def _blocking_job(started: threading.Event, release: threading.Event) -> str:
+    started.set()
+    release.wait(timeout=5)
+    return "done"
+
+
+class TestSimulationExecutor:
+    """Admission control, results and metrics."""
+
+    async def test_run_returns_result(self):
+        executor = SimulationExecutor(max_workers=2, max_queue_size=2)
+        try:
+            assert await executor.run(lambda a, b=0: a + b, 2, b=3) == 5
+            stats = executor.stats()
+            assert stats["completed"] == 1
+            assert stats["queue_depth"] == 0
+            assert stats["running"] == 0
+        finally:
+            executor.shutdown()
+
+    async def test_job_sees_caller_context(self):
+        executor = SimulationExecutor(max_workers=1, max_queue_size=0)
+        profile = Profile()
+        try:
+            with profiling(profile):
+                await executor.run(increment, "jobs")
+            await executor.run(increment, "jobs")  # No active profile: not recorded
+            assert profile.counters == {"jobs": 1}
+        finally:
+            executor.shutdown()
+
+    async def test_does_not_block_event_loop(self):
+        executor = SimulationExecutor(max_workers=1, max_queue_size=0)
+        started, release = threading.Event(), threading.Event()
+        try:
+            task = asyncio.create_task(executor.run(_blocking_job, started, release))
+            await asyncio.to_thread(started.wait, 5)
+
+            # Loop is still free to run other coroutines while the job blocks
+            await asyncio.sleep(0)
+            assert not task.done()
+
+            release.set()
+            assert await task == "done"
+        finally:
+            release.set()
+            executor.shutdown()
+
+    async def test_rejects_when_full(self):
+        executor = SimulationExecutor(max_workers=1, max_queue_size=1)
+        started, release = threading.Event(), threading.Event()
+        try:
+            running = asyncio.create_task(executor.run(_blocking_job, started, release))
+            await asyncio.to_thread(started.wait, 5)
+            queued = asyncio.create_task(executor.run(lambda: "queued"))
+            await asyncio.sleep(0)
+
+            stats = executor.stats()
+            assert stats["running"] == 1
+            assert stats["queue_depth"] == 1
+
+            with pytest.raises(SimulationQueueFullError):
+                await executor.run(lambda: "rejected")
+            assert executor.stats()["rejected"] == 1
+
+            release.set()
+            assert await running == "done"
+            assert await queued == "queued"
+
+            stats = executor.stats()
+            assert stats["completed"] == 2
+            assert stats["max_wait_ms"] > 0
+        finally:
+            release.set()
+            executor.shutdown()
+
+    async def test_failure_is_counted_and_propagated(self):
+        executor = SimulationExecutor(max_workers=1, max_queue_size=0)
+
+        def boom():
+            raise ValueError("bad genome")
+
+        try:
+            with pytest.raises(ValueError):
+                await executor.run(boom)
+            stats = executor.stats()
+            assert stats["failed"] == 1
+            assert stats["completed"] == 0
+            assert stats["running"] == 0
+
+            # Slot is released after a failure
+            assert await executor.run(lambda: 1) == 1
+        finally:
+            executor.shutdown()
+
+    async def test_cancelled_queued_job_releases_slot(self):
+        executor = SimulationExecutor(max_workers=1, max_queue_size=1)
+        started, release = threading.Event(), threading.Event()
+        try:
+            running = asyncio.create_task(executor.run(_blocking_job, started, release))
+            await asyncio.to_thread(started.wait, 5)
+            queued = asyncio.create_task(executor.run(lambda: "never"))
+            await asyncio.sleep(0)
+            assert executor.stats()["queue_depth"] == 1
+
+            queued.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await queued
+            assert executor.stats()["queue_depth"] == 0
+
+            release.set()
+            await running
+        finally:
+            release.set()
+            executor.shutdown()
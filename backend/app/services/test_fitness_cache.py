@@ -0,0 +1,212 @@
+"""
+Tests for per-creature pellet streams and the survivor FitnessCache.
+"""
+
+import random
+
+import pytest
+import torch
+
+from app.genetics.population import generate_population
+from app.schemas.simulation import SimulationConfig
+from app.services.fitness_cache import FitnessCache, fill_misses, seed_from_id
+from app.services.pytorch_simulator import PyTorchSimulator
+from app.simulation.fitness import (
+    _splitmix64,
+    creature_stream_ids,
+    generate_pellet_positions,
+    initialize_pellets,
+    pellet_stream_keys,
+    stream_uniform,
+)
+from app.simulation.tensors import creature_genomes_to_batch, genome_content_hash
+
+BASE = dict(simulation_duration=2.0, neural_mode='pure', time_encoding='none')
+
+
+def _genomes(n: int) -> list[dict]:
+    random.seed(0)
+    genomes = generate_population(n, neural_mode='pure', time_encoding='none')
+    # Fixed ids: pellet streams are keyed by creature id
+    return [{**genome, 'id': f'creature_{i}'} for i, genome in enumerate(genomes)]
+
+
+def _splitmix64_reference(x: int) -> int:
+    mask = 2**64 - 1
+    x = (x + 0x9E3779B97F4A7C15) & mask
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & mask
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & mask
+    return x ^ (x >> 31)
+
+
+class TestPelletStreams:
+    """Counter-based pellet draws depend only on (key, pellet index, slot)."""
+
+    def test_splitmix_matches_unsigned_reference(self):
+        values = [0, 1, 2**63 - 1, 2**63, 2**64 - 1, 0x0123456789ABCDEF]
+        signed = torch.tensor([v - 2**64 if v >= 2**63 else v for v in values])
+        out = _splitmix64(signed).tolist()
+        assert [o % 2**64 for o in out] == [_splitmix64_reference(v) for v in values]
+
+    def test_uniform_range_and_independence(self):
+        keys = pellet_stream_keys(7, 0, list(range(1000)), torch.device('cpu'))
+        counters = torch.zeros(1000, dtype=torch.long)
+        draws = stream_uniform(keys, counters, 0)
+        assert draws.dtype == torch.float32
+        assert 0.0 <= draws.min() and draws.max() < 1.0
+        assert abs(draws.mean().item() - 0.5) < 0.05
+        assert not torch.equal(draws, stream_uniform(keys, counters, 1))
+        assert not torch.equal(draws, stream_uniform(keys, counters + 1, 0))
+
+    def test_keys_depend_on_seed_generation_and_creature(self):
+        ids = creature_stream_ids(['creature_a', 'creature_b'])
+        assert ids == creature_stream_ids(['creature_a', 'creature_b'])
+        base = pellet_stream_keys(1, 0, ids, torch.device('cpu'))
+        assert base[0] != base[1]
+        assert not torch.equal(base, pellet_stream_keys(2, 0, ids, torch.device('cpu')))
+        assert not torch.equal(base, pellet_stream_keys(1, 1, ids, torch.device('cpu')))
+        assert torch.equal(base[1:], pellet_stream_keys(1, 0, ids[1:], torch.device('cpu')))
+
+    def test_seeded_pellets_leave_global_rng_alone(self):
+        batch = creature_genomes_to_batch(_genomes(3))
+        torch.manual_seed(5)
+        expected = torch.rand(1)
+
+        torch.manual_seed(5)
+        first = initialize_pellets(batch, seed=42)
+        assert torch.equal(torch.rand(1), expected)
+        second = initialize_pellets(batch, seed=42)
+        assert torch.equal(first.positions, second.positions)
+        assert not torch.equal(first.positions, initialize_pellets(batch, seed=43).positions)
+
+        # Later pellets come from the same streams
+        indices = torch.full((3,), 2)
+        radii = torch.ones(3)
+        again = [
+            generate_pellet_positions(
+                batch, indices, radii, first.last_pellet_angles, stream_keys=first.stream_keys
+            )
+            for _ in range(2)
+        ]
+        assert torch.equal(again[0][0], again[1][0])
+
+    def test_fitness_independent_of_batch_and_global_rng(self):
+        simulator = PyTorchSimulator(torch.device('cpu'))
+        genomes = _genomes(6)
+        config = SimulationConfig(**BASE, pellet_seed=3)
+
+        torch.manual_seed(1)
+        together = simulator.simulate_batch(genomes, config)
+        torch.manual_seed(2)
+        alone = simulator.simulate_batch(genomes[4:5], config)
+        torch.manual_seed(3)
+        reordered = simulator.simulate_batch(genomes[::-1], config)
+
+        assert alone[0].fitness == pytest.approx(together[4].fitness, rel=1e-4, abs=1e-3)
+        assert [r.fitness for r in reordered[::-1]] == pytest.approx(
+            [r.fitness for r in together], rel=1e-4, abs=1e-3
+        )
+
+    def test_content_hash_ignores_identity(self):
+        genome = _genomes(1)[0]
+        survivor = dict(genome, id='other', survivalStreak=3, parentIds=['a'])
+        mutated = dict(genome, globalFrequencyMultiplier=genome['globalFrequencyMultiplier'] + 0.1)
+        assert genome_content_hash(survivor) == genome_content_hash(genome)
+        assert genome_content_hash(mutated) != genome_content_hash(genome)
+
+
+class TestFitnessCache:
+    """Results of the previous generation are reused per the re-evaluation policy."""
+
+    def _populate(self, cache: FitnessCache, genomes: list[dict], config) -> list[str]:
+        results = [f"result-{g['id']}" for g in genomes]
+        cache.store(genomes, results, config)
+        return results
+
+    def test_from_config_pins_pellet_seed(self):
+        assert FitnessCache.from_config(SimulationConfig()).pellet_seed is None
+        config = SimulationConfig(survivor_reevaluation='never')
+        cache = FitnessCache.from_config(config, default_seed=42)
+        assert cache.enabled and cache.pellet_seed == 42
+        config = SimulationConfig(survivor_reevaluation='never', pellet_seed=5)
+        cache = FitnessCache.from_config(config, default_seed=42)
+        assert cache.pellet_seed == 5
+
+    def test_always_never_caches(self):
+        genomes = _genomes(3)
+        cache = FitnessCache('always')
+        self._populate(cache, genomes, SimulationConfig())
+        assert cache.lookup(genomes, SimulationConfig()) == [None, None, None]
+
+    def test_survivors_hit_offspring_miss(self):
+        genomes = _genomes(4)
+        cache = FitnessCache('never')
+        results = self._populate(cache, genomes[:2], SimulationConfig())
+
+        survivors = [dict(g, survivalStreak=1) for g in genomes[:2]]
+        cached = cache.lookup(survivors + genomes[2:], SimulationConfig())
+        assert cached == results + [None, None]
+        assert cache.hits == 2
+        assert fill_misses(cached, ['x', 'y']) == results + ['x', 'y']
+
+    def test_every_n_refreshes_per_epoch(self):
+        genome = _genomes(1)
+        cache = FitnessCache('every_n', interval=2)
+
+        def config(generation: int) -> SimulationConfig:
+            return SimulationConfig(pellet_generation=cache.pellet_generation(generation))
+
+        results = self._populate(cache, genome, config(0))
+        assert cache.lookup(genome, config(1)) == results
+        cache.store(genome, results, config(1))
+        # A new epoch draws new pellets: everyone is re-simulated
+        assert cache.lookup(genome, config(2)) == [None]
+
+        cache.store(genome, ['fresh'], config(2))
+        assert cache.lookup(genome, config(3)) == ['fresh']
+
+    def test_config_change_invalidates(self):
+        genomes = _genomes(2)
+        cache = FitnessCache('never')
+        self._populate(cache, genomes, SimulationConfig())
+        assert cache.lookup(genomes, SimulationConfig(fitness_pellet_points=50.0)) == [None, None]
+        # Evolution-only settings do not invalidate results; other pellets do
+        assert None not in cache.lookup(genomes, SimulationConfig(mutation_rate=0.9))
+        assert cache.lookup(genomes, SimulationConfig(pellet_generation=1)) == [None, None]
+
+    def test_seed_from_id(self):
+        seeds = {seed_from_id(f"run-{i}") for i in range(100)}
+        assert len(seeds) == 100
+        assert seed_from_id("run-1") == seed_from_id("run-1")
+        assert all(0 <= s < 2**62 for s in seeds)
+
+    def test_pellet_generation_per_policy(self):
+        assert FitnessCache('never').pellet_generation(7) == 0
+        every_3 = FitnessCache('every_n', interval=3)
+        assert [every_3.pellet_generation(g) for g in range(7)] == [0, 0, 0, 1, 1, 1, 2]
+        assert FitnessCache('always').pellet_generation(7) == 7
+
+    def test_cached_result_matches_resimulation(self):
+        genomes = _genomes(4)
+        config = SimulationConfig(**BASE, survivor_reevaluation='never')
+        cache = FitnessCache.from_config(config, default_seed=3)
+        simulator = PyTorchSimulator(torch.device('cpu'))
+
+        def simulate(generation: int) -> list[float]:
+            config = SimulationConfig(
+                **BASE,
+                pellet_seed=cache.pellet_seed,
+                pellet_generation=cache.pellet_generation(generation),
+            )
+            return [r.fitness for r in simulator.simulate_batch(genomes, config)]
+
+        # A result reused in a later generation is what re-simulating would give
+        assert simulate(0) == simulate(5)
+        # ... and a new 'every_n' epoch scores on different pellets
+        cache = FitnessCache.from_config(
+            SimulationConfig(
+                **BASE, survivor_reevaluation='every_n', survivor_reevaluation_interval=2,
+            ),
+            default_seed=3,
+        )
+        assert simulate(0) == simulate(1) != simulate(2)
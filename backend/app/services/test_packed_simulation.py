@@ -0,0 +1,114 @@
+"""
+Tests for PyTorchSimulator.simulate_packed (several configs in one batch).
+"""
+
+import random
+
+import pytest
+import torch
+
+from app.genetics.population import generate_population
+from app.schemas.simulation import SimulationConfig
+from app.services.pytorch_simulator import PyTorchSimulator, packing_key
+from app.simulation.physics import apply_output_smoothing, apply_velocity_cap
+
+BASE = dict(simulation_duration=2.0, neural_mode='pure', time_encoding='none')
+
+
+def _populations(sizes: list[int]) -> list[list[dict]]:
+    random.seed(0)
+    genomes = generate_population(sum(sizes), neural_mode='pure', time_encoding='none')
+    groups, offset = [], 0
+    for size in sizes:
+        groups.append(genomes[offset:offset + size])
+        offset += size
+    return groups
+
+
+def _fitness(results) -> list[float]:
+    return [r.fitness for r in results]
+
+
+class TestSimulatePacked:
+    """Packed groups must score exactly as if simulated with their own config."""
+
+    def test_uniform_configs_match_simulate_batch(self):
+        simulator = PyTorchSimulator(torch.device('cpu'))
+        groups = _populations([4, 6])
+        config = SimulationConfig(**BASE)
+
+        torch.manual_seed(1)
+        packed = simulator.simulate_packed([(groups[0], config), (groups[1], config)])
+        torch.manual_seed(1)
+        batch = simulator.simulate_batch(groups[0] + groups[1], config)
+
+        assert [len(g) for g in packed] == [4, 6]
+        assert _fitness(packed[0] + packed[1]) == _fitness(batch)
+
+    def test_per_creature_knobs(self):
+        simulator = PyTorchSimulator(torch.device('cpu'))
+        groups = _populations([5, 5])
+        genomes = groups[0] + groups[1]
+        configs = [
+            SimulationConfig(**BASE),
+            SimulationConfig(
+                **BASE,
+                neural_dead_zone=0.3,
+                muscle_velocity_cap=1.0,
+                output_smoothing_alpha=0.6,
+                muscle_damping_multiplier=2.0,
+                fitness_pellet_points=50.0,
+                fitness_distance_per_unit=1.0,
+                fitness_efficiency_penalty=1.0,
+            ),
+        ]
+        assert packing_key(configs[0]) == packing_key(configs[1])
+
+        torch.manual_seed(2)
+        packed = simulator.simulate_packed([(groups[0], configs[0]), (groups[1], configs[1])])
+
+        # Same pellets (same seed, same batch size), each group under its own config
+        for k, config in enumerate(configs):
+            torch.manual_seed(2)
+            expected = simulator.simulate_batch(genomes, config)[5 * k:5 * (k + 1)]
+            for got, want in zip(packed[k], expected):
+                assert got.fitness == pytest.approx(want.fitness, rel=1e-4, abs=1e-3)
+                assert got.fitness_breakdown.distance_traveled == pytest.approx(
+                    want.fitness_breakdown.distance_traveled, rel=1e-4, abs=1e-3
+                )
+                assert got.fitness_breakdown.efficiency_penalty == pytest.approx(
+                    want.fitness_breakdown.efficiency_penalty, rel=1e-4, abs=1e-3
+                )
+
+    def test_batch_wide_fields_cannot_be_packed(self):
+        simulator = PyTorchSimulator(torch.device('cpu'))
+        groups = _populations([2, 2])
+        configs = [SimulationConfig(**BASE), SimulationConfig(**BASE, time_step=1 / 60)]
+
+        assert packing_key(configs[0]) != packing_key(configs[1])
+        with pytest.raises(ValueError, match="time_step"):
+            simulator.simulate_packed(list(zip(groups, configs)))
+
+    def test_evolution_settings_do_not_affect_packing(self):
+        config = SimulationConfig(mutation_rate=0.1)
+        assert packing_key(config) == packing_key({'mutation_rate': 0.9})
+
+
+class TestPerCreatureParameters:
+    """[B] parameter tensors broadcast per row."""
+
+    def test_velocity_cap(self):
+        prev = torch.zeros(2, 3)
+        new = torch.ones(2, 3)
+        capped = apply_velocity_cap(new, prev, torch.tensor([1.0, 10.0]), dt=0.1)
+        assert torch.allclose(capped[0], torch.full((3,), 0.1))
+        assert torch.allclose(capped[1], torch.ones(3))
+        slow = apply_velocity_cap(-new, prev, torch.tensor([1.0, 1.0]), dt=0.1)
+        assert torch.equal(slow, -capped[:1].expand(2, 3))
+
+    def test_output_smoothing(self):
+        raw = torch.ones(2, 3)
+        smoothed = torch.zeros(2, 3)
+        out = apply_output_smoothing(raw, smoothed, torch.tensor([0.25, 1.0]))
+        assert torch.allclose(out[0], torch.full((3,), 0.25))
+        assert torch.allclose(out[1], torch.ones(3))
@@ -0,0 +1,120 @@
+"""
+Tests for PyTorchSimulator result marshalling (tensors -> SimulationResult).
+"""
+
+import math
+import random
+
+import torch
+
+from app.genetics.population import generate_population
+from app.schemas.simulation import SimulationConfig
+from app.services.pytorch_simulator import PyTorchSimulator
+from app.simulation.fitness import FitnessConfig, initialize_fitness_state, initialize_pellets
+from app.simulation.frame_codec import decode_activations, decode_node_frames
+from app.simulation.tensors import creature_genomes_to_batch
+
+NAN = float('nan')
+INF = float('inf')
+
+
+def _marshal(frame_format: str = 'json', num_frames: int = 4):
+    """Marshal hand-built result tensors for 3 creatures; creature 1 exploded (NaN/Inf)."""
+    random.seed(0)
+    genomes = generate_population(3, neural_mode='pure', time_encoding='none')
+    batch = creature_genomes_to_batch(genomes)
+    pellets = initialize_pellets(batch, seed=0)
+    state = initialize_fitness_state(batch, pellets)
+    num_nodes = batch.positions.shape[1]
+
+    pellets.total_collected = torch.tensor([2, 0, 1])
+    state.distance_traveled = torch.tensor([1.0, INF, 2.0])
+
+    final_positions = torch.zeros(3, num_nodes, 3)
+    final_positions[1, 0, 0] = NAN
+    frames = torch.arange(3 * num_frames * num_nodes * 3, dtype=torch.float32)
+    frames = frames.reshape(3, num_frames, num_nodes, 3)
+    frames[1, 2, 1, 1] = INF
+    torch.manual_seed(0)
+    activations = {
+        'inputs': torch.rand(3, num_frames, 5),
+        'hidden': torch.rand(3, num_frames, 2),
+        'outputs': torch.rand(3, num_frames, 4),
+    }
+    activations['outputs'][1, 0, 0] = NAN
+
+    result = {
+        'final_positions': final_positions,
+        'final_com': torch.tensor([[3.0, 0.0, 4.0], [NAN, 0.0, 0.0], [1.0, 5.0, 0.0]]),
+        'frames': frames,
+        'fitness_per_frame': torch.tensor([[1.0, 2.0, NAN, 4.0]] * 3),
+        'activations_per_frame': activations,
+    }
+
+    config = SimulationConfig(
+        frame_storage_mode='all', frame_format=frame_format, frame_precision='float32'
+    )
+    results = PyTorchSimulator(torch.device('cpu'))._marshal_results(
+        genomes=genomes,
+        config=config,
+        fitness_config=FitnessConfig(),
+        result=result,
+        fitness_values=torch.tensor([10.0, NAN, 20.0]),
+        fitness_state=state,
+        pellet_batch=pellets,
+        freq_violations=torch.tensor([False, False, True]),
+        num_muscles=[len(g['muscles']) for g in genomes],
+        initial_com=torch.zeros(3, 3),
+        initial_pellet_positions=pellets.positions.clone(),
+        initial_pellet_distances=pellets.initial_distances.clone(),
+        total_activation=torch.tensor([6.0, NAN, 0.0]),
+        use_neural=True,
+        simulation_time=2.0,
+        frame_interval=2,
+        dt=0.25,
+    )
+    return results, frames, activations
+
+
+class TestResultMarshalling:
+    """Bulk marshalling must reproduce the per-creature scalar semantics."""
+
+    def test_scalars_and_disqualification(self):
+        results, _, _ = _marshal()
+
+        reasons = [r.disqualified_reason for r in results]
+        assert reasons == [None, 'physics_explosion', 'frequency_exceeded']
+        assert results[0].fitness == 10.0
+        assert results[1].fitness == 0.0
+        assert results[2].fitness == 0.0  # disqualified
+        assert results[0].net_displacement == 5.0
+        assert results[1].net_displacement == 0.0
+        assert results[1].distance_traveled == 0.0
+        assert [r.pellets_collected for r in results] == [2, 0, 1]
+        assert results[1].total_activation == 0.0
+        assert results[0].fitness_breakdown.efficiency_penalty > 0
+
+    def test_json_frames_layout(self):
+        results, frames, activations = _marshal()
+        first = results[0]
+
+        assert first.frame_count == 4
+        assert first.frames[3][0] == 3 * 2 * 0.25
+        assert first.frames[1][1:] == frames[0, 1].flatten().tolist()
+        assert first.fitness_over_time == [1.0, 2.0, 0.0, 4.0]
+        assert first.activations_per_frame[2]['hidden'] == activations['hidden'][0, 2].tolist()
+        assert set(first.activations_per_frame[0]) == {'inputs', 'hidden', 'outputs'}
+
+        # Non-finite values are sanitized to 0 (JSON-safe)
+        exploded = results[1]
+        assert exploded.frames[2][1 + 3 + 1] == 0.0
+        assert exploded.activations_per_frame[0]['outputs'][0] == 0.0
+        assert all(math.isfinite(v) for row in exploded.frames for v in row)
+
+    def test_binary_matches_json(self):
+        json_results, _, _ = _marshal('json')
+        binary_results, _, _ = _marshal('binary')
+
+        for j, b in zip(json_results, binary_results):
+            assert decode_node_frames(b.frames_encoded) == j.frames
+            assert decode_activations(b.activations_encoded) == j.activations_per_frame
@@ -0,0 +1,102 @@
+"""
+Tests for ShardedSimulator (multi-process simulate_batch / simulate_packed).
+"""
+
+import random
+
+import numpy as np
+import pytest
+import torch
+
+from app.genetics.population import generate_population
+from app.schemas.simulation import SimulationConfig
+from app.services.pytorch_simulator import PyTorchSimulator
+from app.services.sharded_simulator import ShardedSimulator
+
+BASE = dict(simulation_duration=1.0, neural_mode='pure', time_encoding='none', pellet_seed=11)
+
+
+@pytest.fixture(scope='module')
+def sharded():
+    simulator = ShardedSimulator(n_workers=2, threads_per_worker=1, warm_up=False, min_shard_size=2)
+    yield simulator
+    simulator.close()
+
+
+def _genomes(n: int) -> list[dict]:
+    random.seed(0)
+    return generate_population(n, neural_mode='pure', time_encoding='none')
+
+
+def _assert_same(got, want):
+    assert [r.genome_id for r in got] == [r.genome_id for r in want]
+    assert [r.fitness for r in got] == pytest.approx([r.fitness for r in want], rel=1e-4, abs=1e-3)
+    assert [r.pellets_collected for r in got] == [r.pellets_collected for r in want]
+
+
+class TestShardedSimulator:
+    """Sharded results match a single PyTorchSimulator, in input order."""
+
+    def test_matches_single_process(self, sharded):
+        genomes = _genomes(9)
+        config = SimulationConfig(**BASE)
+        expected = PyTorchSimulator(torch.device('cpu')).simulate_batch(genomes, config)
+        _assert_same(sharded.simulate_batch(genomes, config), expected)
+
+    def test_unseeded_batch_uses_one_pellet_seed(self, sharded):
+        genomes = _genomes(6)
+        config = dict(BASE, pellet_seed=None)
+        torch.manual_seed(4)
+        got = sharded.simulate_batch(genomes, config)
+        torch.manual_seed(4)
+        want = PyTorchSimulator(torch.device('cpu')).simulate_batch(genomes, config)
+        _assert_same(got, want)
+
+    def test_packed_groups_split_across_shards(self, sharded):
+        genomes = _genomes(7)
+        configs = [SimulationConfig(**BASE), SimulationConfig(**BASE, fitness_pellet_points=50.0)]
+        groups = [(genomes[:3], configs[0]), (genomes[3:], configs[1])]
+
+        got = sharded.simulate_packed(groups)
+        want = PyTorchSimulator(torch.device('cpu')).simulate_packed(groups)
+        assert [len(g) for g in got] == [3, 4]
+        for got_group, want_group in zip(got, want):
+            _assert_same(got_group, want_group)
+
+    def test_id_less_genomes_named_by_batch_index(self, sharded):
+        genomes = [{k: v for k, v in genome.items() if k != 'id'} for genome in _genomes(8)]
+        config = SimulationConfig(**BASE)
+
+        got = sharded.simulate_batch(genomes, config)
+        assert len({r.genome_id for r in got}) == len(genomes)
+        _assert_same(got, PyTorchSimulator(torch.device('cpu')).simulate_batch(genomes, config))
+
+    def test_empty_and_invalid_batches(self, sharded):
+        assert sharded.simulate_batch([], SimulationConfig(**BASE)) == []
+        configs = [SimulationConfig(**BASE), SimulationConfig(**BASE, time_step=1 / 60)]
+        with pytest.raises(ValueError, match="time_step"):
+            sharded.simulate_packed([(_genomes(2), configs[0]), (_genomes(2), configs[1])])
+
+    def test_recorded_results_round_trip(self, sharded):
+        genomes = _genomes(5)
+        config = SimulationConfig(**BASE, record_frames=True, frame_storage_mode='all')
+
+        got = sharded.simulate_batch(genomes, config)
+        want = PyTorchSimulator(torch.device('cpu')).simulate_batch(genomes, config)
+        _assert_same(got, want)
+        for g, w in zip(got, want):
+            assert g.frame_count == w.frame_count > 0
+            assert np.asarray(g.frames) == pytest.approx(np.asarray(w.frames), rel=1e-4, abs=1e-3)
+            assert [p.id for p in g.pellets] == [p.id for p in w.pellets]
+            assert g.disqualified_reason == w.disqualified_reason
+            assert g.terminated_at == w.terminated_at
+            breakdown = w.fitness_breakdown.model_dump()
+            assert g.fitness_breakdown.model_dump() == pytest.approx(breakdown, rel=1e-4, abs=1e-3)
+
+    def test_worker_error_is_raised_and_pool_recovers(self, sharded):
+        # Bodies are staged in the parent; a broken NEAT genome only fails in the worker
+        broken = dict(_genomes(1)[0], id='broken', controllerType='neural', neatGenome=42)
+        config = SimulationConfig(**dict(BASE, neural_mode='neat'), use_neural_net=True)
+        with pytest.raises(RuntimeError, match="worker"):
+            sharded.simulate_batch([broken] * 4, config)
+        assert len(sharded.simulate_batch(_genomes(4), SimulationConfig(**BASE))) == 4
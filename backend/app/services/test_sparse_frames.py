@@ -0,0 +1,85 @@
+"""
+Tests for frame recording: preallocated buffers and sparse frame storage.
+"""
+
+import random
+
+import pytest
+import torch
+
+from app.genetics.population import generate_population
+from app.schemas.simulation import SimulationConfig
+from app.services.pytorch_simulator import PyTorchSimulator, sparse_frame_rows
+from app.storage.frames import select_creatures_for_frames
+
+BASE = dict(
+    simulation_duration=2.0, neural_mode='pure', time_encoding='none', pellet_seed=4, frame_rate=15
+)
+
+
+def _genomes(n: int) -> list[dict]:
+    random.seed(0)
+    return generate_population(n, neural_mode='pure', time_encoding='none')
+
+
+@pytest.fixture(scope='module')
+def recorded_all():
+    """Every creature recorded, as the reference."""
+    genomes = _genomes(12)
+    results = PyTorchSimulator(torch.device('cpu')).simulate_batch(
+        genomes, SimulationConfig(**BASE, frame_storage_mode='all'),
+    )
+    return genomes, results
+
+
+def test_sparse_frame_rows_match_selection():
+    fitness = [5.0, 1.0, 9.0, 3.0, 7.0]
+    config = SimulationConfig(sparse_top_count=1, sparse_bottom_count=2)
+    ids = select_creatures_for_frames([str(i) for i in range(5)], fitness, 'sparse', 1, 2)
+    assert sparse_frame_rows(fitness, config) == sorted(int(i) for i in ids) == [1, 2, 3]
+
+
+def test_full_recording(recorded_all):
+    _, results = recorded_all
+    steps = int(BASE['simulation_duration'] * 30)
+    expected_frames = -(-steps // (30 // BASE['frame_rate']))
+    for result in results:
+        assert result.frame_count == expected_frames == len(result.frames)
+        assert len(result.fitness_over_time) == expected_frames
+        assert len(result.activations_per_frame) == expected_frames
+        assert set(result.activations_per_frame[0]) == {
+            'inputs', 'hidden', 'outputs', 'outputs_raw'
+        }
+
+
+@pytest.mark.parametrize('replay', [False, True])
+def test_sparse_keeps_selected_frames(recorded_all, replay):
+    genomes, reference = recorded_all
+    config = SimulationConfig(
+        **BASE,
+        frame_storage_mode='sparse',
+        sparse_top_count=2,
+        sparse_bottom_count=3,
+        sparse_frame_replay=replay,
+    )
+    results = PyTorchSimulator(torch.device('cpu')).simulate_batch(genomes, config)
+
+    kept = sparse_frame_rows([r.fitness for r in reference], config)
+    assert len(kept) == 5
+    for i, (result, expected) in enumerate(zip(results, reference)):
+        assert result.fitness == expected.fitness
+        if i in kept:
+            assert result.frames == expected.frames
+            assert result.fitness_over_time == expected.fitness_over_time
+            assert result.activations_per_frame == expected.activations_per_frame
+        else:
+            assert result.frames is None and result.frame_count == 0
+
+
+def test_sparse_replay_rejects_early_termination():
+    with pytest.raises(ValueError, match='early_termination'):
+        SimulationConfig(
+            **BASE, frame_storage_mode='sparse', sparse_frame_replay=True, early_termination=True
+        )
+    # Recording everyone ignores early termination for the whole batch, which stays consistent
+    SimulationConfig(**BASE, frame_storage_mode='sparse', early_termination=True)
@@ -0,0 +1,99 @@
+"""
+Early termination of hopeless creatures during neural simulation.
+
+Opt-in policy for simulate_with_fitness_neural. Every check_interval steps a
+creature is stopped when it
+- is disqualified (NaN/Inf positions or physics explosion, see
+  check_disqualifications): its fitness is 0 whatever happens next,
+- has stagnated: its center of mass moved less than stagnation_distance in
+  XZ over the last stagnation_window steps,
+- is below the fitness bound: after grace_steps its fitness is still below
+  min_fitness.
+
+A stopped creature is scored on the state it had when it stopped. It is
+frozen (freeze_disqualified_creatures) until the batch is compacted, which
+happens once compact_fraction of the rows have stopped. Creatures that run to
+the end are simulated exactly as without the policy: every per-creature
+computation is independent of the other rows in the batch.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+
+import torch
+
+from app.simulation.tensors import CreatureBatch, get_center_of_mass
+
+
+@dataclass
+class EarlyTermination:
+    """Early termination policy (all durations in physics steps)."""
+    check_interval: int = 30            # Steps between checks (host sync + possible compaction)
+    # Steps the COM must stay within stagnation_distance (0 = off)
+    stagnation_window: int = 90
+    stagnation_distance: float = 0.1    # XZ distance (units) that counts as movement
+    min_fitness: float | None = None    # Fitness bound (None = off)
+    grace_steps: int = 150              # Steps before the fitness bound applies
+    compact_fraction: float = 0.25      # Compact once this fraction of the rows has stopped
+
+
+class TerminationTracker:
+    """
+    Running state of an EarlyTermination policy for one batch.
+
+    Keeps the center of mass at every check for the stagnation window; rows
+    follow the batch through compaction via select().
+    """
+
+    def __init__(self, policy: EarlyTermination, com: torch.Tensor):
+        """
+        Args:
+            policy: EarlyTermination settings
+            com: [B, 3] center of mass at the start of the simulation
+        """
+        self.policy = policy
+        # COM history spanning at least stagnation_window steps
+        window_checks = -(-policy.stagnation_window // policy.check_interval)
+        self._history: deque[torch.Tensor] = deque([com.clone()], maxlen=window_checks + 1)
+
+    @torch.no_grad()
+    def check(
+        self,
+        batch: CreatureBatch,
+        disqualified: torch.Tensor,
+        fitness: torch.Tensor | None,
+        steps_done: int,
+    ) -> torch.Tensor:
+        """
+        Find the creatures to stop after `steps_done` steps.
+
+        Args:
+            batch: CreatureBatch with current positions
+            disqualified: [B] disqualification flags (FitnessState.disqualified)
+            fitness: [B] current fitness (only read when the fitness bound applies)
+            steps_done: Physics steps simulated so far
+
+        Returns:
+            [B] boolean tensor - True where the creature should stop
+        """
+        policy = self.policy
+        stop = disqualified.clone()
+
+        com = get_center_of_mass(batch)
+        self._history.append(com)
+        if policy.stagnation_window > 0 and len(self._history) == self._history.maxlen:
+            moved = torch.norm(com[:, [0, 2]] - self._history[0][:, [0, 2]], dim=1)
+            stop |= moved < policy.stagnation_distance
+
+        if self.bound_active(steps_done) and fitness is not None:
+            stop |= fitness < policy.min_fitness
+
+        return stop
+
+    def bound_active(self, steps_done: int) -> bool:
+        """True when the fitness bound applies after `steps_done` steps."""
+        return self.policy.min_fitness is not None and steps_done >= self.policy.grace_steps
+
+    def select(self, rows: torch.Tensor) -> None:
+        """Keep only the history of the creatures at `rows` (after compaction)."""
+        self._history = deque((com[rows] for com in self._history), maxlen=self._history.maxlen)
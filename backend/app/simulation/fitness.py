@@ -8,6 +8,7 @@ Handles:
 - Disqualification detection (NaN, physics explosion, frequency violation)
 """
 
+import hashlib
 import torch
 import math
 from dataclasses import dataclass
@@ -22,7 +23,12 @@ from app.simulation.tensors import CreatureBatch, get_center_of_mass, MAX_NODES
 
 @dataclass
 class FitnessConfig:
-    """Configuration for fitness calculation."""
+    """
+    Configuration for fitness calculation.
+
+    The score weights (pellet_points through efficiency_penalty) may also be
+    [B] tensors, one value per creature, for batches packed from several configs.
+    """
     pellet_points: float = 20.0         # Bonus points for collecting pellet (banked progress 80 + bonus 20 = 100 total)
     progress_max: float = 80.0          # Max points for progress toward pellet
     distance_per_unit: float = 3.0      # Points per unit traveled
@@ -64,6 +70,10 @@ class PelletBatch:
     # None/NaN indicates first pellet (random angle)
     last_pellet_angles: torch.Tensor
 
+    # Per-creature random stream keys [B] int64 (see pellet_stream_keys).
+    # None = draw pellet positions from the global torch RNG.
+    stream_keys: torch.Tensor | None = None
+
 
 # =============================================================================
 # Creature XZ Radius Calculation
@@ -124,6 +134,93 @@ def calculate_creature_xz_radius(batch: CreatureBatch) -> torch.Tensor:
     return final_radius
 
 
+# =============================================================================
+# Counter-Based Pellet Randomness
+# =============================================================================
+#
+# Every pellet draw is a pure function of (stream key, pellet index, draw slot),
+# hashed with SplitMix64 in int64 tensor arithmetic on the batch device. Stream
+# keys are derived from (seed, generation, creature id), so a creature gets
+# the same pellets whatever batch, order or process it is simulated in.
+
+_SPLITMIX_GAMMA = -0x61C8864680B583EB  # 0x9E3779B97F4A7C15 as int64
+_SPLITMIX_MUL1 = -0x40A7B892E31B1A47   # 0xBF58476D1CE4E5B9 as int64
+_SPLITMIX_MUL2 = -0x6B2FB644ECCEEE15   # 0x94D049BB133111EB as int64
+
+# Uniform draws per spawned pellet: angle, opposite-arc offset, distance, height
+PELLET_DRAWS = 4
+
+
+def _to_int64(value: int) -> int:
+    """Wrap a Python int into the signed 64-bit range."""
+    return (value + 2**63) % 2**64 - 2**63
+
+
+def _shift_right(x: torch.Tensor, bits: int) -> torch.Tensor:
+    """Logical (unsigned) right shift of an int64 tensor."""
+    return (x >> bits) & ((1 << (64 - bits)) - 1)
+
+
+def _splitmix64(x: torch.Tensor) -> torch.Tensor:
+    """SplitMix64 finalizer on int64 tensors (multiplication wraps mod 2^64)."""
+    x = x + _SPLITMIX_GAMMA
+    x = (x ^ _shift_right(x, 30)) * _SPLITMIX_MUL1
+    x = (x ^ _shift_right(x, 27)) * _SPLITMIX_MUL2
+    return x ^ _shift_right(x, 31)
+
+
+def creature_stream_ids(creature_ids: list[str]) -> list[int]:
+    """Stable 64-bit integer per creature id (independent of PYTHONHASHSEED)."""
+    return [
+        int.from_bytes(hashlib.blake2b(cid.encode(), digest_size=8).digest(), 'little', signed=True)
+        for cid in creature_ids
+    ]
+
+
+def pellet_stream_keys(
+    seed: int,
+    generation: int,
+    creature_keys: list[int] | torch.Tensor,
+    device: torch.device,
+) -> torch.Tensor:
+    """
+    Build per-creature pellet stream keys.
+
+    Args:
+        seed: Run seed
+        generation: Generation being simulated (fresh pellets every generation)
+        creature_keys: [B] integers identifying each creature (see creature_stream_ids)
+        device: Device of the simulation batch
+
+    Returns:
+        [B] int64 stream keys
+    """
+    if isinstance(creature_keys, torch.Tensor):
+        keys = creature_keys.to(device=device, dtype=torch.long)
+    else:
+        keys = torch.tensor([_to_int64(k) for k in creature_keys], dtype=torch.long, device=device)
+    run_key = _splitmix64(torch.tensor(_to_int64(seed), dtype=torch.long, device=device))
+    run_key = _splitmix64(run_key ^ _to_int64(generation))
+    return _splitmix64(keys ^ run_key)
+
+
+def stream_uniform(keys: torch.Tensor, counters: torch.Tensor, slot: int) -> torch.Tensor:
+    """
+    Counter-based uniform random numbers, one per creature.
+
+    Args:
+        keys: [B] int64 stream keys
+        counters: [B] integer counter per creature (e.g. pellet index)
+        slot: Draw number within one counter value (0 <= slot < PELLET_DRAWS)
+
+    Returns:
+        [B] float32 values in [0, 1)
+    """
+    x = _splitmix64(keys ^ _splitmix64(counters.long() * PELLET_DRAWS + slot))
+    # Top 24 bits are exactly representable in float32
+    return _shift_right(x, 40).float() * (1.0 / (1 << 24))
+
+
 # =============================================================================
 # Pellet Generation
 # =============================================================================
@@ -136,6 +233,7 @@ def generate_pellet_positions(
     last_angles: Optional[torch.Tensor] = None,
     arena_size: float = 50.0,
     seed: Optional[int] = None,
+    stream_keys: torch.Tensor | None = None,
 ) -> tuple[torch.Tensor, torch.Tensor]:
     """
     Generate pellet positions for each creature with opposite-half spawning.
@@ -156,7 +254,10 @@ def generate_pellet_positions(
         creature_xz_radii: [B] XZ radius of each creature
         last_angles: [B] last pellet angle per creature (NaN for first pellet)
         arena_size: Arena boundary size
-        seed: Optional random seed for reproducibility
+        seed: Seed for reproducible draws from streams keyed by batch row
+              (ignored when stream_keys is given)
+        stream_keys: [B] int64 per-creature stream keys (see pellet_stream_keys).
+                     Without keys or seed, draws come from the global torch RNG.
 
     Returns:
         Tuple of ([B, 3] pellet positions, [B] new angles)
@@ -170,14 +271,20 @@ def generate_pellet_positions(
     # Get creature centers of mass
     com = get_center_of_mass(batch)  # [B, 3]
 
-    # Set random seed if provided
-    if seed is not None:
-        torch.manual_seed(seed)
+    if stream_keys is None and seed is not None:
+        stream_keys = pellet_stream_keys(seed, 0, torch.arange(B, device=device), device)
+
+    if stream_keys is not None:
+        def uniform(slot: int) -> torch.Tensor:
+            return stream_uniform(stream_keys, pellet_indices, slot)
+    else:
+        def uniform(slot: int) -> torch.Tensor:
+            return torch.rand(B, device=device)
 
     # Generate angles with opposite-half logic
     # First pellet (index 0 or no last angle): random angle
     # Subsequent pellets: opposite 180° arc (lastAngle + PI ± 90°)
-    random_angles = torch.rand(B, device=device) * 2 * math.pi
+    random_angles = uniform(0) * 2 * math.pi
 
     if last_angles is not None:
         # Check if this is first pellet (pellet_indices == 0 or last_angles is NaN)
@@ -185,7 +292,7 @@ def generate_pellet_positions(
 
         # For subsequent pellets: opposite center + random offset in ±90° range
         opposite_center = last_angles + math.pi
-        offset = (torch.rand(B, device=device) - 0.5) * math.pi  # ±90°
+        offset = (uniform(1) - 0.5) * math.pi  # ±90°
         opposite_angles = opposite_center + offset
 
         # Use random for first, opposite for subsequent
@@ -201,7 +308,7 @@ def generate_pellet_positions(
                           torch.where(pellet_indices <= 2, 9.0, 10.0))
 
     # Random distance within range
-    rand_dist = torch.rand(B, device=device)
+    rand_dist = uniform(2)
     dist_from_edge = min_dist + rand_dist * (max_dist - min_dist)
 
     # Total distance from center = creature radius + distance from edge
@@ -214,7 +321,7 @@ def generate_pellet_positions(
     # Height increases with pellet index, with random variation
     # Base height: 0.5-1.0 (always above ground)
     # Additional height per pellet collected: 0.3
-    base_height = 0.5 + torch.rand(B, device=device) * 0.5  # Random 0.5-1.0
+    base_height = 0.5 + uniform(3) * 0.5  # Random 0.5-1.0
     height_increment = 0.3
     py = base_height + pellet_indices.float() * height_increment
 
@@ -234,6 +341,7 @@ def initialize_pellets(
     batch: CreatureBatch,
     arena_size: float = 50.0,
     seed: Optional[int] = None,
+    stream_keys: torch.Tensor | None = None,
 ) -> PelletBatch:
     """
     Initialize pellet data for all creatures.
@@ -243,7 +351,9 @@ def initialize_pellets(
     Args:
         batch: CreatureBatch with initial positions
         arena_size: Arena boundary size
-        seed: Optional random seed
+        seed: Optional seed for streams keyed by batch row (when stream_keys is None)
+        stream_keys: Optional [B] per-creature stream keys, kept on the
+                     PelletBatch for every later spawn
 
     Returns:
         PelletBatch with initialized pellet data
@@ -254,6 +364,9 @@ def initialize_pellets(
     # Calculate creature radii
     creature_radii = calculate_creature_xz_radius(batch)
 
+    if stream_keys is None and seed is not None:
+        stream_keys = pellet_stream_keys(seed, 0, torch.arange(B, device=device), device)
+
     # Initial pellet indices (all 0)
     pellet_indices = torch.zeros(B, dtype=torch.long, device=device)
 
@@ -262,7 +375,7 @@ def initialize_pellets(
 
     # Generate first pellet positions (with opposite-half spawning)
     positions, new_angles = generate_pellet_positions(
-        batch, pellet_indices, creature_radii, last_angles, arena_size, seed
+        batch, pellet_indices, creature_radii, last_angles, arena_size, stream_keys=stream_keys
     )
 
     # Calculate initial distances (XZ ground distance from edge to pellet)
@@ -278,6 +391,7 @@ def initialize_pellets(
         collected=torch.zeros(B, dtype=torch.bool, device=device),
         total_collected=torch.zeros(B, dtype=torch.long, device=device),
         last_pellet_angles=new_angles,
+        stream_keys=stream_keys,
     )
 
 
@@ -446,6 +560,7 @@ def update_pellets(
     pellets: PelletBatch,
     arena_size: float = 50.0,
     stable_radii: torch.Tensor | None = None,
+    sync_free: bool = False,
 ) -> None:
     """
     Update pellet state after collision check.
@@ -461,6 +576,11 @@ def update_pellets(
         stable_radii: Optional stable creature radii (from fitness state). If provided,
                       uses these for consistent distance calculations. If None, calculates
                       from current positions (legacy behavior).
+        sync_free: Always run the masked spawn path instead of gating it on
+                   newly_collected.any(). Avoids a host/device sync per call, but
+                   draws spawn randomness every call, so the pellet sequence for a
+                   given global seed differs from the gated path (unless the
+                   pellets have stream keys, which make both paths identical).
     """
     # Check for collisions
     newly_collected = check_pellet_collisions(batch, pellets)
@@ -470,7 +590,7 @@ def update_pellets(
     pellets.total_collected = pellets.total_collected + newly_collected.long()
 
     # For creatures that collected, spawn new pellet
-    if newly_collected.any():
+    if sync_free or newly_collected.any():
         # Increment pellet index for collectors
         pellets.pellet_indices = pellets.pellet_indices + newly_collected.long()
 
@@ -482,7 +602,7 @@ def update_pellets(
         # Generate new positions for collectors (with opposite-half spawning)
         new_positions, new_angles = generate_pellet_positions(
             batch, pellets.pellet_indices, creature_radii,
-            pellets.last_pellet_angles, arena_size
+            pellets.last_pellet_angles, arena_size, stream_keys=pellets.stream_keys
         )
 
         # Update positions for collectors only
@@ -667,12 +787,14 @@ def update_fitness_state(
     state: FitnessState,
     pellets: PelletBatch,
     config: FitnessConfig = FitnessConfig(),
+    sync_free: bool = False,
 ) -> None:
     """
     Update fitness state after a physics step.
 
     Updates distance traveled, closest edge distance, and checks for disqualification.
-    Modifies state in-place.
+    Modifies state in-place. With sync_free=True the freeze is applied as a masked
+    update every call instead of being gated on state.disqualified.any().
     """
     com = get_center_of_mass(batch)
 
@@ -699,14 +821,15 @@ def update_fitness_state(
 
     # Freeze disqualified creatures to prevent them from flying further into infinity
     # This zeros their velocities so they stop moving
-    if state.disqualified.any():
-        freeze_disqualified_creatures(batch, state.disqualified)
+    if sync_free or state.disqualified.any():
+        freeze_disqualified_creatures(batch, state.disqualified, sync_free=sync_free)
 
 
 @torch.no_grad()
 def freeze_disqualified_creatures(
     batch: CreatureBatch,
     disqualified: torch.Tensor,
+    sync_free: bool = False,
 ) -> None:
     """
     Freeze disqualified creatures by zeroing their velocities.
@@ -717,8 +840,9 @@ def freeze_disqualified_creatures(
     Args:
         batch: CreatureBatch (modified in place)
         disqualified: [B] boolean tensor of disqualified creatures
+        sync_free: Skip the early-exit check (avoids a host/device sync)
     """
-    if not disqualified.any():
+    if not sync_free and not disqualified.any():
         return
 
     # Zero velocities for disqualified creatures
@@ -821,7 +945,7 @@ def calculate_fitness(
 
     # 4. Distance traveled bonus (XZ only)
     distance_fitness = state.distance_traveled * config.distance_per_unit
-    distance_fitness = torch.clamp(distance_fitness, 0, config.distance_traveled_max)
+    distance_fitness = torch.clamp(distance_fitness, min=0).clamp(max=config.distance_traveled_max)
 
     # 5. Efficiency penalty
     # Normalize by simulation time and muscle count to get average activation per muscle
@@ -0,0 +1,356 @@
+"""
+Binary columnar frame format.
+
+Replay columns of CreatureFrame (node frames, pellet frames, fitness over
+time, neural activations) are stored as a small versioned container of
+numeric arrays instead of zlib-compressed JSON. Arrays are written straight
+from the simulation tensors (no per-value Python floats) and decoded with
+numpy on read.
+
+Layout (little-endian):
+
+    magic     4s   b"GAFR"
+    version   u8   FRAME_FORMAT_VERSION
+    flags     u8   bit 0: payload is zlib-compressed
+    count     u16  number of arrays
+    count x array directory entry:
+        name_len  u8, name (ascii)
+        dtype     u8   0=float16, 1=float32, 2=int32
+        encoding  u8   0=raw, 1=delta along axis 0
+        ndim      u8, shape u32 * ndim
+    payload   array bytes in directory order (C order)
+
+Delta encoding stores frame-to-frame differences. Deltas are quantized in
+closed loop (each delta is taken against the *decoded* previous frame), so
+float16 error does not accumulate over the replay.
+
+Blobs written before this format (zlib JSON) are still decoded: every
+decode_* function falls back to json.loads(zlib.decompress(blob)).
+"""
+
+import json
+import struct
+import zlib
+from typing import Any
+
+import numpy as np
+
+FRAME_FORMAT_VERSION = 1
+MAGIC = b"GAFR"
+
+FLAG_ZLIB = 0x01
+
+ENCODING_RAW = 0
+ENCODING_DELTA = 1
+
+_DTYPES = {
+    0: np.dtype('<f2'),
+    1: np.dtype('<f4'),
+    2: np.dtype('<i4'),
+}
+_DTYPE_CODES = {dtype: code for code, dtype in _DTYPES.items()}
+_PRECISIONS = {'float16': np.dtype('<f2'), 'float32': np.dtype('<f4')}
+
+_HEADER = struct.Struct('<4sBBH')
+_FLOAT16_MAX = float(np.finfo(np.float16).max)
+
+
+# =============================================================================
+# Container
+# =============================================================================
+
+def is_binary_frames(blob: bytes) -> bool:
+    """Check whether a stored blob uses the binary format (vs legacy zlib JSON)."""
+    return blob[:4] == MAGIC
+
+
+def _finite(values: np.ndarray, dtype: np.dtype) -> np.ndarray:
+    """Replace NaN/Inf with 0 (as the JSON path did) and clamp to the dtype range."""
+    values = np.nan_to_num(np.asarray(values, dtype=np.float32), nan=0.0, posinf=0.0, neginf=0.0)
+    if dtype == _DTYPES[0]:
+        values = np.clip(values, -_FLOAT16_MAX, _FLOAT16_MAX)
+    return values
+
+
+def _delta_encode(values: np.ndarray, dtype: np.dtype) -> np.ndarray:
+    """Closed-loop delta encoding along axis 0 (matches np.cumsum on decode)."""
+    deltas = np.empty(values.shape, dtype=dtype)
+    recon = np.zeros(values.shape[1:], dtype=np.float32)
+    for f in range(values.shape[0]):
+        step = values[f] - recon
+        if dtype == _DTYPES[0]:
+            step = np.clip(step, -_FLOAT16_MAX, _FLOAT16_MAX)
+        deltas[f] = step
+        recon = recon + deltas[f].astype(np.float32)
+    return deltas
+
+
+def encode_arrays(
+    arrays: dict[str, np.ndarray],
+    dtypes: dict[str, str] | None = None,
+    delta: tuple[str, ...] = (),
+    compress: bool = True,
+) -> bytes:
+    """
+    Encode named arrays into a binary frame container.
+
+    Args:
+        arrays: Name -> array (floats or ints)
+        dtypes: Name -> 'float16' | 'float32' | 'int32' (default: float32 for
+                float arrays, int32 for integer arrays)
+        delta: Names of float arrays to delta-encode along axis 0
+        compress: zlib-compress the payload (level 1)
+
+    Returns:
+        Encoded bytes
+    """
+    dtypes = dtypes or {}
+    directory = []
+    chunks = []
+
+    for name, values in arrays.items():
+        values = np.asarray(values)
+        requested = dtypes.get(name)
+        if requested == 'int32' or (requested is None and values.dtype.kind in 'iub'):
+            dtype = _DTYPES[2]
+            encoded = np.ascontiguousarray(values, dtype=dtype)
+            encoding = ENCODING_RAW
+        else:
+            dtype = _PRECISIONS[requested or 'float32']
+            values = _finite(values, dtype)
+            if name in delta and values.ndim > 0 and values.shape[0] > 0:
+                encoded = _delta_encode(values, dtype)
+                encoding = ENCODING_DELTA
+            else:
+                encoded = np.ascontiguousarray(values, dtype=dtype)
+                encoding = ENCODING_RAW
+
+        name_bytes = name.encode('ascii')
+        directory.append(struct.pack(
+            f'<B{len(name_bytes)}sBBB{encoded.ndim}I',
+            len(name_bytes), name_bytes, _DTYPE_CODES[dtype], encoding,
+            encoded.ndim, *encoded.shape,
+        ))
+        chunks.append(encoded.tobytes())
+
+    payload = b''.join(chunks)
+    flags = 0
+    if compress:
+        payload = zlib.compress(payload, 1)
+        flags |= FLAG_ZLIB
+
+    header = _HEADER.pack(MAGIC, FRAME_FORMAT_VERSION, flags, len(arrays))
+    return header + b''.join(directory) + payload
+
+
+def decode_arrays(blob: bytes) -> dict[str, np.ndarray]:
+    """
+    Decode a binary frame container into float32 (or int32) arrays.
+
+    Raises:
+        ValueError: If the blob is not in the binary format or has an unknown version
+    """
+    if not is_binary_frames(blob):
+        raise ValueError("Not a binary frame blob")
+    _, version, flags, count = _HEADER.unpack_from(blob, 0)
+    if version != FRAME_FORMAT_VERSION:
+        raise ValueError(f"Unsupported frame format version: {version}")
+
+    offset = _HEADER.size
+    entries = []
+    for _ in range(count):
+        name_len = blob[offset]
+        name = blob[offset + 1:offset + 1 + name_len].decode('ascii')
+        offset += 1 + name_len
+        dtype_code, encoding, ndim = struct.unpack_from('<BBB', blob, offset)
+        offset += 3
+        shape = struct.unpack_from(f'<{ndim}I', blob, offset)
+        offset += 4 * ndim
+        entries.append((name, _DTYPES[dtype_code], encoding, shape))
+
+    payload = blob[offset:]
+    if flags & FLAG_ZLIB:
+        payload = zlib.decompress(payload)
+
+    arrays = {}
+    position = 0
+    for name, dtype, encoding, shape in entries:
+        size = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+        values = np.frombuffer(
+            payload, dtype=dtype, count=size // dtype.itemsize, offset=position
+        ).reshape(shape)
+        position += size
+
+        if dtype.kind == 'f':
+            values = values.astype(np.float32)
+            if encoding == ENCODING_DELTA:
+                values = np.cumsum(values, axis=0, dtype=np.float32)
+        arrays[name] = values
+    return arrays
+
+
+def _decode_legacy(blob: bytes) -> Any:
+    return json.loads(zlib.decompress(blob))
+
+
+# =============================================================================
+# Column Encoders
+# =============================================================================
+
+def encode_node_frames(
+    positions: np.ndarray,
+    frame_dt: float,
+    precision: str = 'float32',
+    delta: bool = False,
+) -> bytes:
+    """
+    Encode node positions for one creature.
+
+    Args:
+        positions: [F, N, 3] node positions per recorded frame
+        frame_dt: Seconds between recorded frames (frame_interval * dt)
+        precision: 'float16' or 'float32' for positions
+        delta: Delta-encode positions between frames
+
+    Returns:
+        Encoded bytes (decoded by decode_node_frames)
+    """
+    num_frames = positions.shape[0]
+    time = np.arange(num_frames, dtype=np.float32) * np.float32(frame_dt)
+    return encode_arrays(
+        {'time': time, 'positions': positions},
+        dtypes={'positions': precision},
+        delta=('time', 'positions') if delta else ('time',),
+    )
+
+
+def encode_node_frame_rows(
+    rows: list[list[float]], precision: str = 'float32', delta: bool = False
+) -> bytes:
+    """Encode node frames given as JSON rows [time, x1, y1, z1, x2, ...]."""
+    table = np.asarray(rows, dtype=np.float32).reshape(len(rows), -1)
+    positions = table[:, 1:].reshape(len(rows), -1, 3)
+    return encode_arrays(
+        {'time': table[:, 0], 'positions': positions},
+        dtypes={'positions': precision},
+        delta=('time', 'positions') if delta else ('time',),
+    )
+
+
+def encode_fitness_over_time(values: np.ndarray | list[float]) -> bytes:
+    """Encode per-frame fitness (always float32: fitness exceeds float16 precision)."""
+    return encode_arrays({'fitness': np.asarray(values, dtype=np.float32)})
+
+
+def encode_activations(
+    inputs: np.ndarray,
+    hidden: np.ndarray,
+    outputs: np.ndarray,
+    outputs_raw: np.ndarray | None = None,
+    precision: str = 'float32',
+) -> bytes:
+    """
+    Encode per-frame neural activations for one creature.
+
+    Args:
+        inputs: [F, I] network inputs
+        hidden: [F, H] hidden activations
+        outputs: [F, O] muscle outputs
+        outputs_raw: [F, O] pre-dead-zone outputs (pure mode only)
+        precision: 'float16' or 'float32'
+    """
+    arrays = {'inputs': inputs, 'hidden': hidden, 'outputs': outputs}
+    if outputs_raw is not None:
+        arrays['outputs_raw'] = outputs_raw
+    return encode_arrays(arrays, dtypes={name: precision for name in arrays})
+
+
+def encode_activation_dicts(frames: list[dict], precision: str = 'float32') -> bytes:
+    """Encode activations given as JSON dicts [{inputs, hidden, outputs, outputs_raw?}, ...]."""
+    def column(key: str) -> np.ndarray:
+        return np.asarray([f[key] for f in frames], dtype=np.float32).reshape(len(frames), -1)
+
+    outputs_raw = column('outputs_raw') if frames and 'outputs_raw' in frames[0] else None
+    return encode_activations(
+        column('inputs'), column('hidden'), column('outputs'), outputs_raw, precision
+    )
+
+
+def encode_pellet_frames(pellets: list[dict]) -> bytes:
+    """
+    Encode pellet records.
+
+    Records are {position: {x, y, z}, collected_at_frame, spawned_at_frame,
+    initial_distance} dicts.
+
+    collected_at_frame=None is stored as -1.
+    """
+    positions = np.asarray(
+        [[p['position']['x'], p['position']['y'], p['position']['z']] for p in pellets],
+        dtype=np.float32,
+    ).reshape(len(pellets), 3)
+    collected = np.asarray(
+        [-1 if p.get('collected_at_frame') is None else p['collected_at_frame'] for p in pellets],
+        dtype=np.int32,
+    )
+    spawned = np.asarray([p.get('spawned_at_frame', 0) for p in pellets], dtype=np.int32)
+    distances = np.asarray([p.get('initial_distance', 5.0) for p in pellets], dtype=np.float32)
+    return encode_arrays({
+        'position': positions,
+        'collected_at_frame': collected,
+        'spawned_at_frame': spawned,
+        'initial_distance': distances,
+    })
+
+
+# =============================================================================
+# Column Decoders (binary or legacy zlib JSON)
+# =============================================================================
+
+def decode_node_frames(blob: bytes) -> list[list[float]]:
+    """Decode node frames to JSON rows [time, x1, y1, z1, x2, ...]."""
+    if not is_binary_frames(blob):
+        return _decode_legacy(blob)
+    arrays = decode_arrays(blob)
+    positions = arrays['positions']
+    flat_positions = positions.reshape(positions.shape[0], -1)
+    table = np.concatenate([arrays['time'][:, None], flat_positions], axis=1)
+    return table.tolist()
+
+
+def decode_fitness_over_time(blob: bytes) -> list[float]:
+    """Decode per-frame fitness to a list of floats."""
+    if not is_binary_frames(blob):
+        return _decode_legacy(blob)
+    return decode_arrays(blob)['fitness'].tolist()
+
+
+def decode_activations(blob: bytes) -> list[dict]:
+    """Decode activations to [{inputs, hidden, outputs, outputs_raw?}, ...]."""
+    if not is_binary_frames(blob):
+        return _decode_legacy(blob)
+    arrays = decode_arrays(blob)
+    keys = [k for k in ('inputs', 'hidden', 'outputs', 'outputs_raw') if k in arrays]
+    columns = [arrays[k].tolist() for k in keys]
+    return [dict(zip(keys, frame)) for frame in zip(*columns)]
+
+
+def decode_pellet_frames(blob: bytes) -> list[dict]:
+    """Decode pellet records (see encode_pellet_frames)."""
+    if not is_binary_frames(blob):
+        return _decode_legacy(blob)
+    arrays = decode_arrays(blob)
+    return [
+        {
+            'position': {'x': pos[0], 'y': pos[1], 'z': pos[2]},
+            'collected_at_frame': None if collected < 0 else collected,
+            'spawned_at_frame': spawned,
+            'initial_distance': distance,
+        }
+        for pos, collected, spawned, distance in zip(
+            arrays['position'].tolist(),
+            arrays['collected_at_frame'].tolist(),
+            arrays['spawned_at_frame'].tolist(),
+            arrays['initial_distance'].tolist(),
+        )
+    ]
@@ -12,11 +12,18 @@ Includes v1/v2 muscle modulation:
 All operations are vectorized using PyTorch tensors for CPU/GPU efficiency.
 """
 
+import dataclasses
 import torch
 import math
+from typing import TYPE_CHECKING
 
+from app.core.profiling import span
 from app.simulation.tensors import CreatureBatch, get_center_of_mass, MAX_NODES, MAX_MUSCLES
 
+if TYPE_CHECKING:
+    from app.simulation.early_termination import EarlyTermination
+    from app.simulation.fitness import FitnessConfig
+
 
 # =============================================================================
 # Physics Constants (matching TypeScript Cannon-ES defaults)
@@ -508,6 +515,7 @@ def apply_ground_collision(
     ground_y: float = GROUND_Y,
     restitution: float = GROUND_RESTITUTION,
     dt: float = TIME_STEP,
+    sync_free: bool = False,
 ) -> None:
     """
     Apply ground collision response (in-place).
@@ -518,6 +526,8 @@ def apply_ground_collision(
         batch: CreatureBatch (modified in place)
         ground_y: Y position of ground plane
         restitution: Bounce coefficient (0 = no bounce, 1 = perfect bounce)
+        sync_free: Skip the early-exit check (which forces a host/device sync)
+                   and always apply the masked updates. Results are identical.
     """
     if batch.batch_size == 0:
         return
@@ -538,7 +548,7 @@ def apply_ground_collision(
     # Also check node_mask (don't process padding nodes)
     below_ground = below_ground & (batch.node_mask > 0.5)
 
-    if not below_ground.any():
+    if not sync_free and not below_ground.any():
         return
 
     # Clamp positions to be above ground
@@ -1004,61 +1014,65 @@ def simulate_with_fitness(
 
     for step in range(num_steps):
         # Physics step with modulation (uses current pellet positions for direction)
-        current_com = physics_step_modulated(
-            batch, base_rest_lengths, pellets.positions, previous_com, time, dt, gravity
-        )
+        with span("simulate.physics_step"):
+            current_com = physics_step_modulated(
+                batch, base_rest_lengths, pellets.positions, previous_com, time, dt, gravity
+            )
 
         # Update fitness state (distance traveled, closest edge distance)
         update_fitness_state(batch, fitness_state, pellets, fitness_config)
 
         # Check for pellet collisions and spawn new pellets
-        newly_collected = check_pellet_collisions(batch, pellets)
-
-        if newly_collected.any():
-            # Mark collection frame for current pellets (GPU tensor ops)
-            current_pellet_idx = pellet_count - 1  # [B]
-            # For creatures that collected, update their current pellet's collection frame
-            batch_indices = torch.arange(B, device=device)
-            pellet_collect_frames[batch_indices, current_pellet_idx] = torch.where(
-                newly_collected, torch.tensor(frame_index, device=device),
-                pellet_collect_frames[batch_indices, current_pellet_idx]
-            )
+        with span("simulate.pellets"):
+            newly_collected = check_pellet_collisions(batch, pellets)
+
+            if newly_collected.any():
+                # Mark collection frame for current pellets (GPU tensor ops)
+                current_pellet_idx = pellet_count - 1  # [B]
+                # For creatures that collected, update their current pellet's collection frame
+                batch_indices = torch.arange(B, device=device)
+                pellet_collect_frames[batch_indices, current_pellet_idx] = torch.where(
+                    newly_collected, torch.tensor(frame_index, device=device),
+                    pellet_collect_frames[batch_indices, current_pellet_idx]
+                )
 
-            # Update pellets (spawns new ones for collectors)
-            # Pass stable creature radii for consistent distance calculations
-            update_pellets(batch, pellets, arena_size, stable_radii=fitness_state.creature_radii)
+                # Update pellets (spawns new ones for collectors)
+                # Pass stable creature radii for consistent distance calculations
+                update_pellets(
+                    batch, pellets, arena_size, stable_radii=fitness_state.creature_radii
+                )
 
-            # Record new pellet data for creatures that collected (GPU tensor ops)
-            new_pellet_idx = pellet_count  # [B] - next slot
-            # Clamp to max_pellets - 1 to avoid overflow
-            new_pellet_idx = torch.clamp(new_pellet_idx, max=max_pellets - 1)
+                # Record new pellet data for creatures that collected (GPU tensor ops)
+                new_pellet_idx = pellet_count  # [B] - next slot
+                # Clamp to max_pellets - 1 to avoid overflow
+                new_pellet_idx = torch.clamp(new_pellet_idx, max=max_pellets - 1)
 
-            # Store new pellet data only for creatures that collected
-            pellet_positions[batch_indices, new_pellet_idx] = torch.where(
-                newly_collected.unsqueeze(-1),
-                pellets.positions,
-                pellet_positions[batch_indices, new_pellet_idx]
-            )
-            pellet_distances[batch_indices, new_pellet_idx] = torch.where(
-                newly_collected,
-                pellets.initial_distances,
-                pellet_distances[batch_indices, new_pellet_idx]
-            )
-            pellet_spawn_frames[batch_indices, new_pellet_idx] = torch.where(
-                newly_collected,
-                torch.tensor(frame_index, device=device),
-                pellet_spawn_frames[batch_indices, new_pellet_idx]
-            )
+                # Store new pellet data only for creatures that collected
+                pellet_positions[batch_indices, new_pellet_idx] = torch.where(
+                    newly_collected.unsqueeze(-1),
+                    pellets.positions,
+                    pellet_positions[batch_indices, new_pellet_idx]
+                )
+                pellet_distances[batch_indices, new_pellet_idx] = torch.where(
+                    newly_collected,
+                    pellets.initial_distances,
+                    pellet_distances[batch_indices, new_pellet_idx]
+                )
+                pellet_spawn_frames[batch_indices, new_pellet_idx] = torch.where(
+                    newly_collected,
+                    torch.tensor(frame_index, device=device),
+                    pellet_spawn_frames[batch_indices, new_pellet_idx]
+                )
 
-            # Increment pellet count for collectors
-            pellet_count = pellet_count + newly_collected.long()
+                # Increment pellet count for collectors
+                pellet_count = pellet_count + newly_collected.long()
 
-            # Reset closest_edge_distance for creatures that collected
-            fitness_state.closest_edge_distance = torch.where(
-                newly_collected,
-                pellets.initial_distances,
-                fitness_state.closest_edge_distance
-            )
+                # Reset closest_edge_distance for creatures that collected
+                fitness_state.closest_edge_distance = torch.where(
+                    newly_collected,
+                    pellets.initial_distances,
+                    fitness_state.closest_edge_distance
+                )
 
         # Update previous COM for next step
         previous_com = current_com
@@ -1214,11 +1228,23 @@ def apply_extension_limit(
     return torch.clamp(rest_lengths, min=min_length, max=max_length)
 
 
+def per_creature(value: float | torch.Tensor, like: torch.Tensor) -> float | torch.Tensor:
+    """
+    Broadcast a scalar-or-[B] parameter against a [B, ...] tensor.
+
+    Packed batches (several configs in one simulation) pass per-creature [B]
+    tensors where single-config batches pass floats; floats are returned as is.
+    """
+    if isinstance(value, torch.Tensor):
+        return value.view(-1, *([1] * (like.dim() - 1)))
+    return value
+
+
 @torch.no_grad()
 def apply_velocity_cap(
     new_rest_lengths: torch.Tensor,
     prev_rest_lengths: torch.Tensor,
-    velocity_cap: float,
+    velocity_cap: float | torch.Tensor,
     dt: float,
 ) -> torch.Tensor:
     """
@@ -1227,15 +1253,19 @@ def apply_velocity_cap(
     Args:
         new_rest_lengths: [B, M] desired rest lengths from neural network
         prev_rest_lengths: [B, M] rest lengths from previous timestep
-        velocity_cap: Maximum length change per second (e.g., 5.0 units/sec)
+        velocity_cap: Maximum length change per second (e.g., 5.0 units/sec), or [B] per creature
         dt: Time step in seconds
 
     Returns:
         [B, M] clamped rest lengths
     """
-    max_delta = velocity_cap * dt
     delta = new_rest_lengths - prev_rest_lengths
-    clamped_delta = torch.clamp(delta, -max_delta, max_delta)
+    if isinstance(velocity_cap, torch.Tensor):
+        max_delta = per_creature(velocity_cap * dt, delta)
+        clamped_delta = torch.maximum(torch.minimum(delta, max_delta), -max_delta)
+    else:
+        max_delta = velocity_cap * dt
+        clamped_delta = torch.clamp(delta, -max_delta, max_delta)
     return prev_rest_lengths + clamped_delta
 
 
@@ -1243,7 +1273,7 @@ def apply_velocity_cap(
 def apply_output_smoothing(
     raw_outputs: torch.Tensor,
     smoothed_outputs: torch.Tensor,
-    alpha: float,
+    alpha: float | torch.Tensor,
 ) -> torch.Tensor:
     """
     Apply exponential smoothing to neural network outputs.
@@ -1261,10 +1291,12 @@ def apply_output_smoothing(
             - 0.3 = moderate smoothing (recommended)
             - 0.5 = light smoothing
             - 1.0 = no smoothing (instant, original behavior)
+            or a [B] tensor (one factor per creature)
 
     Returns:
         [B, M] smoothed outputs
     """
+    alpha = per_creature(alpha, raw_outputs)
     return alpha * raw_outputs + (1 - alpha) * smoothed_outputs
 
 
@@ -1278,8 +1310,9 @@ def physics_step_neural(
     dt: float = TIME_STEP,
     gravity: float = GRAVITY,
     prev_rest_lengths: torch.Tensor | None = None,
-    velocity_cap: float | None = None,
+    velocity_cap: float | torch.Tensor | None = None,
     max_extension_ratio: float | None = None,
+    sync_free: bool = False,
 ) -> tuple[torch.Tensor, torch.Tensor]:
     """
     Perform a physics step with neural network control.
@@ -1293,8 +1326,9 @@ def physics_step_neural(
         dt: Time step
         gravity: Gravity acceleration
         prev_rest_lengths: [B, M] rest lengths from previous step (for velocity capping)
-        velocity_cap: Max muscle length change per second (None = no limit)
+        velocity_cap: Max muscle length change per second, float or [B] tensor (None = no limit)
         max_extension_ratio: Max muscle stretch ratio (None = no limit)
+        sync_free: Use masked ground collision without host/device syncs
 
     Returns:
         Tuple of:
@@ -1334,7 +1368,7 @@ def physics_step_neural(
     integrate_euler(batch, forces, dt)
 
     # Ground collision
-    apply_ground_collision(batch, dt=dt)
+    apply_ground_collision(batch, dt=dt, sync_free=sync_free)
 
     # Compute muscle activation for efficiency penalty
     # Sum of absolute NN outputs for valid muscles
@@ -1450,6 +1484,21 @@ def simulate_with_neural(
     return result
 
 
+def _select_param_rows(value, rows: torch.Tensor):
+    """Index a float-or-[B]-tensor simulation parameter by creature rows."""
+    return value[rows] if isinstance(value, torch.Tensor) else value
+
+
+def _select_config_rows(fitness_config: "FitnessConfig", rows: torch.Tensor) -> "FitnessConfig":
+    """FitnessConfig for the creatures at `rows` (per-creature [B] weights are indexed)."""
+    updates = {
+        field.name: getattr(fitness_config, field.name)[rows]
+        for field in dataclasses.fields(fitness_config)
+        if isinstance(getattr(fitness_config, field.name), torch.Tensor)
+    }
+    return dataclasses.replace(fitness_config, **updates) if updates else fitness_config
+
+
 @torch.no_grad()
 def simulate_with_fitness_neural(
     batch: CreatureBatch,
@@ -1459,7 +1508,7 @@ def simulate_with_fitness_neural(
     num_steps: int,
     fitness_config: "FitnessConfig",
     mode: str = 'hybrid',
-    dead_zone: float = 0.1,
+    dead_zone: float | torch.Tensor = 0.1,
     dt: float = TIME_STEP,
     gravity: float = GRAVITY,
     record_frames: bool = False,
@@ -1470,9 +1519,12 @@ def simulate_with_fitness_neural(
     max_time: float = 20.0,
     use_proprioception: bool = False,
     proprioception_inputs: str = 'all',
-    velocity_cap: float | None = None,
-    output_smoothing_alpha: float = 0.15,
+    velocity_cap: float | torch.Tensor | None = None,
+    output_smoothing_alpha: float | torch.Tensor = 0.15,
     max_extension_ratio: float | None = None,
+    sync_free: bool = False,
+    physics_step_fn=None,  # Callable with physics_step_neural's signature
+    early_termination: "EarlyTermination | None" = None,
 ) -> dict:
     """
     Run neural simulation with proper pellet collection tracking.
@@ -1493,19 +1545,32 @@ def simulate_with_fitness_neural(
         pellets: PelletBatch to update during simulation
         fitness_state: FitnessState to update during simulation
         num_steps: Number of physics steps to run
-        fitness_config: FitnessConfig with parameters
+        fitness_config: FitnessConfig with parameters (weights may be [B] tensors)
         mode: 'pure' or 'hybrid' neural control mode
-        dead_zone: Dead zone threshold for pure mode
+        dead_zone: Dead zone threshold for pure mode, float or [B] tensor
         dt: Time step per step
         gravity: Gravity acceleration
-        record_frames: Whether to record position frames
+        record_frames: Whether to record position frames (into preallocated [B, F, ...] buffers)
         frame_interval: Record every N frames (if recording)
         arena_size: Arena size for pellet spawning bounds
         neural_update_hz: NN update frequency in Hz (replaces hardcoded interval)
         time_encoding: Time encoding for hybrid mode ('cyclic', 'sin', 'raw')
         max_time: Maximum simulation time for 'raw' encoding normalization
-        velocity_cap: Max muscle length change per second (None = no limit)
-        output_smoothing_alpha: Exponential smoothing factor (1.0 = no smoothing)
+        velocity_cap: Max muscle length change per second, float or [B] tensor (None = no limit)
+        output_smoothing_alpha: Exponential smoothing factor (1.0 = no smoothing),
+            float or [B] tensor
+        sync_free: Run the step loop without host/device syncs. Ground collision,
+                   disqualification freezing and pellet bookkeeping become masked
+                   tensor ops applied every step, frame_index lives on the device,
+                   and pellet event buffers are written unconditionally. Physics is
+                   identical to the default loop; pellet respawn randomness is drawn
+                   every step, so respawn positions differ for a given global seed.
+        physics_step_fn: Replacement for physics_step_neural, e.g. a
+                         CompiledNeuralStep (None = eager physics_step_neural)
+        early_termination: Stop hopeless creatures early and compact the batch
+                           (see app.simulation.early_termination). batch, pellets
+                           and fitness_state still end up covering every creature.
+                           Ignored when recording frames, which need the full run.
 
     Returns:
         Dict with:
@@ -1516,6 +1581,8 @@ def simulate_with_fitness_neural(
             - 'total_collected': [B] pellets collected per creature
             - 'pellet_history': list of dicts per creature with pellet events
             - 'fitness_per_frame': [B, F] fitness at each recorded frame
+            - 'terminated_at_step': [B] step each creature was stopped at, -1 if it
+              ran to the end (only with early_termination)
     """
     # Import here to avoid circular import
     from app.simulation.fitness import (
@@ -1523,7 +1590,10 @@ def simulate_with_fitness_neural(
         update_pellets,
         update_fitness_state,
         calculate_fitness,
+        freeze_disqualified_creatures,
     )
+    from app.simulation.early_termination import TerminationTracker
+    from app.simulation.tensors import scatter_rows, select_rows
     from app.neural.sensors import gather_sensor_inputs, gather_proprioception_inputs
 
     B = batch.batch_size
@@ -1539,6 +1609,21 @@ def simulate_with_fitness_neural(
             'fitness_per_frame': [],
         }
 
+    # Early termination works on copies of the caller's batch, pellets and
+    # fitness state; stopped creatures are written back when they stop, the
+    # rest after the last step. rows maps working rows to caller rows.
+    tracker = None
+    if early_termination is not None and not record_frames:
+        tracker = TerminationTracker(early_termination, get_center_of_mass(batch))
+        full_batch, full_pellets, full_state = batch, pellets, fitness_state
+        rows = torch.arange(B, device=device)
+        batch = select_rows(batch, rows)
+        pellets = select_rows(pellets, rows)
+        fitness_state = select_rows(fitness_state, rows)
+        stopped = torch.zeros(B, dtype=torch.bool, device=device)
+        any_stopped = False
+        terminated_at_step = torch.full((B,), -1, dtype=torch.long, device=device)
+
     # Store base rest lengths
     base_rest_lengths = batch.spring_rest_length.clone()
 
@@ -1569,11 +1654,45 @@ def simulate_with_fitness_neural(
 
     # Accumulators
     total_activation = torch.zeros(B, device=device)
-    frames = []
-    fitness_per_frame = []
-    activations_per_frame = []  # Store nn_outputs per frame for visualization
+
+    def per_creature_outputs() -> list[torch.Tensor]:
+        """Loop tensors returned per creature (written back under early termination)."""
+        return [
+            total_activation, pellet_positions, pellet_distances,
+            pellet_spawn_frames, pellet_collect_frames, pellet_count,
+        ]
+
+    if tracker is not None:
+        final_outputs = [t.clone() for t in per_creature_outputs()]
+
+        def write_back(local_rows: torch.Tensor) -> None:
+            """Copy the state of working rows `local_rows` into the caller's rows."""
+            nonlocal final_outputs
+            caller_rows = rows[local_rows]
+            scatter_rows(full_batch, select_rows(batch, local_rows), caller_rows)
+            scatter_rows(full_pellets, select_rows(pellets, local_rows), caller_rows)
+            scatter_rows(full_state, select_rows(fitness_state, local_rows), caller_rows)
+            final_outputs = [
+                final.index_copy(0, caller_rows, current[local_rows])
+                for final, current in zip(final_outputs, per_creature_outputs())
+            ]
+    # Recording buffers: one slot per recorded step, preallocated and written
+    # in place (activation buffers are sized at the first recorded frame)
+    num_frames = (num_steps + frame_interval - 1) // frame_interval if record_frames else 0
+    frames = torch.empty(B, num_frames, MAX_NODES, 3, device=device)
+    fitness_per_frame = torch.empty(B, num_frames, device=device)
+    activations_per_frame: dict[str, torch.Tensor] = {}
+    recorded = 0
     time = 0.0
-    frame_index = 0
+    # In sync-free mode frame_index stays on the device so the pellet buffer
+    # writes below never need a host-to-device copy
+    if sync_free:
+        frame_index = torch.zeros((), dtype=torch.long, device=device)
+    else:
+        frame_index = 0
+    batch_indices = torch.arange(B, device=device)
+
+    step_fn = physics_step_fn if physics_step_fn is not None else physics_step_neural
 
     # Calculate nn_update_interval from neural_update_hz and dt
     # physics_fps = 1/dt, nn_update_interval = physics_fps / neural_update_hz
@@ -1590,56 +1709,58 @@ def simulate_with_fitness_neural(
     for step in range(num_steps):
         # 1. Update NN outputs only every nn_update_interval steps (reduces jitter)
         if step % nn_update_interval == 0 or nn_outputs is None:
-            # Gather base sensor inputs (uses current pellet positions)
-            # Use last_nn_com for velocity calculation - captures movement since last NN update
-            sensor_inputs = gather_sensor_inputs(
-                batch, pellets.positions, last_nn_com, time, mode=mode,
-                time_encoding=time_encoding, max_time=max_time
-            )
-
-            # Update last_nn_com AFTER gathering inputs (for next NN update)
-            last_nn_com = get_center_of_mass(batch)
-
-            # Add proprioception inputs if enabled
-            if use_proprioception:
-                prop_inputs = gather_proprioception_inputs(
-                    batch, base_rest_lengths, proprioception_inputs
+            with span("simulate.nn_tick"):
+                # Gather base sensor inputs (uses current pellet positions)
+                # Use last_nn_com for velocity calculation - captures movement since last NN update
+                sensor_inputs = gather_sensor_inputs(
+                    batch, pellets.positions, last_nn_com, time, mode=mode,
+                    time_encoding=time_encoding, max_time=max_time
                 )
-                sensor_inputs = torch.cat([sensor_inputs, prop_inputs], dim=1)
-
-            # Forward pass through NN - get full activations for visualization
-            # Dead zone applies to pure and neat modes (direct NN control)
-            # Hybrid mode doesn't use dead zone (NN modulates base oscillation)
-            if mode in ('pure', 'neat'):
-                current_full_activations = neural_network.forward_full_with_dead_zone(sensor_inputs, dead_zone)
-                raw_outputs = current_full_activations['outputs']
-            else:
-                current_full_activations = neural_network.forward_full(sensor_inputs)
-                raw_outputs = current_full_activations['outputs']
-
-            # Apply exponential smoothing to outputs
-            if smoothed_outputs is None:
-                # First update: initialize smoothed outputs
-                smoothed_outputs = raw_outputs.clone()
-            else:
-                # Apply smoothing: smoothed = alpha * new + (1 - alpha) * smoothed
-                smoothed_outputs = apply_output_smoothing(
-                    raw_outputs, smoothed_outputs, output_smoothing_alpha
-                )
-
-            # Use smoothed outputs for physics
-            nn_outputs = smoothed_outputs
 
-            # Update activations with smoothed outputs for visualization
-            # (so stored activations match what physics actually uses)
-            current_full_activations['outputs'] = smoothed_outputs.clone()
+                # Update last_nn_com AFTER gathering inputs (for next NN update)
+                last_nn_com = get_center_of_mass(batch)
+
+                # Add proprioception inputs if enabled
+                if use_proprioception:
+                    prop_inputs = gather_proprioception_inputs(
+                        batch, base_rest_lengths, proprioception_inputs
+                    )
+                    sensor_inputs = torch.cat([sensor_inputs, prop_inputs], dim=1)
+
+                # Forward pass through NN - get full activations for visualization
+                # Dead zone applies to pure and neat modes (direct NN control)
+                # Hybrid mode doesn't use dead zone (NN modulates base oscillation)
+                if mode in ('pure', 'neat'):
+                    current_full_activations = neural_network.forward_full_with_dead_zone(sensor_inputs, dead_zone)
+                    raw_outputs = current_full_activations['outputs']
+                else:
+                    current_full_activations = neural_network.forward_full(sensor_inputs)
+                    raw_outputs = current_full_activations['outputs']
+
+                # Apply exponential smoothing to outputs
+                if smoothed_outputs is None:
+                    # First update: initialize smoothed outputs
+                    smoothed_outputs = raw_outputs.clone()
+                else:
+                    # Apply smoothing: smoothed = alpha * new + (1 - alpha) * smoothed
+                    smoothed_outputs = apply_output_smoothing(
+                        raw_outputs, smoothed_outputs, output_smoothing_alpha
+                    )
+
+                # Use smoothed outputs for physics
+                nn_outputs = smoothed_outputs
+
+                # Update activations with smoothed outputs for visualization
+                # (so stored activations match what physics actually uses)
+                current_full_activations['outputs'] = smoothed_outputs.clone()
 
         # 2. Physics step with neural control (uses cached/smoothed nn_outputs)
-        current_com, step_activation = physics_step_neural(
-            batch, base_rest_lengths, nn_outputs, time, mode, dt, gravity,
-            prev_rest_lengths=prev_rest_lengths, velocity_cap=velocity_cap,
-            max_extension_ratio=max_extension_ratio
-        )
+        with span("simulate.physics_step"):
+            current_com, step_activation = step_fn(
+                batch, base_rest_lengths, nn_outputs, time, mode, dt, gravity,
+                prev_rest_lengths=prev_rest_lengths, velocity_cap=velocity_cap,
+                max_extension_ratio=max_extension_ratio, sync_free=sync_free
+            )
 
         # Update prev_rest_lengths for next step's velocity capping
         prev_rest_lengths = batch.spring_rest_length.clone()
@@ -1648,55 +1769,69 @@ def simulate_with_fitness_neural(
         total_activation += step_activation
 
         # 4. Update fitness state (distance traveled, closest edge distance)
-        update_fitness_state(batch, fitness_state, pellets, fitness_config)
+        update_fitness_state(batch, fitness_state, pellets, fitness_config, sync_free=sync_free)
 
         # 5. Also track total activation in fitness state
         fitness_state.total_activation += step_activation
 
+        # Stopped creatures stay frozen until the batch is compacted (their
+        # state was written back when they stopped)
+        if tracker is not None and any_stopped:
+            freeze_disqualified_creatures(batch, stopped, sync_free=True)
+
         # 6. Check for pellet collisions and spawn new pellets
-        newly_collected = check_pellet_collisions(batch, pellets)
-
-        if newly_collected.any():
-            # Mark collection frame for current pellets (GPU tensor ops)
-            current_pellet_idx = pellet_count - 1  # [B]
-            batch_indices = torch.arange(B, device=device)
-            pellet_collect_frames[batch_indices, current_pellet_idx] = torch.where(
-                newly_collected, torch.tensor(frame_index, device=device),
-                pellet_collect_frames[batch_indices, current_pellet_idx]
-            )
+        with span("simulate.pellets"):
+            newly_collected = check_pellet_collisions(batch, pellets)
+
+            # Sync-free mode skips the .any() gate: every write below is a masked
+            # no-op for creatures that did not collect
+            if sync_free or newly_collected.any():
+                frame_tensor = (
+                    frame_index if sync_free else torch.tensor(frame_index, device=device)
+                )
 
-            # Update pellets (spawns new ones for collectors)
-            # Pass stable creature radii for consistent distance calculations
-            update_pellets(batch, pellets, arena_size, stable_radii=fitness_state.creature_radii)
+                # Mark collection frame for current pellets (GPU tensor ops)
+                current_pellet_idx = pellet_count - 1  # [B]
+                pellet_collect_frames[batch_indices, current_pellet_idx] = torch.where(
+                    newly_collected, frame_tensor,
+                    pellet_collect_frames[batch_indices, current_pellet_idx]
+                )
 
-            # Record new pellet data for creatures that collected (GPU tensor ops)
-            new_pellet_idx = torch.clamp(pellet_count, max=max_pellets - 1)
+                # Update pellets (spawns new ones for collectors)
+                # Pass stable creature radii for consistent distance calculations
+                update_pellets(
+                    batch, pellets, arena_size,
+                    stable_radii=fitness_state.creature_radii, sync_free=sync_free
+                )
 
-            pellet_positions[batch_indices, new_pellet_idx] = torch.where(
-                newly_collected.unsqueeze(-1),
-                pellets.positions,
-                pellet_positions[batch_indices, new_pellet_idx]
-            )
-            pellet_distances[batch_indices, new_pellet_idx] = torch.where(
-                newly_collected,
-                pellets.initial_distances,
-                pellet_distances[batch_indices, new_pellet_idx]
-            )
-            pellet_spawn_frames[batch_indices, new_pellet_idx] = torch.where(
-                newly_collected,
-                torch.tensor(frame_index, device=device),
-                pellet_spawn_frames[batch_indices, new_pellet_idx]
-            )
+                # Record new pellet data for creatures that collected (GPU tensor ops)
+                new_pellet_idx = torch.clamp(pellet_count, max=max_pellets - 1)
 
-            # Increment pellet count for collectors
-            pellet_count = pellet_count + newly_collected.long()
+                pellet_positions[batch_indices, new_pellet_idx] = torch.where(
+                    newly_collected.unsqueeze(-1),
+                    pellets.positions,
+                    pellet_positions[batch_indices, new_pellet_idx]
+                )
+                pellet_distances[batch_indices, new_pellet_idx] = torch.where(
+                    newly_collected,
+                    pellets.initial_distances,
+                    pellet_distances[batch_indices, new_pellet_idx]
+                )
+                pellet_spawn_frames[batch_indices, new_pellet_idx] = torch.where(
+                    newly_collected,
+                    frame_tensor,
+                    pellet_spawn_frames[batch_indices, new_pellet_idx]
+                )
 
-            # Reset closest_edge_distance for creatures that collected
-            fitness_state.closest_edge_distance = torch.where(
-                newly_collected,
-                pellets.initial_distances,
-                fitness_state.closest_edge_distance
-            )
+                # Increment pellet count for collectors
+                pellet_count = pellet_count + newly_collected.long()
+
+                # Reset closest_edge_distance for creatures that collected
+                fitness_state.closest_edge_distance = torch.where(
+                    newly_collected,
+                    pellets.initial_distances,
+                    fitness_state.closest_edge_distance
+                )
 
         # Update previous COM
         previous_com = current_com
@@ -1704,30 +1839,86 @@ def simulate_with_fitness_neural(
 
         # Record frame if needed
         if record_frames and (step % frame_interval == 0):
-            frames.append(batch.positions.clone())
+            frames[:, recorded] = batch.positions
 
             # Calculate and record fitness at this frame
-            current_fitness = calculate_fitness(
+            fitness_per_frame[:, recorded] = calculate_fitness(
                 batch, pellets, fitness_state, time, fitness_config
             )
-            fitness_per_frame.append(current_fitness.clone())
 
-            # Record full neural network activations for this frame
-            # Store as dict: {inputs, hidden, outputs, outputs_raw} per creature
-            # outputs_raw = pre-dead-zone values for visualization
+            # Record full neural network activations for this frame:
+            # inputs, hidden, outputs and outputs_raw (pre-dead-zone values,
+            # pure mode only) for visualization
             if current_full_activations is not None:
-                frame_activations = {
-                    'inputs': current_full_activations['inputs'].clone(),
-                    'hidden': current_full_activations['hidden'].clone(),
-                    'outputs': current_full_activations['outputs'].clone(),
-                }
-                # Include raw outputs if available (pure mode only)
-                if 'outputs_raw' in current_full_activations:
-                    frame_activations['outputs_raw'] = current_full_activations['outputs_raw'].clone()
-                activations_per_frame.append(frame_activations)
-
+                for key in ('inputs', 'hidden', 'outputs', 'outputs_raw'):
+                    values = current_full_activations.get(key)
+                    if values is None:
+                        continue
+                    if key not in activations_per_frame:
+                        activations_per_frame[key] = torch.empty(
+                            B, num_frames, *values.shape[1:],
+                            dtype=values.dtype, device=values.device,
+                        )
+                    activations_per_frame[key][:, recorded] = values
+
+            recorded += 1
             frame_index += 1
 
+        # 7. Early termination: stop hopeless creatures, then compact the batch
+        # once enough rows are frozen (host syncs only at check steps)
+        at_check = tracker is not None and (step + 1) % early_termination.check_interval == 0
+        if at_check and step + 1 < num_steps:
+            fitness_now = None
+            if tracker.bound_active(step + 1):
+                fitness_now = calculate_fitness(batch, pellets, fitness_state, time, fitness_config)
+            checked = tracker.check(batch, fitness_state.disqualified, fitness_now, step + 1)
+            newly_stopped = checked & ~stopped
+            newly_stopped_rows = newly_stopped.nonzero().squeeze(1)
+            if len(newly_stopped_rows) > 0:
+                write_back(newly_stopped_rows)
+                terminated_at_step[rows[newly_stopped_rows]] = step + 1
+                stopped = stopped | newly_stopped
+
+            n_stopped = int(stopped.sum())
+            if n_stopped == batch.batch_size:
+                break
+            if n_stopped > 0 and n_stopped >= early_termination.compact_fraction * batch.batch_size:
+                keep = (~stopped).nonzero().squeeze(1)
+                rows = rows[keep]
+                batch = select_rows(batch, keep)
+                pellets = select_rows(pellets, keep)
+                fitness_state = select_rows(fitness_state, keep)
+                neural_network = neural_network.subset(keep)
+                tracker.select(keep)
+                fitness_config = _select_config_rows(fitness_config, keep)
+                dead_zone = _select_param_rows(dead_zone, keep)
+                velocity_cap = _select_param_rows(velocity_cap, keep)
+                output_smoothing_alpha = _select_param_rows(output_smoothing_alpha, keep)
+                base_rest_lengths = base_rest_lengths[keep]
+                prev_rest_lengths = prev_rest_lengths[keep]
+                last_nn_com = last_nn_com[keep]
+                previous_com = previous_com[keep]
+                nn_outputs = nn_outputs[keep]
+                smoothed_outputs = smoothed_outputs[keep]
+                current_full_activations = None
+                (
+                    total_activation, pellet_positions, pellet_distances,
+                    pellet_spawn_frames, pellet_collect_frames, pellet_count,
+                ) = [t[keep] for t in per_creature_outputs()]
+                batch_indices = torch.arange(batch.batch_size, device=device)
+                stopped = torch.zeros(batch.batch_size, dtype=torch.bool, device=device)
+                n_stopped = 0
+            any_stopped = n_stopped > 0
+
+    if tracker is not None:
+        # Creatures still running reached the end
+        write_back((~stopped).nonzero().squeeze(1))
+        batch, pellets, fitness_state = full_batch, full_pellets, full_state
+        (
+            total_activation, pellet_positions, pellet_distances,
+            pellet_spawn_frames, pellet_collect_frames, pellet_count,
+        ) = final_outputs
+
     # Convert pellet tensors to history (single CPU transfer at end)
     pellet_positions_cpu = pellet_positions.cpu().tolist()
     pellet_distances_cpu = pellet_distances.cpu().tolist()
@@ -1756,24 +1947,14 @@ def simulate_with_fitness_neural(
         'total_collected': pellets.total_collected.clone(),
         'pellet_history': pellet_history,
     }
+    if tracker is not None:
+        result['terminated_at_step'] = terminated_at_step
 
-    if record_frames and frames:
-        result['frames'] = torch.stack(frames, dim=1)  # [B, F, N, 3]
-        if fitness_per_frame:
-            result['fitness_per_frame'] = torch.stack(fitness_per_frame, dim=1)  # [B, F]
+    if record_frames and recorded > 0:
+        result['frames'] = frames  # [B, F, N, 3]
+        result['fitness_per_frame'] = fitness_per_frame  # [B, F]
         if activations_per_frame:
-            # Stack full activations: each item is {inputs, hidden, outputs, outputs_raw} with [B, ...] tensors
-            # Result: {inputs: [B, F, I], hidden: [B, F, H], outputs: [B, F, O], outputs_raw: [B, F, O]}
-            stacked_activations = {
-                'inputs': torch.stack([a['inputs'] for a in activations_per_frame], dim=1),
-                'hidden': torch.stack([a['hidden'] for a in activations_per_frame], dim=1),
-                'outputs': torch.stack([a['outputs'] for a in activations_per_frame], dim=1),
-            }
-            # Include raw outputs if available (pure mode only)
-            if 'outputs_raw' in activations_per_frame[0]:
-                stacked_activations['outputs_raw'] = torch.stack(
-                    [a['outputs_raw'] for a in activations_per_frame], dim=1
-                )
-            result['activations_per_frame'] = stacked_activations
+            # {inputs: [B, F, I], hidden: [B, F, H], outputs: [B, F, O], outputs_raw: [B, F, O]}
+            result['activations_per_frame'] = activations_per_frame
 
     return result
@@ -8,15 +8,27 @@ with masks indicating valid elements.
 Device-agnostic: works on CPU or CUDA with same code.
 """
 
+import dataclasses
+import hashlib
+import json
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, TypeVar
 
+import numpy as np
 import torch
 
 # Maximum sizes for padding (matches TypeScript GenomeConstraints)
 MAX_NODES = 8
 MAX_MUSCLES = 20  # Supports search space max_muscles 8-20
 
+# Genome keys that never reach the simulation (identity, lineage, display)
+NON_SIMULATED_GENOME_KEYS = frozenset({
+    'id', 'generation', 'parentIds', 'parent_ids',
+    'survivalStreak', 'survival_streak', 'color', 'name',
+})
+
+Batched = TypeVar('Batched')
+
 
 @dataclass
 class CreatureBatch:
@@ -105,6 +117,45 @@ class CreatureBatch:
         )
 
 
+@dataclass
+class StagedGenomes:
+    """
+    Genome bodies staged on the host, ready to become a CreatureBatch.
+
+    floats / longs are the flat float32 / int64 staging buffers of
+    creature_genomes_to_batch: every _FLOAT_FIELDS / _LONG_FIELDS field is a
+    contiguous [B, ...] block. Plain arrays, so a staged batch can be handed
+    to another process (e.g. through shared memory) and converted there.
+    """
+
+    floats: np.ndarray
+    longs: np.ndarray
+    genome_ids: list[str]
+    genome_muscle_counts: np.ndarray  # [B] int64 - len(genome['muscles']) before validation
+
+    @property
+    def batch_size(self) -> int:
+        return len(self.genome_ids)
+
+    def to_batch(self, device: torch.device | None = None) -> CreatureBatch:
+        """Convert to a CreatureBatch (the staging buffers are copied, never shared)."""
+        return _batch_from_buffers(self.floats.copy(), self.longs.copy(), self.genome_ids, device)
+
+    def select(self, rows: list[int]) -> "StagedGenomes":
+        """Staged genomes of a subset of the batch, in `rows` order."""
+        def gather(buffer: np.ndarray, fields: tuple) -> np.ndarray:
+            parts = [buffer[start:end].reshape(shape)[rows].ravel()
+                     for _, shape, start, end in _field_offsets(self.batch_size, fields)]
+            return np.concatenate(parts)
+
+        return StagedGenomes(
+            floats=gather(self.floats, _FLOAT_FIELDS),
+            longs=gather(self.longs, _LONG_FIELDS),
+            genome_ids=[self.genome_ids[i] for i in rows],
+            genome_muscle_counts=self.genome_muscle_counts[rows],
+        )
+
+
 def creature_genomes_to_batch(
     genomes: list[dict[str, Any]],
     device: torch.device | None = None,
@@ -112,6 +163,10 @@ def creature_genomes_to_batch(
     """
     Convert a list of creature genome dicts to batched tensors.
 
+    Every field is a contiguous view of one host buffer per dtype (see
+    stage_creature_genomes), so the batch reaches the device in two copies
+    (from pinned memory on CUDA).
+
     Args:
         genomes: List of genome dicts (matching TypeScript CreatureGenome structure)
         device: Target device (cpu/cuda). Defaults to cpu.
@@ -119,44 +174,46 @@ def creature_genomes_to_batch(
     Returns:
         CreatureBatch with all creatures batched together
     """
-    if device is None:
-        device = torch.device("cpu")
+    staged = stage_creature_genomes(genomes)
+    return _batch_from_buffers(staged.floats, staged.longs, staged.genome_ids, device)
+
+
+def stage_creature_genomes(genomes: list[dict[str, Any]], first_index: int = 0) -> StagedGenomes:
+    """
+    Stage the bodies of a list of creature genome dicts.
+
+    Values are gathered in one Python pass, scattered into a float64 NumPy
+    staging buffer with one fancy-index write per field, and rounded to
+    float32 once (the same rounding as scalar writes into float32 tensors).
+
+    Args:
+        genomes: List of genome dicts (matching TypeScript CreatureGenome structure)
+        first_index: Batch index of genomes[0] (genomes without an id are named
+            after their index in the whole batch, e.g. when staging one shard of it)
 
+    Returns:
+        StagedGenomes in batch order
+    """
     B = len(genomes)
 
-    # Initialize tensors with zeros (padding)
-    positions = torch.zeros(B, MAX_NODES, 3, device=device)
-    velocities = torch.zeros(B, MAX_NODES, 3, device=device)
-    masses = torch.zeros(B, MAX_NODES, device=device)
-    sizes = torch.zeros(B, MAX_NODES, device=device)
-    frictions = torch.zeros(B, MAX_NODES, device=device)
-    node_mask = torch.zeros(B, MAX_NODES, device=device)
-    node_counts = torch.zeros(B, dtype=torch.long, device=device)
-
-    spring_node_a = torch.zeros(B, MAX_MUSCLES, dtype=torch.long, device=device)
-    spring_node_b = torch.zeros(B, MAX_MUSCLES, dtype=torch.long, device=device)
-    spring_rest_length = torch.zeros(B, MAX_MUSCLES, device=device)
-    spring_stiffness = torch.zeros(B, MAX_MUSCLES, device=device)
-    spring_damping = torch.zeros(B, MAX_MUSCLES, device=device)
-    spring_frequency = torch.zeros(B, MAX_MUSCLES, device=device)
-    spring_amplitude = torch.zeros(B, MAX_MUSCLES, device=device)
-    spring_phase = torch.zeros(B, MAX_MUSCLES, device=device)
-    spring_mask = torch.zeros(B, MAX_MUSCLES, device=device)
-    muscle_counts = torch.zeros(B, dtype=torch.long, device=device)
-
-    direction_bias = torch.zeros(B, MAX_MUSCLES, 3, device=device)
-    bias_strength = torch.zeros(B, MAX_MUSCLES, device=device)
-    velocity_bias = torch.zeros(B, MAX_MUSCLES, 3, device=device)
-    velocity_strength = torch.zeros(B, MAX_MUSCLES, device=device)
-    distance_bias = torch.zeros(B, MAX_MUSCLES, device=device)
-    distance_strength = torch.zeros(B, MAX_MUSCLES, device=device)
-
-    global_freq_multiplier = torch.ones(B, device=device)
+    # Padded staging arrays (zeros = padding), views of one buffer per dtype
+    floats, float_buffer = _staging_arrays(B, _FLOAT_FIELDS, np.float64)
+    longs, long_buffer = _staging_arrays(B, _LONG_FIELDS, np.int64)
+    floats['global_freq_multiplier'][:] = 1.0
 
     genome_ids = []
 
+    # (batch, slot) indices and values of every node / muscle in the batch
+    node_b: list[int] = []
+    node_i: list[int] = []
+    node_values: list[tuple] = []  # x, y, z, size, mass, friction
+    muscle_b: list[int] = []
+    muscle_j: list[int] = []
+    muscle_nodes: list[tuple[int, int]] = []
+    muscle_values: list[tuple] = []  # See the muscle loop for the column order
+
     for b, genome in enumerate(genomes):
-        genome_ids.append(genome.get("id", f"genome_{b}"))
+        genome_ids.append(genome.get("id", f"genome_{first_index + b}"))
 
         nodes = genome.get("nodes", [])
         muscles = genome.get("muscles", [])
@@ -166,15 +223,12 @@ def creature_genomes_to_batch(
 
         # Process nodes
         num_nodes = min(len(nodes), MAX_NODES)
-        node_counts[b] = num_nodes
+        longs['node_counts'][b] = num_nodes
 
         for i, node in enumerate(nodes[:MAX_NODES]):
             node_id_to_idx[node["id"]] = i
 
             pos = node.get("position", {"x": 0, "y": 0.5, "z": 0})
-            positions[b, i, 0] = pos.get("x", 0)
-            positions[b, i, 1] = pos.get("y", 0.5) + 1.0  # Spawn above ground (matches TypeScript +1 offset)
-            positions[b, i, 2] = pos.get("z", 0)
 
             # Calculate mass from size (matches TypeScript formula)
             # Minimum mass prevents extreme accelerations with small nodes
@@ -182,14 +236,20 @@ def creature_genomes_to_batch(
             radius = size * 0.5
             mass = max(0.5, (4 / 3) * 3.14159 * (radius ** 3) * 10)  # Density factor, min 0.5 kg
 
-            sizes[b, i] = size
-            masses[b, i] = mass
-            frictions[b, i] = node.get("friction", 0.5)
-            node_mask[b, i] = 1.0
+            node_b.append(b)
+            node_i.append(i)
+            node_values.append((
+                pos.get("x", 0),
+                pos.get("y", 0.5) + 1.0,  # Spawn above ground (matches TypeScript +1 offset)
+                pos.get("z", 0),
+                size,
+                mass,
+                node.get("friction", 0.5),
+            ))
 
         # Process muscles
         num_muscles = 0
-        for j, muscle in enumerate(muscles[:MAX_MUSCLES]):
+        for muscle in muscles[:MAX_MUSCLES]:
             node_a_id = muscle.get("nodeA", muscle.get("node_a", ""))
             node_b_id = muscle.get("nodeB", muscle.get("node_b", ""))
 
@@ -197,76 +257,227 @@ def creature_genomes_to_batch(
             if node_a_id not in node_id_to_idx or node_b_id not in node_id_to_idx:
                 continue
 
-            idx_a = node_id_to_idx[node_a_id]
-            idx_b = node_id_to_idx[node_b_id]
-
-            spring_node_a[b, num_muscles] = idx_a
-            spring_node_b[b, num_muscles] = idx_b
-            spring_rest_length[b, num_muscles] = muscle.get("restLength", muscle.get("rest_length", 1.0))
-            spring_stiffness[b, num_muscles] = muscle.get("stiffness", 100.0)
-            spring_damping[b, num_muscles] = muscle.get("damping", 3.0)
-            spring_frequency[b, num_muscles] = muscle.get("frequency", 1.0)
-            spring_amplitude[b, num_muscles] = muscle.get("amplitude", 0.2)
-            spring_phase[b, num_muscles] = muscle.get("phase", 0.0)
-            spring_mask[b, num_muscles] = 1.0
-
-            # Direction bias (v1) - handle None values
+            # Direction bias (v1), velocity sensing (v2) - handle None values
             dir_bias = muscle.get("directionBias") or muscle.get("direction_bias") or {"x": 0, "y": 1, "z": 0}
-            direction_bias[b, num_muscles, 0] = dir_bias.get("x", 0) if isinstance(dir_bias, dict) else 0
-            direction_bias[b, num_muscles, 1] = dir_bias.get("y", 1) if isinstance(dir_bias, dict) else 1
-            direction_bias[b, num_muscles, 2] = dir_bias.get("z", 0) if isinstance(dir_bias, dict) else 0
-            bias_strength[b, num_muscles] = muscle.get("biasStrength") or muscle.get("bias_strength") or 0
-
-            # Velocity sensing (v2) - handle None values
+            if not isinstance(dir_bias, dict):
+                dir_bias = {}
             vel_bias = muscle.get("velocityBias") or muscle.get("velocity_bias") or {"x": 0, "y": 1, "z": 0}
-            velocity_bias[b, num_muscles, 0] = vel_bias.get("x", 0) if isinstance(vel_bias, dict) else 0
-            velocity_bias[b, num_muscles, 1] = vel_bias.get("y", 1) if isinstance(vel_bias, dict) else 1
-            velocity_bias[b, num_muscles, 2] = vel_bias.get("z", 0) if isinstance(vel_bias, dict) else 0
-            velocity_strength[b, num_muscles] = muscle.get("velocityStrength") or muscle.get("velocity_strength") or 0
-
-            # Distance awareness (v2) - handle None values
-            distance_bias[b, num_muscles] = muscle.get("distanceBias") or muscle.get("distance_bias") or 0
-            distance_strength[b, num_muscles] = muscle.get("distanceStrength") or muscle.get("distance_strength") or 0
+            if not isinstance(vel_bias, dict):
+                vel_bias = {}
+
+            muscle_b.append(b)
+            muscle_j.append(num_muscles)
+            muscle_nodes.append((node_id_to_idx[node_a_id], node_id_to_idx[node_b_id]))
+            muscle_values.append((
+                muscle.get("restLength", muscle.get("rest_length", 1.0)),
+                muscle.get("stiffness", 100.0),
+                muscle.get("damping", 3.0),
+                muscle.get("frequency", 1.0),
+                muscle.get("amplitude", 0.2),
+                muscle.get("phase", 0.0),
+                dir_bias.get("x", 0),
+                dir_bias.get("y", 1),
+                dir_bias.get("z", 0),
+                muscle.get("biasStrength") or muscle.get("bias_strength") or 0,
+                vel_bias.get("x", 0),
+                vel_bias.get("y", 1),
+                vel_bias.get("z", 0),
+                muscle.get("velocityStrength") or muscle.get("velocity_strength") or 0,
+                # Distance awareness (v2) - handle None values
+                muscle.get("distanceBias") or muscle.get("distance_bias") or 0,
+                muscle.get("distanceStrength") or muscle.get("distance_strength") or 0,
+            ))
 
             num_muscles += 1
 
-        muscle_counts[b] = num_muscles
+        longs['muscle_counts'][b] = num_muscles
 
         # Global frequency multiplier
-        global_freq_multiplier[b] = genome.get("globalFrequencyMultiplier",
-                                                genome.get("global_frequency_multiplier", 1.0))
+        floats['global_freq_multiplier'][b] = genome.get(
+            "globalFrequencyMultiplier", genome.get("global_frequency_multiplier", 1.0)
+        )
 
-    return CreatureBatch(
-        device=device,
-        batch_size=B,
-        positions=positions,
-        velocities=velocities,
-        masses=masses,
-        sizes=sizes,
-        frictions=frictions,
-        node_mask=node_mask,
-        node_counts=node_counts,
-        spring_node_a=spring_node_a,
-        spring_node_b=spring_node_b,
-        spring_rest_length=spring_rest_length,
-        spring_stiffness=spring_stiffness,
-        spring_damping=spring_damping,
-        spring_frequency=spring_frequency,
-        spring_amplitude=spring_amplitude,
-        spring_phase=spring_phase,
-        spring_mask=spring_mask,
-        muscle_counts=muscle_counts,
-        direction_bias=direction_bias,
-        bias_strength=bias_strength,
-        velocity_bias=velocity_bias,
-        velocity_strength=velocity_strength,
-        distance_bias=distance_bias,
-        distance_strength=distance_strength,
-        global_freq_multiplier=global_freq_multiplier,
+    # One fancy-index write per field
+    node_values_np = np.array(node_values, dtype=np.float64).reshape(-1, 6)
+    floats['positions'][node_b, node_i] = node_values_np[:, 0:3]
+    floats['sizes'][node_b, node_i] = node_values_np[:, 3]
+    floats['masses'][node_b, node_i] = node_values_np[:, 4]
+    floats['frictions'][node_b, node_i] = node_values_np[:, 5]
+    floats['node_mask'][node_b, node_i] = 1.0
+
+    muscle_nodes_np = np.array(muscle_nodes, dtype=np.int64).reshape(-1, 2)
+    longs['spring_node_a'][muscle_b, muscle_j] = muscle_nodes_np[:, 0]
+    longs['spring_node_b'][muscle_b, muscle_j] = muscle_nodes_np[:, 1]
+    muscle_values_np = np.array(muscle_values, dtype=np.float64).reshape(-1, 16)
+    for column, name in enumerate((
+        'spring_rest_length', 'spring_stiffness', 'spring_damping',
+        'spring_frequency', 'spring_amplitude', 'spring_phase',
+    )):
+        floats[name][muscle_b, muscle_j] = muscle_values_np[:, column]
+    floats['direction_bias'][muscle_b, muscle_j] = muscle_values_np[:, 6:9]
+    floats['bias_strength'][muscle_b, muscle_j] = muscle_values_np[:, 9]
+    floats['velocity_bias'][muscle_b, muscle_j] = muscle_values_np[:, 10:13]
+    floats['velocity_strength'][muscle_b, muscle_j] = muscle_values_np[:, 13]
+    floats['distance_bias'][muscle_b, muscle_j] = muscle_values_np[:, 14]
+    floats['distance_strength'][muscle_b, muscle_j] = muscle_values_np[:, 15]
+    floats['spring_mask'][muscle_b, muscle_j] = 1.0
+
+    return StagedGenomes(
+        floats=float_buffer.astype(np.float32),
+        longs=long_buffer,
         genome_ids=genome_ids,
+        genome_muscle_counts=np.array(
+            [len(genome.get("muscles", [])) for genome in genomes], dtype=np.int64,
+        ),
     )
 
 
+def _batch_from_buffers(
+    floats: np.ndarray,
+    longs: np.ndarray,
+    genome_ids: list[str],
+    device: torch.device | None,
+) -> CreatureBatch:
+    """CreatureBatch from staging buffers (on CPU the tensors share their memory)."""
+    if device is None:
+        device = torch.device("cpu")
+    batch_size = len(genome_ids)
+    tensors = {
+        **_to_device(floats, batch_size, _FLOAT_FIELDS, device),
+        **_to_device(longs, batch_size, _LONG_FIELDS, device),
+    }
+    return CreatureBatch(
+        device=device, batch_size=batch_size, genome_ids=list(genome_ids), **tensors
+    )
+
+
+# CreatureBatch tensor fields and their per-creature shapes, by dtype
+_FLOAT_FIELDS = (
+    ('positions', (MAX_NODES, 3)),
+    ('velocities', (MAX_NODES, 3)),
+    ('masses', (MAX_NODES,)),
+    ('sizes', (MAX_NODES,)),
+    ('frictions', (MAX_NODES,)),
+    ('node_mask', (MAX_NODES,)),
+    ('spring_rest_length', (MAX_MUSCLES,)),
+    ('spring_stiffness', (MAX_MUSCLES,)),
+    ('spring_damping', (MAX_MUSCLES,)),
+    ('spring_frequency', (MAX_MUSCLES,)),
+    ('spring_amplitude', (MAX_MUSCLES,)),
+    ('spring_phase', (MAX_MUSCLES,)),
+    ('spring_mask', (MAX_MUSCLES,)),
+    ('direction_bias', (MAX_MUSCLES, 3)),
+    ('bias_strength', (MAX_MUSCLES,)),
+    ('velocity_bias', (MAX_MUSCLES, 3)),
+    ('velocity_strength', (MAX_MUSCLES,)),
+    ('distance_bias', (MAX_MUSCLES,)),
+    ('distance_strength', (MAX_MUSCLES,)),
+    ('global_freq_multiplier', ()),
+)
+_LONG_FIELDS = (
+    ('node_counts', ()),
+    ('spring_node_a', (MAX_MUSCLES,)),
+    ('spring_node_b', (MAX_MUSCLES,)),
+    ('muscle_counts', ()),
+)
+
+
+def _field_offsets(batch_size: int, fields: tuple) -> list[tuple[str, tuple, int, int]]:
+    """(name, shape, start, end) of each field in a flat buffer."""
+    layout, offset = [], 0
+    for name, shape in fields:
+        size = batch_size * int(np.prod(shape, dtype=np.int64))
+        layout.append((name, (batch_size, *shape), offset, offset + size))
+        offset += size
+    return layout
+
+
+def _staging_arrays(
+    batch_size: int, fields: tuple, dtype
+) -> tuple[dict[str, np.ndarray], np.ndarray]:
+    """Zeroed flat buffer for `fields` and a shaped view of it per field."""
+    layout = _field_offsets(batch_size, fields)
+    buffer = np.zeros(layout[-1][3], dtype=dtype)
+    return {name: buffer[start:end].reshape(shape) for name, shape, start, end in layout}, buffer
+
+
+def _to_device(
+    buffer: np.ndarray, batch_size: int, fields: tuple, device: torch.device
+) -> dict[str, torch.Tensor]:
+    """Copy a staging buffer to the device in one transfer and split it into per-field views."""
+    host = torch.from_numpy(buffer)
+    if device.type == 'cuda':
+        host = host.pin_memory()
+    flat = host.to(device, non_blocking=True)
+    layout = _field_offsets(batch_size, fields)
+    return {name: flat[start:end].view(shape) for name, shape, start, end in layout}
+
+
+def genome_content_hash(genome: dict[str, Any]) -> int:
+    """
+    Hash the simulated content of a genome.
+
+    Two genomes hash equal when they simulate identically, whatever their id,
+    lineage or survival streak.
+
+    Args:
+        genome: Genome dict (camelCase or snake_case)
+
+    Returns:
+        Unsigned 64-bit hash
+    """
+    content = {k: v for k, v in genome.items() if k not in NON_SIMULATED_GENOME_KEYS}
+    encoded = json.dumps(content, sort_keys=True, separators=(',', ':'), default=str)
+    return int.from_bytes(hashlib.blake2b(encoded.encode(), digest_size=8).digest(), 'little')
+
+
+def select_rows(data: Batched, rows: torch.Tensor) -> Batched:
+    """
+    Copy of a batched dataclass keeping only the creatures at `rows`.
+
+    Works for any dataclass with a `batch_size` field (CreatureBatch,
+    PelletBatch, FitnessState): every tensor or list field whose leading
+    dimension is the batch size is indexed, everything else is shared.
+
+    Args:
+        data: Batched dataclass
+        rows: [K] long tensor of creature indices, in order
+
+    Returns:
+        Dataclass of the same type with batch_size K
+    """
+    batch_size = data.batch_size
+    keep = None
+    updates: dict[str, Any] = {'batch_size': len(rows)}
+    for field in dataclasses.fields(data):
+        value = getattr(data, field.name)
+        if isinstance(value, torch.Tensor) and value.dim() > 0 and value.shape[0] == batch_size:
+            updates[field.name] = value[rows]
+        elif isinstance(value, list) and len(value) == batch_size:
+            keep = rows.tolist() if keep is None else keep
+            updates[field.name] = [value[i] for i in keep]
+    return dataclasses.replace(data, **updates)
+
+
+def scatter_rows(target: Batched, source: Batched, rows: torch.Tensor) -> None:
+    """
+    Write the creatures of `source` back into `target` at `rows` (inverse of select_rows).
+
+    Tensor fields of `target` are replaced, not modified in place, so tensors
+    shared with other objects are left alone. List fields are not written.
+
+    Args:
+        target: Batched dataclass to update (modified in place)
+        source: Batched dataclass of the same type with batch_size len(rows)
+        rows: [K] long tensor of target indices for the source creatures
+    """
+    batch_size = target.batch_size
+    for field in dataclasses.fields(target):
+        value = getattr(target, field.name)
+        if isinstance(value, torch.Tensor) and value.dim() > 0 and value.shape[0] == batch_size:
+            setattr(target, field.name, value.index_copy(0, rows, getattr(source, field.name)))
+
+
 def get_center_of_mass(batch: CreatureBatch) -> torch.Tensor:
     """
     Calculate center of mass for each creature in batch.
@@ -0,0 +1,131 @@
+"""
+Tests for the compiled neural physics step.
+
+The compiled engine must reproduce the eager engine: same trajectories, same
+pellet collection, same fitness. Graph capture is exercised on CPU with the
+'aot_eager' backend (no codegen, so results are bit-identical and fast to
+compile); on CPU the default engine falls back to eager execution.
+"""
+
+import random
+
+import pytest
+import torch
+
+from app.genetics.population import generate_population
+from app.neural.network import BatchedNeuralNetwork, NeuralConfig
+from app.services.pytorch_simulator import PyTorchSimulator
+from app.simulation.compiled import CompiledNeuralStep, is_compile_supported
+from app.simulation.fitness import (
+    FitnessConfig,
+    calculate_fitness,
+    initialize_fitness_state,
+    initialize_pellets,
+)
+from app.simulation.physics import physics_step_neural, simulate_with_fitness_neural
+from app.simulation.tensors import MAX_MUSCLES, creature_genomes_to_batch
+from app.simulation.test_parity import make_test_creature
+
+
+def _run(mode: str, physics_step_fn=None, num_steps: int = 45) -> tuple[dict, object, object]:
+    """Run the test_parity creature with its pellet placed on a node (collected on step 0)."""
+    genomes = [make_test_creature(f"c{i}") for i in range(4)]
+    batch = creature_genomes_to_batch(genomes)
+    pellets = initialize_pellets(batch, seed=42)
+    pellets.positions[0] = batch.positions[0, 0].clone()
+    state = initialize_fitness_state(batch, pellets)
+
+    torch.manual_seed(0)
+    network = BatchedNeuralNetwork.initialize_random(
+        batch_size=4,
+        num_muscles=[3] * 4,
+        config=NeuralConfig(neural_mode=mode, time_encoding='cyclic'),
+        max_muscles=MAX_MUSCLES,
+    )
+
+    torch.manual_seed(1)
+    result = simulate_with_fitness_neural(
+        batch=batch,
+        neural_network=network,
+        pellets=pellets,
+        fitness_state=state,
+        num_steps=num_steps,
+        fitness_config=FitnessConfig(),
+        mode=mode,
+        time_encoding='cyclic',
+        velocity_cap=5.0,
+        max_extension_ratio=2.0,
+        physics_step_fn=physics_step_fn,
+    )
+    return result, pellets, state
+
+
+class TestFallback:
+    """On CPU the default compiled engine is plain eager execution."""
+
+    def test_cpu_not_compiled(self):
+        step = CompiledNeuralStep(torch.device('cpu'))
+        assert not is_compile_supported(torch.device('cpu'))
+        assert not step.compiled
+        assert not step.use_cuda_graphs
+
+    def test_fallback_matches_eager(self):
+        eager, _, _ = _run('pure')
+        fallback, _, _ = _run('pure', physics_step_fn=CompiledNeuralStep(torch.device('cpu')))
+        assert torch.equal(eager['final_positions'], fallback['final_positions'])
+
+    def test_simulator_compiled_flag(self):
+        random.seed(5)
+        genomes = generate_population(6, neural_mode='pure', time_encoding='none')
+        config = {'neural_mode': 'pure', 'time_encoding': 'none', 'simulation_duration': 2.0}
+
+        torch.manual_seed(3)
+        eager = PyTorchSimulator(torch.device('cpu')).simulate_batch(genomes, config)
+        torch.manual_seed(3)
+        compiled_simulator = PyTorchSimulator(torch.device('cpu'), compiled=True)
+        compiled = compiled_simulator.simulate_batch(genomes, config)
+
+        assert [r.fitness for r in eager] == [r.fitness for r in compiled]
+
+
+@pytest.mark.skipif(not hasattr(torch, 'compile'), reason="torch.compile unavailable")
+class TestCompiledParity:
+    """Graph-captured step must satisfy the same parity expectations as eager."""
+
+    @pytest.mark.parametrize("mode", ["pure", "hybrid"])
+    def test_matches_eager(self, mode):
+        step = CompiledNeuralStep(torch.device('cpu'), backend='aot_eager', allow_cpu=True)
+        assert step.compiled
+
+        eager, pellets_e, state_e = _run(mode)
+        compiled, pellets_c, state_c = _run(mode, physics_step_fn=step)
+
+        assert torch.equal(eager['final_positions'], compiled['final_positions'])
+        assert torch.equal(eager['total_activation'], compiled['total_activation'])
+        assert torch.equal(state_e.distance_traveled, state_c.distance_traveled)
+        assert eager['pellet_history'] == compiled['pellet_history']
+
+        # test_parity expectations: pellet placed on a node is collected and fitness is clamped >= 0
+        assert pellets_c.total_collected[0].item() >= 1
+        fitness = calculate_fitness(
+            creature_genomes_to_batch([make_test_creature()] * 4),
+            pellets_c, state_c, simulation_time=1.5, config=FitnessConfig(),
+        )
+        assert (fitness >= 0).all()
+
+    def test_single_step_matches(self):
+        step = CompiledNeuralStep(torch.device('cpu'), backend='aot_eager', allow_cpu=True)
+        batch_a = creature_genomes_to_batch([make_test_creature()] * 2)
+        batch_b = creature_genomes_to_batch([make_test_creature()] * 2)
+        base = batch_a.spring_rest_length.clone()
+        outputs = torch.linspace(-1, 1, base.numel()).reshape(base.shape)
+
+        com_a, act_a = physics_step_neural(batch_a, base, outputs, 0.5, 'hybrid',
+                                           prev_rest_lengths=base, velocity_cap=5.0,
+                                           max_extension_ratio=2.0)
+        com_b, act_b = step(batch_b, base, outputs, 0.5, 'hybrid', prev_rest_lengths=base,
+                            velocity_cap=5.0, max_extension_ratio=2.0)
+
+        assert torch.equal(com_a, com_b)
+        assert torch.equal(act_a, act_b)
+        assert torch.equal(batch_a.velocities, batch_b.velocities)
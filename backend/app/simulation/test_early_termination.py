@@ -0,0 +1,166 @@
+"""
+Tests for early termination in simulate_with_fitness_neural.
+
+Creatures that run to the end must get exactly the results of a run without
+early termination; stopped creatures keep the state they stopped in.
+"""
+
+import random
+
+import pytest
+import torch
+
+from app.genetics.population import generate_population
+from app.neural.network import BatchedNeuralNetwork, NeuralConfig
+from app.schemas.neat import InnovationCounter
+from app.schemas.simulation import SimulationConfig
+from app.services.pytorch_simulator import PyTorchSimulator
+from app.simulation.early_termination import EarlyTermination, TerminationTracker
+from app.simulation.fitness import initialize_fitness_state, initialize_pellets
+from app.simulation.tensors import (
+    MAX_MUSCLES,
+    creature_genomes_to_batch,
+    get_center_of_mass,
+    scatter_rows,
+    select_rows,
+)
+
+BASE = dict(simulation_duration=4.0, time_encoding='none', pellet_seed=1)
+
+
+def _genomes(n: int, mode: str = 'pure') -> list[dict]:
+    random.seed(0)
+    return generate_population(
+        n,
+        neural_mode=mode,
+        use_neat=mode == 'neat',
+        time_encoding='none',
+        innovation_counter=InnovationCounter(),
+    )
+
+
+def _comparable(result) -> tuple:
+    return (
+        result.fitness, result.pellets_collected, result.net_displacement,
+        result.distance_traveled, result.total_activation, result.pellets,
+    )
+
+
+class TestRowSelection:
+    """select_rows / scatter_rows on batched dataclasses."""
+
+    def test_round_trip(self):
+        batch = creature_genomes_to_batch(_genomes(5))
+        pellets = initialize_pellets(batch, seed=3)
+        state = initialize_fitness_state(batch, pellets)
+        rows = torch.tensor([3, 1])
+
+        part = select_rows(state, rows)
+        assert part.batch_size == 2
+        assert torch.equal(part.initial_com, state.initial_com[rows])
+
+        part_batch = select_rows(batch, rows)
+        assert part_batch.genome_ids == [batch.genome_ids[3], batch.genome_ids[1]]
+
+        original = state.distance_traveled
+        part.distance_traveled = torch.tensor([7.0, 9.0])
+        scatter_rows(state, part, rows)
+        assert state.distance_traveled.tolist() == [0.0, 9.0, 0.0, 7.0, 0.0]
+        assert original.tolist() == [0.0] * 5  # Replaced, not modified in place
+
+    def test_network_subset(self):
+        config = NeuralConfig(neural_mode='pure', hidden_size=8, time_encoding='none')
+        genomes = _genomes(4)
+        network = BatchedNeuralNetwork.from_genomes(
+            [g['neuralGenome'] for g in genomes],
+            [len(g['muscles']) for g in genomes],
+            config,
+            MAX_MUSCLES,
+            'cpu',
+        )
+        inputs = torch.randn(4, network.input_size)
+        rows = torch.tensor([2, 0])
+        expected = network.forward(inputs)[rows]
+        assert torch.allclose(network.subset(rows).forward(inputs[rows]), expected)
+
+
+class TestTerminationTracker:
+    """Stop conditions of the policy."""
+
+    def test_stagnation_needs_full_window(self):
+        batch = creature_genomes_to_batch(_genomes(2))
+        policy = EarlyTermination(check_interval=10, stagnation_window=20, stagnation_distance=0.1)
+        tracker = TerminationTracker(policy, get_center_of_mass(batch))
+        not_disqualified = torch.zeros(2, dtype=torch.bool)
+
+        assert not tracker.check(batch, not_disqualified, None, 10).any()  # Window not yet covered
+        batch.positions = batch.positions + torch.tensor([[[1.0, 0.0, 0.0]], [[0.05, 0.0, 0.0]]])
+        assert tracker.check(batch, not_disqualified, None, 20).tolist() == [False, True]
+
+    def test_fitness_bound_after_grace(self):
+        policy = EarlyTermination(stagnation_window=0, min_fitness=10.0, grace_steps=60)
+        tracker = TerminationTracker(policy, torch.zeros(2, 3))
+        batch = creature_genomes_to_batch(_genomes(2))
+        fitness = torch.tensor([5.0, 50.0])
+        assert not tracker.bound_active(30)
+        assert tracker.bound_active(60)
+        disqualified = torch.tensor([False, True])
+        assert tracker.check(batch, disqualified, fitness, 60).tolist() == [True, True]
+        disqualified = torch.zeros(2, dtype=torch.bool)
+        assert tracker.check(batch, disqualified, fitness, 60).tolist() == [True, False]
+
+
+class TestEarlyTerminationSimulation:
+    """End-to-end through PyTorchSimulator."""
+
+    @pytest.mark.parametrize('mode', ['pure', 'neat'])
+    def test_survivors_match_full_run(self, mode):
+        simulator = PyTorchSimulator(torch.device('cpu'))
+        genomes = _genomes(40, mode)
+        full = simulator.simulate_batch(genomes, SimulationConfig(**BASE, neural_mode=mode))
+        early = simulator.simulate_batch(genomes, SimulationConfig(
+            **BASE, neural_mode=mode, early_termination=True,
+            early_termination_stagnation_window=1.0, early_termination_stagnation_distance=0.001,
+            early_termination_compact_fraction=0.1,
+        ))
+
+        stopped = [r for r in early if r.terminated_at is not None]
+        # Compaction happened and some creatures ran to the end
+        assert 0 < len(stopped) < len(early)
+        assert all(0 < r.terminated_at < BASE['simulation_duration'] for r in stopped)
+        for a, b in zip(full, early):
+            assert a.genome_id == b.genome_id
+            if b.terminated_at is None:
+                assert _comparable(a) == _comparable(b)
+
+    def test_whole_batch_stopped(self):
+        simulator = PyTorchSimulator(torch.device('cpu'))
+        results = simulator.simulate_batch(_genomes(6), SimulationConfig(
+            **BASE, early_termination=True, early_termination_stagnation_window=0.0,
+            early_termination_min_fitness=1e6, early_termination_grace_period=1.0,
+        ))
+        assert [r.terminated_at for r in results] == pytest.approx([1.0] * 6)
+        assert all(r.fitness >= 0 and r.pellets for r in results)
+
+    def test_packed_weights_follow_compaction(self):
+        simulator = PyTorchSimulator(torch.device('cpu'))
+        genomes = _genomes(20)
+        early = dict(
+            BASE, early_termination=True, early_termination_stagnation_window=1.0,
+            early_termination_stagnation_distance=0.001, early_termination_compact_fraction=0.1,
+        )
+        configs = [
+            SimulationConfig(**early),
+            SimulationConfig(**early, fitness_distance_per_unit=6.0),
+        ]
+        packed = simulator.simulate_packed([(genomes[:10], configs[0]), (genomes[10:], configs[1])])
+        alone = simulator.simulate_batch(genomes[10:], configs[1])
+        assert [_comparable(r) for r in packed[1]] == [_comparable(r) for r in alone]
+
+    def test_ignored_when_recording_frames(self):
+        simulator = PyTorchSimulator(torch.device('cpu'))
+        results = simulator.simulate_batch(_genomes(4), SimulationConfig(
+            **BASE, frame_storage_mode='all', early_termination=True,
+            early_termination_min_fitness=1e6, early_termination_grace_period=1.0,
+        ))
+        assert all(r.terminated_at is None and r.frame_count > 0 for r in results)
@@ -0,0 +1,168 @@
+"""
+Tests for the binary frame storage format.
+"""
+
+import json
+import random
+import zlib
+
+import numpy as np
+import pytest
+import torch
+
+from app.genetics.population import generate_population
+from app.services.pytorch_simulator import PyTorchSimulator
+from app.simulation.frame_codec import (
+    MAGIC,
+    decode_activations,
+    decode_arrays,
+    decode_fitness_over_time,
+    decode_node_frames,
+    decode_pellet_frames,
+    encode_activation_dicts,
+    encode_arrays,
+    encode_fitness_over_time,
+    encode_node_frame_rows,
+    encode_node_frames,
+    encode_pellet_frames,
+    is_binary_frames,
+)
+
+
+def _trajectory(num_frames: int = 120, num_nodes: int = 8, seed: int = 0) -> np.ndarray:
+    """Smooth random-walk node trajectory [F, N, 3]."""
+    rng = np.random.default_rng(seed)
+    steps = rng.normal(scale=0.05, size=(num_frames, num_nodes, 3)).astype(np.float32)
+    return np.cumsum(steps, axis=0) + rng.uniform(-5, 5, size=(1, num_nodes, 3)).astype(np.float32)
+
+
+class TestContainer:
+    """Round-trip of the raw array container."""
+
+    def test_float32_roundtrip_exact(self):
+        values = _trajectory()
+        blob = encode_arrays({'positions': values})
+        assert blob.startswith(MAGIC)
+        assert np.array_equal(decode_arrays(blob)['positions'], values)
+
+    def test_float32_delta_roundtrip_close(self):
+        values = _trajectory()
+        blob = encode_arrays({'positions': values}, delta=('positions',))
+        decoded = decode_arrays(blob)['positions']
+        assert np.allclose(decoded, values, atol=1e-5)
+
+    def test_float16_delta_error_does_not_accumulate(self):
+        values = _trajectory(num_frames=600)
+        blob = encode_arrays(
+            {'positions': values}, dtypes={'positions': 'float16'}, delta=('positions',)
+        )
+        decoded = decode_arrays(blob)['positions']
+        # Closed-loop deltas: error stays at one float16 rounding (|x| < 8 -> < 2**-9)
+        # instead of growing with the frame count
+        error = np.abs(decoded - values)
+        assert error.max() < 2 ** -9
+        assert error[-100:].max() <= error[:100].max() * 1.5
+
+    def test_int_and_empty_arrays(self):
+        blob = encode_arrays({
+            'frames': np.array([3, -1, 7], dtype=np.int64),
+            'empty': np.zeros((0, 8, 3), dtype=np.float32),
+        }, delta=('empty',), compress=False)
+        arrays = decode_arrays(blob)
+        assert arrays['frames'].tolist() == [3, -1, 7]
+        assert arrays['empty'].shape == (0, 8, 3)
+
+    def test_non_finite_values_zeroed(self):
+        values = np.array([[1.0, np.nan], [np.inf, 1e6]], dtype=np.float32)
+        decoded = decode_arrays(encode_arrays({'v': values}, dtypes={'v': 'float16'}))['v']
+        assert decoded[0, 1] == 0.0 and decoded[1, 0] == 0.0
+        assert np.isfinite(decoded).all()
+
+    def test_rejects_unknown_version(self):
+        blob = bytearray(encode_arrays({'v': np.zeros(3)}))
+        blob[4] = 99
+        with pytest.raises(ValueError):
+            decode_arrays(bytes(blob))
+
+
+class TestColumns:
+    """Column encoders decode to the JSON layout the API has always returned."""
+
+    def test_node_frames_layout(self):
+        positions = _trajectory(num_frames=10, num_nodes=4)
+        blob = encode_node_frames(positions, frame_dt=1 / 15, precision='float32')
+        rows = decode_node_frames(blob)
+
+        assert len(rows) == 10
+        assert len(rows[0]) == 1 + 4 * 3
+        assert rows[3][0] == pytest.approx(3 / 15)
+        assert np.allclose(np.asarray(rows)[:, 1:].reshape(10, 4, 3), positions, atol=1e-5)
+
+    def test_node_frame_rows_roundtrip(self):
+        rows = [[0.0, 1.0, 2.0, 3.0], [0.5, 1.5, 2.5, 3.5]]
+        assert decode_node_frames(encode_node_frame_rows(rows, precision='float32')) == rows
+
+    def test_default_precision_is_float32(self):
+        # float16 is opt-in: it would store 100.3 as 100.25
+        rows = [[0.0, 100.3, -57.1, 0.001]]
+        decoded = decode_node_frames(encode_node_frame_rows(rows))
+        assert np.allclose(decoded, rows, rtol=1e-6, atol=0)
+
+    def test_fitness_and_activations(self):
+        fitness = [0.0, 12.5, 300.25]
+        assert decode_fitness_over_time(encode_fitness_over_time(fitness)) == fitness
+
+        frames = [
+            {'inputs': [0.5, -0.25], 'hidden': [0.125], 'outputs': [1.0, -1.0],
+             'outputs_raw': [0.75, -0.5]},
+            {'inputs': [0.0, 1.0], 'hidden': [-0.5], 'outputs': [0.0, 0.5],
+             'outputs_raw': [0.25, 0.0]},
+        ]
+        assert decode_activations(encode_activation_dicts(frames)) == frames
+
+    def test_pellets(self):
+        pellets = [
+            {'position': {'x': 1.0, 'y': 0.5, 'z': -2.0}, 'collected_at_frame': 12,
+             'spawned_at_frame': 0, 'initial_distance': 4.5},
+            {'position': {'x': 0.0, 'y': 0.5, 'z': 3.0}, 'collected_at_frame': None,
+             'spawned_at_frame': 12, 'initial_distance': 6.0},
+        ]
+        assert decode_pellet_frames(encode_pellet_frames(pellets)) == pellets
+
+    def test_legacy_zlib_json(self):
+        rows = [[0.0, 1.0, 2.0, 3.0]]
+        legacy = zlib.compress(json.dumps(rows).encode())
+        assert not is_binary_frames(legacy)
+        assert decode_node_frames(legacy) == rows
+        assert decode_fitness_over_time(zlib.compress(b'[1.5]')) == [1.5]
+
+
+class TestSimulatorBinaryFrames:
+    """PyTorchSimulator writes binary columns straight from the frame tensors."""
+
+    def test_matches_json_frames(self):
+        random.seed(11)
+        genomes = generate_population(4, neural_mode='pure', time_encoding='none')
+        config = {
+            'neural_mode': 'pure', 'time_encoding': 'none', 'simulation_duration': 1.0,
+            'frame_storage_mode': 'all',
+        }
+        simulator = PyTorchSimulator()
+
+        torch.manual_seed(0)
+        json_results = simulator.simulate_batch(genomes, {**config, 'frame_format': 'json'})
+        torch.manual_seed(0)
+        binary_results = simulator.simulate_batch(
+            genomes, {**config, 'frame_format': 'binary', 'frame_precision': 'float32'}
+        )
+
+        for j, b in zip(json_results, binary_results):
+            assert b.frames is None and b.frames_encoded is not None
+            assert b.frame_count == j.frame_count
+            assert np.allclose(decode_node_frames(b.frames_encoded), j.frames, atol=1e-4)
+            fitness_over_time = decode_fitness_over_time(b.fitness_over_time_encoded)
+            assert np.allclose(fitness_over_time, j.fitness_over_time)
+
+            activations = decode_activations(b.activations_encoded)
+            assert len(activations) == len(j.activations_per_frame)
+            assert np.allclose(activations[-1]['outputs'], j.activations_per_frame[-1]['outputs'])
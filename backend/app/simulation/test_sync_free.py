@@ -0,0 +1,153 @@
+"""
+Tests for the sync-free execution mode of simulate_with_fitness_neural.
+
+Sync-free mode replaces every data-dependent branch in the step loop with
+masked tensor ops. These tests verify that it produces the same results as
+the default (branching) loop.
+"""
+
+import torch
+
+from app.genetics.population import generate_population
+from app.neural.network import BatchedNeuralNetwork, NeuralConfig
+from app.simulation.fitness import (
+    FitnessConfig,
+    freeze_disqualified_creatures,
+    initialize_fitness_state,
+    initialize_pellets,
+)
+from app.simulation.physics import apply_ground_collision, simulate_with_fitness_neural
+from app.simulation.tensors import MAX_MUSCLES, creature_genomes_to_batch
+
+# =============================================================================
+# Helper Functions
+# =============================================================================
+
+def _make_genomes(n: int, seed: int = 0) -> list[dict]:
+    """Create reproducible random pure-mode genomes."""
+    import random
+    random.seed(seed)
+    return generate_population(n, neural_mode='pure', time_encoding='none')
+
+
+def _run(genomes: list[dict], sync_free: bool, collect_first: bool = False,
+         record_frames: bool = False, num_steps: int = 60) -> tuple[dict, object, object]:
+    """Run simulate_with_fitness_neural from an identical seeded starting state."""
+    torch.manual_seed(123)
+    batch = creature_genomes_to_batch(genomes)
+    pellets = initialize_pellets(batch, arena_size=20.0, seed=7)
+    if collect_first:
+        # Put every pellet on the creature's first node so it is collected on step 0
+        pellets.positions = batch.positions[:, 0].clone()
+    state = initialize_fitness_state(batch, pellets)
+
+    network = BatchedNeuralNetwork.from_genomes(
+        neural_genomes=[g['neuralGenome'] for g in genomes],
+        num_muscles=[len(g['muscles']) for g in genomes],
+        config=NeuralConfig(neural_mode='pure', time_encoding='none'),
+        max_muscles=MAX_MUSCLES,
+    )
+
+    torch.manual_seed(456)
+    result = simulate_with_fitness_neural(
+        batch=batch,
+        neural_network=network,
+        pellets=pellets,
+        fitness_state=state,
+        num_steps=num_steps,
+        fitness_config=FitnessConfig(),
+        mode='pure',
+        dt=1 / 30,
+        record_frames=record_frames,
+        arena_size=20.0,
+        time_encoding='none',
+        sync_free=sync_free,
+    )
+    return result, pellets, state
+
+
+# =============================================================================
+# Masked Primitives
+# =============================================================================
+
+class TestMaskedPrimitives:
+    """Masked variants must match the early-exit versions exactly."""
+
+    def test_ground_collision_matches(self):
+        genomes = _make_genomes(8)
+        batch_a = creature_genomes_to_batch(genomes)
+        batch_b = creature_genomes_to_batch(genomes)
+        # Push half the creatures below ground with downward velocity
+        for b in (batch_a, batch_b):
+            b.positions[:4, :, 1] = -0.2
+            b.velocities[:, :, 0] = 1.5
+            b.velocities[:, :, 1] = -2.0
+
+        apply_ground_collision(batch_a)
+        apply_ground_collision(batch_b, sync_free=True)
+
+        assert torch.equal(batch_a.positions, batch_b.positions)
+        assert torch.equal(batch_a.velocities, batch_b.velocities)
+
+    def test_ground_collision_noop_when_airborne(self):
+        batch = creature_genomes_to_batch(_make_genomes(4))
+        batch.positions[:, :, 1] += 5.0
+        batch.velocities[:, :, 0] = 1.0
+        positions = batch.positions.clone()
+        velocities = batch.velocities.clone()
+
+        apply_ground_collision(batch, sync_free=True)
+
+        assert torch.equal(batch.positions, positions)
+        assert torch.equal(batch.velocities, velocities)
+
+    def test_freeze_noop_when_none_disqualified(self):
+        batch = creature_genomes_to_batch(_make_genomes(4))
+        batch.velocities[:] = 1.0
+        freeze_disqualified_creatures(batch, torch.zeros(4, dtype=torch.bool), sync_free=True)
+        assert torch.all(batch.velocities == 1.0)
+
+
+# =============================================================================
+# Full Loop Parity
+# =============================================================================
+
+class TestSyncFreeSimulation:
+    """Sync-free loop must match the default loop."""
+
+    def _assert_same(self, a: dict, b: dict) -> None:
+        assert torch.equal(a['final_positions'], b['final_positions'])
+        assert torch.equal(a['total_activation'], b['total_activation'])
+        assert torch.equal(a['total_collected'], b['total_collected'])
+        assert a['pellet_history'] == b['pellet_history']
+
+    def test_matches_default_without_collection(self):
+        genomes = _make_genomes(16)
+        default, _, state_a = _run(genomes, sync_free=False)
+        sync_free, _, state_b = _run(genomes, sync_free=True)
+
+        self._assert_same(default, sync_free)
+        assert torch.equal(state_a.distance_traveled, state_b.distance_traveled)
+        assert torch.equal(state_a.closest_edge_distance, state_b.closest_edge_distance)
+
+    def test_matches_default_with_collection(self):
+        """A single collection event (step 0) draws the same respawn positions."""
+        genomes = _make_genomes(16)
+        default, pellets_a, _ = _run(genomes, sync_free=False, collect_first=True)
+        sync_free, pellets_b, _ = _run(genomes, sync_free=True, collect_first=True)
+
+        assert (default['total_collected'] >= 1).all()
+        self._assert_same(default, sync_free)
+        assert torch.equal(pellets_a.positions, pellets_b.positions)
+
+    def test_recorded_frame_indices(self):
+        genomes = _make_genomes(6)
+        default, _, _ = _run(genomes, sync_free=False, collect_first=True, record_frames=True)
+        sync_free, _, _ = _run(genomes, sync_free=True, collect_first=True, record_frames=True)
+
+        self._assert_same(default, sync_free)
+        assert torch.equal(default['frames'], sync_free['frames'])
+        assert torch.equal(default['fitness_per_frame'], sync_free['fitness_per_frame'])
+        for history in sync_free['pellet_history']:
+            assert isinstance(history[0]['collected_at_frame'], int)
+            assert history[1]['spawned_at_frame'] == history[0]['collected_at_frame']
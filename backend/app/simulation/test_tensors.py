@@ -361,6 +361,37 @@ class TestEdgeCases:
         # Default position y = 0.5 + 1.0 spawn offset = 1.5
         assert batch.positions[0, 0, 1].item() == 1.5
 
+    def test_values_rounded_like_float32_writes(self):
+        """Test that packed values equal a direct float32 conversion of the genome values."""
+        genome = make_simple_genome("rounding", num_nodes=3, num_muscles=2)
+        genome["nodes"][1]["position"] = {"x": 0.1, "y": 0.7, "z": 1 / 3}
+        genome["nodes"][2]["size"] = 0.123456789
+        genome["muscles"].insert(0, {"id": "bad", "nodeA": "node-0", "nodeB": "missing"})
+        genome["muscles"][1]["stiffness"] = 123.456789
+        genome["globalFrequencyMultiplier"] = 1.1
+        batch = creature_genomes_to_batch([genome])
+
+        def f32(value):
+            return torch.tensor(value, dtype=torch.float32).item()
+
+        assert batch.positions[0, 1].tolist() == [f32(0.1), f32(0.7 + 1.0), f32(1 / 3)]
+        assert batch.sizes[0, 2].item() == f32(0.123456789)
+        # Skipped muscle leaves no gap in the muscle slots
+        assert batch.muscle_counts[0].item() == 2
+        assert batch.spring_stiffness[0, 0].item() == f32(123.456789)
+        assert batch.global_freq_multiplier[0].item() == f32(1.1)
+
+    def test_fields_are_contiguous(self):
+        """Test that fields split from the staging buffer are contiguous and do not overlap."""
+        batch = creature_genomes_to_batch([make_simple_genome("a"), make_simple_genome("b")])
+        positions = batch.positions.clone()
+        masses = batch.masses.clone()
+
+        assert batch.positions.is_contiguous() and batch.spring_node_a.is_contiguous()
+        batch.velocities += 1.0
+        assert torch.equal(batch.positions, positions)
+        assert torch.equal(batch.masses, masses)
+
 
 # =============================================================================
 # Test: get_center_of_mass
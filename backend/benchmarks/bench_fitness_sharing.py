@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark: fitness sharing distance matrix.
+
+Compares the pairwise neural_genome_distance double loop against the
+vectorized apply_fitness_sharing on a generated neural population.
+
+Usage (from backend/):
+    python benchmarks/bench_fitness_sharing.py
+    python benchmarks/bench_fitness_sharing.py --population 1000 --reference-population 200
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Allow running as a plain script from backend/
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+
+from app.genetics.fitness_sharing import apply_fitness_sharing, neural_genome_distance
+from app.genetics.population import generate_population
+
+
+def pairwise_distances(genomes: list[dict]) -> None:
+    """The O(n^2) Python loop apply_fitness_sharing used before vectorization."""
+    n = len(genomes)
+    distances = np.zeros((n, n))
+    for i in range(n):
+        for j in range(i + 1, n):
+            d = neural_genome_distance(genomes[i], genomes[j])
+            distances[i, j] = d
+            distances[j, i] = d
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--population', type=int, default=1000)
+    parser.add_argument('--reference-population', type=int, default=200,
+                        help='Population for the Python loop (extrapolated to --population)')
+    args = parser.parse_args()
+
+    random.seed(0)
+    genomes = generate_population(args.population, neural_mode='pure', time_encoding='none')
+    fitness = [random.random() * 100 for _ in genomes]
+
+    ref = genomes[:args.reference_population]
+    start = time.perf_counter()
+    pairwise_distances(ref)
+    loop = time.perf_counter() - start
+    # Pair count grows as n^2
+    loop_extrapolated = loop * (args.population / len(ref)) ** 2
+    print(f"Population: {args.population}")
+    print(
+        f"  pairwise loop (n={len(ref)}): {loop * 1000:10.1f} ms  "
+        f"(~{loop_extrapolated * 1000:.0f} ms at n={args.population})"
+    )
+
+    start = time.perf_counter()
+    apply_fitness_sharing(genomes, fitness)
+    vectorized = time.perf_counter() - start
+    speedup = loop_extrapolated / vectorized
+    print(f"  vectorized (n={args.population}):   {vectorized * 1000:10.1f} ms  ({speedup:.0f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark: binary frame format vs zlib-compressed JSON.
+
+Simulates a batch with frame recording, then compares per-creature encode
+time (tensor -> stored blob), decode time (blob -> API JSON rows) and stored
+size for node frames.
+
+Usage (from backend/):
+    python benchmarks/bench_frame_codec.py
+    python benchmarks/bench_frame_codec.py --creatures 200 --duration 10
+"""
+
+import argparse
+import json
+import sys
+import time
+import zlib
+from pathlib import Path
+
+# Allow running as a plain script from backend/
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import torch
+
+from app.genetics.population import generate_population
+from app.services.pytorch_simulator import _safe_float
+from app.simulation.fitness import FitnessConfig, initialize_fitness_state, initialize_pellets
+from app.simulation.frame_codec import decode_node_frames, encode_node_frames
+from app.simulation.physics import simulate_with_fitness
+from app.simulation.tensors import creature_genomes_to_batch
+
+
+def json_encode(frames: torch.Tensor, frame_dt: float) -> bytes:
+    """Legacy path: tensor -> Python float rows -> JSON -> zlib."""
+    rows = []
+    for f_idx in range(frames.shape[0]):
+        row = [_safe_float(f_idx * frame_dt)]
+        for pos in frames[f_idx].cpu().tolist():
+            row.extend([_safe_float(pos[0]), _safe_float(pos[1]), _safe_float(pos[2])])
+        rows.append(row)
+    return zlib.compress(json.dumps(rows).encode())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--creatures', type=int, default=100)
+    parser.add_argument('--duration', type=float, default=8.0, help='Simulated seconds')
+    args = parser.parse_args()
+
+    genomes = generate_population(args.creatures)
+    batch = creature_genomes_to_batch(genomes)
+    pellets = initialize_pellets(batch, seed=0)
+    state = initialize_fitness_state(batch, pellets)
+    dt = 1 / 60
+    frame_interval = 4
+    result = simulate_with_fitness(
+        batch, pellets, state, int(args.duration / dt), FitnessConfig(),
+        dt=dt, record_frames=True, frame_interval=frame_interval,
+    )
+    frames = result['frames']  # [B, F, N, 3]
+    frame_dt = frame_interval * dt
+    creatures, frames_per_creature, nodes = frames.shape[:3]
+    print(f"Creatures: {creatures} | frames/creature: {frames_per_creature} | nodes: {nodes}")
+
+    start = time.perf_counter()
+    legacy = [json_encode(frames[i], frame_dt) for i in range(frames.shape[0])]
+    legacy_encode = time.perf_counter() - start
+    start = time.perf_counter()
+    for blob in legacy:
+        json.loads(zlib.decompress(blob))
+    legacy_decode = time.perf_counter() - start
+
+    print(f"{'format':>16} {'encode ms':>10} {'decode ms':>10} {'bytes/creature':>15}")
+    print(f"{'zlib json':>16} {legacy_encode * 1000:>10.1f} {legacy_decode * 1000:>10.1f} "
+          f"{sum(map(len, legacy)) / len(legacy):>15.0f}")
+
+    for precision in ('float32', 'float16'):
+        for delta in (False, True):
+            start = time.perf_counter()
+            frames_np = frames.cpu().numpy()
+            blobs = [
+                encode_node_frames(frames_np[i], frame_dt, precision, delta)
+                for i in range(frames_np.shape[0])
+            ]
+            encode = time.perf_counter() - start
+            start = time.perf_counter()
+            for blob in blobs:
+                decode_node_frames(blob)
+            decode = time.perf_counter() - start
+
+            label = f"{precision}{'+delta' if delta else ''}"
+            print(f"{label:>16} {encode * 1000:>10.1f} {decode * 1000:>10.1f} "
+                  f"{sum(map(len, blobs)) / len(blobs):>15.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark: frame recording cost (time and peak memory).
+
+Each scenario runs in a fresh Python process so peak RSS is comparable:
+- none:          no recording (baseline)
+- all:           every creature recorded
+- sparse-end:    every creature recorded, frames kept for top + bottom only
+- sparse-replay: no recording, then top + bottom re-simulated with frames
+
+Usage (from backend/):
+    python benchmarks/bench_frame_recording.py
+    python benchmarks/bench_frame_recording.py --population 1000 --duration 10
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Allow running as a plain script from backend/
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+SCENARIOS = {
+    'none': {'frame_storage_mode': 'none'},
+    'all': {'frame_storage_mode': 'all'},
+    'sparse-end': {'frame_storage_mode': 'sparse'},
+    'sparse-replay': {'frame_storage_mode': 'sparse', 'sparse_frame_replay': True},
+}
+
+
+def child(args: argparse.Namespace) -> None:
+    """One scenario: simulate one batch, report time and peak RSS."""
+    import random
+
+    import torch
+
+    from app.genetics.population import generate_population
+    from app.schemas.simulation import SimulationConfig
+    from app.services.pytorch_simulator import PyTorchSimulator
+
+    random.seed(0)
+    genomes = generate_population(args.population, neural_mode='pure', time_encoding='none')
+    config = SimulationConfig(
+        neural_mode='pure', time_encoding='none', simulation_duration=args.duration, pellet_seed=0,
+        frame_format='binary', **SCENARIOS[args.scenario],
+    )
+    simulator = PyTorchSimulator(torch.device('cpu'))
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    start = time.perf_counter()
+    results = simulator.simulate_batch(genomes, config)
+    elapsed = time.perf_counter() - start
+
+    print(json.dumps({
+        'seconds': elapsed,
+        'peak_mb': (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before) / 1024,
+        'with_frames': sum(r.frames_encoded is not None for r in results),
+    }))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--population', type=int, default=1000, help='Creatures per batch')
+    parser.add_argument('--duration', type=float, default=10.0, help='Simulated seconds per batch')
+    parser.add_argument('--scenario', choices=list(SCENARIOS), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.scenario:
+        child(args)
+        return
+
+    print(
+        f"Frame recording | population: {args.population} | {args.duration}s simulated | "
+        "binary frames"
+    )
+    print(f"  {'scenario':<14} {'time':>8} {'peak RSS growth':>16} {'with frames':>12}")
+    for scenario in SCENARIOS:
+        cmd = [
+            sys.executable, __file__, '--scenario', scenario,
+            '--population', str(args.population), '--duration', str(args.duration),
+        ]
+        out = subprocess.run(cmd, capture_output=True, text=True, check=True).stdout
+        r = json.loads(out.strip().splitlines()[-1])
+        print(
+            f"  {scenario:<14} {r['seconds']:7.2f}s {r['peak_mb']:13.0f} MB "
+            f"{r['with_frames']:12d}"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Benchmark: genome dict -> CreatureBatch packing (creature_genomes_to_batch).
+
+Usage (from backend/):
+    python benchmarks/bench_genome_packing.py
+    python benchmarks/bench_genome_packing.py --population 5000 --repeats 10
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Allow running as a plain script from backend/
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import torch  # noqa: E402
+
+from app.genetics.population import generate_population  # noqa: E402
+from app.simulation.tensors import creature_genomes_to_batch  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--population', type=int, default=1000, help='Genomes per batch')
+    parser.add_argument('--repeats', type=int, default=5, help='Timed packings')
+    parser.add_argument('--device', default='cpu', help='Target device')
+    args = parser.parse_args()
+
+    random.seed(0)
+    genomes = generate_population(args.population, neural_mode='pure', time_encoding='none')
+    device = torch.device(args.device)
+    creature_genomes_to_batch(genomes, device)  # Warm-up
+
+    start = time.perf_counter()
+    for _ in range(args.repeats):
+        creature_genomes_to_batch(genomes, device)
+    if device.type == 'cuda':
+        torch.cuda.synchronize()
+    elapsed = (time.perf_counter() - start) / args.repeats
+
+    print(f"Genome packing | population: {args.population} | device: {device}")
+    per_genome_us = elapsed / args.population * 1e6
+    print(f"  {elapsed * 1000:8.1f} ms per batch  ({per_genome_us:.1f} us per genome)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark: NEAT forward_full, Numba kernel vs per-genome dict loop.
+
+forward_full runs on every NN tick in 'neat' mode. This compares the packed
+Numba path (one call returning hidden + outputs) against the per-genome
+dict-based loop it replaces, at several batch sizes.
+
+Usage (from backend/):
+    python benchmarks/bench_neat_forward_full.py
+    python benchmarks/bench_neat_forward_full.py --batch-sizes 100 500 2000 --calls 200
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Allow running as a plain script from backend/
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import torch
+
+from app.genetics.neat_mutation import mutate_neat_genome
+from app.neural.neat_network import NEATBatchedNetwork, create_minimal_neat_genome
+from app.schemas.neat import InnovationCounter
+from app.simulation.tensors import MAX_MUSCLES
+
+INPUT_SIZE = 7
+
+
+def make_network(batch_size: int, mutations: int) -> NEATBatchedNetwork:
+    """Build a batch of NEAT networks with some evolved hidden structure."""
+    counter = InnovationCounter()
+    genomes = []
+    num_muscles = []
+    for _ in range(batch_size):
+        outputs = random.randint(3, MAX_MUSCLES)
+        genome = create_minimal_neat_genome(INPUT_SIZE, outputs, innovation_counter=counter)
+        for _ in range(random.randint(0, mutations)):
+            genome = mutate_neat_genome(genome, counter)
+        genomes.append(genome)
+        num_muscles.append(outputs)
+    return NEATBatchedNetwork(genomes, num_muscles, max_muscles=MAX_MUSCLES, max_hidden=16)
+
+
+def time_calls(fn, calls: int) -> float:
+    """Return mean seconds per call."""
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[100, 500, 2000])
+    parser.add_argument('--calls', type=int, default=50, help='forward_full calls per measurement')
+    parser.add_argument(
+        '--mutations', type=int, default=20, help='Max structural mutations per genome'
+    )
+    args = parser.parse_args()
+
+    random.seed(0)
+    print(f"calls: {args.calls} | mutations: 0-{args.mutations}")
+    print(f"{'batch':>8} {'loop ms/call':>14} {'numba ms/call':>14} {'speedup':>8}")
+
+    for batch_size in args.batch_sizes:
+        network = make_network(batch_size, args.mutations)
+        inputs = torch.randn(batch_size, INPUT_SIZE)
+        inputs_cpu = inputs.numpy()
+
+        # Warm-up (triggers JIT compilation of both kernels)
+        network.forward_full(inputs)
+
+        loop = time_calls(
+            lambda: network._forward_full_loop(inputs, inputs_cpu), max(1, args.calls // 10)
+        )
+        numba = time_calls(lambda: network.forward_full(inputs), args.calls)
+        print(f"{batch_size:>8} {loop * 1000:>14.2f} {numba * 1000:>14.3f} {loop / numba:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark: NEAT speciation (assign_species with NEAT compatibility distance).
+
+Compares, on a population of mutated NEAT genomes:
+- per-pair distance with NEATGenome validation + innovation dicts on every call
+- per-pair distance on cached compiled genomes
+- the batched one-vs-many representatives kernel (create_neat_distance_fn)
+
+Usage (from backend/):
+    python benchmarks/bench_neat_speciation.py
+    python benchmarks/bench_neat_speciation.py --population 2000 --threshold 0.5
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Allow running as a plain script from backend/
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.genetics.neat_distance import create_neat_distance_fn, neat_genome_distance_from_dict
+from app.genetics.neat_mutation import mutate_neat_genome
+from app.genetics.speciation import assign_species
+from app.neural.neat_network import create_minimal_neat_genome
+from app.schemas.neat import InnovationCounter
+
+
+def make_population(size: int, max_mutations: int) -> list[dict]:
+    """NEAT creature genomes with a spread of topologies."""
+    counter = InnovationCounter()
+    base = create_minimal_neat_genome(input_size=8, output_size=6, innovation_counter=counter)
+    genomes = []
+    for i in range(size):
+        genome = base
+        for _ in range(random.randint(0, max_mutations)):
+            genome = mutate_neat_genome(genome, counter)
+        genomes.append({'id': f'creature_{i}', 'neatGenome': genome.model_dump()})
+    return genomes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--population', type=int, default=1000)
+    parser.add_argument('--threshold', type=float, default=0.3, help='Compatibility threshold')
+    parser.add_argument('--mutations', type=int, default=8, help='Max mutation rounds per genome')
+    args = parser.parse_args()
+
+    random.seed(0)
+    genomes = make_population(args.population, args.mutations)
+    fitness = [random.random() for _ in genomes]
+
+    start = time.perf_counter()
+    reference = assign_species(
+        genomes, fitness, args.threshold, distance_fn=neat_genome_distance_from_dict
+    )
+    per_pair = time.perf_counter() - start
+    print(f"Population: {args.population} | species: {len(reference)}")
+    print(f"  per-pair validation: {per_pair * 1000:10.1f} ms")
+
+    expected = [[g['id'] for g in s.members] for s in reference]
+
+    # Wrapping the distance function hides it from the batched path
+    compiled_fn = create_neat_distance_fn()
+    start = time.perf_counter()
+    cached = assign_species(
+        genomes, fitness, args.threshold, distance_fn=lambda a, b: compiled_fn(a, b)
+    )
+    compiled = time.perf_counter() - start
+    assert [[g['id'] for g in s.members] for s in cached] == expected
+    print(f"  compiled per-pair:   {compiled * 1000:10.1f} ms  ({per_pair / compiled:.1f}x)")
+
+    start = time.perf_counter()
+    batched_species = assign_species(
+        genomes, fitness, args.threshold, distance_fn=create_neat_distance_fn()
+    )
+    batched = time.perf_counter() - start
+    assert [[g['id'] for g in s.members] for s in batched_species] == expected
+    print(f"  batched kernel:      {batched * 1000:10.1f} ms  ({per_pair / batched:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark: NEAT Numba kernel cold start vs warm-up.
+
+Each scenario runs in a fresh Python process, like an API or NAS worker
+start, and times the first NEAT simulation of a small (sequential kernel)
+and a large (parallel kernel) population, then a second one for reference:
+- cold:    empty kernel cache, no warm-up (JIT on the first simulation)
+- warm-up: empty kernel cache, warm_up_numba_kernels() at startup (compiles)
+- cached:  warm-up again with the cache the previous process left on disk
+
+Usage (from backend/):
+    python benchmarks/bench_numba_warmup.py
+    python benchmarks/bench_numba_warmup.py --small 50 --large 500 --duration 2
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Allow running as a plain script from backend/
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+def child(args: argparse.Namespace) -> None:
+    """One process start: optional warm-up, then first/second simulation latency."""
+    import random
+
+    import torch
+
+    from app.genetics.population import generate_population
+    from app.neural.neat_network import NEATBatchedNetwork, warm_up_numba_kernels
+    from app.schemas.neat import InnovationCounter
+    from app.schemas.simulation import SimulationConfig
+    from app.services.pytorch_simulator import PyTorchSimulator
+
+    report = {'warmup_s': 0.0}
+    if args.warm_up:
+        start = time.perf_counter()
+        warm_up_numba_kernels()
+        report['warmup_s'] = time.perf_counter() - start
+
+    random.seed(0)
+    simulator = PyTorchSimulator(torch.device('cpu'))
+    config = SimulationConfig(neural_mode='neat', simulation_duration=args.duration)
+    assert args.small < NEATBatchedNetwork.NUMBA_PARALLEL_THRESHOLD <= args.large
+
+    for label, size in (('small', args.small), ('large', args.large)):
+        genomes = generate_population(
+            size, neural_mode='neat', use_neat=True, innovation_counter=InnovationCounter()
+        )
+        for run in ('first', 'second'):
+            start = time.perf_counter()
+            simulator.simulate_batch(genomes, config)
+            report[f'{label}_{run}_s'] = time.perf_counter() - start
+
+    print(json.dumps(report))
+
+
+def run_child(args: argparse.Namespace, cache_dir: str, warm_up: bool) -> dict:
+    cmd = [
+        sys.executable, __file__, '--child',
+        '--small', str(args.small), '--large', str(args.large), '--duration', str(args.duration),
+    ]
+    if warm_up:
+        cmd.append('--warm-up')
+    env = dict(os.environ, NUMBA_CACHE_DIR=cache_dir)
+    start = time.perf_counter()
+    out = subprocess.run(cmd, env=env, capture_output=True, text=True, check=True).stdout
+    report = json.loads(out.strip().splitlines()[-1])
+    report['process_s'] = time.perf_counter() - start
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--small', type=int, default=50,
+                        help='Population below the parallel threshold')
+    parser.add_argument('--large', type=int, default=500,
+                        help='Population at/above the parallel threshold')
+    parser.add_argument('--duration', type=float, default=2.0,
+                        help='Simulated seconds per batch')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--warm-up', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args)
+        return
+
+    print(
+        f"NEAT simulation latency | small: {args.small} | large: {args.large} | "
+        f"{args.duration}s simulated"
+    )
+    print(
+        f"  {'scenario':<8} {'warm-up':>9} {'small 1st':>10} {'small 2nd':>10} "
+        f"{'large 1st':>10} {'large 2nd':>10} {'process':>9}"
+    )
+    with tempfile.TemporaryDirectory() as cold_dir, tempfile.TemporaryDirectory() as warm_dir:
+        scenarios = (
+            ('cold', cold_dir, False), ('warm-up', warm_dir, True), ('cached', warm_dir, True),
+        )
+        for scenario, cache_dir, warm_up in scenarios:
+            r = run_child(args, cache_dir, warm_up)
+            print(
+                f"  {scenario:<8} {r['warmup_s']:8.2f}s {r['small_first_s']:9.2f}s "
+                f"{r['small_second_s']:9.2f}s {r['large_first_s']:9.2f}s "
+                f"{r['large_second_s']:9.2f}s {r['process_s']:8.2f}s"
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark: dict genome operators vs PopulationArrays (structure of arrays).
+
+Times one generation's worth of offspring (mutation + uniform crossover) and
+packing for the simulator, on genome dicts and on PopulationArrays.
+
+Usage (from backend/):
+    python benchmarks/bench_population_arrays.py
+    python benchmarks/bench_population_arrays.py --population 2000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Allow running as a plain script from backend/
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np  # noqa: E402
+
+from app.genetics.crossover import uniform_crossover  # noqa: E402
+from app.genetics.mutation import MutationConfig, mutate_genome  # noqa: E402
+from app.genetics.population import generate_population  # noqa: E402
+from app.genetics.population_arrays import PopulationArrays  # noqa: E402
+from app.simulation.tensors import creature_genomes_to_batch  # noqa: E402
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--population', type=int, default=1000,
+                        help='Genomes (and children) per generation')
+    args = parser.parse_args()
+
+    random.seed(0)
+    genomes = generate_population(args.population, neural_mode='pure', time_encoding='none')
+    config = MutationConfig(structural_rate=0.0)
+    rng = np.random.default_rng(0)
+    first = rng.integers(0, args.population, args.population)
+    second = rng.integers(0, args.population, args.population)
+    population = PopulationArrays.from_genomes(genomes)
+
+    rows = [
+        ('mutate',
+         lambda: [mutate_genome(g, config) for g in genomes],
+         lambda: population.mutate(rng, config)),
+        ('crossover',
+         lambda: [uniform_crossover(genomes[a], genomes[b]) for a, b in zip(first, second)],
+         lambda: population.crossover(first, second, rng)),
+        ('pack for simulator',
+         lambda: creature_genomes_to_batch(genomes),
+         lambda: population.to_batch()),
+    ]
+
+    print(f"Population operators | population: {args.population} | pure mode")
+    print(f"  {'operation':<20} {'dicts':>9} {'arrays':>9}")
+    for name, dict_op, array_op in rows:
+        print(f"  {name:<20} {timed(dict_op) * 1000:7.1f}ms {timed(array_op) * 1000:7.1f}ms")
+    from_genomes = timed(lambda: PopulationArrays.from_genomes(genomes))
+    print(f"  {'(from_genomes)':<20} {'':>9} {from_genomes * 1000:7.1f}ms")
+    print(f"  {'(to_genomes)':<20} {'':>9} {timed(population.to_genomes) * 1000:7.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Benchmark: result marshalling in PyTorchSimulator.simulate_batch.
+
+Compares the previous per-creature loop (.item() per scalar, .cpu().tolist()
+per frame, _safe_float(v.item()) per activation value) against the bulk
+marshalling stage (one sanitized host copy per result tensor), on synthetic
+simulation outputs of realistic shape. Physics is not run, so the numbers
+isolate post-processing.
+
+Usage (from backend/):
+    python benchmarks/bench_result_marshalling.py
+    python benchmarks/bench_result_marshalling.py --creatures 1000 --frames 300 --device cuda:0
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Allow running as a plain script from backend/
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import torch
+
+from app.core.device import get_best_device
+from app.genetics.population import generate_population
+from app.schemas.simulation import (
+    FitnessBreakdown,
+    PelletResult,
+    SimulationConfig,
+    SimulationResult,
+)
+from app.services.pytorch_simulator import PyTorchSimulator, _safe_float
+from app.simulation.fitness import FitnessConfig, initialize_fitness_state, initialize_pellets
+from app.simulation.tensors import creature_genomes_to_batch
+
+
+def legacy_marshal(genomes, fitness_config, result, fitness_values, fitness_state, pellet_batch,
+                   freq_violations, initial_com, total_activation, simulation_time,
+                   frame_interval, dt):
+    """The per-creature loop simulate_batch used before bulk marshalling (JSON frames)."""
+    results = []
+    for i in range(len(genomes)):
+        disqualified_reason = None
+        if freq_violations[i]:
+            disqualified_reason = "frequency_exceeded"
+        elif torch.any(torch.isnan(result['final_positions'][i])):
+            disqualified_reason = "physics_explosion"
+
+        final_com = result['final_com'][i]
+        displacement = final_com[[0, 2]] - initial_com[i][[0, 2]]
+        net_displacement = _safe_float(torch.norm(displacement).item())
+        distance_traveled = _safe_float(fitness_state.distance_traveled[i].item())
+        pellets_collected = int(pellet_batch.total_collected[i].item())
+        num_muscles_i = len(genomes[i].get("muscles", []))
+        avg_activation = total_activation[i].item() / (simulation_time * max(num_muscles_i, 1))
+
+        frames_tensor = result['frames'][i]
+        frames = []
+        for f_idx in range(frames_tensor.shape[0]):
+            frame_data = [_safe_float(f_idx * frame_interval * dt)]
+            for pos in frames_tensor[f_idx].cpu().tolist():
+                frame_data.extend([_safe_float(pos[0]), _safe_float(pos[1]), _safe_float(pos[2])])
+            frames.append(frame_data)
+
+        fitness_over_time = [_safe_float(f.item()) for f in result['fitness_per_frame'][i]]
+
+        act = result['activations_per_frame']
+        activations = []
+        for f in range(act['inputs'].shape[1]):
+            activations.append({
+                'inputs': [_safe_float(v.item()) for v in act['inputs'][i][f]],
+                'hidden': [_safe_float(v.item()) for v in act['hidden'][i][f]],
+                'outputs': [_safe_float(v.item()) for v in act['outputs'][i][f]],
+            })
+
+        pos = pellet_batch.positions[i].cpu().tolist()
+        results.append(SimulationResult(
+            genome_id=genomes[i]["id"],
+            fitness=_safe_float(fitness_values[i].item()),
+            pellets_collected=pellets_collected,
+            disqualified=disqualified_reason is not None,
+            disqualified_reason=disqualified_reason,
+            fitness_breakdown=FitnessBreakdown(
+                progress=_safe_float(net_displacement * fitness_config.distance_per_unit),
+                efficiency_penalty=_safe_float(
+                    (avg_activation / 60) * 10 * fitness_config.efficiency_penalty
+                ),
+            ),
+            net_displacement=net_displacement,
+            distance_traveled=distance_traveled,
+            total_activation=_safe_float(total_activation[i].item()),
+            frame_count=len(frames),
+            frames=frames,
+            pellets=[PelletResult(id="pellet_0", position={"x": pos[0], "y": pos[1], "z": pos[2]},
+                                  spawned_at_frame=0, initial_distance=5.0)],
+            fitness_over_time=fitness_over_time,
+            activations_per_frame=activations,
+        ))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--device', default=None, help='PyTorch device (default: best available)')
+    parser.add_argument('--creatures', type=int, default=1000)
+    parser.add_argument('--frames', type=int, default=300)
+    parser.add_argument('--inputs', type=int, default=20)
+    parser.add_argument('--hidden', type=int, default=8)
+    parser.add_argument('--outputs', type=int, default=12)
+    args = parser.parse_args()
+
+    device = torch.device(args.device) if args.device else get_best_device()
+    num_creatures, num_frames = args.creatures, args.frames
+
+    genomes = generate_population(num_creatures, neural_mode='pure', time_encoding='none')
+    batch = creature_genomes_to_batch(genomes, device=device)
+    pellets = initialize_pellets(batch, seed=0)
+    state = initialize_fitness_state(batch, pellets)
+    num_nodes = batch.positions.shape[1]
+
+    result = {
+        'final_positions': batch.positions,
+        'final_com': torch.randn(num_creatures, 3, device=device),
+        'frames': torch.randn(num_creatures, num_frames, num_nodes, 3, device=device),
+        'fitness_per_frame': torch.rand(num_creatures, num_frames, device=device) * 100,
+        'activations_per_frame': {
+            'inputs': torch.randn(num_creatures, num_frames, args.inputs, device=device),
+            'hidden': torch.randn(num_creatures, num_frames, args.hidden, device=device),
+            'outputs': torch.randn(num_creatures, num_frames, args.outputs, device=device),
+        },
+    }
+    common = dict(
+        genomes=genomes,
+        fitness_config=FitnessConfig(),
+        result=result,
+        fitness_values=torch.rand(num_creatures, device=device) * 100,
+        fitness_state=state,
+        pellet_batch=pellets,
+        freq_violations=torch.zeros(num_creatures, dtype=torch.bool, device=device),
+        initial_com=torch.zeros(num_creatures, 3, device=device),
+        total_activation=torch.rand(num_creatures, device=device),
+        simulation_time=10.0,
+        frame_interval=4,
+        dt=1 / 120,
+    )
+    activation_values = num_creatures * num_frames * (args.inputs + args.hidden + args.outputs)
+    print(f"Device: {device} | creatures: {num_creatures} | frames: {num_frames} | "
+          f"nodes: {num_nodes} | activation values: {activation_values:,}")
+
+    start = time.perf_counter()
+    legacy_marshal(**common)
+    legacy = time.perf_counter() - start
+    print(f"  per-creature loop: {legacy * 1000:10.1f} ms")
+
+    simulator = PyTorchSimulator(device)
+    for frame_format in ('json', 'binary'):
+        config = SimulationConfig(frame_storage_mode='all', frame_format=frame_format)
+        start = time.perf_counter()
+        simulator._marshal_results(
+            config=config,
+            initial_pellet_positions=pellets.positions,
+            initial_pellet_distances=pellets.initial_distances,
+            num_muscles=[len(g.get('muscles', [])) for g in genomes],
+            use_neural=True,
+            **common,
+        )
+        bulk = time.perf_counter() - start
+        print(f"  bulk ({frame_format:>6}):    {bulk * 1000:10.1f} ms  ({legacy / bulk:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
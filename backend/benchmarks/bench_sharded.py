@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark: PyTorchSimulator vs ShardedSimulator on CPU.
+
+Times simulate_batch for one process (torch using every CPU) against
+ShardedSimulator with several worker counts (CPUs split between workers),
+for pure and NEAT populations. Worker start-up is reported separately.
+
+Usage (from backend/):
+    python benchmarks/bench_sharded.py
+    python benchmarks/bench_sharded.py --population 1000 --workers 2 4 8
+    python benchmarks/bench_sharded.py --modes neat --duration 5
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+# Allow running as a plain script from backend/
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import torch
+
+from app.genetics.population import generate_population
+from app.schemas.neat import InnovationCounter
+from app.schemas.simulation import SimulationConfig
+from app.services.pytorch_simulator import PyTorchSimulator
+from app.services.sharded_simulator import ShardedSimulator
+
+
+def time_batches(simulator, genomes: list[dict], config: SimulationConfig, repeats: int) -> float:
+    """Mean seconds per simulate_batch (after one untimed warm-up batch)."""
+    simulator.simulate_batch(genomes, config)
+    start = time.perf_counter()
+    for _ in range(repeats):
+        simulator.simulate_batch(genomes, config)
+    return (time.perf_counter() - start) / repeats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--population', type=int, default=500, help='Creatures per batch')
+    parser.add_argument('--workers', type=int, nargs='+', default=[2, 4],
+                        help='Worker counts to test')
+    parser.add_argument('--modes', nargs='+', default=['pure', 'neat'], choices=['pure', 'neat'])
+    parser.add_argument('--duration', type=float, default=3.0, help='Simulated seconds per batch')
+    parser.add_argument('--repeats', type=int, default=3, help='Timed batches per measurement')
+    args = parser.parse_args()
+
+    cpus = os.cpu_count() or 1
+    print(
+        f"CPU sharding | population: {args.population} | {args.duration}s simulated | {cpus} CPUs"
+    )
+
+    for mode in args.modes:
+        random.seed(0)
+        genomes = generate_population(
+            args.population,
+            neural_mode=mode,
+            use_neat=mode == 'neat',
+            innovation_counter=InnovationCounter(),
+        )
+        config = SimulationConfig(
+            neural_mode=mode, simulation_duration=args.duration, pellet_seed=0
+        )
+
+        single = time_batches(PyTorchSimulator(torch.device('cpu')), genomes, config, args.repeats)
+        rate = args.population / single
+        print(f"\n  {mode}: 1 process      {single:7.2f}s/batch  {rate:8.0f} creatures/s")
+
+        for n_workers in args.workers:
+            start = time.perf_counter()
+            with ShardedSimulator(n_workers=n_workers) as sharded:
+                startup = time.perf_counter() - start
+                elapsed = time_batches(sharded, genomes, config, args.repeats)
+            print(
+                f"  {mode}: {n_workers:2d} workers     {elapsed:7.2f}s/batch  "
+                f"{args.population / elapsed:8.0f} creatures/s"
+                f"  ({single / elapsed:.2f}x, start-up {startup:.1f}s)"
+            )
+
+
+if __name__ == '__main__':
+    main()
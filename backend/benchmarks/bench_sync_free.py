@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark: sync-free vs default step loop in simulate_with_fitness_neural.
+
+Measures physics steps/sec for the default loop (data-dependent .any()
+branches, one host/device sync per branch per step) against the sync-free
+loop (masked tensor ops only) at several batch sizes.
+
+Usage (from backend/):
+    python benchmarks/bench_sync_free.py
+    python benchmarks/bench_sync_free.py --device cuda:0 --steps 600
+    python benchmarks/bench_sync_free.py --batch-sizes 100 1000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Allow running as a plain script from backend/
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import torch
+
+from app.core.device import get_best_device
+from app.genetics.population import generate_population
+from app.neural.network import BatchedNeuralNetwork, NeuralConfig
+from app.simulation.fitness import FitnessConfig, initialize_fitness_state, initialize_pellets
+from app.simulation.physics import simulate_with_fitness_neural
+from app.simulation.tensors import MAX_MUSCLES, creature_genomes_to_batch
+
+
+def _synchronize(device: torch.device) -> None:
+    if device.type == 'cuda':
+        torch.cuda.synchronize(device)
+
+
+def run_once(genomes: list[dict], device: torch.device, num_steps: int, sync_free: bool) -> float:
+    """Run one simulation and return elapsed seconds (setup excluded)."""
+    batch = creature_genomes_to_batch(genomes, device=device)
+    pellets = initialize_pellets(batch, arena_size=10.0, seed=42)
+    state = initialize_fitness_state(batch, pellets)
+    network = BatchedNeuralNetwork.from_genomes(
+        neural_genomes=[g['neuralGenome'] for g in genomes],
+        num_muscles=[len(g['muscles']) for g in genomes],
+        config=NeuralConfig(neural_mode='pure', time_encoding='none'),
+        max_muscles=MAX_MUSCLES,
+        device=device,
+    )
+
+    _synchronize(device)
+    start = time.perf_counter()
+    simulate_with_fitness_neural(
+        batch=batch,
+        neural_network=network,
+        pellets=pellets,
+        fitness_state=state,
+        num_steps=num_steps,
+        fitness_config=FitnessConfig(),
+        mode='pure',
+        dt=1 / 30,
+        arena_size=10.0,
+        time_encoding='none',
+        sync_free=sync_free,
+    )
+    _synchronize(device)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--device', default=None, help='PyTorch device (default: best available)')
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[100, 1000, 10000])
+    parser.add_argument('--steps', type=int, default=300, help='Physics steps per run')
+    parser.add_argument(
+        '--repeats', type=int, default=3, help='Timed runs per configuration (best is reported)'
+    )
+    args = parser.parse_args()
+
+    device = torch.device(args.device) if args.device else get_best_device()
+    print(f"Device: {device} | steps/run: {args.steps} | repeats: {args.repeats}")
+    print(f"{'batch':>8} {'default steps/s':>16} {'sync-free steps/s':>18} {'speedup':>8}")
+
+    for batch_size in args.batch_sizes:
+        genomes = generate_population(batch_size, neural_mode='pure', time_encoding='none')
+
+        # Warm-up (allocator, kernels) with a short run of each mode
+        run_once(genomes, device, 10, sync_free=False)
+        run_once(genomes, device, 10, sync_free=True)
+
+        default = min(run_once(genomes, device, args.steps, False) for _ in range(args.repeats))
+        sync_free = min(run_once(genomes, device, args.steps, True) for _ in range(args.repeats))
+
+        default_sps = args.steps / default
+        sync_free_sps = args.steps / sync_free
+        speedup = default / sync_free
+        print(f"{batch_size:>8} {default_sps:>16.1f} {sync_free_sps:>18.1f} {speedup:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
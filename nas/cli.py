@@ -35,6 +35,8 @@ def run(
     quiet: bool = typer.Option(False, "--quiet", "-q", help="Minimal output"),
     batched: bool = typer.Option(True, "--batched/--no-batched", "-b", help="Batch all seeds together (1.4-1.6x faster)"),
     sparse_store: bool = typer.Option(False, "--sparse-store", help="Store frames for top 10 + bottom 10 creatures (for replays)"),
+    shards: int = typer.Option(0, "--shards", help="Split every batch across N worker processes (CPU, runs seeds sequentially)"),
+    profile: bool = typer.Option(False, "--profile", help="Record phase timings per generation (runs seeds sequentially; see 'nas profile')"),
 ):
     """
     Run evolution experiment with specified config.
@@ -42,6 +44,8 @@ def run(
     Examples:
         nas run --config neat_baseline --generations 100 --seeds 3
         nas run -c neat_sparse -g 50 -s 1 --population-size 500
+        nas run -c neat_baseline -p 1000 --shards 8
+        nas run -c neat_baseline -g 20 -s 1 --profile
     """
     import torch
     from configs import get_config, list_configs, CONFIGS
@@ -86,12 +90,18 @@ def run(
     console.print(f"  Population: {cfg['population_size']}")
     console.print(f"  Seeds: {seed_list}")
     console.print(f"  Mode: {cfg.get('neural_mode', 'pure')}")
-    console.print(f"  Batched: {batched}")
+    console.print(f"  Batched: {batched and not shards and not profile}")
+    if shards:
+        console.print(f"  Shards: {shards}")
     console.print()
 
     results = []
+    simulator = None
+    if shards:
+        from app.services.sharded_simulator import ShardedSimulator
+        simulator = ShardedSimulator(n_workers=shards, device=torch_device or 'cpu')
 
-    if batched and len(seed_list) > 1:
+    if batched and len(seed_list) > 1 and not shards and not profile:
         # Use batched runner for better throughput
         console.print("[yellow]Using batched mode (all seeds simulated together)[/yellow]\n")
 
@@ -142,12 +152,17 @@ def run(
                 device=torch_device,
                 callback=on_generation,
                 verbose=not quiet,
+                simulator=simulator,
+                profile=profile,
             )
             results.append(result)
             writer.complete_seed(result)
 
             console.print(f"  [green]Done![/green] Best: {result.best_fitness:.1f} | Time: {result.total_time_s:.1f}s | {result.creatures_per_second:.0f} creatures/s\n")
 
+    if simulator is not None:
+        simulator.close()
+
     # Aggregate stats
     agg = get_aggregate_stats(results)
     writer.complete_all(agg)
@@ -356,6 +371,66 @@ def show(
             console.print(f"  Seed {sr.get('seed', i)}: best={sr.get('best_fitness', 0):.1f}, time={sr.get('total_time_s', 0):.1f}s")
 
 
+@app.command(name="profile")
+def profile_results(
+    config: str = typer.Argument(..., help="Config name (latest result file) or path to a result file"),
+):
+    """
+    Summarize phase timings recorded with 'nas run --profile'.
+
+    Spans are averaged over every profiled generation of every seed. With
+    --shards, physics runs in worker processes and only the main-process
+    phases are recorded.
+
+    Example:
+        nas run -c neat_baseline -g 20 -s 1 --profile
+        nas profile neat_baseline
+    """
+    from app.core.profiling import Profile
+    from results_io import RESULTS_DIR, generation_profiles, load_result
+
+    path = Path(config)
+    if not path.is_file():
+        matching = list(RESULTS_DIR.glob(f"{config}_*.json"))
+        if not matching:
+            console.print(f"[red]No results found for '{config}'[/red]")
+            raise typer.Exit(1)
+        path = sorted(matching)[-1]
+
+    profiles = generation_profiles(load_result(path))
+    if not profiles:
+        console.print(f"[yellow]No profiled generations in {path}[/yellow] (record them with 'nas run --profile')")
+        raise typer.Exit(1)
+
+    total = Profile()
+    for gen_profile in profiles:
+        total.merge(gen_profile)
+    gens = len(profiles)
+    spans = sorted(total.spans.items(), key=lambda item: item[1][0], reverse=True)
+    span_ms = sum(ms for _, (ms, _) in spans) or 1.0
+
+    table = Table(title=f"Phase timings: {path.name} ({gens} generations)")
+    table.add_column("Span", style="cyan")
+    table.add_column("ms/gen", justify="right", style="green")
+    table.add_column("Share", justify="right")
+    table.add_column("Calls/gen", justify="right")
+    table.add_column("us/call", justify="right")
+    for name, (ms, calls) in spans:
+        table.add_row(
+            name,
+            f"{ms / gens:.1f}",
+            f"{100 * ms / span_ms:.1f}%",
+            f"{calls / gens:.0f}",
+            f"{1000 * ms / calls:.1f}",
+        )
+    console.print(table)
+
+    if total.counters:
+        console.print("\n[bold]Counters (per generation):[/bold]")
+        for name, n in sorted(total.counters.items()):
+            console.print(f"  {name}: {n / gens:.1f}")
+
+
 @app.command()
 def benchmark(
     population_size: int = typer.Option(500, "--population-size", "-p", help="Population size to test"),
@@ -422,6 +497,7 @@ def search(
     stagnation_limit: int = typer.Option(50, "--stagnation-limit", help="Stop trial early if no improvement for N generations (0 to disable)"),
     n_jobs: int = typer.Option(1, "--n-jobs", "-j", help="Parallel workers (1=sequential, -1=all cores, recommended: 15-20 for 128-core)"),
     limit_threads: bool = typer.Option(False, "--limit-threads", help="Force single-threaded PyTorch (fixes nested parallelism when n_jobs > 1)"),
+    pack_trials: int = typer.Option(1, "--pack-trials", help="Simulate N trials' populations in one batch (replaces --n-jobs when > 1)"),
 ):
     """
     Run Optuna hyperparameter search.
@@ -437,6 +513,9 @@ def search(
 
         # Multi-objective Pareto search with parallelism
         nas search exp-003 -m neat -n 100 --multi-objective --n-jobs 15
+
+        # Pack 32 trials per simulation batch (saturates a many-core CPU)
+        nas search pure-packed -m pure -n 64 -g 30 --pack-trials 32
     """
     import torch
     from search import run_search, print_study_summary
@@ -456,6 +535,8 @@ def search(
     console.print(f"  Device: {torch_device}")
     console.print(f"  Multi-objective: {multi_objective}")
     console.print(f"  Parallel workers: {n_jobs if n_jobs > 0 else 'all cores'}")
+    if pack_trials > 1:
+        console.print(f"  Packed trials: {pack_trials} per simulation batch")
     if limit_threads:
         console.print(f"  Thread limiting: ENABLED (prevents nested parallelism)")
     if stagnation_limit > 0:
@@ -477,6 +558,7 @@ def search(
         stagnation_limit=stagnation_limit,
         n_jobs=n_jobs,
         limit_threads=limit_threads,
+        pack_trials=pack_trials,
     )
 
     # Print summary
@@ -39,6 +39,7 @@ def generation_stats_to_dict(stats: GenerationStats) -> dict[str, Any]:
         'worst_fitness': stats.worst_fitness,
         'simulation_time_ms': stats.simulation_time_ms,
         'evolution_time_ms': stats.evolution_time_ms,
+        **({'profile': stats.profile} if stats.profile is not None else {}),
     }
 
 
@@ -174,6 +175,24 @@ def load_result(path: str | Path) -> dict[str, Any]:
         return json.load(f)
 
 
+def generation_profiles(data: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    Collect the per-generation profiles of a result file.
+
+    Only generations recorded with profiling on (nas run --profile) have one.
+    Covers completed seeds and the in-progress seed of a partial file.
+    """
+    seed_runs = list(data.get('seed_results', []))
+    if data.get('current_seed'):
+        seed_runs.append(data['current_seed'])
+    return [
+        gen['profile']
+        for run in seed_runs
+        for gen in run.get('generations', [])
+        if gen.get('profile')
+    ]
+
+
 def list_results() -> list[dict[str, Any]]:
     """List all result files with summary info."""
     ensure_results_dir()
@@ -15,7 +15,9 @@ sys.path.insert(0, str(__import__('pathlib').Path(__file__).parent.parent / 'bac
 
 import torch
 
-from app.services.pytorch_simulator import PyTorchSimulator
+from app.core.profiling import Profile, profiling
+from app.services.pytorch_simulator import PyTorchSimulator, packing_key
+from app.services.fitness_cache import FitnessCache, fill_misses
 from app.genetics.population import (
     generate_population,
     evolve_population,
@@ -35,6 +37,8 @@ class GenerationStats:
     worst_fitness: float
     simulation_time_ms: int
     evolution_time_ms: int = 0
+    cached_count: int = 0  # Survivors whose cached result was reused
+    profile: dict | None = None  # Profile.to_dict() spans/counters (run_evolution(profile=True))
 
 
 @dataclass
@@ -49,6 +53,19 @@ class RunResult:
     creatures_per_second: float = 0.0
 
 
+def _label_offspring(genomes: list[dict], seed: int, generation: int) -> None:
+    """
+    Give new creatures ids derived from (seed, generation, index).
+
+    generate_id() draws from uuid4, which random.seed does not control, and
+    pellet streams are keyed by creature id; seeded ids keep runs reproducible.
+    Survivors keep their id.
+    """
+    for i, genome in enumerate(genomes):
+        if genome.get('survivalStreak', 0) == 0:
+            genome['id'] = f"creature_{seed}_{generation}_{i}"
+
+
 def run_evolution(
     config: dict[str, Any],
     generations: int,
@@ -57,6 +74,8 @@ def run_evolution(
     callback: Callable[[GenerationStats], None] | None = None,
     verbose: bool = True,
     stagnation_limit: int = 0,
+    simulator: PyTorchSimulator | None = None,
+    profile: bool = False,
 ) -> RunResult:
     """
     Run a complete evolution loop in memory.
@@ -69,6 +88,10 @@ def run_evolution(
         callback: Called after each generation with stats
         verbose: Print progress to console
         stagnation_limit: Stop early if no improvement for N generations (0 = disabled)
+        simulator: Reuse an existing (warm) simulator instead of creating one;
+                   its device takes precedence over `device`
+        profile: Record app.core.profiling spans/counters per generation
+                 (GenerationStats.profile)
 
     Returns:
         RunResult with all generation stats and best genome
@@ -84,10 +107,12 @@ def run_evolution(
         torch.cuda.manual_seed_all(seed)
 
     # Initialize simulator
-    simulator = PyTorchSimulator(device=device)
+    if simulator is None:
+        simulator = PyTorchSimulator(device=device)
 
     # Convert config to SimulationConfig for validation
     sim_config = SimulationConfig(**config)
+    fitness_cache = FitnessCache.from_config(sim_config)
 
     # Prepare evolution config
     use_neat = sim_config.neural_mode == 'neat'
@@ -116,6 +141,7 @@ def run_evolution(
         bias_mode=sim_config.bias_mode,
         neat_initial_connectivity=sim_config.neat_initial_connectivity,
     )
+    _label_offspring(genomes, seed, 0)
 
     # Evolution config for genetics
     evolution_config = {
@@ -176,6 +202,7 @@ def run_evolution(
         'proprioception_inputs': sim_config.proprioception_inputs,
         'neat_max_hidden_nodes': sim_config.neat_max_hidden_nodes,
         'max_muscles': sim_config.max_muscles,
+        'pellet_seed': seed if sim_config.pellet_seed is None else sim_config.pellet_seed,
     }
 
     # Run evolution
@@ -193,9 +220,16 @@ def run_evolution(
     total_start = time.time()
 
     for gen in range(generations):
-        # Simulate
+        gen_profile = Profile() if profile else None
+
+        # Simulate (survivors with a valid cached result are skipped)
         sim_start = time.time()
-        results = simulator.simulate_batch(genomes, batch_config)
+        batch_config['pellet_generation'] = fitness_cache.pellet_generation(gen)
+        cached = fitness_cache.lookup(genomes, batch_config)
+        missing = [g for g, r in zip(genomes, cached) if r is None]
+        with profiling(gen_profile):
+            results = fill_misses(cached, simulator.simulate_batch(missing, batch_config))
+        fitness_cache.store(genomes, results, batch_config)
         sim_time_ms = int((time.time() - sim_start) * 1000)
 
         # Extract fitness scores
@@ -211,6 +245,7 @@ def run_evolution(
             median_fitness=sorted_fitness[len(sorted_fitness) // 2],
             worst_fitness=sorted_fitness[-1],
             simulation_time_ms=sim_time_ms,
+            cached_count=fitness_cache.hits,
         )
 
         # Track overall best genome
@@ -236,15 +271,19 @@ def run_evolution(
         # Evolve (if not last generation)
         if gen < generations - 1:
             evo_start = time.time()
-            genomes, _ = evolve_population(
-                genomes=genomes,
-                fitness_scores=fitness_scores,
-                config=evolution_config,
-                generation=gen,
-                innovation_counter=innovation_counter,
-            )
+            with profiling(gen_profile):
+                genomes, _ = evolve_population(
+                    genomes=genomes,
+                    fitness_scores=fitness_scores,
+                    config=evolution_config,
+                    generation=gen,
+                    innovation_counter=innovation_counter,
+                )
+            _label_offspring(genomes, seed, gen + 1)
             stats.evolution_time_ms = int((time.time() - evo_start) * 1000)
 
+        if gen_profile is not None:
+            stats.profile = gen_profile.to_dict()
         gen_stats.append(stats)
 
         # Callback
@@ -253,7 +292,8 @@ def run_evolution(
 
         # Console output
         if verbose:
-            print(f"  gen {gen+1:3d}/{generations} | best: {stats.best_fitness:6.1f} | avg: {stats.avg_fitness:6.1f} | {stats.simulation_time_ms}ms")
+            cached_note = f" | {stats.cached_count} cached" if fitness_cache.enabled else ""
+            print(f"  gen {gen+1:3d}/{generations} | best: {stats.best_fitness:6.1f} | avg: {stats.avg_fitness:6.1f} | {stats.simulation_time_ms}ms{cached_note}")
 
         # Early stopping check
         if stagnation_limit > 0 and gens_since_improvement >= stagnation_limit:
@@ -812,6 +852,295 @@ def run_multi_seed_pipelined(
     return results
 
 
+def _evolution_config(sim_config: SimulationConfig) -> dict[str, Any]:
+    """Genetics settings for evolve_population (same keys as run_evolution)."""
+    return {
+        'population_size': sim_config.population_size,
+        'elite_count': sim_config.elite_count,
+        'cull_percentage': sim_config.cull_percentage,
+        'selection_method': sim_config.selection_method,
+        'tournament_size': sim_config.tournament_size,
+        'crossover_rate': sim_config.crossover_rate,
+        'use_crossover': sim_config.use_crossover,
+        'mutation_rate': sim_config.mutation_rate,
+        'mutation_magnitude': sim_config.mutation_magnitude,
+        'weight_mutation_rate': sim_config.weight_mutation_rate,
+        'weight_mutation_magnitude': sim_config.weight_mutation_magnitude,
+        'weight_mutation_decay': sim_config.weight_mutation_decay,
+        'use_neural_net': sim_config.use_neural_net,
+        'neural_hidden_size': sim_config.neural_hidden_size,
+        'neural_output_bias': sim_config.neural_output_bias,
+        'min_nodes': sim_config.min_nodes,
+        'max_nodes': sim_config.max_nodes,
+        'max_muscles': sim_config.max_muscles,
+        'max_frequency': sim_config.max_allowed_frequency,
+        'use_fitness_sharing': sim_config.use_fitness_sharing,
+        'sharing_radius': sim_config.sharing_radius,
+        'compatibility_threshold': sim_config.compatibility_threshold,
+        'min_species_size': sim_config.min_species_size,
+        'use_neat': sim_config.neural_mode == 'neat',
+        'neat_add_connection_rate': sim_config.neat_add_connection_rate,
+        'neat_add_node_rate': sim_config.neat_add_node_rate,
+        'neat_enable_rate': sim_config.neat_enable_rate,
+        'neat_disable_rate': sim_config.neat_disable_rate,
+        'neat_excess_coefficient': sim_config.neat_excess_coefficient,
+        'neat_disjoint_coefficient': sim_config.neat_disjoint_coefficient,
+        'neat_weight_coefficient': sim_config.neat_weight_coefficient,
+        'neat_max_hidden_nodes': sim_config.neat_max_hidden_nodes,
+    }
+
+
+@dataclass
+class _Lane:
+    """One (config, seed) evolution inside a packed run."""
+    config_idx: int
+    seed_idx: int
+    seed: int
+    config: dict[str, Any]
+    batch_config: SimulationConfig
+    evolution_config: dict[str, Any]
+    genomes: list[dict]
+    innovation_counter: InnovationCounter | None
+    fitness_cache: FitnessCache
+    rng_state: tuple  # (random, np.random, torch) state between this lane's evolution steps
+    stats: list[GenerationStats] = field(default_factory=list)
+    best_genome: dict | None = None
+    best_fitness: float = float('-inf')
+    best_threshold: float = float('-inf')
+    avg_threshold: float = float('-inf')
+    gens_since_improvement: int = 0
+    done: bool = False
+
+
+def _get_rng_state() -> tuple:
+    """State of the global random, np.random and torch RNGs."""
+    import random
+    import numpy as np
+
+    return random.getstate(), np.random.get_state(), torch.get_rng_state()
+
+
+def _set_rng_state(state: tuple) -> None:
+    """Restore a state from _get_rng_state."""
+    import random
+    import numpy as np
+
+    random.setstate(state[0])
+    np.random.set_state(state[1])
+    torch.set_rng_state(state[2])
+
+
+def run_packed_trials(
+    configs: list[dict[str, Any]],
+    generations: int,
+    seeds: list[int],
+    device: torch.device | None = None,
+    callback: Callable[[int, int, GenerationStats], None] | None = None,
+    verbose: bool = True,
+    stagnation_limit: int = 0,
+) -> list[list[RunResult]]:
+    """
+    Run several configs (e.g. Optuna trials) x seeds, packing their populations
+    into shared simulation batches.
+
+    Unlike run_multi_seed_batched, the configs may differ: every (config, seed)
+    pair evolves independently, and each generation all pairs whose configs
+    share a packing_key are simulated together with PyTorchSimulator.simulate_packed.
+    neural_dead_zone, muscle_velocity_cap, output_smoothing_alpha,
+    muscle_damping_multiplier and the fitness weights may vary within a batch;
+    configs that differ in time_step (or another batch-wide setting) form
+    separate batches.
+
+    Args:
+        configs: Simulation configuration dicts, one per trial
+        generations: Number of generations per run
+        seeds: List of random seeds (each config runs with every seed)
+        device: PyTorch device
+        callback: Called with (config_idx, seed_idx, stats) after each generation
+        verbose: Print progress
+        stagnation_limit: Stop a run early if no improvement for N generations (0 = disabled)
+
+    Returns:
+        One list of RunResults (one per seed) for each config, in input order
+    """
+    import random
+    import numpy as np
+
+    simulator = PyTorchSimulator(device=device)
+    improvement_margin = 1.05  # Same early-stopping rule as run_evolution
+
+    lanes: list[_Lane] = []
+    for config_idx, config in enumerate(configs):
+        sim_config = SimulationConfig(**config)
+        use_neat = sim_config.neural_mode == 'neat'
+        constraints = GenomeConstraints(
+            min_nodes=sim_config.min_nodes,
+            max_nodes=sim_config.max_nodes,
+            max_muscles=sim_config.max_muscles,
+            max_frequency=sim_config.max_allowed_frequency,
+        )
+        # Every simulation knob is honored; only frame recording is switched off.
+        # One pellet seed for every lane keeps them packable; creature ids
+        # (seeded per lane) still give each lane its own pellet streams.
+        pellet_seed = 0 if sim_config.pellet_seed is None else sim_config.pellet_seed
+        batch_config = sim_config.model_copy(
+            update={'frame_storage_mode': 'none', 'frame_rate': 15, 'pellet_seed': pellet_seed}
+        )
+        evolution_config = _evolution_config(sim_config)
+
+        for seed_idx, seed in enumerate(seeds):
+            random.seed(seed)
+            np.random.seed(seed)
+            torch.manual_seed(seed)
+
+            innovation_counter = InnovationCounter() if use_neat else None
+            genomes = generate_population(
+                size=sim_config.population_size,
+                constraints=constraints,
+                use_neural_net=sim_config.use_neural_net,
+                neural_hidden_size=sim_config.neural_hidden_size,
+                neural_output_bias=sim_config.neural_output_bias,
+                neural_mode=sim_config.neural_mode,
+                time_encoding=sim_config.time_encoding,
+                use_proprioception=sim_config.use_proprioception,
+                proprioception_inputs=sim_config.proprioception_inputs,
+                use_neat=use_neat,
+                innovation_counter=innovation_counter,
+                bias_mode=sim_config.bias_mode,
+                neat_initial_connectivity=sim_config.neat_initial_connectivity,
+            )
+            _label_offspring(genomes, seed, 0)
+            lanes.append(_Lane(
+                config_idx=config_idx,
+                seed_idx=seed_idx,
+                seed=seed,
+                config=config,
+                batch_config=batch_config,
+                evolution_config=evolution_config,
+                genomes=genomes,
+                innovation_counter=innovation_counter,
+                fitness_cache=FitnessCache.from_config(sim_config),
+                rng_state=_get_rng_state(),
+            ))
+
+    # Lanes that can share a simulation batch (fixed for the whole run)
+    packs: dict[tuple, list[_Lane]] = {}
+    for lane in lanes:
+        packs.setdefault(packing_key(lane.batch_config), []).append(lane)
+
+    if verbose:
+        print(f"Packing {len(lanes)} runs ({len(configs)} configs x {len(seeds)} seeds) into {len(packs)} batch(es)")
+
+    total_creatures = 0
+    total_start = time.time()
+
+    for gen in range(generations):
+        gen_start = time.time()
+        for pack in packs.values():
+            active = [lane for lane in pack if not lane.done]
+            if not active:
+                continue
+
+            sim_start = time.time()
+            batch_configs = [
+                lane.batch_config.model_copy(update={'pellet_generation': lane.fitness_cache.pellet_generation(gen)})
+                for lane in active
+            ]
+            cached_per_lane = [
+                lane.fitness_cache.lookup(lane.genomes, batch_config)
+                for lane, batch_config in zip(active, batch_configs)
+            ]
+            fresh_per_lane = simulator.simulate_packed([
+                ([g for g, r in zip(lane.genomes, cached) if r is None], batch_config)
+                for lane, cached, batch_config in zip(active, cached_per_lane, batch_configs)
+            ])
+            results_per_lane = [
+                fill_misses(cached, fresh) for cached, fresh in zip(cached_per_lane, fresh_per_lane)
+            ]
+            for lane, results, batch_config in zip(active, results_per_lane, batch_configs):
+                lane.fitness_cache.store(lane.genomes, results, batch_config)
+            sim_time_ms = int((time.time() - sim_start) * 1000)
+            total_creatures += sum(len(lane.genomes) for lane in active)
+
+            for lane, results in zip(active, results_per_lane):
+                fitness_scores = [r.fitness for r in results]
+                sorted_fitness = sorted(fitness_scores, reverse=True)
+                current_avg = sum(fitness_scores) / len(fitness_scores)
+
+                stats = GenerationStats(
+                    generation=gen,
+                    best_fitness=sorted_fitness[0],
+                    avg_fitness=current_avg,
+                    median_fitness=sorted_fitness[len(sorted_fitness) // 2],
+                    worst_fitness=sorted_fitness[-1],
+                    simulation_time_ms=sim_time_ms // len(active),  # Amortized
+                    cached_count=lane.fitness_cache.hits,
+                )
+
+                if sorted_fitness[0] > lane.best_fitness:
+                    lane.best_fitness = sorted_fitness[0]
+                    lane.best_genome = lane.genomes[fitness_scores.index(sorted_fitness[0])].copy()
+
+                # Early stopping: either best or avg must improve by >5%
+                improved = False
+                if sorted_fitness[0] > lane.best_threshold * improvement_margin:
+                    lane.best_threshold = sorted_fitness[0]
+                    improved = True
+                if current_avg > lane.avg_threshold * improvement_margin:
+                    lane.avg_threshold = current_avg
+                    improved = True
+                lane.gens_since_improvement = 0 if improved else lane.gens_since_improvement + 1
+                if stagnation_limit > 0 and lane.gens_since_improvement >= stagnation_limit:
+                    lane.done = True
+
+                if gen < generations - 1 and not lane.done:
+                    evo_start = time.time()
+                    # Each lane draws from its own seeded streams, as if it ran alone
+                    outer_rng_state = _get_rng_state()
+                    _set_rng_state(lane.rng_state)
+                    try:
+                        lane.genomes, _ = evolve_population(
+                            genomes=lane.genomes,
+                            fitness_scores=fitness_scores,
+                            config=lane.evolution_config,
+                            generation=gen,
+                            innovation_counter=lane.innovation_counter,
+                        )
+                    finally:
+                        lane.rng_state = _get_rng_state()
+                        _set_rng_state(outer_rng_state)
+                    _label_offspring(lane.genomes, lane.seed, gen + 1)
+                    stats.evolution_time_ms = int((time.time() - evo_start) * 1000)
+
+                lane.stats.append(stats)
+
+                if callback:
+                    callback(lane.config_idx, lane.seed_idx, stats)
+
+        if verbose:
+            running = sum(not lane.done for lane in lanes)
+            gen_ms = int((time.time() - gen_start) * 1000)
+            print(f"  gen {gen+1:3d}/{generations} | running: {running}/{len(lanes)} | {gen_ms}ms")
+
+        if all(lane.done for lane in lanes):
+            break
+
+    total_time = time.time() - total_start
+
+    results: list[list[RunResult]] = [[] for _ in configs]
+    for lane in lanes:
+        results[lane.config_idx].append(RunResult(
+            config=lane.config,
+            seed=lane.seed,
+            generations=lane.stats,
+            best_genome=lane.best_genome,
+            best_fitness=lane.best_fitness,
+            total_time_s=total_time / len(lanes),  # Amortized per run
+            creatures_per_second=total_creatures / total_time if total_time > 0 else 0,
+        ))
+    return results
+
+
 def run_parallel_configs(
     configs: list[tuple[str, dict[str, Any]]],
     generations: int,
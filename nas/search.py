@@ -19,7 +19,7 @@ from optuna.samplers import TPESampler, NSGAIISampler
 from optuna.pruners import MedianPruner
 
 from configs import BASE_CONFIG
-from runner import run_evolution
+from runner import run_evolution, run_packed_trials
 
 
 # =============================================================================
@@ -425,6 +425,90 @@ def create_multi_objective(
     return objective
 
 
+def optimize_packed(
+    study: optuna.Study,
+    mode: Literal['neat', 'pure'],
+    n_trials: int,
+    pack_trials: int,
+    generations: int,
+    seeds: list[int],
+    device: str,
+    results_dir: Path,
+    population_size: int = 300,
+    stagnation_limit: int = 50,
+    multi_objective: bool = False,
+):
+    """
+    Run the search in rounds of pack_trials trials simulated together.
+
+    Each round asks Optuna for pack_trials configurations, runs all of them
+    (x seeds) through run_packed_trials so their populations share simulation
+    batches, then tells the study the results. Intermediate pruning is not
+    applied since every trial of a round finishes at the same time.
+    """
+    completed = 0
+    while completed < n_trials:
+        round_size = min(pack_trials, n_trials - completed)
+        trials = [study.ask() for _ in range(round_size)]
+
+        configs = []
+        trial_params = []
+        for trial in trials:
+            config = BASE_CONFIG.copy()
+            config['neural_mode'] = mode
+            config['population_size'] = population_size  # Fixed, not optimized
+            if mode == 'neat':
+                # NEAT-REQUIRED CONSTRAINTS (do not search these)
+                config['selection_method'] = 'speciation'
+                config['use_fitness_sharing'] = False
+                params = suggest_neat_params(trial)
+            else:
+                params = suggest_pure_params(trial)
+            config.update(params)
+            configs.append(config)
+            trial_params.append(params)
+
+        try:
+            results = run_packed_trials(
+                configs=configs,
+                generations=generations,
+                seeds=seeds,
+                device=device,
+                verbose=False,
+                stagnation_limit=stagnation_limit,
+            )
+        except Exception as e:
+            print(f"Trials {trials[0].number}-{trials[-1].number} failed: {e}")
+            for trial in trials:
+                study.tell(trial, state=optuna.trial.TrialState.FAIL)
+            completed += round_size
+            continue
+
+        for trial, params, runs in zip(trials, trial_params, results):
+            all_best = [r.best_fitness for r in runs]
+            all_avg = [r.generations[-1].avg_fitness if r.generations else 0.0 for r in runs]
+            mean_best = sum(all_best) / len(all_best)
+            mean_avg = sum(all_avg) / len(all_avg)
+
+            trial_result = {
+                'trial_number': trial.number,
+                'params': params,
+                'best_fitness_per_seed': all_best,
+                'avg_fitness_per_seed': all_avg,
+                'mean_best_fitness': mean_best,
+                'mean_avg_fitness': mean_avg,
+                'generations': generations,
+                'seeds': seeds,
+            }
+            with open(results_dir / f"trial_{trial.number:04d}.json", 'w') as f:
+                json.dump(trial_result, f, indent=2)
+
+            study.tell(trial, (mean_best, mean_avg) if multi_objective else mean_best)
+
+        completed += round_size
+        print(f"  {completed}/{n_trials} trials complete (packed {round_size} per batch)")
+
+
 # =============================================================================
 # STUDY MANAGEMENT
 # =============================================================================
@@ -490,6 +574,7 @@ def run_search(
     stagnation_limit: int = 50,  # Stop early if no improvement for N generations
     n_jobs: int = 1,  # Number of parallel workers (1=sequential, -1=all cores)
     limit_threads: bool = False,  # Force single-threaded PyTorch to avoid nested parallelism
+    pack_trials: int = 1,  # Trials simulated together in one batch (1 = one trial at a time)
 ) -> tuple[optuna.Study, Path]:
     """
     Run hyperparameter search.
@@ -507,6 +592,8 @@ def run_search(
         population_size: Fixed population size (not optimized - more is always better)
         stagnation_limit: Stop trial early if no improvement for N generations (0 = disabled)
         n_jobs: Number of parallel workers (1=sequential, -1=all cores)
+        pack_trials: Pack this many trials' populations into shared simulation
+            batches (see optimize_packed); n_jobs is ignored when > 1
 
     Returns:
         Tuple of (completed Optuna study, results directory path)
@@ -539,7 +626,9 @@ def run_search(
     )
 
     # Create objective
-    if multi_objective:
+    if pack_trials > 1:
+        objective = None
+    elif multi_objective:
         objective = create_multi_objective(
             mode=mode,
             generations=generations,
@@ -569,15 +658,32 @@ def run_search(
     print(f"  Seeds: {seeds}")
     print(f"  Device: {device}")
     print(f"  Parallel workers: {n_jobs if n_jobs > 0 else 'all cores'}")
+    if pack_trials > 1:
+        print(f"  Packed trials: {pack_trials}")
     print(f"  Results: {results_dir}")
     print()
 
-    study.optimize(
-        objective,
-        n_trials=n_trials,
-        n_jobs=n_jobs,
-        show_progress_bar=True,
-    )
+    if pack_trials > 1:
+        optimize_packed(
+            study,
+            mode=mode,
+            n_trials=n_trials,
+            pack_trials=pack_trials,
+            generations=generations,
+            seeds=seeds,
+            device=device,
+            results_dir=results_dir,
+            population_size=population_size,
+            stagnation_limit=stagnation_limit,
+            multi_objective=multi_objective,
+        )
+    else:
+        study.optimize(
+            objective,
+            n_trials=n_trials,
+            n_jobs=n_jobs,
+            show_progress_bar=True,
+        )
 
     # Save study summary
     summary = {
@@ -24,7 +24,23 @@ import optuna
 from optuna.samplers import TPESampler
 
 from configs import BASE_CONFIG
-from runner import run_evolution
+from worker_pool import TrialWorkerPool, evaluate_config
+
+
+def build_trial_config(params: dict[str, Any], mode: str, population_size: int) -> dict[str, Any]:
+    """Full config for a trial: BASE_CONFIG + mode constraints + sampled params."""
+    config = BASE_CONFIG.copy()
+    config['neural_mode'] = mode
+    config['population_size'] = population_size
+
+    if mode == 'neat':
+        # NEAT-required constraints
+        config['selection_method'] = 'speciation'
+        config['use_fitness_sharing'] = False
+        config['use_crossover'] = True
+
+    config.update(params)
+    return config
 
 
 def run_trial_with_params(args):
@@ -41,55 +57,14 @@ def run_trial_with_params(args):
     """
     trial_id, params, mode, generations, seeds, device, population_size, stagnation_limit = args
 
-    # Build config
-    config = BASE_CONFIG.copy()
-    config['neural_mode'] = mode
-    config['population_size'] = population_size
-
-    if mode == 'neat':
-        # NEAT-required constraints
-        config['selection_method'] = 'speciation'
-        config['use_fitness_sharing'] = False
-        config['use_crossover'] = True
-
-    config.update(params)
-
-    # Run evolution for each seed
-    all_best_fitness = []
-    all_avg_fitness = []
-
-    for seed in seeds:
-        try:
-            result = run_evolution(
-                config=config,
-                generations=generations,
-                seed=seed,
-                device=device,
-                verbose=False,
-                stagnation_limit=stagnation_limit,
-            )
-
-            all_best_fitness.append(result.best_fitness)
-            final_avg = result.generations[-1].avg_fitness if result.generations else 0.0
-            all_avg_fitness.append(final_avg)
-
-        except Exception as e:
-            print(f"Trial {trial_id} seed {seed} failed: {e}")
-            all_best_fitness.append(0.0)
-            all_avg_fitness.append(0.0)
-
-    # Compute final metrics
-    mean_best = sum(all_best_fitness) / len(all_best_fitness)
-    mean_avg = sum(all_avg_fitness) / len(all_avg_fitness)
-
-    return {
-        'trial_id': trial_id,
-        'params': params,
-        'mean_best_fitness': mean_best,
-        'mean_avg_fitness': mean_avg,
-        'best_fitness_per_seed': all_best_fitness,
-        'avg_fitness_per_seed': all_avg_fitness,
-    }
+    result = evaluate_config(
+        build_trial_config(params, mode, population_size),
+        generations,
+        seeds,
+        device=device,
+        stagnation_limit=stagnation_limit,
+    )
+    return {'trial_id': trial_id, 'params': params, **result}
 
 
 def run_optuna_pool_search(
@@ -105,6 +80,8 @@ def run_optuna_pool_search(
     batch_size: int | None = None,
     storage: str | None = None,
     results_dir: str | None = None,
+    persistent_workers: bool = True,
+    threads_per_worker: int | None = None,
 ) -> tuple[optuna.Study, Path]:
     """
     Run Optuna hyperparameter search using multiprocessing.Pool.
@@ -130,6 +107,9 @@ def run_optuna_pool_search(
         batch_size: Trials per batch (default: n_workers)
         storage: Optuna storage URL (optional)
         results_dir: Where to save results
+        persistent_workers: Keep one TrialWorkerPool (warm, CPU-pinned workers)
+            for the whole search instead of a new multiprocessing.Pool per batch
+        threads_per_worker: Threads per persistent worker (None = cpu_count / n_workers)
 
     Returns:
         Tuple of (completed Optuna study, results directory path)
@@ -174,6 +154,15 @@ def run_optuna_pool_search(
     trial_count = 0
     batch_num = 0
 
+    worker_pool = None
+    if persistent_workers and n_workers > 1:
+        worker_pool = TrialWorkerPool(
+            n_workers=n_workers,
+            device=device,
+            threads_per_worker=threads_per_worker,
+            warmup_config=build_trial_config({}, mode, population_size),
+        )
+
     while trial_count < n_trials:
         # How many trials in this batch?
         remaining = n_trials - trial_count
@@ -195,6 +184,15 @@ def run_optuna_pool_search(
         # Run trials in parallel
         if n_workers == 1:
             results = [run_trial_with_params(args) for args in trial_args]
+        elif worker_pool is not None:
+            results = worker_pool.map(
+                [(args[0], build_trial_config(args[1], mode, population_size)) for args in trial_args],
+                generations,
+                seeds,
+                stagnation_limit,
+            )
+            for args, result in zip(trial_args, results):
+                result['params'] = args[1]
         else:
             with Pool(processes=n_workers) as pool:
                 results = pool.map(run_trial_with_params, trial_args)
@@ -225,6 +223,9 @@ def run_optuna_pool_search(
         batch_best = max(r['mean_best_fitness'] for r in results)
         print(f"Batch {batch_num} complete: best={batch_best:.1f}, overall best={study.best_value:.1f}\n")
 
+    if worker_pool is not None:
+        worker_pool.close()
+
     elapsed_time = time.time() - start_time
 
     # Save study summary
@@ -273,6 +274,8 @@ if __name__ == "__main__":
         device: str = typer.Option("cpu", "--device", "-d"),
         stagnation_limit: int = typer.Option(50, "--stagnation-limit"),
         storage: str = typer.Option(None, "--storage"),
+        persistent: bool = typer.Option(True, "--persistent/--no-persistent", help="Reuse warm, CPU-pinned workers across batches"),
+        threads_per_worker: int = typer.Option(None, "--threads-per-worker", "-t"),
     ):
         """
         Run Optuna hyperparameter search with multiprocessing.Pool backend.
@@ -306,6 +309,8 @@ if __name__ == "__main__":
             n_workers=n_workers,
             batch_size=batch_size,
             storage=storage,
+            persistent_workers=persistent,
+            threads_per_worker=threads_per_worker,
         )
 
     app()
@@ -124,6 +124,21 @@ def sample_pure_params() -> dict[str, Any]:
     return params
 
 
+def build_trial_config(config_params: dict[str, Any], mode: str, population_size: int) -> dict[str, Any]:
+    """Full config for a trial: BASE_CONFIG + mode constraints + sampled params."""
+    config = BASE_CONFIG.copy()
+    config['neural_mode'] = mode
+    config['population_size'] = population_size
+
+    if mode == 'neat':
+        # NEAT-required constraints
+        config['selection_method'] = 'speciation'
+        config['use_fitness_sharing'] = False
+
+    config.update(config_params)
+    return config
+
+
 def run_single_trial(args):
     """
     Run a single trial (complete evolution run with multiple seeds).
@@ -157,56 +172,20 @@ def run_single_trial(args):
         # NOTE: Don't call set_num_interop_threads() - it can only be called once
         # and causes errors in multiprocessing. Rely on env var instead.
 
-    # NOW import runner
-    from runner import run_evolution
+    from worker_pool import evaluate_config
 
-    # Build full config
-    config = BASE_CONFIG.copy()
-    config['neural_mode'] = mode
-    config['population_size'] = population_size
-
-    if mode == 'neat':
-        # NEAT-required constraints
-        config['selection_method'] = 'speciation'
-        config['use_fitness_sharing'] = False
-
-    config.update(config_params)
-
-    # Run evolution for each seed
-    all_best_fitness = []
-    all_avg_fitness = []
-
-    for seed in seeds:
-        try:
-            result = run_evolution(
-                config=config,
-                generations=generations,
-                seed=seed,
-                device=device,
-                verbose=False,
-                stagnation_limit=stagnation_limit,
-            )
-
-            all_best_fitness.append(result.best_fitness)
-            final_avg = result.generations[-1].avg_fitness if result.generations else 0.0
-            all_avg_fitness.append(final_avg)
-
-        except Exception as e:
-            print(f"Trial {trial_id} seed {seed} failed: {e}")
-            all_best_fitness.append(0.0)
-            all_avg_fitness.append(0.0)
-
-    # Compute metrics
-    mean_best = sum(all_best_fitness) / len(all_best_fitness)
-    mean_avg = sum(all_avg_fitness) / len(all_avg_fitness)
+    result = evaluate_config(
+        build_trial_config(config_params, mode, population_size),
+        generations,
+        seeds,
+        device=device,
+        stagnation_limit=stagnation_limit,
+    )
 
     return {
         'trial_id': trial_id,
         'params': config_params,
-        'best_fitness_per_seed': all_best_fitness,
-        'avg_fitness_per_seed': all_avg_fitness,
-        'mean_best_fitness': mean_best,
-        'mean_avg_fitness': mean_avg,
+        **result,
     }
 
 
@@ -222,6 +201,8 @@ def run_processpool_search(
     n_workers: int = 1,
     threads_per_worker: int | None = None,
     results_dir: str | None = None,
+    persistent_workers: bool = True,
+    stream_generations: bool = False,
 ) -> Path:
     """
     Run hyperparameter search using simple multiprocessing.Pool.
@@ -239,7 +220,12 @@ def run_processpool_search(
         population_size: Fixed population size
         stagnation_limit: Early stopping threshold
         n_workers: Number of parallel workers
+        threads_per_worker: Threads per worker (None = cpu_count / n_workers)
         results_dir: Where to save results
+        persistent_workers: Use a TrialWorkerPool (warm, CPU-pinned workers that
+            keep their simulator and compiled kernels) instead of multiprocessing.Pool
+        stream_generations: Print per-generation progress streamed from the workers
+            (persistent workers only)
 
     Returns:
         Path to results directory
@@ -310,6 +296,35 @@ def run_processpool_search(
                 json.dump(result, f, indent=2)
             print(f"Trial {i+1}/{n_trials} completed: fitness={result['mean_best_fitness']:.1f}")
             sys.stdout.flush()
+    elif persistent_workers:
+        from worker_pool import TrialWorkerPool
+
+        params_by_id = {args[0]: args[1] for args in trial_args}
+
+        def on_generation(trial_id, seed_idx, stats):
+            if stats['generation'] % 10 == 0:
+                print(f"  trial {trial_id} seed {seed_idx} gen {stats['generation']}: best={stats['best_fitness']:.1f}")
+
+        with TrialWorkerPool(
+            n_workers=n_workers,
+            device=device,
+            threads_per_worker=threads_per_worker,
+            warmup_config=build_trial_config({}, mode, population_size),
+            stream_generations=stream_generations,
+        ) as pool:
+            for trial_id, params in params_by_id.items():
+                pool.submit(trial_id, build_trial_config(params, mode, population_size),
+                            generations, seeds, stagnation_limit)
+
+            for i, result in enumerate(pool.as_completed(on_generation if stream_generations else None)):
+                result['params'] = params_by_id[result['trial_id']]
+                results.append(result)
+                # Save immediately
+                result_file = results_dir / f"trial_{result['trial_id']:04d}.json"
+                with open(result_file, 'w') as f:
+                    json.dump(result, f, indent=2)
+                print(f"Trial {i+1}/{n_trials} completed: fitness={result['mean_best_fitness']:.1f}")
+                sys.stdout.flush()
     else:
         # Parallel with incremental results
         with Pool(processes=n_workers) as pool:
@@ -367,6 +382,8 @@ if __name__ == "__main__":
         threads_per_worker: int = typer.Option(None, "--threads-per-worker", "-t"),
         device: str = typer.Option("cpu", "--device", "-d"),
         stagnation_limit: int = typer.Option(50, "--stagnation-limit"),
+        persistent: bool = typer.Option(True, "--persistent/--no-persistent", help="Reuse warm, CPU-pinned workers across trials"),
+        stream: bool = typer.Option(False, "--stream", help="Print per-generation progress from workers"),
     ):
         """
         Run Process Pool hyperparameter search with proper thread control.
@@ -387,6 +404,8 @@ if __name__ == "__main__":
             stagnation_limit=stagnation_limit,
             n_workers=n_workers,
             threads_per_worker=threads_per_worker,
+            persistent_workers=persistent,
+            stream_generations=stream,
         )
 
     app()
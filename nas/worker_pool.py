@@ -0,0 +1,303 @@
+"""
+Long-lived worker pool for process-parallel hyperparameter search.
+
+multiprocessing.Pool workers in search_processpool.py / search_optuna_pool.py
+used to import torch, build a PyTorchSimulator and JIT the Numba kernels in
+neat_network.py for every trial. A TrialWorkerPool starts its processes once:
+each worker pins itself to its own CPUs, limits its thread pools, loads the
+Numba kernels from their on-disk cache, warms a simulator and then takes
+trials from a shared queue, streaming per-generation stats and final
+results back to the parent.
+
+Usage:
+    with TrialWorkerPool(n_workers=8, warmup_config=config) as pool:
+        for trial_id, config in enumerate(configs):
+            pool.submit(trial_id, config, generations=50, seeds=[42, 123])
+        for result in pool.as_completed():
+            print(result['trial_id'], result['mean_best_fitness'])
+"""
+
+import multiprocessing as mp
+import os
+import queue
+import sys
+import time
+import traceback
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+# NOTE: Don't import torch/runner here - workers must set thread limits first.
+# This module is imported by every spawned worker before _worker_main runs.
+sys.path.insert(0, str(Path(__file__).parent.parent / 'backend'))
+
+from app.core.threads import limit_threads
+
+
+def evaluate_config(
+    config: dict[str, Any],
+    generations: int,
+    seeds: list[int],
+    device: str = 'cpu',
+    stagnation_limit: int = 0,
+    simulator=None,
+    on_generation: Callable[[int, Any], None] | None = None,
+) -> dict[str, Any]:
+    """
+    Run one trial: evolve `config` once per seed and average the results.
+
+    A failing seed scores 0.0 instead of failing the whole trial.
+
+    Args:
+        config: Full simulation configuration dict
+        generations: Generations per seed
+        seeds: Random seeds to average over
+        device: PyTorch device
+        stagnation_limit: Early stopping threshold (0 = disabled)
+        simulator: Warm PyTorchSimulator to reuse (None = create one per seed)
+        on_generation: Called with (seed_idx, GenerationStats) after each generation
+
+    Returns:
+        Dict with per-seed and mean best/final-average fitness
+    """
+    from runner import run_evolution
+
+    all_best_fitness = []
+    all_avg_fitness = []
+
+    for seed_idx, seed in enumerate(seeds):
+        callback = None
+        if on_generation is not None:
+            def callback(stats, seed_idx=seed_idx):
+                on_generation(seed_idx, stats)
+
+        try:
+            result = run_evolution(
+                config=config,
+                generations=generations,
+                seed=seed,
+                device=device,
+                callback=callback,
+                verbose=False,
+                stagnation_limit=stagnation_limit,
+                simulator=simulator,
+            )
+            all_best_fitness.append(result.best_fitness)
+            final_avg = result.generations[-1].avg_fitness if result.generations else 0.0
+            all_avg_fitness.append(final_avg)
+        except Exception as e:
+            print(f"Seed {seed} failed: {e}")
+            all_best_fitness.append(0.0)
+            all_avg_fitness.append(0.0)
+
+    return {
+        'best_fitness_per_seed': all_best_fitness,
+        'avg_fitness_per_seed': all_avg_fitness,
+        'mean_best_fitness': sum(all_best_fitness) / len(all_best_fitness),
+        'mean_avg_fitness': sum(all_avg_fitness) / len(all_avg_fitness),
+    }
+
+
+def _worker_main(
+    worker_idx: int,
+    tasks: mp.Queue,
+    results: mp.Queue,
+    device: str,
+    threads: int,
+    cpus: list[int] | None,
+    warmup_config: dict[str, Any] | None,
+    stream_generations: bool,
+) -> None:
+    """Worker process: configure threads, warm up, then serve trials until None."""
+    # Thread limits must be in place BEFORE torch/numba are imported
+    if threads:
+        limit_threads(threads)
+    if cpus and hasattr(os, 'sched_setaffinity'):
+        os.sched_setaffinity(0, cpus)
+
+    import torch
+    if threads:
+        torch.set_num_threads(threads)
+
+    from runner import PyTorchSimulator, run_evolution  # runner puts backend/ on sys.path
+    from app.neural.neat_network import warm_up_numba_kernels
+
+    simulator = PyTorchSimulator(device=torch.device(device))
+
+    # Load (or compile) the Numba kernels, then run the smallest population
+    # once so torch's lazy initialization also happens before the first trial
+    warmup_start = time.time()
+    warm_up_numba_kernels()
+    if warmup_config is not None:
+        run_evolution(
+            config=dict(warmup_config, population_size=10, simulation_duration=1.0),
+            generations=1,
+            seed=0,
+            verbose=False,
+            simulator=simulator,
+        )
+    results.put(('ready', worker_idx, time.time() - warmup_start))
+
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+        task_id, config, generations, seeds, stagnation_limit = task
+
+        on_generation = None
+        if stream_generations:
+            def on_generation(seed_idx, stats, task_id=task_id):
+                results.put(('generation', task_id, seed_idx, asdict(stats)))
+
+        start = time.time()
+        try:
+            result = evaluate_config(
+                config, generations, seeds,
+                device=device,
+                stagnation_limit=stagnation_limit,
+                simulator=simulator,
+                on_generation=on_generation,
+            )
+        except Exception:
+            results.put(('error', task_id, traceback.format_exc()))
+            continue
+        result.update(trial_id=task_id, worker=worker_idx, elapsed_s=time.time() - start)
+        results.put(('result', task_id, result))
+
+
+class TrialWorkerPool:
+    """
+    Fixed set of warm worker processes that evaluate trials from a queue.
+
+    Workers are started with the 'spawn' method (safe with torch) and live
+    until close(). Each one is pinned to `threads_per_worker` CPUs of its own
+    when enough CPUs are available.
+    """
+
+    def __init__(
+        self,
+        n_workers: int,
+        device: str = 'cpu',
+        threads_per_worker: int | None = None,
+        pin_threads: bool = True,
+        warmup_config: dict[str, Any] | None = None,
+        stream_generations: bool = False,
+    ):
+        """
+        Start the worker processes.
+
+        Args:
+            n_workers: Number of worker processes
+            device: PyTorch device for every worker
+            threads_per_worker: Threads per worker (None = available CPUs / n_workers)
+            pin_threads: Pin each worker to a disjoint CPU set (Linux only)
+            warmup_config: Config run for one small generation per worker at
+                           startup (None = only the Numba kernel warm-up)
+            stream_generations: Send per-generation stats back while trials run
+        """
+        if hasattr(os, 'sched_getaffinity'):
+            available = sorted(os.sched_getaffinity(0))
+        else:
+            available = list(range(os.cpu_count() or 1))
+        if threads_per_worker is None:
+            threads_per_worker = max(1, len(available) // n_workers)
+
+        self.n_workers = n_workers
+        self.threads_per_worker = threads_per_worker
+        self.warmup_s: dict[int, float] = {}
+
+        ctx = mp.get_context('spawn')
+        self._tasks = ctx.Queue()
+        self._results = ctx.Queue()
+        self._pending: set[Any] = set()
+        self._processes = []
+        for worker_idx in range(n_workers):
+            cpus = available[worker_idx * threads_per_worker:(worker_idx + 1) * threads_per_worker]
+            pinned = pin_threads and len(cpus) == threads_per_worker
+            process = ctx.Process(
+                target=_worker_main,
+                args=(
+                    worker_idx, self._tasks, self._results, device, threads_per_worker,
+                    cpus if pinned else None, warmup_config, stream_generations,
+                ),
+                daemon=True,
+            )
+            process.start()
+            self._processes.append(process)
+
+    def submit(
+        self,
+        task_id: Any,
+        config: dict[str, Any],
+        generations: int,
+        seeds: list[int],
+        stagnation_limit: int = 0,
+    ) -> None:
+        """Queue one trial; its result is returned by as_completed()."""
+        self._pending.add(task_id)
+        self._tasks.put((task_id, config, generations, seeds, stagnation_limit))
+
+    def as_completed(
+        self,
+        on_generation: Callable[[Any, int, dict], None] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Yield results of all submitted trials as they finish.
+
+        Args:
+            on_generation: Called with (task_id, seed_idx, stats dict) for streamed
+                           generations (requires stream_generations=True)
+
+        Raises:
+            RuntimeError: If a trial raises or a worker process dies
+        """
+        while self._pending:
+            try:
+                message = self._results.get(timeout=1.0)
+            except queue.Empty:
+                dead = [p for p in self._processes if not p.is_alive()]
+                if dead:
+                    raise RuntimeError(f"Worker exited with code {dead[0].exitcode}")
+                continue
+
+            kind = message[0]
+            if kind == 'ready':
+                self.warmup_s[message[1]] = message[2]
+            elif kind == 'generation':
+                if on_generation is not None:
+                    on_generation(message[1], message[2], message[3])
+            elif kind == 'result':
+                self._pending.discard(message[1])
+                yield message[2]
+            elif kind == 'error':
+                self._pending.discard(message[1])
+                raise RuntimeError(f"Trial {message[1]} failed:\n{message[2]}")
+
+    def map(
+        self,
+        tasks: list[tuple[Any, dict[str, Any]]],
+        generations: int,
+        seeds: list[int],
+        stagnation_limit: int = 0,
+    ) -> list[dict[str, Any]]:
+        """Run (task_id, config) pairs and return their results in input order."""
+        for task_id, config in tasks:
+            self.submit(task_id, config, generations, seeds, stagnation_limit)
+        by_id = {r['trial_id']: r for r in self.as_completed()}
+        return [by_id[task_id] for task_id, _ in tasks]
+
+    def close(self) -> None:
+        """Stop the workers after their current trial."""
+        for _ in self._processes:
+            self._tasks.put(None)
+        for process in self._processes:
+            process.join(timeout=30)
+            if process.is_alive():
+                process.terminate()
+        self._processes = []
+
+    def __enter__(self) -> 'TrialWorkerPool':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()